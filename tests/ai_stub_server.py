@@ -0,0 +1,193 @@
+"""
+Local stub of an OpenAI-compatible chat completions backend.
+
+Used by the AI client tests and as a benchmark target: it "generates" a fixed
+completion token-by-token with a configurable time-to-first-token and per-token
+delay, either as a single JSON response or as an SSE stream.
+
+Benchmark latency-to-decision (time until call_ai returns a parsed answer):
+
+    python tests/ai_stub_server.py --tokens-after-json 200 --token-delay 0.01
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_ANSWER = {
+    "final_category": "Manga",
+    "final_sub_category": "Action",
+    "reason": "Battle-focused shounen with tournament arcs.",
+    "confidence_score": 0.92,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into word/space/punctuation pieces roughly the size of model tokens."""
+    return re.findall(r"\s+|\w+|[^\w\s]", text)
+
+
+class StubAIServer:
+    """
+    Threaded OpenAI-compatible stub. Use as a context manager:
+
+        with StubAIServer(completion='{"a": 1} trailing words') as server:
+            call_ai(...) against server.endpoint
+    """
+
+    def __init__(
+        self,
+        completion: Optional[str] = None,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+        reject_stream_options: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.completion = completion if completion is not None else json.dumps(DEFAULT_ANSWER)
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.reject_stream_options = reject_stream_options
+        self.requests: List[dict] = []
+        self.connections = 0
+        self.tokens_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        # Full endpoint so call_ai does not apply any port-based URL heuristics
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def start(self) -> "StubAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # Keep test output quiet
+                pass
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests.append(payload)
+
+                if server.reject_stream_options and "stream_options" in payload:
+                    # Mimic strict servers that refuse fields they do not know
+                    body = b'{"error": {"message": "Unrecognized request argument: stream_options"}}'
+                    self.send_response(400)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                tokens = tokenize(server.completion)
+                usage = {"prompt_tokens": 42, "completion_tokens": len(tokens)}
+                time.sleep(server.first_token_delay)
+
+                if not payload.get("stream"):
+                    time.sleep(server.token_delay * len(tokens))
+                    with server._lock:
+                        server.tokens_sent += len(tokens)
+                    body = json.dumps({
+                        "object": "chat.completion",
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": server.completion}}],
+                        "usage": usage,
+                    }).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for token in tokens:
+                        self._send_event({"choices": [{"index": 0, "delta": {"content": token}}]})
+                        with server._lock:
+                            server.tokens_sent += 1
+                        time.sleep(server.token_delay)
+                    self._send_event({"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": usage})
+                    self._send_chunk(b"data: [DONE]\n\n")
+                    self._send_chunk(b"")
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client stopped reading early (decision already made)
+                    self.close_connection = True
+
+            def _send_event(self, data: dict) -> None:
+                self._send_chunk(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+
+            def _send_chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from unittest.mock import patch
+    from vibe_manga.vibe_manga import ai_api
+
+    trailing = " ".join(["This classification reflects the overall tone."] * max(1, args.tokens_after_json // 8))
+    completion = json.dumps(DEFAULT_ANSWER) + "\n\n" + trailing
+
+    with StubAIServer(completion, first_token_delay=args.first_token_delay, token_delay=args.token_delay) as server:
+        with patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+            for label, stream in (("full response", False), ("streaming", True)):
+                timings = []
+                for i in range(args.runs):
+                    start = time.perf_counter()
+                    result = ai_api.call_ai(
+                        f"benchmark prompt {i}", "system", provider="local", model="stub",
+                        stream=stream, use_cache=False
+                    )
+                    timings.append(time.perf_counter() - start)
+                    assert result == DEFAULT_ANSWER, result
+                avg = sum(timings) / len(timings)
+                print(f"{label:>14}: latency-to-decision avg {avg * 1000:.1f} ms over {args.runs} runs")
+        print(f"connections opened: {server.connections} for {len(server.requests)} requests")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--first-token-delay", type=float, default=0.05)
+    parser.add_argument("--token-delay", type=float, default=0.005)
+    parser.add_argument("--tokens-after-json", type=int, default=200, help="Approximate trailing prose tokens after the JSON answer.")
+    run_benchmark(parser.parse_args())
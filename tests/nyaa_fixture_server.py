@@ -0,0 +1,191 @@
+"""
+Local stand-in for the Nyaa listing pages.
+
+Serves generated `torrent-list` HTML tables for `/?f=0&c=3_1&q=<query>&p=<page>`
+so the scraper can be exercised end-to-end (fetch, parse, merge) without the
+network. Each page request can be delayed to make concurrency observable.
+
+Run directly to benchmark the page parsers on generated or saved pages:
+
+    python tests/nyaa_fixture_server.py [saved_page.html ...] --runs 20
+"""
+import argparse
+import html
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ROW_TEMPLATE = """
+<tr class="default">
+  <td><a href="/?c=3_1" title="Literature - English-translated"><img src="/static/img/icons/nyaa/3_1.png"></a></td>
+  <td colspan="2">
+    <a href="/view/{id}#comments" class="comments" title="comments"><i class="fa fa-comments-o"></i>1</a>
+    <a href="/view/{id}" title="{name}">{name}</a>
+  </td>
+  <td class="text-center">
+    <a href="/download/{id}.torrent"><i class="fa fa-fw fa-download"></i></a>
+    <a href="{magnet}"><i class="fa fa-fw fa-magnet"></i></a>
+  </td>
+  <td class="text-center">{size}</td>
+  <td class="text-center" data-timestamp="{timestamp}">2024-01-01 00:00</td>
+  <td class="text-center">{seeders}</td>
+  <td class="text-center">{leechers}</td>
+  <td class="text-center">{completed}</td>
+</tr>"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>Nyaa</title></head><body>
+<div class="container">
+<div class="table-responsive">
+<table class="table table-bordered table-hover table-striped torrent-list">
+<thead><tr><th>Category</th><th>Name</th><th>Link</th><th>Size</th><th>Date</th><th>S</th><th>L</th><th>C</th></tr></thead>
+<tbody>{rows}
+</tbody>
+</table>
+</div>
+</div>
+</body></html>"""
+
+
+def make_row(id: int, timestamp: int, name: Optional[str] = None, magnet: Optional[str] = None) -> dict:
+    """Builds the data for one listing row."""
+    return {
+        "id": id,
+        "name": name or f"Series {id} v01-05 (Digital)",
+        "magnet": magnet or f"magnet:?xt=urn:btih:{id:040x}&dn=series-{id}",
+        "size": f"{(id % 900) + 100}.0 MiB",
+        "timestamp": timestamp,
+        "seeders": id % 50,
+        "leechers": id % 7,
+        "completed": id * 3,
+    }
+
+
+def make_pages(count: int, per_page: int = 75, start_id: int = 1, newest_ts: int = 1_700_000_000) -> List[List[dict]]:
+    """Builds `count` pages of rows in date-descending order, like Nyaa's default sort."""
+    pages = []
+    row_id = start_id
+    for _ in range(count):
+        page = []
+        for _ in range(per_page):
+            page.append(make_row(row_id, newest_ts - row_id * 60))
+            row_id += 1
+        pages.append(page)
+    return pages
+
+
+def render_page(rows: List[dict]) -> str:
+    rendered = "".join(
+        ROW_TEMPLATE.format(**{k: html.escape(str(v), quote=True) for k, v in row.items()})
+        for row in rows
+    )
+    return PAGE_TEMPLATE.format(rows=rendered)
+
+
+class NyaaFixtureServer:
+    """
+    Threaded fixture server. `listings` maps a search query ("" for the front
+    page) to its pages of rows; pages past the end render an empty table.
+    """
+
+    def __init__(self, listings: Dict[str, List[List[dict]]], delay: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.listings = listings
+        self.delay = delay
+        self.requests: List[Tuple[str, int, float]] = []  # (query, page, monotonic start)
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def front_page_template(self) -> str:
+        return f"{self.base_url}/?f=0&c=3_1&q=&p={{page}}"
+
+    @property
+    def search_template(self) -> str:
+        return f"{self.base_url}/?f=0&c=3_1&q={{query}}&p={{page}}"
+
+    def requested_pages(self, query: str = "") -> List[int]:
+        return sorted(page for q, page, _ in self.requests if q == query)
+
+    def __enter__(self) -> "NyaaFixtureServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # Keep test output quiet
+                pass
+
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query, keep_blank_values=True)
+                query = params.get("q", [""])[0]
+                page = int(params.get("p", ["1"])[0])
+                with server._lock:
+                    server.requests.append((query, page, time.monotonic()))
+                    server._active += 1
+                    server.max_concurrent = max(server.max_concurrent, server._active)
+                try:
+                    time.sleep(server.delay)
+                    pages = server.listings.get(query, [])
+                    rows = pages[page - 1] if 0 < page <= len(pages) else []
+                    body = render_page(rows).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server._active -= 1
+
+        return Handler
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from vibe_manga.vibe_manga.nyaa_scraper import _parse_page, _parse_page_soup
+
+    if args.pages:
+        documents = [Path(p).read_text(encoding="utf-8") for p in args.pages]
+    else:
+        documents = [render_page(rows) for rows in make_pages(10)]
+
+    for doc in documents:
+        assert _parse_page(doc) == _parse_page_soup(doc), "parsers disagree"
+
+    rows = sum(len(_parse_page(doc)) for doc in documents)
+    timings = {}
+    for label, parse in (("BeautifulSoup", _parse_page_soup), ("lxml XPath", _parse_page)):
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            for doc in documents:
+                parse(doc)
+        timings[label] = (time.perf_counter() - start) / (args.runs * len(documents))
+        print(f"{label:>14}: {timings[label] * 1000:.2f} ms/page ({rows} rows over {len(documents)} pages)")
+    print(f"speedup: {timings['BeautifulSoup'] / timings['lxml XPath']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="Saved Nyaa listing pages (defaults to generated pages).")
+    parser.add_argument("--runs", type=int, default=20)
+    run_benchmark(parser.parse_args())
@@ -0,0 +1,225 @@
+"""
+In-process fake of the qBittorrent Web API (v2) for tests.
+
+Implements the endpoints VibeManga uses: auth/login, sync/maindata (with real
+rid/delta semantics), torrents/info, torrents/add, torrents/stop, torrents/pause,
+torrents/start, torrents/resume and torrents/delete. Torrent state is driven from the test via add/update/remove.
+Every request is recorded in `requests` as (method, path, params).
+"""
+import copy
+import hashlib
+import itertools
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_TORRENT = {
+    "name": "",
+    "progress": 0.0,
+    "state": "downloading",
+    "size": 100 * 1024 * 1024,
+    "save_path": "/downloads/VibeManga",
+    "content_path": "",
+    "tags": "VibeManga",
+    "category": "",
+    "dlspeed": 0,
+}
+
+
+def magnet_hash(magnet: str) -> str:
+    """Info hash for a magnet link (btih if present, else a stable digest)."""
+    params = parse_qs(urlparse(magnet).query)
+    for xt in params.get("xt", []):
+        if xt.startswith("urn:btih:"):
+            return xt.split(":")[-1].lower()
+    return hashlib.sha1(magnet.encode("utf-8")).hexdigest()
+
+
+class FakeQBittorrent:
+    def __init__(self, username: str = "admin", password: str = "adminadmin", host: str = "127.0.0.1", port: int = 0):
+        self.username = username
+        self.password = password
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.fail_next: List[int] = []  # Status codes to return for the next non-login requests
+        self._sessions: Dict[str, Dict[int, Dict[str, Dict[str, Any]]]] = {}  # sid -> rid -> snapshot
+        self._rid_counter = itertools.count(1)
+        self._lock = threading.RLock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakeQBittorrent":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    # --- Test controls ---
+
+    def add(self, torrent_hash: str, **fields) -> None:
+        with self._lock:
+            self.torrents[torrent_hash] = {**DEFAULT_TORRENT, "hash": torrent_hash, **fields}
+
+    def update(self, torrent_hash: str, **fields) -> None:
+        with self._lock:
+            self.torrents[torrent_hash].update(fields)
+
+    def remove(self, torrent_hash: str) -> None:
+        with self._lock:
+            self.torrents.pop(torrent_hash, None)
+
+    def expire_sessions(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def calls(self, path: str) -> List[Dict[str, Any]]:
+        return [params for _, p, params in self.requests if p == path]
+
+    # --- Protocol ---
+
+    def _maindata(self, sid: str, rid: int) -> Dict[str, Any]:
+        snapshots = self._sessions.setdefault(sid, {})
+        current = {h: {k: v for k, v in t.items() if k != "hash"} for h, t in self.torrents.items()}
+        new_rid = next(self._rid_counter)
+        previous = snapshots.get(rid)
+        # Like qBittorrent, only the latest snapshot per session is kept
+        snapshots.clear()
+        snapshots[new_rid] = copy.deepcopy(current)
+
+        if previous is None:
+            return {"rid": new_rid, "full_update": True, "torrents": current, "server_state": {"dl_info_speed": 0}}
+
+        changed = {}
+        for h, fields in current.items():
+            old = previous.get(h)
+            if old is None:
+                changed[h] = fields
+            else:
+                diff = {k: v for k, v in fields.items() if old.get(k) != v}
+                if diff:
+                    changed[h] = diff
+        data: Dict[str, Any] = {"rid": new_rid}
+        if changed:
+            data["torrents"] = changed
+        removed = [h for h in previous if h not in current]
+        if removed:
+            data["torrents_removed"] = removed
+        return data
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # Keep test output quiet
+                pass
+
+            def _reply(self, status: int, body: Any = "Ok.", headers: Optional[Dict[str, str]] = None) -> None:
+                payload = json.dumps(body) if not isinstance(body, str) else body
+                data = payload.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json" if not isinstance(body, str) else "text/plain")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _form(self) -> Dict[str, str]:
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+                ctype = self.headers.get("Content-Type", "")
+                if ctype.startswith("multipart/form-data"):
+                    msg = BytesParser(policy=default_policy).parsebytes(
+                        f"Content-Type: {ctype}\r\n\r\n".encode("utf-8") + raw
+                    )
+                    return {
+                        part.get_param("name", header="content-disposition"): part.get_content().strip()
+                        for part in msg.iter_parts()
+                    }
+                return {k: v[0] for k, v in parse_qs(raw.decode("utf-8"), keep_blank_values=True).items()}
+
+            def _sid(self) -> Optional[str]:
+                for chunk in self.headers.get("Cookie", "").split(";"):
+                    name, _, value = chunk.strip().partition("=")
+                    if name == "SID":
+                        return value
+                return None
+
+            def _handle(self, method: str) -> None:
+                parsed = urlparse(self.path)
+                path = parsed.path
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                if method == "POST":
+                    params.update(self._form())
+                with server._lock:
+                    server.requests.append((method, path, params))
+
+                if path == "/api/v2/auth/login":
+                    if params.get("username") == server.username and params.get("password") == server.password:
+                        sid = hashlib.sha1(str(len(server.requests)).encode()).hexdigest()[:16]
+                        with server._lock:
+                            server._sessions[sid] = {}
+                        return self._reply(200, headers={"Set-Cookie": f"SID={sid}; path=/"})
+                    return self._reply(200, "Fails.")
+
+                sid = self._sid()
+                with server._lock:
+                    if sid not in server._sessions:
+                        return self._reply(403, "Forbidden")
+                    if server.fail_next:
+                        return self._reply(server.fail_next.pop(0), "Injected failure")
+
+                    if path == "/api/v2/sync/maindata":
+                        return self._reply(200, server._maindata(sid, int(params.get("rid", 0))))
+                    if path == "/api/v2/torrents/info":
+                        tag = params.get("tag")
+                        torrents = [
+                            dict(t) for t in server.torrents.values()
+                            if not tag or tag in [x.strip() for x in t["tags"].split(",")]
+                        ]
+                        return self._reply(200, torrents)
+                    if path == "/api/v2/torrents/add":
+                        for url in filter(None, params.get("urls", "").split("\n")):
+                            h = magnet_hash(url.strip())
+                            server.torrents[h] = {
+                                **DEFAULT_TORRENT, "hash": h, "name": h,
+                                "tags": params.get("tags", ""), "category": params.get("category", ""),
+                                "save_path": params.get("savepath", ""),
+                            }
+                        return self._reply(200)
+                    if path in ("/api/v2/torrents/stop", "/api/v2/torrents/pause"):
+                        for h in params.get("hashes", "").split("|"):
+                            if h in server.torrents:
+                                server.torrents[h]["state"] = "stoppedUP"
+                        return self._reply(200)
+                    if path in ("/api/v2/torrents/start", "/api/v2/torrents/resume"):
+                        for h in params.get("hashes", "").split("|"):
+                            if h in server.torrents:
+                                server.torrents[h]["state"] = "uploading"
+                        return self._reply(200)
+                    if path == "/api/v2/torrents/delete":
+                        for h in params.get("hashes", "").split("|"):
+                            server.torrents.pop(h, None)
+                        return self._reply(200)
+                return self._reply(404, "Not Found")
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+        return Handler
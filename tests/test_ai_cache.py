@@ -0,0 +1,133 @@
+import json
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from vibe_manga.vibe_manga import ai_api
+from vibe_manga.vibe_manga.ai_api import AIResponseCache, TokenTracker, call_ai
+
+
+def make_response(content, prompt_tokens=10, completion_tokens=5):
+    resp = MagicMock()
+    resp.raise_for_status.return_value = None
+    resp.json.return_value = {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+    }
+    return resp
+
+
+@pytest.fixture
+def isolated_cache(tmp_path):
+    cache = AIResponseCache(path=tmp_path / "ai_cache.jsonl", ttl_seconds=3600, enabled=True)
+    tracker = TokenTracker()
+    with patch.object(ai_api, "response_cache", cache), patch.object(ai_api, "tracker", tracker):
+        yield cache, tracker
+
+
+def test_identical_call_is_served_from_cache(isolated_cache):
+    cache, tracker = isolated_cache
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"category": "Manga/Action"}')) as mock_post:
+        first = call_ai("prompt", "system", provider="local", model="m1", temperature=0.2)
+        second = call_ai("prompt", "system", provider="local", model="m1", temperature=0.2)
+
+    assert first == second == {"category": "Manga/Action"}
+    assert mock_post.call_count == 1
+    assert tracker.get_cache_summary()["m1"] == {"hits": 1, "misses": 1}
+    # Tokens are only counted for the real request
+    assert tracker.get_summary()["m1"] == {"prompt": 10, "completion": 5}
+
+
+def test_cache_key_covers_prompt_model_and_temperature(isolated_cache):
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"ok": true}')) as mock_post:
+        call_ai("prompt", "system", provider="local", model="m1", temperature=0.2)
+        call_ai("prompt", "system", provider="local", model="m2", temperature=0.2)
+        call_ai("prompt", "system", provider="local", model="m1", temperature=0.7)
+        call_ai("other", "system", provider="local", model="m1", temperature=0.2)
+        call_ai("prompt", "other system", provider="local", model="m1", temperature=0.2)
+
+    assert mock_post.call_count == 5
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "ai_cache.jsonl"
+    key = AIResponseCache.make_key("local", "m1", "sys", "user", 0.7, True)
+
+    AIResponseCache(path=path).put(key, {"a": 1})
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert (record["key"], record["response"]) == (key, {"a": 1})
+    assert AIResponseCache(path=path).get(key) == {"a": 1}
+
+
+def test_puts_append_and_load_compacts(tmp_path):
+    path = tmp_path / "ai_cache.jsonl"
+    cache = AIResponseCache(path=path)
+    for n in range(5):
+        cache.put("k", {"n": n})
+    cache.put("other", "text")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "torn", "ts"')  # Interrupted write
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 7
+
+    reloaded = AIResponseCache(path=path)
+    assert reloaded.get("k") == {"n": 4} and reloaded.get("other") == "text"
+    # Superseded and torn lines are dropped once they dominate the file
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    cache = AIResponseCache(path=tmp_path / "ai_cache.jsonl", ttl_seconds=60)
+    key = AIResponseCache.make_key("local", "m1", "sys", "user", 0.7, True)
+    cache.put(key, {"a": 1})
+    cache._entries[key]["ts"] = time.time() - 120
+
+    assert cache.get(key) is None
+
+
+def test_opt_out_bypasses_cache(isolated_cache):
+    cache, tracker = isolated_cache
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"ok": true}')) as mock_post:
+        call_ai("prompt", "system", provider="local", model="m1", use_cache=False)
+        call_ai("prompt", "system", provider="local", model="m1", use_cache=False)
+
+    assert mock_post.call_count == 2
+    assert tracker.get_cache_summary() == {}
+    assert not cache.get_path().exists()
+
+
+def test_failed_responses_are_not_cached(isolated_cache):
+    cache, _ = isolated_cache
+    with patch.object(ai_api, "AI_MAX_RETRIES", 0), \
+         patch.object(ai_api._get_session(), "post", return_value=make_response("not json at all")):
+        result = call_ai("prompt", "system", provider="local", model="m1")
+
+    # Non-JSON content falls through to the cleaned text, which must not be cached in JSON mode
+    assert result == "not json at all"
+    assert not cache.get_path().exists()
+
+
+def test_rejected_answers_are_not_cached_or_replayed(isolated_cache):
+    cache, _ = isolated_cache
+    accept = lambda answer: answer.get("category") == "Manga/Action"
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"category": "Invented/Thing"}')) as mock_post:
+        call_ai("prompt", "system", provider="local", model="m1", cache_if=accept)
+        call_ai("prompt", "system", provider="local", model="m1", cache_if=accept)
+    assert mock_post.call_count == 2 and not cache.get_path().exists()
+
+    # An entry cached before the check existed is not replayed either
+    key = AIResponseCache.make_key("local", "m1", "system", "prompt", 0.7, True, ai_api.LOCAL_AI_BASE_URL)
+    cache.put(key, {"category": "Invented/Thing"})
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"category": "Manga/Action"}')) as mock_post:
+        assert call_ai("prompt", "system", provider="local", model="m1", cache_if=accept) == {"category": "Manga/Action"}
+    assert mock_post.call_count == 1
+
+
+def test_cache_key_covers_endpoint(isolated_cache):
+    with patch.object(ai_api._get_session(), "post", return_value=make_response('{"ok": true}')) as mock_post:
+        with patch.object(ai_api, "LOCAL_AI_BASE_URL", "http://host-a:8000/v1"):
+            call_ai("prompt", "system", provider="local", model="m1")
+        with patch.object(ai_api, "LOCAL_AI_BASE_URL", "http://host-b:8000/v1"):
+            call_ai("prompt", "system", provider="local", model="m1")
+
+    assert mock_post.call_count == 2
@@ -0,0 +1,103 @@
+import json
+import pytest
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import ai_api
+from vibe_manga.vibe_manga.ai_api import StreamingJSONExtractor, TokenTracker, call_ai
+
+from ai_stub_server import StubAIServer, DEFAULT_ANSWER, tokenize
+
+
+@pytest.fixture
+def no_cache():
+    tracker = TokenTracker()
+    with patch.object(ai_api.response_cache, "enabled", False), patch.object(ai_api, "tracker", tracker):
+        yield tracker
+
+
+def feed_all(text):
+    extractor = StreamingJSONExtractor()
+    for token in tokenize(text):
+        parsed = extractor.feed(token)
+        if parsed is not None:
+            return parsed, extractor.text
+    return None, extractor.text
+
+
+def test_extractor_returns_as_soon_as_object_closes():
+    answer = {"category": "Manga/Action", "reason": "has {braces} and \"quotes\""}
+    parsed, consumed = feed_all(json.dumps(answer) + " and then a long explanation")
+
+    assert parsed == answer
+    assert "explanation" not in consumed
+
+
+def test_extractor_skips_reasoning_blocks_and_prose_braces():
+    text = (
+        "<think>maybe {\"category\": \"Wrong/Guess\"} is right</think>"
+        "Sure! Use {this} format:\n```json\n{\"category\": \"Manga/Romance\"}\n```"
+    )
+    parsed, _ = feed_all(text)
+
+    assert parsed == {"category": "Manga/Romance"}
+
+
+def test_extractor_waits_for_complete_object():
+    extractor = StreamingJSONExtractor()
+    assert extractor.feed('{"a": {"b": 1}') is None
+    assert extractor.feed('}') == {"a": {"b": 1}}
+
+
+def test_streaming_call_stops_reading_after_json(no_cache):
+    completion = json.dumps(DEFAULT_ANSWER) + " " + "trailing words " * 200
+    with StubAIServer(completion, token_delay=0.002) as server, \
+         patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+        result = call_ai("prompt", "system", provider="local", model="stub", stream=True)
+
+    assert result == DEFAULT_ANSWER
+    assert server.requests[0]["stream"] is True
+    assert server.tokens_sent < len(tokenize(completion))
+
+
+def test_non_streaming_call_against_stub_reuses_connection(no_cache):
+    with StubAIServer() as server, patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+        for i in range(3):
+            assert call_ai(f"prompt {i}", "system", provider="local", model="stub", stream=False) == DEFAULT_ANSWER
+
+    assert [r["stream"] for r in server.requests] == [False, False, False]
+    assert server.connections == 1
+    assert no_cache.get_summary()["stub"]["prompt"] == 3 * 42
+
+
+def test_streaming_text_mode_reads_full_completion(no_cache):
+    with StubAIServer("plain <think>hmm</think>answer text") as server, \
+         patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+        result = call_ai("prompt", "system", provider="local", model="stub", json_mode=False, stream=True)
+
+    assert result == "plain answer text"
+    assert no_cache.get_summary()["stub"]["completion"] == len(tokenize("plain <think>hmm</think>answer text"))
+
+
+def test_streaming_requests_usage_and_estimates_when_cut_short(no_cache):
+    completion = json.dumps(DEFAULT_ANSWER) + " " + "trailing words " * 200
+    with StubAIServer(completion) as server, patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+        call_ai("prompt", "system", provider="local", model="stub", stream=True)
+        call_ai("prompt", "system", provider="local", model="stub", json_mode=False, stream=True)
+
+    assert server.requests[0]["stream_options"] == {"include_usage": True}
+    # The full text stream reports real usage; the early JSON decision is estimated
+    assert no_cache.get_estimated_summary() == {"stub": 1}
+    usage = no_cache.get_summary()["stub"]
+    assert usage["prompt"] == 42 + ai_api._estimate_tokens("system") + ai_api._estimate_tokens("prompt")
+    assert usage["completion"] > len(tokenize(completion))
+
+
+def test_streaming_retries_without_stream_options_when_rejected(no_cache):
+    with StubAIServer(reject_stream_options=True) as server, patch.object(ai_api, "LOCAL_AI_BASE_URL", server.endpoint):
+        result = call_ai("prompt", "system", provider="local", model="stub", stream=True)
+
+    assert result == DEFAULT_ANSWER
+    assert "stream_options" in server.requests[0]
+    assert "stream_options" not in server.requests[1]
+    # The rejected response was read and released, so the retry reused its connection
+    assert server.connections == 1
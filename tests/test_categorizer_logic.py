@@ -147,3 +147,141 @@ def test_suggest_category_interactive_reject(mock_meta, mock_call_ai, mock_serie
     last_call_args = mock_call_ai.call_args_list[-1]
     prompt_sent = last_call_args[0][0]
     assert "The user REJECTED the new category 'Manga/NewOne'" in prompt_sent
+
+@patch("vibe_manga.vibe_manga.categorizer.call_ai")
+@patch("vibe_manga.vibe_manga.categorizer.get_or_create_metadata")
+def test_council_agents_run_concurrently(mock_meta, mock_call_ai, mock_series_and_library):
+    """
+    Moderator, Practical and Creative are independent and must be in flight together;
+    Consensus only starts once all three have answered.
+    """
+    import threading
+    series, library = mock_series_and_library
+    mock_meta.return_value = (SeriesMetadata(title="Test"), "src")
+
+    barrier = threading.Barrier(3, timeout=5)
+    seen_before_consensus = []
+
+    def fake_call_ai(prompt, system_role, **kwargs):
+        if "final_category" in prompt:
+            seen_before_consensus.append(mock_call_ai.call_count)
+            return {"final_category": "Manga", "final_sub_category": "Action", "reason": "ok", "confidence_score": 1.0}
+        # Deadlocks (BrokenBarrierError) unless all three agents run at the same time
+        barrier.wait()
+        if "Synopsis:" in prompt:
+            return {"classification": "SAFE"}
+        return {"category": "Manga/Action"}
+
+    mock_call_ai.side_effect = fake_call_ai
+
+    result = suggest_category(series, library, quiet=True)
+
+    assert result["moderation"] == {"classification": "SAFE"}
+    assert result["practical"] == {"category": "Manga/Action"}
+    assert result["creative"] == {"category": "Manga/Action"}
+    assert result["consensus"]["final_sub_category"] == "Action"
+    assert seen_before_consensus == [4]
+
+@patch("vibe_manga.vibe_manga.categorizer.call_ai")
+@patch("vibe_manga.vibe_manga.categorizer.get_or_create_metadata")
+def test_batch_categorization_one_request_per_role(mock_meta, mock_call_ai, mock_series_and_library):
+    """
+    Batch mode sends one request per role for the whole batch, validates every
+    consensus item, and retries only the invalid one individually.
+    """
+    from vibe_manga.vibe_manga.categorizer import suggest_categories_batch
+    _, library = mock_series_and_library
+    series_list = [Series(name=f"Series {i}", path=MagicMock()) for i in range(3)]
+    mock_meta.side_effect = lambda path, name: (SeriesMetadata(title=name, genres=["Action"], synopsis="x" * 5000), "src")
+
+    def fake_call_ai(prompt, system_role, **kwargs):
+        if "BATCH MODE" in prompt:
+            if '"results": [{"id": int, "final_category"' in prompt:
+                return {"results": [
+                    {"id": 0, "final_category": "Manga", "final_sub_category": "Action"},
+                    {"id": 1, "final_category": "Manga", "final_sub_category": "Invented"},
+                    {"id": 2, "final_category": "Manga", "final_sub_category": "Action"},
+                ]}
+            if "classification" in prompt:
+                return {"results": [{"id": i, "classification": "SAFE"} for i in range(3)]}
+            return {"results": [{"id": i, "category": "Manga/Action"} for i in range(3)]}
+        # Individual retry path (single-series council)
+        if "final_category" in prompt:
+            return {"final_category": "Manga", "final_sub_category": "Action", "reason": "retry"}
+        if "Synopsis:" in prompt:
+            return {"classification": "SAFE"}
+        return {"category": "Manga/Action"}
+
+    mock_call_ai.side_effect = fake_call_ai
+
+    results = suggest_categories_batch(series_list, library)
+
+    assert [r["consensus"]["final_sub_category"] for r in results] == ["Action", "Action", "Action"]
+    assert results[1]["consensus"]["reason"] == "retry"
+    assert all(r["metadata"].title == s.name for r, s in zip(results, series_list))
+
+    batch_prompts = [c[0][0] for c in mock_call_ai.call_args_list if "BATCH MODE" in c[0][0]]
+    # MODERATOR + PRACTICAL + CREATIVE + CONSENSUS for 3 series, plus 4 calls for the single retry
+    assert len(batch_prompts) == 4
+    assert mock_call_ai.call_count == 8
+    # Synopsis is truncated, not the full metadata dump
+    assert all("x" * 1000 not in p for p in batch_prompts)
+
+
+@patch("vibe_manga.vibe_manga.categorizer.call_ai")
+@patch("vibe_manga.vibe_manga.categorizer.get_or_create_metadata")
+def test_batch_categorization_retries_items_missing_from_response(mock_meta, mock_call_ai, mock_series_and_library):
+    """Items a role silently drops are not sent to batch consensus and get retried individually."""
+    from vibe_manga.vibe_manga.categorizer import suggest_categories_batch
+    _, library = mock_series_and_library
+    series_list = [Series(name=f"Series {i}", path=MagicMock()) for i in range(2)]
+    mock_meta.side_effect = lambda path, name: (SeriesMetadata(title=name), "src")
+
+    def fake_call_ai(prompt, system_role, **kwargs):
+        if "BATCH MODE" in prompt:
+            if '"results": [{"id": int, "final_category"' in prompt:
+                assert '"id": 1' not in prompt
+                return {"results": [{"id": 0, "final_category": "Manga", "final_sub_category": "Action"}]}
+            if "classification" in prompt:
+                return {"results": [{"id": 0, "classification": "SAFE"}]}  # id 1 missing
+            return {"results": [{"id": i, "category": "Manga/Action"} for i in range(2)]}
+        if "final_category" in prompt:
+            return {"final_category": "Manga", "final_sub_category": "Action", "reason": "single"}
+        return {"classification": "SAFE"} if "Synopsis:" in prompt else {"category": "Manga/Action"}
+
+    mock_call_ai.side_effect = fake_call_ai
+
+    results = suggest_categories_batch(series_list, library)
+
+    assert results[0]["consensus"]["final_sub_category"] == "Action"
+    assert results[1]["consensus"]["reason"] == "single"
+
+
+@patch("vibe_manga.vibe_manga.categorizer.call_ai")
+@patch("vibe_manga.vibe_manga.categorizer.get_or_create_metadata")
+def test_ai_cache_opt_out_reaches_every_call(mock_meta, mock_call_ai, mock_series_and_library):
+    """--no-ai-cache is a per-call option, not a switch on the shared cache."""
+    from vibe_manga.vibe_manga.categorizer import suggest_categories_batch
+    series, library = mock_series_and_library
+    mock_meta.return_value = (SeriesMetadata(title="Test"), "src")
+    mock_call_ai.return_value = None  # Every answer invalid: exercises batch, retry and consensus paths
+
+    suggest_categories_batch([series, Series(name="Other", path=MagicMock())], library, use_ai_cache=False)
+    suggest_category(series, library, quiet=True, use_ai_cache=False)
+
+    assert mock_call_ai.call_count > 0
+    assert all(c.kwargs["use_cache"] is False for c in mock_call_ai.call_args_list)
+
+
+@patch("vibe_manga.vibe_manga.categorizer.call_ai")
+@patch("vibe_manga.vibe_manga.categorizer.get_or_create_metadata")
+def test_only_valid_consensus_is_cacheable(mock_meta, mock_call_ai, mock_series_and_library):
+    series, library = mock_series_and_library
+    mock_meta.return_value = (SeriesMetadata(title="Test"), "src")
+    mock_call_ai.return_value = {"final_category": "Manga", "final_sub_category": "Action", "category": "Manga/Action"}
+
+    suggest_category(series, library, quiet=True)
+
+    cache_if = next(c.kwargs["cache_if"] for c in mock_call_ai.call_args_list if c.kwargs.get("cache_if"))
+    assert cache_if({"final_category": "Manga", "final_sub_category": "Action"})
+    assert not cache_if({"final_category": "Manga", "final_sub_category": "Invented"})
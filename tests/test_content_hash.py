@@ -0,0 +1,71 @@
+import zipfile
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import content_hash
+from vibe_manga.vibe_manga import dedupe_engine
+from vibe_manga.vibe_manga.content_hash import TieredHasher, sample_digest
+from vibe_manga.vibe_manga.dedupe_engine import ContentDuplicateDetector
+from vibe_manga.vibe_manga.inspection_store import InspectionStore
+from vibe_manga.vibe_manga.models import Category, Library, Series, Volume
+
+SAMPLE = content_hash.CONTENT_HASH_SAMPLE_BYTES
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return (path, len(data), path.name)
+
+
+def test_tiers_only_read_what_they_need(tmp_path):
+    base = bytes(range(256)) * (SAMPLE // 64)  # 4 samples long
+    middle_changed = bytearray(base)
+    middle_changed[len(base) // 2] ^= 0xFF
+    files = [
+        write(tmp_path / "a.cbz", base),
+        write(tmp_path / "b.cbz", base),
+        write(tmp_path / "c.cbz", bytes(middle_changed)),  # same head/tail, differs in the middle
+        write(tmp_path / "d.cbz", b"unique size"),
+    ]
+    hasher = TieredHasher()
+    with patch.object(content_hash, "full_digest", wraps=content_hash.full_digest) as full:
+        groups = hasher.find_duplicates(files)
+
+    assert list(groups.values()) == [["a.cbz", "b.cbz"]]
+    assert hasher.stats["sampled"] == 3  # d.cbz has a unique size and is never opened
+    assert full.call_count == 3
+
+
+def test_zip_central_directory_separates_archives(tmp_path):
+    def make_zip(path, names):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+            for name in names:
+                zf.writestr(name, b"x" * 100)
+        return path
+
+    a = make_zip(tmp_path / "a.cbz", ["001.jpg", "002.jpg"])
+    b = make_zip(tmp_path / "b.cbz", ["001.jpg", "003.jpg"])
+    assert a.stat().st_size == b.stat().st_size
+    with patch.object(content_hash, "CONTENT_HASH_SAMPLE_BYTES", 16):
+        assert sample_digest(a, a.stat().st_size) != sample_digest(b, b.stat().st_size)
+
+
+def test_detector_reuses_stored_digests(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedupe_engine, "get_inspection_store", lambda: store)
+    store = InspectionStore(tmp_path / "inspections.db")
+    series_dir = tmp_path / "Series"
+    series_dir.mkdir()
+    volumes = []
+    for name, data in (("v01.cbz", b"same"), ("v01 (copy).cbz", b"same"), ("v02.cbz", b"diff")):
+        (series_dir / name).write_bytes(data)
+        volumes.append(Volume(path=series_dir / name, name=name, size_bytes=len(data)))
+    sub = Category(name="Sub", path=tmp_path, series=[Series(name="Series", path=series_dir, volumes=volumes)])
+    library = Library(path=tmp_path, categories=[Category(name="Main", path=tmp_path, sub_categories=[sub])])
+
+    first = ContentDuplicateDetector(library, use_hashing=True).detect()
+    assert [sorted(v.name for v in d.volumes) for d in first] == [["v01 (copy).cbz", "v01.cbz"]]
+    assert store.lookup(series_dir / "v01.cbz").full_hash == first[0].file_hash
+
+    with patch.object(content_hash, "sample_digest") as sample, patch.object(content_hash, "full_digest") as full:
+        second = ContentDuplicateDetector(library, use_hashing=True).detect()
+    assert sample.call_count == 0 and full.call_count == 0
+    assert [d.file_hash for d in second] == [d.file_hash for d in first]
@@ -0,0 +1,92 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import dedupe_actions
+from vibe_manga.vibe_manga.dedupe_actions import ActionExecutor, independent_groups
+from vibe_manga.vibe_manga.dedupe_resolver import ResolutionAction, ResolutionPlan
+
+
+def make_series(root, name, files):
+    path = root / name
+    path.mkdir(parents=True)
+    for f in files:
+        (path / f).write_bytes(b"x" * 100)
+    return path
+
+
+def merge(group_id, target, *sources, conflicts=None):
+    return ResolutionPlan(group_id=group_id, action=ResolutionAction.MERGE, target_path=target,
+                          source_paths=list(sources), conflict_resolution=conflicts or {})
+
+
+def test_conflicts_resolved_in_memory(tmp_path):
+    target = make_series(tmp_path, "Berserk", ["Berserk v01.cbz", "Berserk v02.cbz"])
+    source = make_series(tmp_path, "Berserk (Dark Horse)", ["Berserk DH v01.cbz", "Berserk DH v02.cbz", "Berserk DH v03.cbz"])
+    plan = merge("g1", target, source, conflicts={"Berserk DH v01.cbz": "both", "Berserk DH v02.cbz": "skip"})
+
+    executor = ActionExecutor()
+    with patch.object(dedupe_actions.os, "scandir", wraps=dedupe_actions.os.scandir) as scandir:
+        result = executor.execute_plan(plan)
+    # The target is listed once; conflicts never go back to the filesystem
+    assert [call.args[0] for call in scandir.call_args_list].count(target) == 1
+
+    assert result.success and result.files_moved == 2
+    assert result.errors == ["Skipped (conflict): Berserk DH v02.cbz"]
+    assert sorted(p.name for p in target.iterdir()) == [
+        "Berserk v01.cbz", "Berserk v01_dup1.cbz", "Berserk v02.cbz", "Berserk v03.cbz", "series.json",
+    ]
+    assert result.files_renamed == 2 and result.bytes_moved == 200
+
+
+def test_dry_run_reports_without_moving(tmp_path):
+    target = make_series(tmp_path, "Monster", ["Monster v01.cbz"])
+    source = make_series(tmp_path, "Monster (2001)", ["Monster v02.cbz", "Monster v03.cbz"])
+
+    executor = ActionExecutor(simulate=True)
+    executor.execute_plans([merge("g1", target, source)])
+
+    assert sorted(p.name for p in source.iterdir()) == ["Monster v02.cbz", "Monster v03.cbz"]
+    summary = executor.get_execution_summary()
+    assert summary['files_moved'] == 2 and summary['bytes_moved'] == 200 and summary['bytes_copied'] == 0
+    assert executor.describe_throughput().startswith("Would move 2 files")
+
+
+def test_plans_grouped_by_shared_paths(tmp_path):
+    a, b, c, d = (tmp_path / n for n in "abcd")
+    plans = [
+        merge("1", a, b),
+        merge("2", c, d),
+        ResolutionPlan(group_id="3", action=ResolutionAction.DELETE, source_paths=[b / "v01.cbz"]),
+    ]
+    assert sorted(independent_groups(plans)) == [[0, 2], [1]]
+
+
+def test_cross_device_falls_back_to_copy(tmp_path):
+    target = make_series(tmp_path, "Vinland", ["Vinland v01.cbz"])
+    source = make_series(tmp_path, "Vinland Saga", ["Vinland v02.cbz"])
+
+    real_stat = dedupe_actions.os.stat
+    other_device = lambda p, *a, **k: type("st", (), {"st_dev": -1})() if Path(p) == target else real_stat(p, *a, **k)
+    with patch.object(dedupe_actions.os, "stat", side_effect=other_device):
+        result = ActionExecutor().execute_plan(merge("g1", target, source))
+
+    assert result.files_moved == 1 and result.files_renamed == 0 and result.bytes_copied == 100
+    assert (target / "Vinland v02.cbz").exists() and not source.exists()
+
+
+def test_case_insensitive_conflicts_and_no_silent_overwrite(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedupe_actions, "_CASE_INSENSITIVE", True)
+    index = dedupe_actions.DirectoryIndex()
+    target = make_series(tmp_path, "Blame", ["blame v01.cbz"])
+    assert index.exists(target / "Blame v01.cbz")
+
+    # A target file that was not planned as a replace is never overwritten
+    source = make_series(tmp_path, "Blame!", ["Blame v02.cbz"])
+    (target / "Blame v02.cbz").write_bytes(b"keep")
+    batch = dedupe_actions.MergeBatch(moves=[
+        dedupe_actions.FileMove(source / "Blame v02.cbz", target / "Blame v02.cbz", 100, rename=True),
+    ])
+    result = dedupe_actions.ActionResult(True, "")
+    ActionExecutor()._apply_batch(batch, result)
+    assert result.files_moved == 0 and result.errors
+    assert (target / "Blame v02.cbz").read_bytes() == b"keep"
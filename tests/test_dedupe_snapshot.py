@@ -0,0 +1,75 @@
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import dedupe_engine
+from vibe_manga.vibe_manga.dedupe_engine import DedupeEngine, LibrarySnapshot
+from vibe_manga.vibe_manga.models import Category, Library, Series, SeriesMetadata, SubGroup, Volume
+
+
+def make_library():
+    def series(name, mal_id=None, sizes=()):
+        s = Series(name=name, path=Path("/lib/Main/Sub") / name,
+                   volumes=[Volume(path=Path(f"/lib/{name}/v{n}.cbz"), name=f"v{n}.cbz", size_bytes=size)
+                            for n, size in enumerate(sizes)])
+        if mal_id:
+            s.metadata = SeriesMetadata(title=name, mal_id=mal_id)
+        return s
+
+    first = series("Blue Lock", mal_id=1, sizes=[1000, 2000])
+    first.sub_groups = [SubGroup(name="Extras", path=first.path / "Extras",
+                                 volumes=[Volume(path=Path("/lib/extra.cbz"), name="extra.cbz", size_bytes=3000, page_count=20)])]
+    second = series("Blue Lock (2018)", mal_id=1, sizes=[2000])
+    third = series("Vagabond", sizes=[5000])
+    sub = Category(name="Sub", path=Path("/lib/Main/Sub"), series=[first, second, third])
+    return Library(path=Path("/lib"), categories=[Category(name="Main", path=Path("/lib/Main"), sub_categories=[sub])])
+
+
+def test_snapshot_is_flat_and_aligned():
+    snapshot = LibrarySnapshot.build(make_library())
+    assert [s.name for s in snapshot.series] == ["Blue Lock", "Blue Lock (2018)", "Vagabond"]
+    assert snapshot.mal_ids == [1, 1, None]
+    assert [v.name for v in snapshot.volumes] == ["v0.cbz", "v1.cbz", "extra.cbz", "v0.cbz", "v0.cbz"]
+    assert snapshot.volume_series == [0, 0, 0, 1, 2]
+    assert snapshot.size_keys == ["1000", "2000", "3000_20", "2000", "5000"]
+    assert all(len(names) == len(norm) for names, norm in zip(snapshot.identities, snapshot.normalized))
+
+
+def test_engine_shares_one_traversal_and_times_detectors():
+    library = make_library()
+    with patch.object(dedupe_engine.LibrarySnapshot, "build", wraps=LibrarySnapshot.build) as build:
+        engine = DedupeEngine(library)
+        results = engine.detect_all()
+    assert build.call_count == 1
+    assert [g.mal_id for g in results['mal_id_conflicts']] == [1]
+    assert len(results['content_duplicates']) == 1
+    assert {'snapshot', 'mal-id', 'content', 'fuzzy', 'total'} <= set(engine.timings)
+
+    engine.detect_by_mode('mal-id')
+    assert set(engine.timings) == {'snapshot', 'mal-id'}
+
+
+def test_interrupted_fuzzy_run_does_not_wait_for_content_hashing():
+    engine = DedupeEngine(make_library())
+    release = threading.Event()
+
+    def slow_content():
+        release.wait(5)  # Stands in for hashing a large library
+        return ["late"]
+
+    def interrupted_fuzzy(progress=None, on_group=None):
+        engine.fuzzy_detector.interrupted = True
+        return []
+
+    try:
+        with patch.object(engine.content_detector, "detect", side_effect=slow_content), \
+             patch.object(engine.fuzzy_detector, "detect", side_effect=interrupted_fuzzy):
+            start = time.perf_counter()
+            results = engine.detect_all()
+            elapsed = time.perf_counter() - start
+    finally:
+        release.set()
+
+    assert elapsed < 2
+    assert results['content_duplicates'] == []
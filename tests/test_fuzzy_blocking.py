@@ -0,0 +1,121 @@
+import difflib
+import random
+import string
+from collections import Counter
+from pathlib import Path
+
+from vibe_manga.vibe_manga.dedupe_engine import FuzzyDuplicateDetector
+from vibe_manga.vibe_manga.fuzzy_blocking import NameBlocker, min_shared_qgrams, qgram_tokens, ratio_if_similar
+from vibe_manga.vibe_manga.models import Category, Library, Series
+
+
+def make_names(n, seed=7):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 8))) for _ in range(500)]
+    names = []
+    for _ in range(n):
+        if names and rng.random() < 0.2:
+            # Near-duplicate of an earlier name: one substitution or deletion
+            base = rng.choice(names)[0]
+            p = rng.randrange(len(base))
+            names.append([base[:p] + rng.choice("xyz") + base[p + 1:] if rng.random() < 0.5 else base[:p] + base[p + 1:]])
+        else:
+            names.append(["".join(rng.choice(words) for _ in range(rng.randint(2, 5)))])
+    return names
+
+
+def brute_force(names, threshold):
+    return {
+        (i, j)
+        for i in range(len(names))
+        for j in range(i + 1, len(names))
+        if difflib.SequenceMatcher(None, names[i][0], names[j][0]).ratio() >= threshold
+    }
+
+
+def test_blocking_finds_every_pair_brute_force_finds():
+    names = make_names(200)
+    for threshold in (0.95, 0.85):
+        expected = brute_force(names, threshold)
+        pairs = NameBlocker(threshold).candidate_pairs(names)
+        found = {(i, j) for i, j in pairs if ratio_if_similar(names[i][0], names[j][0], threshold) is not None}
+        assert found == expected
+        assert len(pairs) < len(names) * (len(names) - 1) // 20
+
+
+def test_shared_qgram_bound_holds():
+    rng = random.Random(1)
+    for _ in range(2000):
+        a = "".join(rng.choice("abcde") for _ in range(rng.randint(4, 30)))
+        b = list(a)
+        for _ in range(rng.randint(0, 2)):
+            b[rng.randrange(len(b))] = rng.choice("abcde")
+        b = "".join(b)
+        ratio = difflib.SequenceMatcher(None, a, b).ratio()
+        if ratio >= 0.9:
+            for q in (2, 3):
+                shared = sum((Counter(qgram_tokens(a, q)) & Counter(qgram_tokens(b, q))).values())
+                assert shared >= min_shared_qgrams(len(a), 0.9, q)
+
+
+def make_library(names):
+    sub = Category(name="Sub", path=Path("/lib/Manga/Sub"))
+    sub.series = [Series(name=n, path=Path(f"/lib/Manga/Sub/{n}")) for n in names]
+    return Library(path=Path("/lib"), categories=[Category(name="Manga", path=Path("/lib/Manga"), sub_categories=[sub])])
+
+
+def test_detector_groups_and_reports_best_similarity():
+    library = make_library([
+        "Yotsuba to!", "Yotsubato", "One Piece", "Kaguya-sama Love is War", "Kaguya sama Love is Wars", "Berserk",
+    ])
+    groups = FuzzyDuplicateDetector(library).detect()
+    assert sorted(sorted(s.name for s in g.items) for g in groups) == [
+        ["Kaguya sama Love is Wars", "Kaguya-sama Love is War"], ["Yotsuba to!", "Yotsubato"],
+    ]
+    by_first = {g.items[0].name: g for g in groups}
+    assert by_first["Yotsuba to!"].confidence == 1.0
+    assert by_first["Kaguya-sama Love is War"].confidence == difflib.SequenceMatcher(None, "kaguyasamaloveiswar", "kaguyasamaloveiswars").ratio()
+
+
+def make_near_duplicate_library(n=600):
+    return make_library([n[0].title() for n in make_names(n, seed=11)])
+
+
+def group_signature(groups):
+    return [([s.name for s in g.items], g.confidence) for g in groups]
+
+
+def test_parallel_scoring_matches_serial(monkeypatch):
+    monkeypatch.setattr("vibe_manga.vibe_manga.dedupe_engine.FUZZY_SHARD_SIZE", 25)
+    monkeypatch.setattr("vibe_manga.vibe_manga.dedupe_engine.FUZZY_PARALLEL_MIN_PAIRS", 0)
+    library = make_near_duplicate_library()
+
+    serial = FuzzyDuplicateDetector(library, workers=1).detect()
+    streamed, updates = [], []
+    parallel = FuzzyDuplicateDetector(library, workers=3).detect(
+        progress=lambda done, total: updates.append((done, total)), on_group=streamed.append
+    )
+
+    assert serial and group_signature(parallel) == group_signature(serial)
+    assert streamed == parallel
+    assert updates[-1][0] == updates[-1][1]
+
+
+def test_interrupt_returns_groups_found_so_far(monkeypatch):
+    monkeypatch.setattr("vibe_manga.vibe_manga.dedupe_engine.FUZZY_SHARD_SIZE", 25)
+    library = make_near_duplicate_library()
+    full = FuzzyDuplicateDetector(library, workers=1).detect()
+
+    calls = []
+
+    def progress(done, total):
+        calls.append(done)
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+
+    detector = FuzzyDuplicateDetector(library, workers=1)
+    partial = detector.detect(progress=progress)
+
+    assert detector.interrupted
+    assert 0 < len(partial) < len(full)
+    assert group_signature(partial) == group_signature(full[:len(partial)])
@@ -0,0 +1,98 @@
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from vibe_manga.vibe_manga.grab_status_store import GrabStatusStore, entry_key
+from vibe_manga.vibe_manga.cli.grab import grab
+
+
+def make_entries(n):
+    return [{"name": f"Series {i} v01", "magnet_link": f"magnet:?xt=urn:btih:{i:040x}"} for i in range(n)]
+
+
+def write_match_file(path, entries):
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+
+def test_changes_are_buffered_until_threshold(tmp_path):
+    match_file = tmp_path / "matches.json"
+    entries = make_entries(5)
+    store = GrabStatusStore(match_file, flush_seconds=3600, flush_every=3)
+
+    store.set(entries[0], "grabbed")
+    store.set(entries[1], "skipped")
+    assert entries[0]["grab_status"] == "grabbed"
+    assert not store.journal_path.exists() and len(store) == 2
+
+    store.set(entries[2], "skipped")  # Third change triggers the flush
+    assert len(store) == 0
+    assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_flush_after_interval(tmp_path):
+    store = GrabStatusStore(tmp_path / "matches.json", flush_seconds=0, flush_every=1000)
+    store.set(make_entries(1)[0], "grabbed")
+    assert store.journal_path.exists() and len(store) == 0
+
+
+def test_apply_overlays_last_write_and_ignores_torn_line(tmp_path):
+    match_file = tmp_path / "matches.json"
+    entries = make_entries(3)
+    store = GrabStatusStore(match_file, flush_seconds=3600)
+    store.set(entries[0], "grabbed")
+    store.flush()
+    store.set(entries[0], "pulled")
+    store.set(entries[1], "skipped")
+    store.flush()
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"key": "' + entry_key(entries[2]) + '", "sta')  # Crash mid-append
+
+    fresh = make_entries(3)
+    assert GrabStatusStore(match_file).apply(fresh) == 2
+    assert [e.get("grab_status") for e in fresh] == ["pulled", "skipped", None]
+
+    # The next append starts on a new line
+    store.set(entries[2], "blacklisted")
+    store.flush()
+    fresh = make_entries(3)
+    GrabStatusStore(match_file).apply(fresh)
+    assert fresh[2]["grab_status"] == "blacklisted"
+
+
+def test_merge_writes_match_file_and_truncates_journal(tmp_path):
+    match_file = tmp_path / "matches.json"
+    write_match_file(match_file, make_entries(3))
+    store = GrabStatusStore(match_file)
+    store.set(make_entries(3)[1], "grabbed")
+    store.flush()
+
+    assert store.merge()
+
+    saved = json.loads(match_file.read_text(encoding="utf-8"))
+    assert [e.get("grab_status") for e in saved] == [None, "grabbed", None]
+    assert not store.journal_path.exists()
+
+
+def test_entries_without_magnet_use_name(tmp_path):
+    store = GrabStatusStore(tmp_path / "matches.json", flush_seconds=0)
+    store.set({"name": "No magnet"}, "skipped")
+    entry = {"name": "No magnet"}
+    GrabStatusStore(tmp_path / "matches.json").apply([entry])
+    assert entry["grab_status"] == "skipped"
+
+
+def test_cli_merge_status(tmp_path):
+    match_file = tmp_path / "matches.json"
+    write_match_file(match_file, make_entries(2))
+    store = GrabStatusStore(match_file, flush_seconds=0)
+    store.set(make_entries(2)[0], "grabbed")
+
+    with patch("vibe_manga.vibe_manga.cli.grab.process_grab") as process_grab:
+        result = CliRunner().invoke(grab, ["--input-file", str(match_file), "--merge-status"])
+
+    assert result.exit_code == 0, result.output
+    process_grab.assert_not_called()
+    saved = json.loads(match_file.read_text(encoding="utf-8"))
+    assert saved[0]["grab_status"] == "grabbed"
+    assert not store.journal_path.exists()
@@ -0,0 +1,130 @@
+import threading
+import time
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import inspection_service
+from vibe_manga.vibe_manga.inspection_service import InspectionResult, InspectionService, disk_order
+from vibe_manga.vibe_manga.inspection_store import InspectionStore
+from vibe_manga.vibe_manga.models import Volume
+
+
+def make_volume(path, good=True):
+    if good:
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("001.jpg", b"page")
+    else:
+        path.write_bytes(b"not a zip")
+    return Volume(path=path, name=path.name, size_bytes=path.stat().st_size)
+
+
+def test_results_and_reuse(tmp_path):
+    store = InspectionStore(tmp_path / "inspections.db")
+    service = InspectionService(workers=2, store=store)
+    volumes = [
+        make_volume(tmp_path / "v01.cbz"),
+        make_volume(tmp_path / "v02.cbz", good=False),
+        Volume(path=tmp_path / "missing.cbz", name="missing.cbz", size_bytes=0),
+    ]
+
+    first = {r.volume.name: r for r in service.run(volumes, check_integrity=True, checksum=True)}
+    assert first["v01.cbz"].ok and first["v01.cbz"].page_count == 1 and first["v01.cbz"].checksum
+    assert first["v02.cbz"].corrupt and first["v02.cbz"].error == "Not a valid zip file"
+    assert not first["missing.cbz"].exists
+
+    second = {r.volume.name: r for r in service.run(volumes, check_integrity=True, checksum=True)}
+    assert second["v01.cbz"].cached and second["v01.cbz"].checksum == first["v01.cbz"].checksum
+    assert second["v02.cbz"].cached and second["v02.cbz"].corrupt
+
+
+def test_bounded_queue_and_timeout(tmp_path):
+    release = threading.Event()
+    consumed = []
+
+    def volumes():
+        for n in range(20):
+            consumed.append(n)
+            yield Volume(path=Path(tmp_path / f"v{n:02d}.cbz"), name=f"v{n:02d}", size_bytes=0)
+
+    def fake_inspect(volume, check_integrity, checksum, store):
+        if volume.name == "v00":
+            time.sleep(2)  # stuck on a slow share
+        elif volume.name != "v01":
+            release.wait(5)
+        return InspectionResult(volume)
+
+    service = InspectionService(workers=2, timeout=0.5, store=InspectionStore(tmp_path / "db"))
+    with patch.object(inspection_service, "inspect_file", side_effect=fake_inspect):
+        results = service.run(volumes())
+        first = next(results)
+        assert first.volume.name == "v01"
+        assert len(consumed) <= 2 * inspection_service.INSPECTION_IN_FLIGHT_PER_WORKER + 1
+        release.set()
+        rest = list(results)
+
+    names = [first.volume.name] + [r.volume.name for r in rest]
+    assert sorted(names) == [f"v{n:02d}" for n in range(20)]
+    timed_out = [r for r in rest if r.timed_out]
+    assert [r.volume.name for r in timed_out] == ["v00"]
+
+
+def test_disk_order_sorts_by_inode_and_puts_missing_last(tmp_path):
+    vols = [make_volume(tmp_path / f"v{n:02d}.cbz") for n in range(5)]
+    missing = Volume(path=tmp_path / "gone.cbz", name="gone.cbz", size_bytes=0)
+    ordered = disk_order([missing] + vols[::-1], workers=2)
+    assert ordered[-1] is missing
+    inodes = [v.path.stat().st_ino for v in ordered[:-1]]
+    assert inodes == sorted(inodes)
+
+
+def test_enrich_volumes_updates_volumes_as_results_stream(tmp_path, monkeypatch):
+    from vibe_manga.vibe_manga.scanner import enrich_volumes
+
+    store = InspectionStore(tmp_path / "inspections.db")
+    monkeypatch.setattr(inspection_service, "get_inspection_store", lambda: store)
+    good, bad = make_volume(tmp_path / "v01.cbz"), make_volume(tmp_path / "v02.cbz", good=False)
+    missing = Volume(path=tmp_path / "gone.cbz", name="gone.cbz", size_bytes=0)
+
+    seen = [r.volume.name for r in enrich_volumes([good, bad, missing], deep=True, workers=2)]
+    assert sorted(seen) == ["gone.cbz", "v01.cbz", "v02.cbz"]
+    assert (good.page_count, good.is_corrupt) == (1, False)
+    assert (bad.page_count, bad.is_corrupt) == (0, True)
+    assert missing.is_corrupt
+
+
+def test_perform_deep_analysis_on_library(tmp_path, monkeypatch):
+    from vibe_manga.vibe_manga.cli.base import perform_deep_analysis
+    from vibe_manga.vibe_manga.models import Category, Library, Series
+
+    store = InspectionStore(tmp_path / "inspections.db")
+    monkeypatch.setattr(inspection_service, "get_inspection_store", lambda: store)
+    vol = make_volume(tmp_path / "v01.cbz")
+    series = Series(name="Series", path=tmp_path, volumes=[vol])
+    sub = Category(name="Sub", path=tmp_path, series=[series])
+    library = Library(path=tmp_path, categories=[Category(name="Main", path=tmp_path, sub_categories=[sub])])
+
+    perform_deep_analysis([library], deep=True, verify=True)
+    assert (vol.page_count, vol.is_corrupt) == (1, False)
+
+
+def test_verify_table_keeps_name_order_as_results_arrive(tmp_path):
+    from vibe_manga.vibe_manga import dedupe_resolver
+    from vibe_manga.vibe_manga.dedupe_resolver import DuplicateResolver
+    from vibe_manga.vibe_manga.models import Series
+
+    volumes = [make_volume(tmp_path / name) for name in ("v03.cbz", "v01.cbz", "v02.cbz")]
+    series = Series(name="S", path=tmp_path, volumes=volumes)
+    resolver = DuplicateResolver(whitelist_path=tmp_path / "whitelist.json")
+
+    def reverse_completion(ordered, **kwargs):
+        for volume in reversed(ordered):
+            yield InspectionResult(volume=volume, size=1024, checksum="abcdef0123")
+
+    tables = []
+    with patch.object(resolver.inspection_service, "run", side_effect=reverse_completion), \
+         patch.object(dedupe_resolver.Live, "update", lambda self, table: tables.append(table)):
+        resolver._verify_integrity([series])
+
+    shown = [list(table.columns[0].cells) for table in tables]
+    assert shown == [["v03.cbz"], ["v02.cbz", "v03.cbz"], ["v01.cbz", "v02.cbz", "v03.cbz"]]
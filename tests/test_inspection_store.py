@@ -0,0 +1,62 @@
+import os
+import zipfile
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import inspection_store
+from vibe_manga.vibe_manga.inspection_store import InspectionStore, inspect_volume
+
+
+def make_cbz(path, names=("001.jpg", "002.png", "info.txt")):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, name.encode())
+    return path
+
+
+def inspect(path, store, check_integrity=False):
+    with patch.object(inspection_store, "inspect_archive_details", wraps=inspection_store.inspect_archive_details) as details:
+        result = inspect_volume(path, check_integrity=check_integrity, store=store)
+    return result, details.call_count
+
+
+def test_inspection_is_reused_until_the_file_changes(tmp_path):
+    store = InspectionStore(tmp_path / "inspections.db")
+    cbz = make_cbz(tmp_path / "v01.cbz")
+
+    assert inspect(cbz, store) == ((2, False), 1)
+    assert inspect(cbz, store) == ((2, False), 0)
+    # A cheap inspection does not answer --verify; a verified one answers both
+    assert inspect(cbz, store, check_integrity=True) == ((2, False), 1)
+    assert inspect(cbz, store, check_integrity=True) == ((2, False), 0)
+
+    record = store.lookup(cbz)
+    assert record.formats == [".jpg", ".png", ".txt"]
+    assert set(record.crcs) == {"001.jpg", "002.png", "info.txt"}
+
+    make_cbz(cbz, names=("001.jpg",))
+    os.utime(cbz, ns=(1, 1))
+    assert inspect(cbz, store) == ((1, False), 1)
+
+
+def test_records_follow_renames_and_survive_reopen(tmp_path):
+    path = tmp_path / "inspections.db"
+    store = InspectionStore(path)
+    cbz = make_cbz(tmp_path / "v01.cbz")
+    inspect_volume(cbz, store=store)
+    store.update(cbz, full_hash="abc")
+    store.close()
+
+    moved = cbz.rename(tmp_path / "Series v01.cbz")
+    reopened = InspectionStore(path)
+    record = reopened.lookup(moved)
+    assert record.page_count == 2 and record.full_hash == "abc"
+    assert record.path == str(moved)
+
+
+def test_superseded_json_digest_cache_is_removed(tmp_path):
+    legacy = tmp_path / "vibe_manga_content_hashes.json"
+    legacy.write_text('{"/old/path.cbz": {"size": 1, "mtime": 0, "sample": "x"}}', encoding="utf-8")
+    store = InspectionStore(tmp_path / "inspections.db")
+
+    assert store.lookup(make_cbz(tmp_path / "v01.cbz")) is None
+    assert not legacy.exists()
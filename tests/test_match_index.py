@@ -0,0 +1,61 @@
+import json
+import os
+
+from vibe_manga.vibe_manga import grabber
+from vibe_manga.vibe_manga.grabber import generate_search_candidates, get_matched_or_parsed_name
+from vibe_manga.vibe_manga.match_index import MatchIndex, load_match_index, magnet_info_hash
+
+HASH = "0123456789abcdef0123456789abcdef01234567"
+
+
+def make_entries():
+    return [
+        {"name": "Series A v01", "magnet_link": f"magnet:?xt=urn:btih:{HASH.upper()}&dn=a", "matched_id": "Manga/Series A"},
+        {"name": "Series A v01", "magnet_link": "magnet:?xt=urn:btih:" + "f" * 40},
+        {"name": "Series B v02", "magnet_link": "magnet:?xt=urn:btih:" + "e" * 40},
+    ]
+
+
+def test_lookups():
+    index = MatchIndex(make_entries())
+    assert index.by_name("Series A v01")["matched_id"] == "Manga/Series A"
+    assert len(index.all_by_name("Series A v01")) == 2
+    assert index.by_name("missing") is None
+    assert magnet_info_hash(make_entries()[0]["magnet_link"]) == HASH
+    # Renamed torrent still resolves through its info-hash
+    assert index.for_torrent({"name": "renamed", "hash": HASH})["name"] == "Series A v01"
+
+
+def test_load_reuses_until_file_changes(tmp_path):
+    path = tmp_path / "matches.json"
+    path.write_text(json.dumps(make_entries()), encoding="utf-8")
+
+    first = load_match_index(path)
+    assert load_match_index(path) is first
+
+    path.write_text(json.dumps(make_entries()[:1]), encoding="utf-8")
+    os.utime(path, ns=(0, 1))
+    second = load_match_index(path)
+    assert second is not first and len(second) == 1
+
+    assert len(load_match_index(tmp_path / "missing.json")) == 0
+
+
+def test_matched_name_uses_index():
+    series = type("S", (), {"name": "Series A"})()
+    name = get_matched_or_parsed_name("Series A v01", match_index=MatchIndex(make_entries()), series_map={"Manga/Series A": series})
+    assert name == "[green]Series A[/green]"
+
+
+def test_search_candidates_memoized_and_copied(monkeypatch):
+    calls = []
+    real = grabber._generate_search_candidates
+    monkeypatch.setattr(grabber, "_generate_search_candidates", lambda text: calls.append(text) or real(text))
+    monkeypatch.setattr(grabber, "_candidate_cache", {})
+
+    first = generate_search_candidates("[Group] Some Title v01-05")
+    first.append("mutated")
+    second = generate_search_candidates("[Group] Some Title v01-05")
+
+    assert calls == ["[Group] Some Title v01-05"]
+    assert "mutated" not in second
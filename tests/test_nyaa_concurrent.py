@@ -0,0 +1,141 @@
+import pytest
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import constants as c
+from vibe_manga.vibe_manga import nyaa_scraper
+from vibe_manga.vibe_manga.nyaa_scraper import scrape_nyaa, scrape_nyaa_queries
+
+from nyaa_fixture_server import NyaaFixtureServer, make_pages, make_row
+
+
+@pytest.fixture
+def serve():
+    """Starts a fixture server and points the scraper URL templates at it."""
+    servers = []
+
+    def _serve(listings, delay=0.0):
+        server = NyaaFixtureServer(listings, delay=delay).__enter__()
+        servers.append(server)
+        patchers = [
+            patch.object(c, "NYAA_ENGLISH_TRANSLATED_URL_TEMPLATE", server.front_page_template),
+            patch.object(c, "NYAA_SEARCH_URL_TEMPLATE", server.search_template),
+        ]
+        for p in patchers:
+            p.start()
+            servers.append(p)
+        return server
+
+    yield _serve
+    for item in reversed(servers):
+        if isinstance(item, NyaaFixtureServer):
+            item.__exit__()
+        else:
+            item.stop()
+
+
+def scrape(queries, **kwargs):
+    kwargs.setdefault("rate_limit_per_second", 1000)
+    kwargs.setdefault("show_progress", False)
+    return scrape_nyaa_queries(queries, **kwargs)
+
+
+def test_results_are_merged_in_page_order(serve):
+    pages = make_pages(6, per_page=10)
+    # Early pages are slowest to respond, so completions arrive out of order
+    server = serve({"": pages}, delay=0.02)
+
+    results = scrape([None], pages=6, max_workers=4, pages_in_flight=4)
+
+    expected = [row["magnet"] for page in pages for row in page]
+    assert [r["magnet_link"] for r in results] == expected
+    assert server.max_concurrent > 1
+    first = results[0]
+    assert first["torrent_link"] == c.NYAA_BASE_URL + "/download/1.torrent"
+    assert first["date"] == str(pages[0][0]["timestamp"])
+    assert (first["seeders"], first["leechers"], first["completed"]) == (1, 1, 3)
+
+
+def test_stop_at_timestamp_discards_rows_and_pages_after_stop(serve):
+    pages = make_pages(8, per_page=10)
+    stop_row = pages[2][4]
+    serve({"": pages})
+
+    results = scrape([None], pages=8, stop_at_timestamp=stop_row["timestamp"], max_workers=4, pages_in_flight=3)
+
+    expected = [row["magnet"] for page in pages for row in page][:24]
+    assert [r["magnet_link"] for r in results] == expected
+
+
+def test_search_stops_at_first_empty_page(serve):
+    server = serve({"Berserk": make_pages(2, per_page=5)})
+
+    results = scrape(["Berserk"], pages=10, max_workers=2, pages_in_flight=2)
+
+    assert len(results) == 10
+    # Look-ahead may fetch a page or two past the end, but not the whole budget
+    assert max(server.requested_pages("Berserk")) <= 4
+
+
+def test_queries_are_deduplicated_by_magnet(serve):
+    shared = make_row(500, 1_700_000_000)
+    serve({
+        "Re:Zero": [[make_row(1, 1_700_000_100), shared]],
+        "Re Zero": [[shared, make_row(2, 1_699_999_000)]],
+    })
+    known = {make_row(2, 0)["magnet"]}
+
+    results = scrape(["Re:Zero", "Re Zero"], pages=2, known_magnets=known)
+
+    assert [r["magnet_link"] for r in results] == [make_row(1, 0)["magnet"], shared["magnet"]]
+
+
+def test_unexpected_page_error_skips_page_and_keeps_other_queries(serve):
+    serve({"Broken": [[make_row(1, 1_700_000_100)]], "Fine": [[make_row(2, 1_700_000_000)]]})
+    parse_page = nyaa_scraper._parse_page
+
+    def flaky_parse(text):
+        if f"{1:040x}" in text:  # Info-hash of the only row on the "Broken" page
+            raise ValueError("unexpected markup")
+        return parse_page(text)
+
+    with patch.object(nyaa_scraper, "_parse_page", side_effect=flaky_parse):
+        results = scrape(["Broken", "Fine"], pages=1)
+
+    assert [r["magnet_link"] for r in results] == [make_row(2, 0)["magnet"]]
+
+
+def test_request_rate_is_globally_bounded(serve):
+    server = serve({"A": make_pages(3, per_page=2), "B": make_pages(3, per_page=2, start_id=100)})
+
+    scrape(["A", "B"], pages=3, rate_limit_per_second=20, max_workers=4, pages_in_flight=3)
+
+    starts = sorted(ts for _, _, ts in server.requests)
+    assert len(starts) == 6
+    # Six request starts at 20/s span at least five intervals
+    assert starts[-1] - starts[0] >= 5 * (1 / 20) * 0.9
+
+
+def test_scrape_nyaa_single_query_wrapper(serve):
+    serve({"": make_pages(1, per_page=3)})
+
+    results = scrape_nyaa(pages=1)
+
+    assert len(results) == 3
+
+
+def test_page_budget_caps_total_pages_and_favours_earlier_queries(serve):
+    server = serve({
+        "A": make_pages(5, per_page=2),
+        "B": make_pages(5, per_page=2, start_id=100),
+        "C": make_pages(5, per_page=2, start_id=200),
+    })
+    stats = {}
+
+    results = scrape(["A", "B", "C"], pages=5, page_budget=7, max_workers=1, pages_in_flight=2, query_stats=stats)
+
+    assert len(server.requests) == 7
+    counts = [len(server.requested_pages(q)) for q in "ABC"]
+    assert counts[0] >= counts[1] >= counts[2]
+    assert server.requested_pages("A") == list(range(1, counts[0] + 1))
+    assert sum(s["pages"] for s in stats.values()) == 7
+    assert len(results) == 14
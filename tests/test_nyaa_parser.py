@@ -0,0 +1,65 @@
+from vibe_manga.vibe_manga.nyaa_scraper import Torrent, _parse_page, _parse_page_soup
+
+from nyaa_fixture_server import ROW_TEMPLATE, make_pages, make_row, render_page
+
+IRREGULAR_ROWS = """
+<tr><td>too</td><td>few</td><td>cells</td></tr>
+<tr class="danger">
+  <td>cat</td>
+  <td><a href="/view/9" title="  Spaced &amp; Escaped &quot;Title&quot;  ">x</a></td>
+  <td><a href="/download/9.torrent">t</a> <a href="magnet:?xt=urn:btih:nine">m</a></td>
+  <td> <span>1.5</span> GiB <!-- note --> </td>
+  <td>no timestamp attribute</td>
+  <td> 4 </td><td>0</td><td>12</td>
+</tr>
+<tr>
+  <td>cat</td><td><a href="/view/10" title="No magnet">x</a></td>
+  <td><a href="/download/10.torrent">t</a></td>
+  <td>1 MiB</td><td data-timestamp="1">d</td><td>1</td><td>1</td><td>1</td>
+</tr>
+<tr>
+  <td>cat</td><td><a href="/view/11" title="Bad count">x</a></td>
+  <td><a href="/download/11.torrent">t</a><a href="magnet:?xt=11">m</a></td>
+  <td>1 MiB</td><td data-timestamp="1">d</td><td>n/a</td><td>1</td><td>1</td>
+</tr>
+"""
+
+
+def test_fast_parser_matches_soup_parser_on_generated_pages():
+    for rows in make_pages(3, per_page=40):
+        page = render_page(rows)
+        assert _parse_page(page) == _parse_page_soup(page)
+
+
+def test_fast_parser_matches_soup_parser_on_irregular_rows():
+    page = render_page([make_row(1, 1_700_000_000)]).replace("</tbody>", IRREGULAR_ROWS + "</tbody>")
+
+    fast = _parse_page(page)
+
+    assert fast == _parse_page_soup(page)
+    assert [t.name for t in fast] == ["Series 1 v01-05 (Digital)", 'Spaced & Escaped "Title"']
+    assert fast[1] == Torrent(
+        name='Spaced & Escaped "Title"',
+        torrent_link="https://nyaa.si/download/9.torrent",
+        magnet_link="magnet:?xt=urn:btih:nine",
+        size="1.5 GiB",
+        date=None,
+        seeders=4,
+        leechers=0,
+        completed=12,
+    )
+    assert all(type(t.magnet_link) is str for t in fast)
+
+
+def test_rows_outside_torrent_table_are_ignored():
+    stray = "<table><tbody>" + ROW_TEMPLATE.format(**make_row(2, 1)) + "</tbody></table>"
+    page = render_page([make_row(1, 1)]).replace("<body>", "<body>" + stray)
+
+    assert [t.name for t in _parse_page(page)] == ["Series 1 v01-05 (Digital)"]
+    assert _parse_page(page) == _parse_page_soup(page)
+
+
+def test_empty_documents_parse_to_no_rows():
+    assert _parse_page("") == []
+    assert _parse_page("   ") == []
+    assert _parse_page(render_page([])) == []
@@ -167,4 +167,71 @@ def test_organize_execution_direct_target(mock_index_cls, mock_get_root, mock_sc
     
     # Verify destination output
     assert "Archive/Old" in result.output
-    assert "Naruto" in result.output
\ No newline at end of file
+    assert "Naruto" in result.output
+
+def test_iter_ai_suggestions_parallel_preserves_order(mock_library):
+    """Parallel scheduling keeps results in candidate order and bounds in-flight work."""
+    import threading
+    import time
+    from vibe_manga.vibe_manga.cli.organize import iter_ai_suggestions
+
+    candidates = [Series(name=f"S{i}", path=Path(f"Manga/Action/S{i}")) for i in range(6)]
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_suggest(series, library, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        # Later series finish first to prove results are re-ordered
+        time.sleep(0.02 * (6 - int(series.name[1:])))
+        with lock:
+            state["active"] -= 1
+        return {"consensus": {"final_category": "Manga", "final_sub_category": series.name}}
+
+    with patch("vibe_manga.vibe_manga.cli.organize.suggest_category", side_effect=fake_suggest):
+        results = list(iter_ai_suggestions(candidates, mock_library, parallel=3))
+
+    assert [s.name for s, _ in results] == [s.name for s in candidates]
+    assert [r["consensus"]["final_sub_category"] for _, r in results] == [s.name for s in candidates]
+    assert 1 < state["peak"] <= 3
+
+
+@patch("vibe_manga.vibe_manga.cli.organize.suggest_category")
+@patch("vibe_manga.vibe_manga.cli.organize.run_scan_with_progress")
+@patch("vibe_manga.vibe_manga.cli.organize.get_library_root")
+@patch("vibe_manga.vibe_manga.cli.organize.LibraryIndex")
+def test_organize_parallel_auto(mock_index_cls, mock_get_root, mock_scan, mock_suggest, mock_library):
+    """--parallel categorizes every candidate and reports each decision."""
+    runner = CliRunner()
+    mock_scan.return_value = mock_library
+    mock_get_root.return_value = Path("/tmp/lib")
+    mock_suggest.side_effect = lambda series, library, **kwargs: {
+        "consensus": {"final_category": "Manga", "final_sub_category": f"Sorted{series.name}"},
+    }
+
+    result = runner.invoke(cli, ["organize", "--simulate", "--auto", "--parallel", "2"])
+
+    assert result.exit_code == 0
+    assert mock_suggest.call_count == 2
+    assert "Manga/SortedNaruto" in result.output
+    assert "Manga/SortedHorimiya" in result.output
+
+
+def test_iter_ai_suggestions_batches_candidates(mock_library):
+    """batch_size groups candidates into suggest_categories_batch calls and keeps order."""
+    from vibe_manga.vibe_manga.cli.organize import iter_ai_suggestions
+
+    candidates = [Series(name=f"S{i}", path=Path(f"Manga/Action/S{i}")) for i in range(5)]
+
+    def fake_batch(series_list, library, **kwargs):
+        assert "quiet" not in kwargs
+        return [{"consensus": {"final_category": "Manga", "final_sub_category": s.name}} for s in series_list]
+
+    with patch("vibe_manga.vibe_manga.cli.organize.suggest_categories_batch", side_effect=fake_batch) as mock_batch, \
+         patch("vibe_manga.vibe_manga.cli.organize.suggest_category") as mock_single:
+        results = list(iter_ai_suggestions(candidates, mock_library, batch_size=2, parallel=2, quiet=True))
+
+    assert [len(c[0][0]) for c in mock_batch.call_args_list] == [2, 2, 1]
+    mock_single.assert_not_called()
+    assert [r["consensus"]["final_sub_category"] for _, r in results] == [s.name for s in candidates]
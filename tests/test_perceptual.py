@@ -0,0 +1,69 @@
+import io
+import zipfile
+
+import numpy as np
+from PIL import Image
+
+from vibe_manga.vibe_manga import dedupe_engine
+from vibe_manga.vibe_manga.dedupe_engine import PerceptualDuplicateDetector
+from vibe_manga.vibe_manga.inspection_store import InspectionStore
+from vibe_manga.vibe_manga.models import Category, Library, Series, Volume
+from vibe_manga.vibe_manga.perceptual import hamming, page_fingerprint, sample_page_names
+
+
+def make_page(seed):
+    # Blocky random "artwork" so pages are distinct but survive re-encoding
+    rng = np.random.RandomState(seed)
+    blocks = rng.randint(0, 256, size=(12, 8), dtype=np.uint8)
+    return Image.fromarray(np.kron(blocks, np.ones((25, 25), dtype=np.uint8)))
+
+
+def encode(img, fmt):
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **({"quality": 70} if fmt == "JPEG" else {}))
+    return buf.getvalue()
+
+
+def make_volume(path, seeds, fmt):
+    ext = ".jpg" if fmt == "JPEG" else ".png"
+    with zipfile.ZipFile(path, "w") as zf:
+        for n, seed in enumerate(seeds):
+            zf.writestr(f"{n:03d}{ext}", encode(make_page(seed), fmt))
+    return Volume(path=path, name=path.name, size_bytes=path.stat().st_size)
+
+
+def test_fingerprints_survive_reencoding():
+    png = page_fingerprint(encode(make_page(1), "PNG"))
+    jpeg = page_fingerprint(encode(make_page(1), "JPEG"))
+    other = page_fingerprint(encode(make_page(2), "PNG"))
+    assert hamming(png, jpeg) <= 6
+    assert hamming(png, other) > 30
+    assert page_fingerprint(encode(Image.new("L", (200, 300), 255), "PNG")) is None  # blank
+
+
+def test_sampling_is_spread_and_in_page_order():
+    names = [f"{n:03d}.jpg" for n in range(100)] + ["info.txt"]
+    sampled = sample_page_names(names)
+    assert len(sampled) == 12
+    assert sampled == sorted(sampled)
+    assert sampled[0] != "000.jpg" and sampled[-1] != "099.jpg"
+
+
+def test_detector_groups_reencoded_copies(tmp_path, monkeypatch):
+    store = InspectionStore(tmp_path / "inspections.db")
+    monkeypatch.setattr(dedupe_engine, "get_inspection_store", lambda: store)
+    seeds = list(range(100, 130))
+    original = make_volume(tmp_path / "Series v01.cbz", seeds, "PNG")
+    # Another release: JPEG, with an extra credits page up front
+    reencoded = make_volume(tmp_path / "Series v01 [Other].cbz", [999] + seeds, "JPEG")
+    different = make_volume(tmp_path / "Series v02.cbz", list(range(200, 230)), "PNG")
+
+    sub = Category(name="Sub", path=tmp_path, series=[
+        Series(name="Series", path=tmp_path, volumes=[original, reencoded, different]),
+    ])
+    library = Library(path=tmp_path, categories=[Category(name="Main", path=tmp_path, sub_categories=[sub])])
+
+    groups = PerceptualDuplicateDetector(library, workers=2).detect()
+    assert [sorted(v.name for v in g.volumes) for g in groups] == [["Series v01 [Other].cbz", "Series v01.cbz"]]
+    assert groups[0].similarity >= 0.6
+    assert store.lookup(original.path).page_hashes
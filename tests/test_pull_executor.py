@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from vibe_manga.vibe_manga.pull_executor import SerialKeyExecutor
+from vibe_manga.vibe_manga.grabber import PullJob, _run_pull_job, _apply_library_updates
+from vibe_manga.vibe_manga.models import Library
+
+
+def test_same_key_runs_in_order_one_at_a_time():
+    order = []
+    active = {"a": 0}
+    overlap = []
+
+    def task(n):
+        active["a"] += 1
+        overlap.append(active["a"])
+        time.sleep(0.01)
+        order.append(n)
+        active["a"] -= 1
+        return n
+
+    with SerialKeyExecutor(4) as executor:
+        futures = [executor.submit("series-a", task, n) for n in range(5)]
+
+    assert [f.result() for f in futures] == list(range(5))
+    assert order == list(range(5))
+    assert max(overlap) == 1
+
+
+def test_different_keys_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    with SerialKeyExecutor(2) as executor:
+        # Deadlocks (BrokenBarrierError) unless both tasks run at the same time
+        futures = [executor.submit(key, barrier.wait) for key in ("a", "b")]
+
+    for f in futures:
+        f.result()
+
+
+def test_exception_does_not_block_key():
+    def boom():
+        raise ValueError("copy failed")
+
+    with SerialKeyExecutor(2) as executor:
+        failed = executor.submit("a", boom)
+        after = executor.submit("a", lambda: "ok")
+
+    with pytest.raises(ValueError):
+        failed.result()
+    assert after.result() == "ok"
+
+
+def make_job(tmp_path, index, name):
+    src = tmp_path / "downloads" / f"{name}.cbz"
+    src.parent.mkdir(exist_ok=True)
+    src.write_bytes(b"x" * 10)
+    return PullJob(
+        index=index,
+        torrent={"hash": f"{index:040x}", "name": name},
+        display_name=name,
+        series_name="Series",
+        content_path=str(src),
+        transfer_plan=[{"src": src, "dst_name": f"Series v0{index}.cbz", "v": [float(index)], "c": [], "u": [], "skip": False}],
+        target_dir=tmp_path / "library" / "Series",
+        stage_dir=tmp_path / "stage" / f"{index:040x}",
+    )
+
+
+def test_jobs_for_one_series_import_and_update_library_once(tmp_path, monkeypatch):
+    saves = []
+    monkeypatch.setattr("vibe_manga.vibe_manga.grabber.save_library_cache", saves.append)
+    jobs = [make_job(tmp_path, i, f"Series v0{i}") for i in (1, 2)]
+    (tmp_path / "library" / "Series").mkdir(parents=True)
+
+    with SerialKeyExecutor(2) as executor:
+        futures = [executor.submit(job.series_key, _run_pull_job, job) for job in jobs]
+    assert [f.result().status for f in futures] == ["done", "done"]
+    assert sorted(p.name for p in (tmp_path / "library" / "Series").iterdir()) == ["Series v01.cbz", "Series v02.cbz"]
+
+    library = Library(path=tmp_path / "library", categories=[])
+    _apply_library_updates(library, jobs)
+
+    assert len(saves) == 1
+    uncat = library.categories[0]
+    series = uncat.sub_categories[0].series
+    assert len(series) == 1 and len(series[0].volumes) == 2
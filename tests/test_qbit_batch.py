@@ -0,0 +1,181 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga.qbit_api import QBitAPI
+from vibe_manga.vibe_manga import grabber
+from vibe_manga.vibe_manga.grabber import process_grab
+from vibe_manga.vibe_manga.grab_status_store import GrabStatusStore
+from vibe_manga.vibe_manga.matcher import parse_entry
+
+from qbit_fake_server import FakeQBittorrent, magnet_hash
+
+
+def magnet(i: int) -> str:
+    return f"magnet:?xt=urn:btih:{i:040x}"
+
+
+@pytest.fixture
+def qbt():
+    with FakeQBittorrent() as server, \
+         patch.dict(os.environ, {"QBIT_URL": server.url, "QBIT_USER": "admin", "QBIT_PASS": "adminadmin"}):
+        yield server
+
+
+def test_adds_are_sent_once_per_tag(qbt):
+    batch = QBitAPI().batch(backoff=0)
+    for i in range(3):
+        batch.add(magnet(i), key=i, tag="VibeManga")
+    batch.add(magnet(3), key=3, tag="Other", savepath="Elsewhere")
+    batch.add(magnet(0), key="dup", tag="VibeManga")  # Same magnet queued twice
+    assert len(batch) == 4
+
+    result = batch.flush()
+
+    adds = qbt.calls("/api/v2/torrents/add")
+    assert len(adds) == 2
+    assert adds[0]["urls"].split("\n") == [magnet(0), magnet(1), magnet(2)]
+    assert (adds[1]["tags"], adds[1]["savepath"]) == ("Other", "Elsewhere")
+    assert sorted(result.succeeded, key=str) == [0, 1, 2, 3, "dup"]
+    assert result.failed == [] and len(batch) == 0
+
+
+def test_failed_request_is_retried(qbt):
+    qbt.fail_next = [500]
+    batch = QBitAPI().batch(backoff=0)
+    batch.add(magnet(1), key="a")
+
+    assert batch.flush().succeeded == ["a"]
+    assert len(qbt.calls("/api/v2/torrents/add")) == 2
+    assert magnet_hash(magnet(1)) in qbt.torrents
+
+
+def test_group_reported_failed_after_retries(qbt):
+    qbt.fail_next = [500] * 10
+    batch = QBitAPI().batch(retries=2, backoff=0)
+    batch.delete("aaa", key="a")
+    batch.delete("bbb", key="b")
+
+    result = batch.flush()
+
+    assert result.failed == ["a", "b"] and result.succeeded == []
+    assert len(qbt.calls("/api/v2/torrents/delete")) == 3
+
+
+def test_deletes_relogin_on_expired_session(qbt):
+    qbt.add("aaa")
+    qbt.add("bbb")
+    qbit = QBitAPI()
+    assert qbit.login()
+    qbt.expire_sessions()
+
+    with qbit.batch(backoff=0) as batch:
+        batch.delete("aaa")
+        batch.delete("bbb")
+
+    assert qbt.torrents == {}
+    assert len(qbt.calls("/api/v2/auth/login")) == 2
+    # The 403'd request is replayed once after logging in, not retried per hash
+    assert [c["hashes"] for c in qbt.calls("/api/v2/torrents/delete")] == ["aaa|bbb", "aaa|bbb"]
+
+
+def test_auto_add_submits_one_request_and_journals_status(qbt, tmp_path):
+    entries = [
+        parse_entry({"name": f"[Group] Series {title} v01-05 (Digital)", "magnet_link": magnet(i), "seeders": "5", "size": "1.0 GiB"})
+        for i, title in enumerate(["Alpha", "Beta", "Gamma"])
+    ]
+    match_file = tmp_path / "matches.json"
+    match_file.write_text(json.dumps(entries), encoding="utf-8")
+
+    before = match_file.read_text(encoding="utf-8")
+
+    process_grab("next", str(match_file), False, str(tmp_path), auto_add_only=True)
+
+    adds = qbt.calls("/api/v2/torrents/add")
+    assert len(adds) == 1
+    assert adds[0]["urls"].split("\n") == [magnet(0), magnet(1), magnet(2)]
+    # Statuses are journaled instead of rewriting the match file
+    assert match_file.read_text(encoding="utf-8") == before
+    assert GrabStatusStore(match_file).apply(entries) == 3
+    assert [e["grab_status"] for e in entries] == ["grabbed"] * 3
+
+
+def test_auto_add_respects_max_downloads(qbt, tmp_path):
+    entries = [
+        parse_entry({"name": f"[Group] Series {title} v01-05 (Digital)", "magnet_link": magnet(i), "seeders": "5", "size": "1.0 GiB"})
+        for i, title in enumerate(["Alpha", "Beta", "Gamma"])
+    ]
+    match_file = tmp_path / "matches.json"
+    match_file.write_text(json.dumps(entries), encoding="utf-8")
+
+    process_grab("next", str(match_file), False, str(tmp_path), auto_add_only=True, max_downloads=2)
+
+    GrabStatusStore(match_file).apply(entries)
+    assert [e.get("grab_status") for e in entries] == ["grabbed", "grabbed", None]
+    assert len(qbt.calls("/api/v2/torrents/add")) == 1
+
+
+def test_auto_add_queues_a_torrent_listed_under_two_groups_once(qbt, tmp_path):
+    # The same release listed under two titles lands in two groups
+    entries = [
+        parse_entry({"name": f"[Group] {title} v01-05 (Digital)", "magnet_link": magnet(0), "seeders": "5", "size": "1.0 GiB"})
+        for title in ["Alpha", "Beta"]
+    ]
+    match_file = tmp_path / "matches.json"
+    match_file.write_text(json.dumps(entries), encoding="utf-8")
+
+    with patch.object(grabber.console, "print") as printed:
+        process_grab("next", str(match_file), False, str(tmp_path), auto_add_only=True, max_downloads=2)
+
+    adds = qbt.calls("/api/v2/torrents/add")
+    assert [url for add in adds for url in add["urls"].split("\n")] == [magnet(0)]
+    assert sum("Added:" in str(call.args[0]) for call in printed.call_args_list) == 1
+
+
+def test_pull_restarts_torrents_it_did_not_remove(qbt, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Sync state file
+    qbt.add("aaa", name="Series A v01", progress=1.0)
+    qbt.add("bbb", name="Series B v01", progress=1.0)
+    match_file = tmp_path / "matches.json"
+    match_file.write_text("[]", encoding="utf-8")
+
+    # Preparation fails for every torrent, so nothing is pulled
+    with patch.object(grabber, "_prepare_pull_job", return_value=None), \
+         patch.object(grabber, "PULL_TEMPDIR", ""):
+        grabber.process_pull(input_file=str(match_file), assume_yes=True)
+
+    assert [c["hashes"] for c in qbt.calls("/api/v2/torrents/stop")] == ["aaa|bbb"]
+    assert [c["hashes"] for c in qbt.calls("/api/v2/torrents/start")] == ["aaa|bbb"]
+    assert {t["state"] for t in qbt.torrents.values()} == {"uploading"}
+
+
+def test_pull_cleans_up_finished_jobs_when_a_later_one_raises(qbt, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Sync state file
+    qbt.add("aaa", name="Series A v01", progress=1.0)
+    qbt.add("bbb", name="Series B v01", progress=1.0)
+    entries = [{"name": "Series A v01", "grab_status": "grabbed"}, {"name": "Series B v01", "grab_status": "grabbed"}]
+    match_file = tmp_path / "matches.json"
+    match_file.write_text(json.dumps(entries), encoding="utf-8")
+
+    def prepare(i, total, t, *args):
+        return grabber.PullJob(index=i, torrent=t, display_name=t["name"], series_name=t["name"], content_path="", transfer_plan=[])
+
+    def run(job, **kwargs):
+        if job.torrent["hash"] == "bbb":
+            raise OSError("disk full")
+        job.status = "done"
+        return job
+
+    with patch.object(grabber, "_prepare_pull_job", side_effect=prepare), \
+         patch.object(grabber, "_run_pull_job", side_effect=run), \
+         patch.object(grabber, "PULL_MAX_WORKERS", 1), \
+         patch.object(grabber, "PULL_TEMPDIR", ""), \
+         patch.object(grabber.click, "prompt", side_effect=AssertionError("prompted")), \
+         pytest.raises(OSError):
+        grabber.process_pull(input_file=str(match_file), assume_yes=True)
+
+    # The finished torrent is removed and marked pulled; the failed one is started again
+    assert list(qbt.torrents) == ["bbb"] and qbt.torrents["bbb"]["state"] == "uploading"
+    GrabStatusStore(match_file).apply(entries)
+    assert [e["grab_status"] for e in entries] == ["pulled", "grabbed"]
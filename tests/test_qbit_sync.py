@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga.qbit_api import QBitAPI
+from vibe_manga.vibe_manga.qbit_sync import QBitSyncClient, get_torrents_with_sync
+
+from qbit_fake_server import FakeQBittorrent
+
+
+@pytest.fixture
+def qbt():
+    with FakeQBittorrent() as server, \
+         patch.dict(os.environ, {"QBIT_URL": server.url, "QBIT_USER": "admin", "QBIT_PASS": "adminadmin"}):
+        yield server
+
+
+def test_first_sync_is_full_then_deltas(qbt, tmp_path):
+    qbt.add("aaa", name="Series A v01", progress=0.5)
+    qbt.add("bbb", name="Series B v01", progress=0.1)
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+
+    first = client.sync()
+    assert first.full_update and sorted(first.added) == ["aaa", "bbb"]
+    assert client.torrents["aaa"]["hash"] == "aaa"
+
+    qbt.update("aaa", progress=1.0, state="uploading")
+    qbt.remove("bbb")
+    qbt.add("ccc", name="Series C v01")
+    second = client.sync()
+
+    assert not second.full_update
+    assert (second.added, second.updated, second.removed, second.completed) == (["ccc"], ["aaa"], ["bbb"], ["aaa"])
+    assert client.torrents["aaa"]["state"] == "uploading"
+    assert client.torrents["aaa"]["name"] == "Series A v01"  # Untouched fields are kept
+    assert set(client.torrents) == {"aaa", "ccc"}
+
+
+def test_state_persists_across_invocations_without_the_session(qbt, tmp_path):
+    qbt.add("aaa", name="Series A v01")
+    QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json").sync()
+    logins = len(qbt.calls("/api/v2/auth/login"))
+    assert "sid" not in (tmp_path / "sync.json").read_text().lower()
+
+    qbt.update("aaa", progress=0.7)
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+    delta = client.sync()
+
+    assert len(qbt.calls("/api/v2/auth/login")) == logins + 1  # Logs in again
+    # A new session starts with a full snapshot, still diffed against the cached table
+    assert delta.full_update and delta.updated == ["aaa"] and not delta.added
+    assert client.torrents["aaa"]["progress"] == 0.7
+
+
+def test_expired_session_recovers_with_full_update(qbt, tmp_path):
+    qbt.add("aaa", name="Series A v01", progress=0.2)
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+    client.sync()
+
+    qbt.expire_sessions()
+    qbt.update("aaa", progress=1.0)
+    delta = client.sync()
+
+    assert delta.full_update
+    # Completion is still detected by comparing against the cached table
+    assert delta.completed == ["aaa"]
+
+
+def test_get_torrents_filters_by_tag(qbt, tmp_path):
+    qbt.add("aaa", name="Mine", tags="VibeManga, other")
+    qbt.add("bbb", name="Not mine", tags="linux-isos")
+
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+    assert [t["name"] for t in client.get_torrents(tag="VibeManga")] == ["Mine"]
+
+
+def test_fallback_to_torrents_info_when_sync_unavailable(tmp_path):
+    qbit = QBitAPI()
+    with patch.object(qbit, "get_maindata", return_value=None), \
+         patch.object(qbit, "get_torrents_info", return_value=[{"hash": "x"}]) as info:
+        assert get_torrents_with_sync(qbit, tag="VibeManga", state_path=tmp_path / "sync.json") == [{"hash": "x"}]
+    info.assert_called_once_with(tag="VibeManga")
+
+
+def test_watch_reports_completions_after_baseline(qbt, tmp_path):
+    qbt.add("aaa", name="Done already", progress=1.0)
+    qbt.add("bbb", name="Downloading", progress=0.4)
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+    stop = threading.Event()
+    reported = []
+
+    def on_complete(torrents):
+        reported.extend(t["name"] for t in torrents)
+        stop.set()
+
+    watcher = threading.Thread(target=client.watch, args=(on_complete,), kwargs={"tag": "VibeManga", "interval": 0.01, "stop_event": stop})
+    watcher.start()
+    while client.rid == 0:  # Wait for the baseline round
+        time.sleep(0.005)
+    qbt.update("bbb", progress=1.0, state="uploading")
+    watcher.join(timeout=5)
+
+    assert not watcher.is_alive()
+    assert reported == ["Downloading"]
+
+
+def test_watch_without_baseline_reports_the_first_round(qbt, tmp_path):
+    qbt.add("aaa", name="Series A v01", progress=1.0)
+    qbt.add("bbb", name="Series B v01", progress=0.5)
+    client = QBitSyncClient(QBitAPI(), state_path=tmp_path / "sync.json")
+    client.sync()  # What the startup pull saw
+    qbt.update("bbb", progress=1.0)
+
+    reported = []
+    client.watch(reported.append, tag="VibeManga", interval=0, max_rounds=1, baseline=False)
+
+    assert [[t["hash"] for t in batch] for batch in reported] == [["bbb"]]
+
+
+def test_watch_pull_runs_unattended(tmp_path):
+    from vibe_manga.vibe_manga import grabber
+
+    def fake_watch(self, on_complete, tag, interval, baseline):
+        assert baseline is False
+        on_complete([{"name": "Series A v01"}])
+
+    with patch.object(grabber.QBitSyncClient, "watch", fake_watch), \
+         patch.object(grabber, "QBitAPI"), \
+         patch.object(grabber.QBitSyncClient, "_load_state"), \
+         patch.object(grabber, "process_pull") as process_pull, \
+         patch.object(grabber.click, "confirm", side_effect=AssertionError("prompted")):
+        grabber.watch_pull(pause=True, root_path=str(tmp_path), input_file="m.json")
+
+    # Once for torrents already complete at startup, once for the finished one
+    assert process_pull.call_count == 2
+    assert all(c.kwargs["assume_yes"] is True and c.kwargs["pause"] is False for c in process_pull.call_args_list)
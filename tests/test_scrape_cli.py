@@ -7,8 +7,8 @@ import os
 def test_scrape_with_query():
     runner = CliRunner()
     
-    # Mock scrape_nyaa to return empty list
-    with patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa') as mock_scrape, \
+    # Mock scrape_nyaa_queries to return empty list
+    with patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries') as mock_scrape, \
          patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value={}), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history'):
         
@@ -19,20 +19,16 @@ def test_scrape_with_query():
         
         assert result.exit_code == 0
         
-        # Should call twice: 'Re:Zero' and 'Re Zero'
-        assert mock_scrape.call_count == 2
-        
-        calls = mock_scrape.call_args_list
-        args1, kwargs1 = calls[0]
-        args2, kwargs2 = calls[1]
-        
-        assert kwargs1['query'] == 'Re:Zero'
-        assert kwargs2['query'] == 'Re Zero'
+        # 'Re:Zero' and 'Re Zero' search the same terms, so only one is scheduled
+        assert mock_scrape.call_count == 1
+        assert mock_scrape.call_args[0][0] == ['Re:Zero']
+        # Searches never stop at the incremental timestamp
+        assert mock_scrape.call_args[1]['stop_at_timestamp'] is None
 
 def test_scrape_no_query():
     runner = CliRunner()
     
-    with patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa') as mock_scrape, \
+    with patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries') as mock_scrape, \
          patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value={}), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history'):
         
@@ -42,5 +38,27 @@ def test_scrape_no_query():
         
         assert result.exit_code == 0
         assert mock_scrape.call_count == 1
-        # Should be called with query=None
-        assert mock_scrape.call_args[1]['query'] is None
+        # Should be called with the front page (query None) only
+        assert mock_scrape.call_args[0][0] == [None]
+
+def test_scrape_appends_new_entries_to_store(tmp_path):
+    runner = CliRunner()
+    output = tmp_path / "out.jsonl"
+    existing = {"name": "Old", "magnet_link": "magnet:old", "date": "100"}
+    fresh = {"name": "New", "magnet_link": "magnet:new", "date": "200"}
+
+    with patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', return_value=[existing, fresh]) as mock_scrape, \
+         patch('vibe_manga.vibe_manga.cli.scrape.get_latest_timestamp_from_nyaa', return_value=200), \
+         patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value={}), \
+         patch('vibe_manga.vibe_manga.cli.scrape.save_query_history'):
+
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(existing) + "\n")
+
+        result = runner.invoke(scrape, ['--output', str(output)])
+
+        assert result.exit_code == 0
+        # Incremental scrape stops at the stored high-water mark
+        assert mock_scrape.call_args[1]['stop_at_timestamp'] == 100
+        with open(output, encoding='utf-8') as f:
+            assert [json.loads(line)["name"] for line in f] == ["Old", "New"]
@@ -23,7 +23,7 @@ def test_scrape_continuity():
     with patch('vibe_manga.vibe_manga.cli.scrape.run_scan_with_progress', return_value=library), \
          patch('vibe_manga.vibe_manga.cli.scrape.get_library_root', return_value=Path("/tmp")), \
          patch('vibe_manga.vibe_manga.cli.scrape.find_gaps') as mock_find_gaps, \
-         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa', return_value=[]) as mock_scrape_nyaa, \
+         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', return_value=[]) as mock_scrape_nyaa, \
          patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value={}), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history'):
          
@@ -43,10 +43,9 @@ def test_scrape_continuity():
         # Should scrape for "Incomplete Series"
         # "Complete Series" should be skipped
         
-        # Collect all query args passed to scrape_nyaa
-        called_queries = [call.kwargs.get('query') for call in mock_scrape_nyaa.call_args_list]
+        # Collect all queries passed to scrape_nyaa_queries
+        called_queries = [q for call in mock_scrape_nyaa.call_args_list for q in call.args[0]]
         
-        # Flatten list if needed (though queries are passed one by one)
         print(f"Called queries: {called_queries}")
         
         assert "Incomplete Series" in called_queries
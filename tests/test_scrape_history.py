@@ -4,6 +4,14 @@ from unittest.mock import patch, mock_open, MagicMock
 from click.testing import CliRunner
 from vibe_manga.vibe_manga.cli.scrape import scrape, SCRAPE_HISTORY_FILENAME, SCRAPE_QUERY_COOLDOWN_DAYS
 
+
+def fake_scrape(queries, query_stats=None, **kwargs):
+    # Report one fetched page per query, like a real search with no results
+    if query_stats is not None:
+        for q in queries:
+            query_stats[q] = {"pages": 1, "new": 0}
+    return []
+
 def test_scrape_history_update():
     runner = CliRunner()
     
@@ -12,7 +20,7 @@ def test_scrape_history_update():
     
     with patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value=mock_history), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history') as mock_save, \
-         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa', return_value=[]) as mock_scrape_nyaa:
+         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', side_effect=fake_scrape) as mock_scrape_nyaa:
         
         # Run with query
         result = runner.invoke(scrape, ['-q', 'TestQuery'])
@@ -36,7 +44,7 @@ def test_scrape_history_cooldown():
     
     with patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value=mock_history), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history') as mock_save, \
-         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa', return_value=[]) as mock_scrape_nyaa:
+         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', side_effect=fake_scrape) as mock_scrape_nyaa:
         
         # Run with same query
         result = runner.invoke(scrape, ['-q', 'TestQuery'])
@@ -56,7 +64,7 @@ def test_scrape_history_force_bypass():
     
     with patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value=mock_history), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history') as mock_save, \
-         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa', return_value=[]) as mock_scrape_nyaa:
+         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', side_effect=fake_scrape) as mock_scrape_nyaa:
         
         # Run with force
         result = runner.invoke(scrape, ['-q', 'TestQuery', '--force'])
@@ -78,7 +86,7 @@ def test_scrape_history_expired_cooldown():
     
     with patch('vibe_manga.vibe_manga.cli.scrape.load_query_history', return_value=mock_history), \
          patch('vibe_manga.vibe_manga.cli.scrape.save_query_history') as mock_save, \
-         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa', return_value=[]) as mock_scrape_nyaa:
+         patch('vibe_manga.vibe_manga.cli.scrape.scrape_nyaa_queries', side_effect=fake_scrape) as mock_scrape_nyaa:
         
         # Run
         result = runner.invoke(scrape, ['-q', 'TestQuery'])
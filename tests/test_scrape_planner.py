@@ -0,0 +1,75 @@
+from vibe_manga.vibe_manga.cli.scrape import generate_search_alternatives
+from vibe_manga.vibe_manga.scrape_planner import ScrapeTarget, gap_size, plan_queries
+
+DAY = 24 * 3600
+NOW = 1_700_000_000
+
+
+def target(name, gaps=1, manual=False):
+    return ScrapeTarget(name=name, alternatives=generate_search_alternatives(name), gap_size=gaps, manual=manual)
+
+
+def test_gap_size_counts_missing_units():
+    assert gap_size(["Missing Vol #3-7", "Missing Ch #12"]) == 6
+    assert gap_size(["No volumes found."]) == 1
+
+
+def test_equivalent_and_subsumed_alternatives_are_coalesced():
+    plan = plan_queries([target("Re:Zero"), target("The Tower of God Season 2")], {}, now_ts=NOW)
+
+    assert plan.query_strings == ["Re:Zero", "Tower God"]
+    assert plan.coalesced["Re Zero"] == "Re:Zero"
+    assert plan.coalesced["The Tower of God Season 2"] == "Tower God"
+
+
+def test_single_term_queries_do_not_absorb_other_series():
+    plan = plan_queries([target("Berserk"), target("Berserk of Gluttony")], {}, now_ts=NOW)
+
+    assert set(plan.query_strings) == {"Berserk", "Berserk Gluttony"}
+
+
+def test_identical_searches_across_series_are_merged_with_combined_gaps():
+    plan = plan_queries([target("Blue Lock", gaps=2), target("Blue Lock", gaps=3), target("Dandadan", gaps=1)], {}, now_ts=NOW)
+
+    assert plan.query_strings == ["Blue Lock", "Dandadan"]
+    # Same target name is only counted once
+    assert plan.queries[0].gap_size == 2
+
+
+def test_order_by_expected_yield():
+    targets = [target("Alpha Series", gaps=2), target("Beta Series", gaps=10), target("Gamma Series", gaps=10), target("Manual Pick", manual=True)]
+    history = {"Gamma Series": NOW - 40 * DAY}  # Ran recently-ish and found nothing
+    yields = {"Beta Series": {"last_success": NOW - 200 * DAY}}
+
+    plan = plan_queries(targets, history, yield_history=yields, now_ts=NOW, cooldown_seconds=30 * DAY)
+
+    assert plan.query_strings == ["Manual Pick", "Beta Series", "Gamma Series", "Alpha Series"]
+
+
+def test_cooldown_applies_to_surviving_query():
+    history = {"Re:Zero": NOW - DAY}
+    plan = plan_queries([target("Re:Zero")], history, now_ts=NOW, cooldown_seconds=30 * DAY)
+    assert plan.query_strings == [] and plan.cooling_down == ["Re:Zero"]
+
+    forced = plan_queries([target("Re:Zero")], history, now_ts=NOW, cooldown_seconds=30 * DAY, force=True)
+    assert forced.query_strings == ["Re:Zero"]
+
+
+def test_non_ascii_titles_are_planned():
+    plan = plan_queries([target("進撃の巨人", manual=True)], {}, now_ts=NOW)
+    assert plan.query_strings[0] == "進撃の巨人"
+
+
+def test_queries_without_terms_pass_through():
+    plan = plan_queries([ScrapeTarget(name="odd", alternatives=["!!!", "!!!"], manual=True)], {}, now_ts=NOW)
+    assert plan.query_strings == ["!!!"]
+
+
+def test_merged_query_keeps_largest_page_cap():
+    plan = plan_queries([
+        ScrapeTarget(name="A", alternatives=["Re:Zero"], max_pages=2),
+        ScrapeTarget(name="B", alternatives=["Re Zero"], max_pages=5),
+        ScrapeTarget(name="C", alternatives=["Tower God"], max_pages=3),
+        ScrapeTarget(name="D", alternatives=["Tower of God"], max_pages=4),
+    ], {}, now_ts=NOW)
+    assert plan.page_caps == {"Re:Zero": 5, "Tower God": 4}
@@ -0,0 +1,93 @@
+import json
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import scrape_store
+from vibe_manga.vibe_manga.scrape_store import ScrapeStore, open_scrape_store
+
+
+def entry(n, ts=None):
+    return {"name": f"Series {n}", "magnet_link": f"magnet:?xt={n}", "date": str(ts if ts is not None else 1000 + n)}
+
+
+def test_append_dedupes_by_magnet_and_tracks_high_water(tmp_path):
+    store = ScrapeStore(tmp_path / "scrape.jsonl")
+    assert len(store) == 0 and store.high_water is None
+
+    added = store.append([entry(1), entry(2), entry(1)])
+    assert [e["name"] for e in added] == ["Series 1", "Series 2"]
+    assert store.append([entry(2), entry(3)]) == [entry(3)]
+
+    reopened = ScrapeStore(tmp_path / "scrape.jsonl")
+    assert len(reopened) == 3
+    assert reopened.high_water == 1003
+    assert "magnet:?xt=2" in reopened
+    # Newest first, like the legacy file; append order on request
+    assert [e["name"] for e in reopened.iter_entries()] == ["Series 3", "Series 2", "Series 1"]
+    assert [e["name"] for e in reopened.iter_entries(newest_first=False)] == ["Series 1", "Series 2", "Series 3"]
+
+
+def test_incremental_append_does_not_reread_entries(tmp_path):
+    path = tmp_path / "scrape.jsonl"
+    ScrapeStore(path).append([entry(n) for n in range(100)])
+    before = path.read_text(encoding="utf-8")
+
+    store = ScrapeStore(path)
+    with patch.object(ScrapeStore, "iter_entries", side_effect=AssertionError("full read")):
+        store.append([entry(500)])
+        assert store.high_water == 1500
+
+    # Existing lines are untouched; the new entry is appended
+    assert path.read_text(encoding="utf-8") == before + json.dumps(entry(500)) + "\n"
+
+
+def test_stale_sidecars_are_rebuilt(tmp_path):
+    path = tmp_path / "scrape.jsonl"
+    ScrapeStore(path).append([entry(1), entry(2)])
+    # Simulate an append interrupted after the data write (torn last line included)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry(3)) + "\n" + '{"name": "torn')
+
+    store = ScrapeStore(path)
+    assert len(store) == 3
+    assert store.high_water == 1003
+    assert "magnet:?xt=3" in store
+
+
+def test_legacy_json_array_is_read_and_converted_on_append(tmp_path):
+    legacy = tmp_path / "scrape.json"
+    legacy.write_text(json.dumps([entry(2), entry(1)]), encoding="utf-8")
+    store = ScrapeStore(tmp_path / "scrape.jsonl", legacy_path=legacy)
+
+    assert len(store) == 2 and store.high_water == 1002
+    assert [e["name"] for e in store.iter_entries()] == ["Series 2", "Series 1"]
+
+    assert store.append([entry(1), entry(3)]) == [entry(3)]
+    lines = (tmp_path / "scrape.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Series 1", "Series 2", "Series 3"]
+    assert [e["name"] for e in store.iter_entries()] == ["Series 3", "Series 2", "Series 1"]
+    assert len(ScrapeStore(tmp_path / "scrape.jsonl")) == 3
+
+
+def test_reverse_read_spans_blocks(tmp_path, monkeypatch):
+    path = tmp_path / "scrape.jsonl"
+    ScrapeStore(path).append([entry(n) for n in range(50)])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"name": "torn')
+    monkeypatch.setattr(scrape_store, "_REVERSE_READ_BLOCK", 7)
+
+    assert [e["name"] for e in ScrapeStore(path).iter_entries()] == [f"Series {n}" for n in reversed(range(50))]
+
+
+def test_explicit_legacy_output_is_left_untouched(tmp_path):
+    legacy = tmp_path / "results.json"
+    legacy.write_text(json.dumps([entry(2), entry(1)]), encoding="utf-8")
+    before = legacy.read_text(encoding="utf-8")
+
+    store = open_scrape_store(legacy)
+    assert store.append([entry(3)]) == [entry(3)]
+
+    assert legacy.read_text(encoding="utf-8") == before
+    assert store.path == tmp_path / "results.jsonl"
+    # Later opens of either name read the converted store
+    assert [e["name"] for e in open_scrape_store(legacy).iter_entries()] == ["Series 3", "Series 2", "Series 1"]
+    assert len(open_scrape_store(tmp_path / "results.jsonl")) == 3
@@ -0,0 +1,81 @@
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from vibe_manga.vibe_manga.transfer import transfer_file, describe_transfers, TransferResult
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src" / "Series v01.cbz"
+    path.parent.mkdir()
+    path.write_bytes(os.urandom(3 * 1024 + 17))
+    return path
+
+
+def exdev(*args, **kwargs):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+def test_hardlink_first(src, tmp_path):
+    dst = tmp_path / "Series v01.cbz"
+    result = transfer_file(src, dst)
+    assert result.method == "hardlink"
+    assert os.path.samefile(src, dst)
+
+
+def test_overwrites_existing_destination_atomically(src, tmp_path):
+    dst = tmp_path / "Series v01.cbz"
+    dst.write_bytes(b"old")
+    transfer_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Series v01.cbz", "src"]
+
+
+def test_relinking_same_file_leaves_no_temp(src, tmp_path):
+    dst = tmp_path / "Series v01.cbz"
+    transfer_file(src, dst)
+    transfer_file(src, dst)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Series v01.cbz", "src"]
+
+
+def test_falls_back_to_copy_with_progress(src, tmp_path):
+    dst = tmp_path / "Series v01.cbz"
+    seen = []
+    with patch("vibe_manga.vibe_manga.transfer.os.link", exdev), \
+         patch("vibe_manga.vibe_manga.transfer._reflink", exdev), \
+         patch("vibe_manga.vibe_manga.transfer.TRANSFER_CHUNK_SIZE", 1024):
+        result = transfer_file(src, dst, progress=seen.append)
+
+    assert result.method == "copy"
+    assert seen == [1024, 1024, 1024, 17]
+    assert dst.read_bytes() == src.read_bytes() and src.exists()
+    assert dst.stat().st_mtime == pytest.approx(src.stat().st_mtime)
+
+
+def test_rename_only_when_move_allowed(src, tmp_path):
+    dst = tmp_path / "Series v01.cbz"
+    data = src.read_bytes()
+    with patch("vibe_manga.vibe_manga.transfer.os.link", exdev), \
+         patch("vibe_manga.vibe_manga.transfer._reflink", exdev):
+        result = transfer_file(src, dst, allow_move=True)
+    assert result.method == "rename"
+    assert not src.exists() and dst.read_bytes() == data
+
+
+def test_raises_when_every_method_fails(src, tmp_path):
+    with pytest.raises(OSError):
+        transfer_file(src, tmp_path / "missing-dir" / "x.cbz", methods=("hardlink", "copy"))
+    assert not (tmp_path / "missing-dir").exists()
+
+
+def test_describe_transfers():
+    results = [
+        TransferResult("hardlink", 10, 0.0),
+        TransferResult("hardlink", 10, 0.0),
+        TransferResult("copy", 4 * 1024 * 1024, 2.0),
+    ]
+    assert describe_transfers(results) == "2 hardlinked, 1 copied at 2.0 MB/s"
+    assert describe_transfers([]) == "nothing transferred"
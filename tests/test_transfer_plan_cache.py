@@ -0,0 +1,77 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import grabber
+from vibe_manga.vibe_manga.grabber import _prepare_pull_job
+from vibe_manga.vibe_manga.models import Series, Volume
+from vibe_manga.vibe_manga.transfer_plan_cache import TransferPlanCache
+
+TORRENT_HASH = "ab" * 20
+
+
+def make_torrent(tmp_path):
+    content = tmp_path / "downloads" / "Series"
+    content.mkdir(parents=True)
+    for n in (1, 2, 3):
+        (content / f"Series v0{n}.cbz").write_bytes(b"x" * n)
+    return {"hash": TORRENT_HASH, "name": "Series v01-03", "content_path": str(content), "_display_name": "Series", "_sort_name": "series"}
+
+
+def make_series(tmp_path, volumes):
+    path = tmp_path / "library" / "Series"
+    return Series(name="Series", path=path, volumes=[Volume(path=path / v, name=v, size_bytes=1) for v in volumes])
+
+
+def prepare(t, cache, series=None):
+    with patch.object(grabber, "QBIT_DOWNLOAD_ROOT", ""), \
+         patch.object(grabber, "_find_local_series", return_value=series), \
+         patch.object(grabber, "generate_transfer_plan", wraps=grabber.generate_transfer_plan) as gen:
+        job = _prepare_pull_job(0, 1, t, False, None, {}, None, None, cache)
+    return job, gen.call_count
+
+
+def test_second_run_reuses_plan_from_disk(tmp_path):
+    t = make_torrent(tmp_path)
+    series = make_series(tmp_path, ["Series v01.cbz"])
+    cache_path = tmp_path / "plans.json"
+
+    cache = TransferPlanCache(cache_path)
+    first, calls = prepare(t, cache, series)
+    cache.save()
+    assert calls == 1
+    assert [item["skip"] for item in first.transfer_plan] == [True, False, False]
+
+    second, calls = prepare(t, TransferPlanCache(cache_path), series)
+    assert calls == 0
+    assert second.series_name == first.series_name
+    assert [(item["src"], item["dst_name"], item["skip"]) for item in second.transfer_plan] == \
+           [(item["src"], item["dst_name"], item["skip"]) for item in first.transfer_plan]
+    assert isinstance(second.transfer_plan[0]["src"], Path)
+
+
+def test_changed_files_or_library_invalidate_plan(tmp_path):
+    t = make_torrent(tmp_path)
+    cache = TransferPlanCache(tmp_path / "plans.json")
+    prepare(t, cache, make_series(tmp_path, ["Series v01.cbz"]))
+
+    # Library gained a volume: redundancy decisions must be recomputed
+    job, calls = prepare(t, cache, make_series(tmp_path, ["Series v01.cbz", "Series v02.cbz"]))
+    assert calls == 1
+    assert [item["skip"] for item in job.transfer_plan] == [True, True, False]
+
+    # A file in the torrent changed
+    (Path(t["content_path"]) / "Series v04.cbz").write_bytes(b"x")
+    job, calls = prepare(t, cache, make_series(tmp_path, ["Series v01.cbz", "Series v02.cbz"]))
+    assert calls == 1
+    assert len(job.transfer_plan) == 4
+
+
+def test_prune_and_discard(tmp_path):
+    cache = TransferPlanCache(tmp_path / "plans.json")
+    cache.put("a", "f", "s", "Series", "Series", [])
+    cache.put("b", "f", "s", "Series", "Series", [])
+    cache.prune(["a"])
+    assert list(cache.entries) == ["a"]
+    cache.discard("a")
+    cache.save()
+    assert len(TransferPlanCache(tmp_path / "plans.json")) == 0
@@ -0,0 +1,63 @@
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from vibe_manga.vibe_manga import analysis, zip_directory
+from vibe_manga.vibe_manga.analysis import IMAGE_EXTENSIONS, inspect_archive, inspect_archive_details
+
+
+def zipfile_details(path):
+    with zipfile.ZipFile(path) as z:
+        infos = [(i.filename, i.CRC) for i in z.infolist() if not i.is_dir()]
+    suffixes = [Path(name).suffix.lower() for name, _ in infos]
+    return {
+        "page_count": sum(1 for s in suffixes if s in IMAGE_EXTENSIONS),
+        "formats": sorted(set(s for s in suffixes if s)),
+        "crcs": dict(infos),
+    }
+
+
+def test_matches_zipfile_on_awkward_archives(tmp_path):
+    path = tmp_path / "v01.cbz"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Chapter 1/", b"")
+        for name in ["Chapter 1/001.JPG", "002.png", "003.webp", "ページ.jpeg", ".jpg", "notes.", "cover.jxl", "info.txt"]:
+            zf.writestr(name, name.encode("utf-8"))
+        zf.comment = b"x" * 1000
+
+    details = inspect_archive_details(path)
+    expected = zipfile_details(path)
+    assert {k: details[k] for k in expected} == expected
+    assert details["page_count"] == 4 and not details["is_corrupt"]
+    assert inspect_archive(path) == (4, False)
+
+
+def test_reads_only_the_central_directory(tmp_path):
+    path = tmp_path / "v02.cbz"
+    with zipfile.ZipFile(path, "w") as zf:
+        for n in range(300):
+            zf.writestr(f"{n:03d}.jpg", b"p" * 2000)
+    # Data prepended (self-extracting style) moves every stored offset
+    prefixed = tmp_path / "v03.cbz"
+    prefixed.write_bytes(b"MZ" * 5000 + path.read_bytes())
+
+    with patch.object(analysis.zipfile, "ZipFile", side_effect=AssertionError("ZipFile used")):
+        assert inspect_archive(path) == (300, False)
+        assert inspect_archive(prefixed) == (300, False)
+        assert len(inspect_archive_details(path)["crcs"]) == 300
+
+
+def test_falls_back_to_zipfile(tmp_path, monkeypatch):
+    broken = tmp_path / "broken.cbz"
+    broken.write_bytes(b"not a zip at all")
+    assert inspect_archive(broken) == (0, True)
+    assert inspect_archive_details(broken)["error"] == "Not a valid zip file"
+
+    # Central directory beyond the tail read: one extra read, same answer
+    big = tmp_path / "big.cbz"
+    with zipfile.ZipFile(big, "w") as zf:
+        for n in range(50):
+            zf.writestr(f"{n:03d}.png", b"p")
+    monkeypatch.setattr(zip_directory, "ZIP_TAIL_READ_BYTES", 64)
+    assert len(zip_directory.read_entries(big)) == 50
+    assert inspect_archive(big) == (50, False)
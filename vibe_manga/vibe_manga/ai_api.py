@@ -1,36 +1,211 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
 import re
 import os
-from typing import Optional, Dict, Any, Union, Literal, List
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Union, Literal, List
 
 from .constants import (
     REMOTE_AI_BASE_URL, REMOTE_AI_API_KEY, REMOTE_AI_MODEL,
     LOCAL_AI_BASE_URL, LOCAL_AI_API_KEY, LOCAL_AI_MODEL,
-    AI_TIMEOUT, AI_MAX_RETRIES, ROLE_CONFIG
+    AI_TIMEOUT, AI_MAX_RETRIES, ROLE_CONFIG,
+    AI_CACHE_ENABLED, AI_CACHE_TTL_SECONDS, AI_CACHE_FILENAME,
+    AI_MAX_CONCURRENT_LOCAL, AI_MAX_CONCURRENT_REMOTE, AI_STREAM,
+    AI_CHARS_PER_TOKEN_ESTIMATE
 )
 from .logging import get_logger, log_api_call
 
 logger = get_logger(__name__)
 
 class TokenTracker:
-    """Tracks token usage across the session."""
+    """Tracks token usage and response cache effectiveness across the session."""
     def __init__(self):
         self.usage = {} # model_name -> {"prompt": int, "completion": int}
+        self.cache = {} # model_name -> {"hits": int, "misses": int}
+        self.estimated = {} # model_name -> calls whose usage was estimated
+        self._lock = threading.Lock()
 
-    def add_usage(self, model: str, prompt: int, completion: int):
-        if model not in self.usage:
-            self.usage[model] = {"prompt": 0, "completion": 0}
-        self.usage[model]["prompt"] += prompt
-        self.usage[model]["completion"] += completion
+    def add_usage(self, model: str, prompt: int, completion: int, estimated: bool = False):
+        with self._lock:
+            if model not in self.usage:
+                self.usage[model] = {"prompt": 0, "completion": 0}
+            self.usage[model]["prompt"] += prompt
+            self.usage[model]["completion"] += completion
+            if estimated:
+                self.estimated[model] = self.estimated.get(model, 0) + 1
+
+    def add_cache_result(self, model: str, hit: bool):
+        with self._lock:
+            if model not in self.cache:
+                self.cache[model] = {"hits": 0, "misses": 0}
+            self.cache[model]["hits" if hit else "misses"] += 1
 
     def get_summary(self) -> Dict[str, Dict[str, int]]:
         return self.usage
 
+    def get_cache_summary(self) -> Dict[str, Dict[str, int]]:
+        return self.cache
+
+    def get_estimated_summary(self) -> Dict[str, int]:
+        return self.estimated
+
 # Global instance
 tracker = TokenTracker()
 
+class AIResponseCache:
+    """
+    Persistent cache of parsed AI responses.
+
+    Entries are keyed by a hash of (provider, base URL, model, system prompt,
+    user prompt, temperature, json_mode) and expire after `ttl_seconds`. The cache lives in a
+    JSON Lines file in the working directory, next to the other VibeManga state
+    files. Each put appends one line, so concurrent council calls only hold the
+    lock for a short write; later lines win. The file is compacted on load once
+    it holds more than twice as many lines as live entries.
+    """
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: int = AI_CACHE_TTL_SECONDS,
+        enabled: bool = AI_CACHE_ENABLED
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def get_path(self) -> Path:
+        return self.path or (Path.cwd() / AI_CACHE_FILENAME)
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_role: str,
+        user_prompt: str,
+        temperature: float,
+        json_mode: bool,
+        base_url: str = ""
+    ) -> str:
+        raw = json.dumps(
+            [provider, base_url, model, system_role, user_prompt, round(float(temperature), 4), json_mode],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl_seconds > 0 and time.time() - entry.get("ts", 0) > self.ttl_seconds
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        # Caller must hold self._lock
+        if self._entries is None:
+            self._entries = {}
+            path = self.get_path()
+            if path.exists():
+                lines = 0
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            lines += 1
+                            try:
+                                record = json.loads(line)
+                                self._entries[record["key"]] = {"ts": record["ts"], "response": record["response"]}
+                            except (ValueError, KeyError, TypeError):
+                                continue  # Torn or foreign line
+                except Exception as e:
+                    logger.warning(f"Failed to load AI response cache: {e}")
+                for key in [k for k, entry in self._entries.items() if self._expired(entry)]:
+                    del self._entries[key]
+                if lines > 2 * len(self._entries):
+                    self._compact()
+        return self._entries
+
+    def _record(self, key: str, entry: Dict[str, Any]) -> str:
+        return json.dumps({"key": key, **entry}, ensure_ascii=False) + "\n"
+
+    def _compact(self) -> None:
+        # Caller must hold self._lock
+        path = self.get_path()
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(self._record(k, entry) for k, entry in self._entries.items())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Failed to compact AI response cache: {e}")
+
+    def _append(self, key: str, entry: Dict[str, Any]) -> None:
+        # Caller must hold self._lock
+        try:
+            with open(self.get_path(), "a", encoding="utf-8") as f:
+                f.write(self._record(key, entry))
+        except Exception as e:
+            logger.error(f"Failed to save AI response cache: {e}")
+
+    def get(self, key: str) -> Optional[Union[Dict[str, Any], str]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+            if not entry:
+                return None
+            if self._expired(entry):
+                del self._entries[key]
+                return None
+            return entry.get("response")
+
+    def put(self, key: str, response: Union[Dict[str, Any], str]) -> None:
+        if not self.enabled:
+            return
+        entry = {"ts": time.time(), "response": response}
+        with self._lock:
+            self._load()[key] = entry
+            self._append(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            path = self.get_path()
+            if path.exists():
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.error(f"Failed to clear AI response cache: {e}")
+
+# Global instance
+response_cache = AIResponseCache()
+
+# Per-provider request slots. Callers may fan out freely (council agents, multi-series
+# scheduling); these keep the number of simultaneous HTTP requests within provider limits.
+_provider_slots = {
+    "local": threading.BoundedSemaphore(max(1, AI_MAX_CONCURRENT_LOCAL)),
+    "remote": threading.BoundedSemaphore(max(1, AI_MAX_CONCURRENT_REMOTE)),
+}
+
+# Shared HTTP session so repeated calls reuse keep-alive connections instead of
+# re-handshaking (TCP/TLS) for every request.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                pool_size = max(AI_MAX_CONCURRENT_LOCAL, AI_MAX_CONCURRENT_REMOTE, 1)
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
 def clean_ai_response(text: str) -> str:
     """
     Removes 'thinking' or 'reasoning' blocks often output by models like DeepSeek R1, Perplexity Sonar, or Claude.
@@ -90,6 +265,144 @@ def extract_json(text: str) -> Optional[Dict[str, Any]]:
     logger.warning(f"Failed to extract JSON from AI response. Preview: {text[:200]}...")
     return None
 
+_REASONING_TAGS = ("think", "thinking", "reasoning")
+
+def _has_open_reasoning_block(text: str) -> bool:
+    """True if a <think>/<thinking>/<reasoning> block has been opened but not yet closed."""
+    return any(text.count(f"<{tag}>") > text.count(f"</{tag}>") for tag in _REASONING_TAGS)
+
+def _find_json_object(text: str, start: int = 0) -> Optional[tuple]:
+    """
+    Returns (begin, end) of the first brace-balanced {...} span at or after `start`,
+    honouring JSON string escapes, or None if no object has closed yet.
+    """
+    depth = 0
+    begin = -1
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"' and depth > 0:
+            in_string = True
+        elif ch == "{":
+            if depth == 0:
+                begin = i
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+    return None
+
+class StreamingJSONExtractor:
+    """
+    Accumulates streamed completion text and extracts the first JSON object
+    (via extract_json) as soon as its closing brace arrives, so callers can
+    stop reading the stream without waiting for trailing prose.
+    """
+    def __init__(self):
+        self._parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        self._parts.append(chunk)
+        if "}" not in chunk:
+            return None
+
+        text = self.text
+        if _has_open_reasoning_block(text):
+            return None
+
+        cleaned = clean_ai_response(text)
+        pos = 0
+        while True:
+            span = _find_json_object(cleaned, pos)
+            if span is None:
+                return None
+            begin, end = span
+            try:
+                return json.loads(cleaned[begin:end])
+            except json.JSONDecodeError:
+                # Braces in prose; fall back to the resilient extractor for this span
+                parsed = extract_json(cleaned[begin:end])
+                if isinstance(parsed, dict):
+                    return parsed
+            pos = end
+
+def _iter_stream_chunks(response: requests.Response):
+    """
+    Yields (content_delta, usage) pairs from a streamed completion.
+    Understands OpenAI-style SSE ("data: {...}") and Ollama-style NDJSON lines.
+    """
+    # SSE responses are text/event-stream without a charset; requests would assume latin-1
+    response.encoding = "utf-8"
+    for line in response.iter_lines(decode_unicode=True):
+        if not line:
+            continue
+        if line.startswith("data:"):
+            line = line[5:].strip()
+            if line == "[DONE]":
+                return
+        try:
+            chunk = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+        delta = ""
+        choices = chunk.get("choices")
+        if choices:
+            delta = (choices[0].get("delta") or {}).get("content") or ""
+        elif isinstance(chunk.get("message"), dict):
+            delta = chunk["message"].get("content") or ""
+        usage = chunk.get("usage")
+        if usage is None and "eval_count" in chunk:
+            # Ollama's native final chunk
+            usage = {"prompt_tokens": chunk.get("prompt_eval_count", 0), "completion_tokens": chunk["eval_count"]}
+        yield delta, usage
+
+        if chunk.get("done") is True:
+            return
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for text whose usage the server never reported."""
+    return -(-len(text) // AI_CHARS_PER_TOKEN_ESTIMATE)
+
+def _read_streamed_completion(response: requests.Response, json_mode: bool) -> tuple:
+    """
+    Consumes a streamed completion.
+
+    Returns (content, usage, parsed). In JSON mode `parsed` is filled as soon as the
+    first JSON object closes and the rest of the stream is abandoned. Usage arrives
+    in the final chunk, so it is None when the stream is cut early (or the server
+    does not report it); call_ai then records an estimate.
+    """
+    extractor = StreamingJSONExtractor()
+    usage = None
+    parsed = None
+    try:
+        for delta, chunk_usage in _iter_stream_chunks(response):
+            if chunk_usage:
+                usage = chunk_usage
+            if not delta:
+                continue
+            early = extractor.feed(delta)
+            if json_mode and early is not None:
+                parsed = early
+                break
+    finally:
+        response.close()
+    return extractor.text, usage, parsed
+
 def get_available_models(provider: Literal["remote", "local"]) -> List[str]:
     """
     Fetches available models from the provider's /v1/models endpoint.
@@ -132,7 +445,7 @@ def get_available_models(provider: Literal["remote", "local"]) -> List[str]:
 
     log_api_call(endpoint, "GET")
     try:
-        response = requests.get(endpoint, headers=headers, timeout=10)
+        response = _get_session().get(endpoint, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -157,13 +470,25 @@ def call_ai(
     model: Optional[str] = None,
     temperature: float = 0.7,
     json_mode: bool = True,
-    status_callback: Optional[callable] = None
+    status_callback: Optional[callable] = None,
+    use_cache: bool = True,
+    stream: Optional[bool] = None,
+    cache_if: Optional[Callable[[Any], bool]] = None
 ) -> Union[Dict[str, Any], str, None]:
     """
     Calls the configured AI backend with retries.
+
+    Successful responses are stored in the persistent response cache and
+    replayed for identical requests unless `use_cache` is False. With
+    `cache_if`, only responses it accepts are stored or replayed, so answers
+    the caller rejects are asked again next time instead of replayed.
+
+    With `stream` (default: AI_STREAM) the completion is read token-by-token and,
+    in JSON mode, returned as soon as the first JSON object closes.
     """
-    import time
-    
+    if stream is None:
+        stream = AI_STREAM
+
     # Determine config based on provider
     if provider == "local":
         base_url = LOCAL_AI_BASE_URL
@@ -194,8 +519,11 @@ def call_ai(
             {"role": "user", "content": user_prompt}
         ],
         "temperature": temperature,
-        "stream": False
+        "stream": stream
     }
+    if stream:
+        # Ask for a final usage chunk; dropped on retry if the server rejects the field
+        payload["stream_options"] = {"include_usage": True}
     
     # OpenRouter specific headers for remote calls
     if provider == "remote" and "openrouter.ai" in base_url:
@@ -233,6 +561,18 @@ def call_ai(
     if endpoint.endswith("/v1"):
         endpoint = f"{endpoint}/chat/completions"
 
+    cache_key = None
+    if use_cache and response_cache.enabled:
+        cache_key = AIResponseCache.make_key(provider, target_model, system_role, user_prompt, temperature, json_mode, base_url)
+        cached = response_cache.get(cache_key)
+        if cached is not None and (cache_if is None or cache_if(cached)):
+            tracker.add_cache_result(target_model, hit=True)
+            logger.debug(f"AI cache hit ({provider}) for model {target_model}")
+            if status_callback:
+                status_callback(f"Using cached AI response ({provider})")
+            return cached
+        tracker.add_cache_result(target_model, hit=False)
+
     log_api_call(endpoint, "POST", params={"model": target_model, "temp": temperature, "len": len(user_prompt)})
 
     for attempt in range(AI_MAX_RETRIES + 1):
@@ -242,19 +582,39 @@ def call_ai(
             if status_callback:
                 status_callback(msg)
 
-            response = requests.post(
-                endpoint,
-                headers=headers,
-                json=payload,
-                timeout=AI_TIMEOUT
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            parsed = None
+            with _provider_slots.get(provider, _provider_slots["remote"]):
+                response = _get_session().post(
+                    endpoint,
+                    headers=headers,
+                    json=payload,
+                    timeout=AI_TIMEOUT,
+                    stream=stream
+                )
+                try:
+                    if not response.ok:
+                        # Buffer the error body so it can still be logged once the stream is closed
+                        response.content
+                    response.raise_for_status()
+
+                    if stream:
+                        content, usage, parsed = _read_streamed_completion(response, json_mode)
+                        # Normalise to the non-streamed shape so the checks below apply unchanged
+                        data = {"choices": [{"message": {"content": content}}], "usage": usage}
+                    else:
+                        data = response.json()
+                finally:
+                    # Release the connection even when the status check or stream read raises
+                    response.close()
             
             # Track usage
             usage = data.get("usage")
-            if usage:
+            if not usage and stream:
+                # Stream abandoned early or no usage chunk: estimate what was spent
+                p_tokens = _estimate_tokens(system_role) + _estimate_tokens(user_prompt)
+                c_tokens = _estimate_tokens(data["choices"][0]["message"]["content"] or "")
+                tracker.add_usage(target_model, p_tokens, c_tokens, estimated=True)
+            elif usage:
                 # Standard OpenAI field names: prompt_tokens, completion_tokens
                 # Ollama/Local might vary slightly but many follow OpenAI now
                 p_tokens = usage.get("prompt_tokens", usage.get("input_tokens", 0))
@@ -274,8 +634,11 @@ def call_ai(
             # Clean logic is now handled inside extract_json for JSON mode,
             # but for text mode we should also clean it.
             if json_mode:
-                parsed = extract_json(content)
+                if parsed is None:
+                    parsed = extract_json(content)
                 if parsed:
+                    if cache_key and (cache_if is None or cache_if(parsed)):
+                        response_cache.put(cache_key, parsed)
                     return parsed
                 else:
                     msg = f"AI response JSON parse failed (Attempt {attempt+1}/{AI_MAX_RETRIES+1})"
@@ -286,7 +649,10 @@ def call_ai(
                         time.sleep(1)
                         continue
             
-            return clean_ai_response(content)
+            cleaned = clean_ai_response(content)
+            if cache_key and not json_mode and cleaned and (cache_if is None or cache_if(cleaned)):
+                response_cache.put(cache_key, cleaned)
+            return cleaned
 
         except requests.exceptions.RequestException as e:
             status_code = e.response.status_code if e.response is not None else "Unknown"
@@ -296,6 +662,11 @@ def call_ai(
             elif status_code == 403:
                 logger.error(f"AI API Forbidden (403). Your API Key for {provider} may not have access to model '{target_model}' or the provider is blocking the request.")
                 return None # Don't retry forbidden
+            elif status_code == 400 and "stream_options" in payload:
+                # Some OpenAI-compatible servers reject unknown fields; fall back to estimated usage
+                logger.debug(f"AI API ({provider}) rejected stream_options; retrying without it.")
+                payload.pop("stream_options")
+                continue
             elif status_code == 429:
                  msg = "AI API Rate Limit (429). Retrying after delay..."
                  logger.debug(msg)
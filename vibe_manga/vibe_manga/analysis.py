@@ -16,6 +16,7 @@ from .constants import (
     BYTES_PER_MB,
     BYTES_PER_GB
 )
+from .zip_directory import Entry, read_entries, decode_name, suffix as entry_suffix, count_suffixes
 
 logger = logging.getLogger(__name__)
 
@@ -540,39 +541,87 @@ def find_structural_duplicates(
                     warnings.append(msg)
     return warnings
 
-def inspect_archive(file_path: Path, check_integrity: bool = False) -> Tuple[int, bool]:
+_IMAGE_SUFFIXES = frozenset(ext.encode('ascii') for ext in IMAGE_EXTENSIONS)
 
-    ext, page_count, is_corrupt = file_path.suffix.lower(), 0, False
 
-    if ext == '.cbz':
+def _entry_infos(entries: List[Entry]) -> Optional[Tuple[List[Tuple[str, int]], List[str]]]:
+    """(filename, crc) and lower-cased suffix of each file entry; None if a name does not decode."""
+    infos, suffixes = [], []
+    try:
+        for name, crc, flags in entries:
+            if name.endswith(b'/'):
+                continue
+            infos.append((decode_name(name, flags), crc))
+            # The suffix starts at an ASCII '.', so it decodes on its own
+            suffixes.append(decode_name(entry_suffix(name), flags).lower())
+    except UnicodeDecodeError:
+        return None
+    return infos, suffixes
 
-        try:
 
-            with zipfile.ZipFile(file_path, 'r') as z:
+def inspect_archive(file_path: Path, check_integrity: bool = False) -> Tuple[int, bool]:
 
-                if check_integrity and z.testzip() is not None: is_corrupt = True
+    # Page count only: count image suffixes straight from the central directory
+    if not check_integrity and file_path.suffix.lower() == '.cbz':
+        entries = read_entries(file_path)
+        if entries is not None:
+            return count_suffixes(entries, _IMAGE_SUFFIXES), False
 
-                page_count = sum(1 for info in z.infolist() if not info.is_dir() and Path(info.filename).suffix.lower() in IMAGE_EXTENSIONS)
+    details = inspect_archive_details(file_path, check_integrity)
 
-        except Exception: is_corrupt = True
+    return details["page_count"], details["is_corrupt"]
 
-    elif ext == '.cbr' and rarfile:
 
-        try:
-
-            with rarfile.RarFile(file_path, 'r') as r:
 
-                if check_integrity:
+def inspect_archive_details(file_path: Path, check_integrity: bool = False) -> Dict[str, Any]:
+    """
+    Page count, corruption flag (with the reason in "error"), entry formats
+    (suffixes) and per-entry CRC32s of a CBZ/CBR, all read from one pass over
+    the archive's entry list.
 
-                    try: r.testrar()
+    Without an integrity test a CBZ's entry list comes from its central
+    directory alone (zip_directory); zipfile is the fallback for ZIP64 and
+    anything that does not parse.
+    """
+    ext, is_corrupt, error = file_path.suffix.lower(), False, None
+    infos: List[Tuple[str, int]] = []  # (filename, crc) of file entries
+    suffixes: Optional[List[str]] = None
 
-                    except Exception: is_corrupt = True
+    fast = None
+    if ext == '.cbz' and not check_integrity:
+        entries = read_entries(file_path)
+        fast = _entry_infos(entries) if entries is not None else None
 
-                page_count = sum(1 for info in r.infolist() if not info.isdir() and Path(info.filename).suffix.lower() in IMAGE_EXTENSIONS)
+    if fast is not None:
+        infos, suffixes = fast
 
-        except Exception: is_corrupt = True
+    elif ext == '.cbz':
+        try:
+            with zipfile.ZipFile(file_path, 'r') as z:
+                bad = z.testzip() if check_integrity else None
+                if bad is not None: is_corrupt, error = True, f"Corrupted file: {bad}"
+                infos = [(info.filename, info.CRC) for info in z.infolist() if not info.is_dir()]
+        except zipfile.BadZipFile: is_corrupt, error = True, "Not a valid zip file"
+        except Exception as e: is_corrupt, error = True, f"Error: {e}"
 
-    return page_count, is_corrupt
+    elif ext == '.cbr' and rarfile:
+        try:
+            with rarfile.RarFile(file_path, 'r') as r:
+                if check_integrity:
+                    try: r.testrar()
+                    except Exception as e: is_corrupt, error = True, f"Corrupted: {e}"
+                infos = [(info.filename, getattr(info, 'CRC', 0) or 0) for info in r.infolist() if not info.isdir()]
+        except Exception as e: is_corrupt, error = True, f"Error: {e}"
+
+    if suffixes is None:
+        suffixes = [Path(name).suffix.lower() for name, _ in infos]
+    return {
+        "page_count": sum(1 for suffix in suffixes if suffix in IMAGE_EXTENSIONS),
+        "is_corrupt": is_corrupt,
+        "error": error,
+        "formats": sorted(set(s for s in suffixes if s)),
+        "crcs": {name: crc for name, crc in infos},
+    }
 
 
 
@@ -1,12 +1,13 @@
 import logging
 import json
+import concurrent.futures
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple, Callable
+from typing import List, Optional, Dict, Any, Tuple, Callable, Sequence
 
 from .models import Library, Category, Series
 from .metadata import SeriesMetadata, get_or_create_metadata
 from .ai_api import call_ai
-from .constants import ROLE_CONFIG
+from .constants import ROLE_CONFIG, AI_BATCH_SYNOPSIS_CHARS
 from .config import get_ai_role_config, get_ai_config  # Import from config.py
 
 logger = logging.getLogger(__name__)
@@ -15,7 +16,8 @@ def _fetch_agent_opinion(
     role_name: str, 
     base_prompt: str, 
     update_status: Optional[Callable[[str], None]],
-    default_response: Dict[str, Any]
+    default_response: Dict[str, Any],
+    use_ai_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Helper to fetch AI response with smart retries for JSON errors.
@@ -33,7 +35,8 @@ def _fetch_agent_opinion(
             config["role_prompt"], 
             provider=config["provider"], 
             model=config["model"],
-            json_mode=True
+            json_mode=True,
+            use_cache=use_ai_cache
         )
         
         if isinstance(response, dict):
@@ -54,7 +57,8 @@ def get_ai_categorization(
     current_category: Optional[str] = None,
     quiet: bool = False,
     status_callback: Optional[Callable[[str], None]] = None,
-    confirm_callback: Optional[Callable[[str, str], bool]] = None
+    confirm_callback: Optional[Callable[[str, str], bool]] = None,
+    use_ai_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Orchestrates the AI categorization flow:
@@ -62,6 +66,9 @@ def get_ai_categorization(
     2. Practical suggestion
     3. Creative suggestion
     4. Consensus decision (with validation loop)
+
+    Steps 1-3 are independent and run concurrently; only step 4 needs all three.
+    With `use_ai_cache` False every request goes to the model (see call_ai).
     """
     results = {}
 
@@ -71,38 +78,33 @@ def get_ai_categorization(
         elif not quiet:
             logger.info(msg)
 
-    # 1. Moderator
-    update_status(f"Step 1/4: Consulting Moderator...")
+    # 1-3. Moderator, Practical and Creative are independent: consult them concurrently
+    update_status("Steps 1-3/4: Consulting Moderator, Practical Analyst & Creative Director...")
     mod_prompt = f"Manga Title: {series_name}\nSynopsis: {metadata.synopsis}\nGenres: {metadata.genres}\nTags: {metadata.tags}"
-    results["moderation"] = _fetch_agent_opinion(
-        "MODERATOR", 
-        mod_prompt, 
-        update_status, 
-        default_response={"classification": "SAFE", "reason": "AI Error: Invalid response"}
-    )
-    
-    # 2. Practical
-    update_status(f"Step 2/4: Consulting Practical Analyst...")
     prac_prompt = f"Manga: {series_name}\nMetadata: {metadata.to_dict()}\nCategories: {available_categories}"
-    results["practical"] = _fetch_agent_opinion(
-        "PRACTICAL",
-        prac_prompt,
-        update_status,
-        default_response={"category": "Uncategorized/Error", "reason": "AI Error: Invalid response"}
-    )
-    
-    # 3. Creative
-    update_status(f"Step 3/4: Consulting Creative Director...")
     crea_prompt = f"Manga: {series_name}\nMetadata: {metadata.to_dict()}\nCategories: {available_categories}"
-    results["creative"] = _fetch_agent_opinion(
-        "CREATIVE",
-        crea_prompt,
-        update_status,
-        default_response={"category": "Uncategorized/Error", "reason": "AI Error: Invalid response"}
-    )
+
+    council = {
+        "moderation": ("MODERATOR", mod_prompt, {"classification": "SAFE", "reason": "AI Error: Invalid response"}),
+        "practical": ("PRACTICAL", prac_prompt, {"category": "Uncategorized/Error", "reason": "AI Error: Invalid response"}),
+        "creative": ("CREATIVE", crea_prompt, {"category": "Uncategorized/Error", "reason": "AI Error: Invalid response"}),
+    }
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(council)) as executor:
+        futures = {
+            key: executor.submit(_fetch_agent_opinion, role, prompt, update_status, default_response, use_ai_cache)
+            for key, (role, prompt, default_response) in council.items()
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                role, _, default_response = council[key]
+                logger.error(f"{role} raised an unexpected error: {e}")
+                results[key] = default_response
     
     # 4. Consensus with Validation Loop
-    update_status(f"Step 4/4: Reaching Consensus...")
+    update_status("Step 4/4: Reaching Consensus...")
     cons_config = get_ai_role_config("CONSENSUS")
     
     # Base prompt components
@@ -163,7 +165,10 @@ def get_ai_categorization(
             cons_config["role_prompt"], 
             provider=cons_config["provider"], 
             model=cons_config["model"],
-            json_mode=True
+            json_mode=True,
+            use_cache=use_ai_cache,
+            # Rejected answers must be asked again, not replayed from the cache
+            cache_if=lambda answer: isinstance(answer, dict) and _is_valid_consensus(answer, available_categories)
         )
         
         # Basic Type Check
@@ -246,31 +251,21 @@ def get_category_list(library: Library, restrict_to_main: Optional[str] = None)
         available = ["Manga/Action", "Manga/Romance", "Manga/Comedy", "Adult/Hentai"]
     return available
 
-def suggest_category(
-    series: Series,
+def _resolve_available_categories(
     library: Library,
-    user_feedback: Optional[str] = None,
     custom_categories: Optional[List[str]] = None,
-    restrict_to_main: Optional[str] = None,
-    quiet: bool = False,
-    status_callback: Optional[Callable[[str], None]] = None,
-    confirm_callback: Optional[Callable[[str, str], bool]] = None
-) -> Optional[Dict[str, Any]]:
-    """
-    Fetches metadata and AI suggestions for a single series.
-    """
-    # Get metadata
-    metadata, source = get_or_create_metadata(series.path, series.name)
-    
-    # Get flat list of current categories (Main/Sub)
+    restrict_to_main: Optional[str] = None
+) -> List[str]:
+    """Returns the flat Main/Sub category list a suggestion must pick from."""
     if custom_categories is not None:
         available = custom_categories
         if restrict_to_main:
             available = [c for c in available if c.startswith(f"{restrict_to_main}/")]
-    else:
-        available = get_category_list(library, restrict_to_main=restrict_to_main)
-        
-    # Determine Current Category from path (e.g. .../Manga/Action/Naruto -> Manga/Action)
+        return available
+    return get_category_list(library, restrict_to_main=restrict_to_main)
+
+def _guess_current_category(series: Series) -> str:
+    """Determines Current Category from path (e.g. .../Manga/Action/Naruto -> Manga/Action)."""
     current_cat = "Uncategorized"
     try:
         # Assuming path structure: Root/Main/Sub/Series
@@ -283,6 +278,28 @@ def suggest_category(
         current_cat = f"{grandparent}/{parent}"
     except Exception:
         pass
+    return current_cat
+
+def suggest_category(
+    series: Series,
+    library: Library,
+    user_feedback: Optional[str] = None,
+    custom_categories: Optional[List[str]] = None,
+    restrict_to_main: Optional[str] = None,
+    quiet: bool = False,
+    status_callback: Optional[Callable[[str], None]] = None,
+    confirm_callback: Optional[Callable[[str, str], bool]] = None,
+    use_ai_cache: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetches metadata and AI suggestions for a single series.
+    """
+    # Get metadata
+    metadata, source = get_or_create_metadata(series.path, series.name)
+    
+    # Get flat list of current categories (Main/Sub)
+    available = _resolve_available_categories(library, custom_categories, restrict_to_main)
+    current_cat = _guess_current_category(series)
 
     logger.info(f"Requesting AI categorization for '{series.name}'...")
     results = get_ai_categorization(
@@ -293,10 +310,251 @@ def suggest_category(
         current_category=current_cat,
         quiet=quiet,
         status_callback=status_callback,
-        confirm_callback=confirm_callback
+        confirm_callback=confirm_callback,
+        use_ai_cache=use_ai_cache
     )
     
     # Attach metadata to results for display/use in UI
     results["metadata"] = metadata
     
-    return results
\ No newline at end of file
+    return results
+
+# --- Batch Mode ---
+
+BATCH_ROLE_FIELDS = {
+    "MODERATOR": '{"id": int, "classification": "SAFE|ADULT|ILLEGAL", "reason": "str"}',
+    "PRACTICAL": '{"id": int, "category": "Main/Sub", "reason": "str"}',
+    "CREATIVE": '{"id": int, "category": "Main/Sub", "reason": "str"}',
+    "CONSENSUS": '{"id": int, "final_category": "str", "final_sub_category": "str", "confidence_score": 0.0-1.0, "reason": "str"}',
+}
+
+def _compact_series_entry(item_id: int, series_name: str, metadata: SeriesMetadata) -> Dict[str, Any]:
+    """Minimal per-series payload for batch prompts (no full metadata dump)."""
+    synopsis = (metadata.synopsis or "").strip()
+    if len(synopsis) > AI_BATCH_SYNOPSIS_CHARS:
+        synopsis = synopsis[:AI_BATCH_SYNOPSIS_CHARS - 3].rstrip() + "..."
+    entry = {"id": item_id, "name": series_name, "genres": metadata.genres, "tags": metadata.tags}
+    if metadata.demographics:
+        entry["demographics"] = metadata.demographics
+    if synopsis:
+        entry["synopsis"] = synopsis
+    return entry
+
+def _batch_instruction(role_name: str, count: int) -> str:
+    return (
+        f"\n\nBATCH MODE: The input contains {count} separate series. Evaluate each one independently "
+        "using your rules above. Return ONLY a JSON object of the form "
+        f"{{\"results\": [{BATCH_ROLE_FIELDS[role_name]}, ...]}} with exactly one entry per input 'id'."
+    )
+
+def _fetch_batch_opinions(
+    role_name: str,
+    prompt: str,
+    ids: Sequence[int],
+    required_field: str,
+    use_ai_cache: bool = True,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Sends one batch request for a role and returns the valid per-item answers keyed by id.
+    Items that are missing or malformed are simply absent from the result.
+    `cache_if` decides whether the raw response may be cached (see call_ai).
+    """
+    config = get_ai_role_config(role_name)
+    response = call_ai(
+        prompt + _batch_instruction(role_name, len(ids)),
+        config["role_prompt"],
+        provider=config["provider"],
+        model=config["model"],
+        json_mode=True,
+        use_cache=use_ai_cache,
+        cache_if=cache_if
+    )
+
+    items = response.get("results") if isinstance(response, dict) else None
+    if not isinstance(items, list):
+        logger.warning(f"{role_name} batch returned no 'results' array: {type(response)}")
+        return {}
+
+    wanted = set(ids)
+    answers: Dict[int, Dict[str, Any]] = {}
+    for item in items:
+        if not isinstance(item, dict) or not item.get(required_field):
+            continue
+        try:
+            item_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if item_id in wanted and item_id not in answers:
+            answers[item_id] = {k: v for k, v in item.items() if k != "id"}
+    return answers
+
+def _is_valid_consensus(consensus: Dict[str, Any], available_categories: List[str]) -> bool:
+    cat = consensus.get("final_category")
+    sub = consensus.get("final_sub_category")
+    if not isinstance(cat, str) or not isinstance(sub, str) or not cat or not sub:
+        return False
+    return f"{cat}/{sub}" in available_categories
+
+def get_ai_categorization_batch(
+    items: Sequence[Tuple[str, SeriesMetadata, Optional[str]]],
+    available_categories: List[str],
+    user_feedback: Optional[str] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
+    use_ai_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Categorizes many series with one request per council role.
+
+    Each item is (series_name, metadata, current_category). The prompt carries only
+    name, genres, tags and a truncated synopsis per series. Consensus answers are
+    validated per item against `available_categories`; items that are missing,
+    malformed or invalid are retried individually through get_ai_categorization
+    (auto mode, so new categories are rejected). Results keep the input order.
+    """
+    def update_status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    entries = [_compact_series_entry(i, name, meta) for i, (name, meta, _) in enumerate(items)]
+    ids = [e["id"] for e in entries]
+    series_block = json.dumps(entries, ensure_ascii=False)
+
+    # 1-3. One request per role, roles in parallel
+    update_status(f"Batch of {len(items)}: Consulting Moderator, Practical Analyst & Creative Director...")
+    role_prompts = {
+        "moderation": ("MODERATOR", f"Series: {series_block}", "classification"),
+        "practical": ("PRACTICAL", f"Categories: {available_categories}\nSeries: {series_block}", "category"),
+        "creative": ("CREATIVE", f"Categories: {available_categories}\nSeries: {series_block}", "category"),
+    }
+    views: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(role_prompts)) as executor:
+        futures = {
+            key: executor.submit(_fetch_batch_opinions, role, prompt, ids, field, use_ai_cache)
+            for key, (role, prompt, field) in role_prompts.items()
+        }
+        for key, future in futures.items():
+            try:
+                views[key] = future.result()
+            except Exception as e:
+                logger.error(f"{role_prompts[key][0]} batch raised an unexpected error: {e}")
+                views[key] = {}
+
+    # Only series with all three views go to the batch consensus
+    complete_ids = [i for i in ids if all(i in views[key] for key in role_prompts)]
+
+    consensus_answers: Dict[int, Dict[str, Any]] = {}
+    if complete_ids:
+        update_status(f"Batch of {len(items)}: Reaching Consensus...")
+        cons_entries = []
+        for i in complete_ids:
+            _, meta, current = items[i]
+            cons_entries.append({
+                "id": i,
+                "name": items[i][0],
+                "genres": meta.genres,
+                "tags": meta.tags,
+                "current_location": current,
+                "moderator_view": views["moderation"][i],
+                "pragmatic_view": views["practical"][i],
+                "creative_view": views["creative"][i],
+            })
+        cons_prompt = (
+            f"Official Category List: {available_categories}\n"
+            f"Series: {json.dumps(cons_entries, ensure_ascii=False)}\n"
+        )
+        narrative_rules = get_ai_config().get_narrative_content()
+        if narrative_rules:
+            cons_prompt += (
+                "\n### USER NARRATIVE & CATEGORIZATION RULES (PRIMARY AUTHORITY):\n"
+                "The user has provided the following narrative design rules which MUST take precedence over standard logic and agent views:\n"
+                f"{narrative_rules}\n"
+            )
+        if user_feedback:
+            cons_prompt += (
+                "\nUSER FEEDBACK / INSTRUCTION:\n"
+                f"The user has explicitly requested or added the following details: '{user_feedback}'.\n"
+                "IMPORTANT: This feedback overrides previous constraints.\n"
+            )
+        cons_prompt += "\nYou MUST pick each 'final_category'/'final_sub_category' pair from the Official Category List."
+        def all_valid(response: Any) -> bool:
+            items = response.get("results") if isinstance(response, dict) else None
+            if not isinstance(items, list):
+                return False
+            valid = {
+                str(item.get("id")) for item in items
+                if isinstance(item, dict) and _is_valid_consensus(item, available_categories)
+            }
+            return valid >= {str(i) for i in complete_ids}
+
+        consensus_answers = _fetch_batch_opinions(
+            "CONSENSUS", cons_prompt, complete_ids, "final_category", use_ai_cache, cache_if=all_valid
+        )
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    retry_ids = []
+    for i in ids:
+        consensus = consensus_answers.get(i)
+        if consensus and _is_valid_consensus(consensus, available_categories):
+            results[i] = {
+                "moderation": views["moderation"][i],
+                "practical": views["practical"][i],
+                "creative": views["creative"][i],
+                "consensus": consensus,
+            }
+        else:
+            retry_ids.append(i)
+
+    # Individually retry anything the batch could not settle
+    if retry_ids:
+        logger.info(f"Batch categorization: retrying {len(retry_ids)}/{len(items)} series individually")
+    for n, i in enumerate(retry_ids, 1):
+        name, meta, current = items[i]
+        update_status(f"Batch retry {n}/{len(retry_ids)}: {name}")
+        results[i] = get_ai_categorization(
+            name,
+            meta,
+            available_categories,
+            user_feedback=user_feedback,
+            current_category=current,
+            quiet=True,
+            status_callback=status_callback,
+            use_ai_cache=use_ai_cache
+        )
+
+    return results
+
+def suggest_categories_batch(
+    series_list: Sequence[Series],
+    library: Library,
+    user_feedback: Optional[str] = None,
+    custom_categories: Optional[List[str]] = None,
+    restrict_to_main: Optional[str] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
+    use_ai_cache: bool = True
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batch counterpart of suggest_category: returns one result per series, in order.
+    """
+    available = _resolve_available_categories(library, custom_categories, restrict_to_main)
+
+    items = []
+    metadatas = []
+    for series in series_list:
+        metadata, source = get_or_create_metadata(series.path, series.name)
+        metadatas.append(metadata)
+        items.append((series.name, metadata, _guess_current_category(series)))
+
+    logger.info(f"Requesting batch AI categorization for {len(items)} series...")
+    results = get_ai_categorization_batch(
+        items,
+        available,
+        user_feedback=user_feedback,
+        status_callback=status_callback,
+        use_ai_cache=use_ai_cache
+    )
+
+    for result, metadata in zip(results, metadatas):
+        if result is not None:
+            result["metadata"] = metadata
+    return results
@@ -8,7 +8,6 @@ import sys
 import click
 import logging
 import datetime
-import concurrent.futures
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict
 from rich.console import Console
@@ -22,11 +21,11 @@ from rich.panel import Panel
 from rich.rule import Rule
 
 # Internal imports
-from ..scanner import scan_library, enrich_series
+from ..scanner import scan_library, enrich_volumes
 from ..models import Library, Category, Series
 from ..cache import get_cached_library, save_library_cache, load_library_state
 from ..config import get_config, get_ai_role_config
-from ..ai_api import get_available_models
+from ..ai_api import get_available_models, tracker
 from ..constants import (
     BYTES_PER_GB,
     PROGRESS_REFRESH_RATE,
@@ -195,8 +194,17 @@ def perform_deep_analysis(
         logger.debug("No series to analyze")
         return
 
+    # Inspect volumes, not series, so one huge series doesn't serialize the run
+    volumes = []
+    for s in series_list:
+        if not isinstance(s, Series):
+            continue
+        volumes.extend(s.volumes)
+        for sg in s.sub_groups:
+            volumes.extend(sg.volumes)
+
     action_name = "Verifying" if verify else "Analyzing"
-    logger.info(f"{action_name} {len(series_list)} series...")
+    logger.info(f"{action_name} {len(volumes)} volumes in {len(series_list)} series...")
     
     # Progress Bar for Deep Scan
     progress = Progress(
@@ -204,32 +212,59 @@ def perform_deep_analysis(
         TextColumn(f"[bold blue]{action_name} Content..."),
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeRemainingColumn(),
         TextColumn("{task.description}"),
         console=console
     )
 
     with Live(progress, console=console, refresh_per_second=DEEP_ANALYSIS_REFRESH_RATE):
-        task_id = progress.add_task("", total=len(series_list))
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_series = {
-                executor.submit(enrich_series, s, deep=deep, verify=verify): s
-                for s in series_list
-            }
-
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_series):
-                series = future_to_series[future]
-                completed += 1
-                try:
-                    future.result()  # Propagate exceptions if any
-                except Exception as e:
-                    logger.error(f"Error analyzing {series.name}: {e}", exc_info=True)
-                    console.print(f"[red]Error analyzing {series.name}: {e}[/red]")
-
-                progress.update(task_id, completed=completed, description=f"[dim]{series.name}[/dim]")
-
-    logger.info(f"Deep analysis complete: {completed} series processed")
+        task_id = progress.add_task("[dim]Ordering by disk location...[/dim]", total=len(volumes))
+
+        corrupt = completed = 0
+        for result in enrich_volumes(volumes, deep=deep, verify=verify):
+            if result.timed_out:
+                console.print(f"[yellow]Timed out: {result.volume.path}[/yellow]")
+            elif result.volume.is_corrupt:
+                corrupt += 1
+            completed += 1
+            status = f" [red]({corrupt} corrupt)[/red]" if corrupt else ""
+            progress.update(task_id, advance=1, description=f"[dim]{result.volume.name}[/dim]{status}")
+    logger.info(f"Deep analysis complete: {completed} volumes in {len(series_list)} series processed")
+
+def print_ai_usage_report() -> None:
+    """
+    Prints token usage and response cache hits/misses per model for this session.
+    """
+    usage = tracker.get_summary()
+    cache_stats = tracker.get_cache_summary()
+    estimated = tracker.get_estimated_summary()
+    if not usage and not cache_stats:
+        return
+
+    console.print("")
+    report = Table(title="AI Usage Summary", box=box.SIMPLE_HEAD)
+    report.add_column("Model", style="cyan")
+    report.add_column("Input Tokens", justify="right")
+    report.add_column("Output Tokens", justify="right")
+    report.add_column("Total", justify="right", style="bold white")
+    report.add_column("Cache Hits", justify="right", style="green")
+    report.add_column("Cache Misses", justify="right", style="yellow")
+
+    for model in sorted(set(usage) | set(cache_stats)):
+        counts = usage.get(model, {"prompt": 0, "completion": 0})
+        hits = cache_stats.get(model, {"hits": 0, "misses": 0})
+        mark = "~" if estimated.get(model) else ""
+        report.add_row(
+            model,
+            f"{mark}{counts['prompt']}",
+            f"{mark}{counts['completion']}",
+            f"{mark}{counts['prompt'] + counts['completion']}",
+            str(hits["hits"]),
+            str(hits["misses"])
+        )
+    if estimated:
+        report.caption = f"~ includes estimates for {sum(estimated.values())} streamed call(s) cut short before usage was reported"
+    console.print(report)
 
 def select_model_interactive(models: List[str], default: Optional[str] = None) -> str:
     """
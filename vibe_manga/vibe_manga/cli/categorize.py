@@ -13,9 +13,12 @@ from .organize import organize
 @click.option("--model-assign", is_flag=True, help="Configure AI models.")
 @click.option("--pause", is_flag=True, help="Pause (Interactive mode).")
 @click.option("--newroot", help="Target NEW root (Copy mode).")
+@click.option("--no-ai-cache", is_flag=True, help="Bypass the persistent AI response cache.")
+@click.option("--parallel", type=click.IntRange(1, 10), default=1, help="Series to categorize concurrently (--auto only).")
+@click.option("--batch-size", type=click.IntRange(1, 50), default=1, help="Series per AI request (--auto only).")
 @click.option("-v", "--verbose", count=True, help="Verbosity.")
 @click.pass_context
-def categorize(ctx, query, auto, simulate, no_cache, model_assign, pause, newroot, verbose):
+def categorize(ctx, query, auto, simulate, no_cache, model_assign, pause, newroot, no_ai_cache, parallel, batch_size, verbose):
     """
     [DEPRECATED] Use 'organize' instead.
     
@@ -51,5 +54,8 @@ def categorize(ctx, query, auto, simulate, no_cache, model_assign, pause, newroo
         no_tag=[], 
         genre=[], 
         no_genre=[], 
-        no_source=[]
+        no_source=[],
+        no_ai_cache=no_ai_cache,
+        parallel=parallel,
+        batch_size=batch_size
     )
\ No newline at end of file
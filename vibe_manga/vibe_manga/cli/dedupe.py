@@ -5,6 +5,7 @@ Provides comprehensive duplicate detection and resolution workflow:
 1. MAL ID Conflicts - Same MAL ID in different folders
 2. Content Duplicates - Same files via hashing/metadata
 3. Fuzzy Duplicates - Similar names with AI assistance
+4. Perceptual Duplicates - Same pages in differently encoded archives (--mode perceptual)
 """
 
 import click
@@ -14,11 +15,13 @@ from pathlib import Path
 from typing import Optional, Dict, List
 
 from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn, TimeRemainingColumn
 
 from .base import console, get_library_root, run_scan_with_progress, perform_deep_analysis
 from ..dedupe_engine import DedupeEngine, DuplicateGroup
 from ..dedupe_resolver import DuplicateResolver, ResolutionPlan, ResolutionAction
 from ..dedupe_actions import ActionExecutor
+from ..constants import FUZZY_MAX_WORKERS
 from ..logging import get_logger, set_log_level
 
 logger = get_logger(__name__)
@@ -31,12 +34,13 @@ logger = get_logger(__name__)
 @click.option("--verify", is_flag=True, help="Verify archive integrity (slow) before deduping.")
 @click.option("--no-cache", is_flag=True, help="Force fresh scan, ignore cache.")
 @click.option("--structural-only", is_flag=True, help="Only check for structural duplicates (deprecated, use --mode fuzzy).")
-@click.option("--mode", "-m", type=click.Choice(['all', 'mal-id', 'content', 'fuzzy'], case_sensitive=False), default='all', help="Detection mode: all, mal-id, content, or fuzzy.")
+@click.option("--mode", "-m", type=click.Choice(['all', 'mal-id', 'content', 'fuzzy', 'perceptual'], case_sensitive=False), default='all', help="Detection mode: all, mal-id, content, fuzzy, or perceptual.")
 @click.option("--hashing", is_flag=True, help="Use file hashing for content duplicates (slow but accurate).")
 @click.option("--auto", is_flag=True, help="Auto-resolve simple cases (same MAL ID, clear supersets).")
 @click.option("--simulate", is_flag=True, help="Preview changes without executing them.")
 @click.option("--report", type=click.Path(), help="Save detailed report to JSON file.")
 @click.option("--whitelist", type=click.Path(), help="Path to whitelist file (default: vibe_manga_duplicate_whitelist.json).")
+@click.option("--workers", type=int, default=None, help="Processes for fuzzy name scoring (default: CPU count).")
 def dedupe(
     query: Optional[str],
     verbose: int,
@@ -49,7 +53,8 @@ def dedupe(
     auto: bool,
     simulate: bool,
     report: Optional[str],
-    whitelist: Optional[str]
+    whitelist: Optional[str],
+    workers: Optional[int]
 ) -> None:
     """
     Interactive duplicate detection and resolution for manga library.
@@ -61,7 +66,8 @@ def dedupe(
     - mal-id: Detect series with same MAL ID (highest confidence)
     - content: Detect duplicate files by size/hash (medium confidence)  
     - fuzzy: Detect series with similar names (lower confidence)
-    - all: Run all detection modes (recommended)
+    - perceptual: Detect re-encoded copies of volumes by comparing sampled pages (slow on first run)
+    - all: Run mal-id, content and fuzzy detection (recommended)
     
     During interactive resolution, you can use:
     - [I]nspect: Deep dive into file details and quality
@@ -113,15 +119,38 @@ def dedupe(
     
     # Initialize detection engine
     console.print("\n[bold blue]Initializing duplicate detection...[/bold blue]")
-    engine = DedupeEngine(library, use_hashing=hashing)
+    engine = DedupeEngine(library, use_hashing=hashing, workers=workers or FUZZY_MAX_WORKERS)
     
     # Run detection
     console.print(f"[bold]Running {mode} duplicate detection...[/bold]")
-    with console.status("[dim]Scanning for duplicates...[/dim]"):
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task("[dim]Scanning for duplicates...[/dim]", total=None)
+
+        def on_fuzzy_progress(scored: int, total: int) -> None:
+            progress.update(task, description="[dim]Scoring similar names (Ctrl+C to stop early)...[/dim]", completed=scored, total=total)
+
+        def on_fuzzy_group(group: DuplicateGroup) -> None:
+            names = " ~ ".join(s.name for s in group.items)
+            progress.console.print(f"[dim]  Fuzzy match ({group.confidence:.0%}): {names}[/dim]")
+
+        def on_perceptual_progress(done: int, total: int) -> None:
+            progress.update(task, description="[dim]Fingerprinting sampled pages...[/dim]", completed=done, total=total)
+
         if mode == 'all':
-            all_results = engine.detect_all()
+            all_results = engine.detect_all(on_fuzzy_progress, on_fuzzy_group)
         else:
-            all_results = engine.detect_by_mode(mode)
+            all_results = engine.detect_by_mode(mode, on_fuzzy_progress, on_fuzzy_group, on_perceptual_progress)
+
+    if engine.fuzzy_detector.interrupted:
+        console.print(f"[yellow]Fuzzy detection stopped early: continuing with the {len(all_results['fuzzy_duplicates'])} group(s) found so far.[/yellow]")
     
     # Filter by query if provided
     if query:
@@ -130,6 +159,7 @@ def dedupe(
     # Show detection summary
     summary = engine.get_duplicate_summary(all_results)
     _display_detection_summary(summary, all_results, mode)
+    console.print("[dim]Timings: " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in engine.timings.items()) + "[/dim]")
     
     if summary['total_groups'] == 0:
         console.print("\n[green]✓ No duplicates found![/green]")
@@ -181,6 +211,15 @@ def dedupe(
             if plan:
                 resolution_plans.append(plan)
     
+    # Process perceptual duplicates (same pages, different files)
+    if all_results['perceptual_duplicates']:
+        console.print("\n[bold yellow]=== Perceptual Duplicates (re-encoded copies) ===[/bold yellow]")
+        for duplicate in all_results['perceptual_duplicates']:
+            console.print(f"\n[dim]Sampled pages match: {duplicate.similarity:.0%}[/dim]")
+            plan = resolver.resolve_content_duplicate(duplicate)
+            if plan:
+                resolution_plans.append(plan)
+    
     # Show resolution summary
     if resolution_plans:
         _display_resolution_summary(resolution_plans)
@@ -193,6 +232,7 @@ def dedupe(
                 # Show execution summary
                 summary = executor.get_execution_summary()
                 _display_execution_summary(summary)
+                console.print(f"[dim]{executor.describe_throughput()}[/dim]")
                 
                 # Save report if requested
                 if report:
@@ -201,6 +241,14 @@ def dedupe(
             else:
                 console.print("[yellow]Execution cancelled.[/yellow]")
         else:
+            # Dry run: resolve every move without touching files
+            executor = ActionExecutor(simulate=True)
+            executor.execute_plans(resolution_plans)
+            _display_execution_summary(executor.get_execution_summary())
+            console.print(f"[dim]{executor.describe_throughput()}[/dim]")
+            if report:
+                executor.save_execution_report(Path(report))
+                console.print(f"[dim]Report saved to: {report}[/dim]")
             console.print("\n[dim]Simulate mode - no changes made.[/dim]")
             console.print("[dim]Run without --simulate to apply changes.[/dim]")
     else:
@@ -214,7 +262,7 @@ def _filter_results_by_mode(results: Dict, mode: str) -> Dict:
     if mode == 'all':
         return results
     
-    filtered = {'mal_id_conflicts': [], 'content_duplicates': [], 'fuzzy_duplicates': []}
+    filtered = {'mal_id_conflicts': [], 'content_duplicates': [], 'fuzzy_duplicates': [], 'perceptual_duplicates': []}
     
     if mode == 'mal-id':
         filtered['mal_id_conflicts'] = results['mal_id_conflicts']
@@ -222,6 +270,8 @@ def _filter_results_by_mode(results: Dict, mode: str) -> Dict:
         filtered['content_duplicates'] = results['content_duplicates']
     elif mode == 'fuzzy':
         filtered['fuzzy_duplicates'] = results['fuzzy_duplicates']
+    elif mode == 'perceptual':
+        filtered['perceptual_duplicates'] = results['perceptual_duplicates']
     
     return filtered
 
@@ -229,7 +279,7 @@ def _filter_results_by_mode(results: Dict, mode: str) -> Dict:
 def _filter_results_by_query(results: Dict, query: str) -> Dict:
     """Filter detection results by query string."""
     query_lower = query.lower()
-    filtered = {'mal_id_conflicts': [], 'content_duplicates': [], 'fuzzy_duplicates': []}
+    filtered = {'mal_id_conflicts': [], 'content_duplicates': [], 'fuzzy_duplicates': [], 'perceptual_duplicates': []}
     
     # Filter MAL ID conflicts
     for duplicate in results['mal_id_conflicts']:
@@ -246,6 +296,11 @@ def _filter_results_by_query(results: Dict, query: str) -> Dict:
         if any(query_lower in series.name.lower() for series in duplicate.items):
             filtered['fuzzy_duplicates'].append(duplicate)
     
+    # Filter perceptual duplicates
+    for duplicate in results['perceptual_duplicates']:
+        if any(query_lower in vol.path.parent.name.lower() for vol in duplicate.volumes):
+            filtered['perceptual_duplicates'].append(duplicate)
+    
     return filtered
 
 
@@ -277,6 +332,13 @@ def _display_detection_summary(summary: Dict, results: Dict, mode: str):
             f"{summary['total_affected_series']} series affected"
         )
     
+    if summary['perceptual_groups'] > 0:
+        table.add_row(
+            "Perceptual Duplicates",
+            str(summary['perceptual_groups']),
+            f"{summary['perceptual_files']} files, {summary['perceptual_space_mb']:.1f} MB"
+        )
+    
     if summary['total_groups'] == 0:
         table.add_row("No duplicates found", "0", "-")
     
@@ -6,8 +6,9 @@ Selects a manga from matched results and adds it to qBittorrent.
 import click
 from typing import Optional
 
-from .base import get_library_root
+from .base import get_library_root, console
 from ..grabber import process_grab
+from ..grab_status_store import GrabStatusStore
 
 @click.command()
 @click.argument("name", required=False)
@@ -17,11 +18,23 @@ from ..grabber import process_grab
 @click.option("--auto-add-only", is_flag=True, help="Same as auto-add, but skips items that don't match criteria instead of prompting.")
 @click.option("--force", is_flag=True, help="Process items even if they were previously marked for skipping in auto-add modes.")
 @click.option("--max", "max_downloads", type=int, help="Limit the number of auto-added items.")
-def grab(name: Optional[str], input_file: str, status: bool, auto_add: bool, auto_add_only: bool, force: bool, max_downloads: Optional[int]) -> None:
+@click.option("--merge-status", is_flag=True, help="Write journaled grab/pull statuses back into the input file and exit.")
+def grab(name: Optional[str], input_file: str, status: bool, auto_add: bool, auto_add_only: bool, force: bool, max_downloads: Optional[int], merge_status: bool) -> None:
     """
     Selects a manga from matched results and adds it to qBittorrent.
     
     NAME can be a parsed name from the JSON or 'next' to get the first unflagged entry.
     """
+    if merge_status:
+        store = GrabStatusStore(input_file)
+        pending = len(store.load())
+        if not pending:
+            console.print(f"[dim]No journaled grab statuses to merge into {input_file}.[/dim]")
+        elif store.merge():
+            console.print(f"[green]Merged {pending} grab status change(s) into {input_file}.[/green]")
+        else:
+            console.print(f"[red]Could not merge grab statuses into {input_file}.[/red]")
+        return
+
     root_path = get_library_root()
     process_grab(name, input_file, status, root_path, auto_add=auto_add, auto_add_only=auto_add_only, force=force, max_downloads=max_downloads)
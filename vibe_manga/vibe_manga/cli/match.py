@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 @click.command()
 @click.argument("query", required=False)
-@click.option("--input-file", default=NYAA_DEFAULT_OUTPUT_FILENAME, help="Input JSON file (default: nyaa_scrape_results.json)")
+@click.option("--input-file", default=NYAA_DEFAULT_OUTPUT_FILENAME, help="Input scrape store (default: nyaa_scrape_results.jsonl; legacy JSON arrays are accepted)")
 @click.option("--output-file", default="nyaa_match_results.json", help="Output JSON file.")
 @click.option("--table", is_flag=True, help="Show the results table.")
 @click.option("--all", "show_all", is_flag=True, help="Show all entries, including skipped ones.")
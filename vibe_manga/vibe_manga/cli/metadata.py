@@ -19,11 +19,11 @@ from .base import (
     console, 
     get_library_root, 
     run_scan_with_progress, 
-    run_model_assignment
+    run_model_assignment,
+    print_ai_usage_report
 )
 from ..models import Series
 from ..metadata import get_or_create_metadata
-from ..ai_api import tracker
 from ..constants import PROGRESS_REFRESH_RATE
 from ..logging import get_logger, log_substep
 
@@ -194,22 +194,6 @@ def metadata(query: Optional[str], force_update: bool, trust_jikan: bool, proces
         console.print(table)
     
     # Final AI Report
-    usage = tracker.get_summary()
-    if usage:
-        console.print("")
-        report = Table(title="AI Usage Summary", box=box.SIMPLE_HEAD)
-        report.add_column("Model", style="cyan")
-        report.add_column("Input Tokens", justify="right")
-        report.add_column("Output Tokens", justify="right")
-        report.add_column("Total", justify="right", style="bold white")
-        
-        for model, counts in usage.items():
-            report.add_row(
-                model,
-                str(counts["prompt"]),
-                str(counts["completion"]),
-                str(counts["prompt"] + counts["completion"])
-            )
-        console.print(report)
+    print_ai_usage_report()
 
     console.print(f"[green]Metadata update complete for {len(targets)} series![/green]")
@@ -9,9 +9,11 @@ import logging
 import queue
 import threading
 import json
+import concurrent.futures
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from rich.console import Console
 from rich.prompt import Confirm
@@ -22,9 +24,9 @@ from rich.table import Table
 from rich import box
 from rich.rule import Rule
 
-from .base import console, run_scan_with_progress, get_library_root, run_model_assignment
+from .base import console, run_scan_with_progress, get_library_root, run_model_assignment, print_ai_usage_report
 from ..indexer import LibraryIndex
-from ..categorizer import suggest_category, get_category_list
+from ..categorizer import suggest_category, suggest_categories_batch, get_category_list
 from ..models import Series, Library, Category
 from ..scanner import scan_library
 from ..logging import log_step, log_substep
@@ -226,6 +228,62 @@ def copy_worker(task_queue: queue.Queue, result_queue: queue.Queue, progress: Pr
         progress.update(task_id_copy, visible=False)
         task_queue.task_done()
 
+def iter_ai_suggestions(
+    candidates: List[Series],
+    library: Library,
+    parallel: int = 1,
+    batch_size: int = 1,
+    status_callback: Optional[Callable[[str], None]] = None,
+    **suggest_kwargs: Any
+) -> Iterator[Tuple[Series, Optional[Dict[str, Any]]]]:
+    """
+    Yields (series, suggestion) pairs in candidate order.
+
+    With batch_size > 1, series are categorized in groups of `batch_size` using one
+    request per council role (see suggest_categories_batch). With parallel > 1, up to
+    `parallel` series (or batches) are in flight at once (bounded look-ahead) while
+    results are still consumed in order. Provider limits are enforced in call_ai.
+    """
+    jobs = [candidates[i:i + batch_size] for i in range(0, len(candidates), max(1, batch_size))]
+
+    def run(job: List[Series]) -> List[Optional[Dict[str, Any]]]:
+        label = job[0].name if len(job) == 1 else f"Batch of {len(job)}"
+
+        def job_status(msg: str) -> None:
+            if status_callback:
+                status_callback(f"{label}: {msg}" if parallel > 1 else msg)
+        try:
+            if batch_size > 1:
+                batch_kwargs = {k: v for k, v in suggest_kwargs.items() if k != "quiet"}
+                return suggest_categories_batch(job, library, status_callback=job_status, **batch_kwargs)
+            return [suggest_category(job[0], library, status_callback=job_status, **suggest_kwargs)]
+        except Exception as e:
+            logger.error(f"AI categorization failed for {label}: {e}")
+            return [None] * len(job)
+
+    if parallel <= 1:
+        for job in jobs:
+            yield from zip(job, run(job))
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+        pending = deque()
+        remaining = iter(jobs)
+
+        def fill() -> None:
+            while len(pending) < parallel:
+                job = next(remaining, None)
+                if job is None:
+                    return
+                pending.append((job, executor.submit(run, job)))
+
+        fill()
+        while pending:
+            job, future = pending.popleft()
+            suggestions = future.result()
+            fill()
+            yield from zip(job, suggestions)
+
 def visualize_ai_decision(results: dict, series_name: str, console_override: Optional[Console] = None):
     """Visualizes the AI categorization decision using Rich panels."""
     if not results: return
@@ -322,6 +380,9 @@ def visualize_ai_decision(results: dict, series_name: str, console_override: Opt
 @click.option("--newonly", is_flag=True, help="Skip series that already exist in --newroot destination.")
 @click.option("--instruct", help="Provide specific instructions/feedback to the Consensus AI (e.g., 'Force all Isekai to Fantasy').")
 @click.option("--interactive", is_flag=True, help="Enable interactive mode with manual confirmation and detailed UI.")
+@click.option("--no-ai-cache", is_flag=True, help="Bypass the persistent AI response cache and query the models fresh.")
+@click.option("--parallel", type=click.IntRange(1, 10), default=1, help="Number of series to categorize concurrently in non-interactive mode (Default: 1).")
+@click.option("--batch-size", type=click.IntRange(1, 50), default=1, help="Categorize N series per AI request in non-interactive mode (Default: 1 = off).")
 def organize(
     model_assign: bool,
     newonly: bool,
@@ -340,6 +401,9 @@ def organize(
     no_cache: bool,
     explain: bool,
     interactive: bool,
+    no_ai_cache: bool,
+    parallel: int,
+    batch_size: int,
 ) -> None:
     """
     Organize series by moving or copying them based on filters and AI suggestions.
@@ -349,7 +413,7 @@ def organize(
     """
     if model_assign:
         run_model_assignment()
-    
+
     library_root = get_library_root()
     
     # 1. Setup Phase
@@ -525,7 +589,8 @@ def organize(
                                 custom_categories=custom_schema if mode == "COPY" else None,
                                 restrict_to_main=restrict_to,
                                 status_callback=update_status_cb,
-                                confirm_callback=confirm_cb
+                                confirm_callback=confirm_cb,
+                                use_ai_cache=not no_ai_cache
                             )
                         
                         if not results or not results.get("consensus"):
@@ -673,7 +738,26 @@ def organize(
             def update_ai_status(msg: str):
                 progress.update(task_id_ai, description=f"[magenta]{msg}", visible=True)
 
-            for series in candidates:
+            # Case A: Direct Target (e.g. "Manga/Action") needs no AI
+            if target and "/" in target:
+                suggestions = ((series, None) for series in candidates)
+            # Case B: AI Assisted (optionally several series in flight at once)
+            else:
+                suggestions = iter_ai_suggestions(
+                    candidates,
+                    library,
+                    parallel=parallel,
+                    batch_size=batch_size,
+                    status_callback=update_ai_status,
+                    custom_categories=custom_schema if mode == "COPY" else None,
+                    restrict_to_main=target, # None or "Manga"
+                    # Use quiet mode if auto is enabled to prevent spinner conflict
+                    quiet=auto,
+                    user_feedback=instruct,
+                    use_ai_cache=not no_ai_cache
+                )
+
+            for series, suggestion in suggestions:
                 # Update Main Task
                 progress.update(task_id_total, description=f"[bold green]Processing: {series.name}")
                 
@@ -686,32 +770,15 @@ def organize(
                 # Determine Target Path
                 final_category_path = ""
                 
-                # Case A: Direct Target (e.g. "Manga/Action")
                 if target and "/" in target:
                     final_category_path = target
                     
-                # Case B: AI Assisted
                 else:
-                    restrict_to = target # None or "Manga"
-                    
-                    # Use quiet mode if auto is enabled to prevent spinner conflict
-                    use_quiet = auto 
-                    
-                    suggestion = suggest_category(
-                        series, 
-                        library, 
-                        custom_categories=custom_schema if mode == "COPY" else None,
-                        restrict_to_main=restrict_to,
-                        quiet=use_quiet,
-                        status_callback=update_ai_status,
-                        user_feedback=instruct
-                    )
-                    
                     # Reset AI Task visibility
                     progress.update(task_id_ai, visible=False)
                     
                     if not suggestion or "consensus" not in suggestion:
-                        if not use_quiet:
+                        if not auto:
                             console.print(f"[red]AI failed to categorize {series.name}. Skipping.[/red]")
                         fail_count += 1
                         progress.advance(task_id_total)
@@ -770,4 +837,5 @@ def organize(
         f"Complete!\nSuccess: {success_count}\nFailed: {fail_count}\nSkipped: {skipped_count}", 
         title="Summary", 
         border_style="green"
-    ))
\ No newline at end of file
+    ))
+    print_ai_usage_report()
\ No newline at end of file
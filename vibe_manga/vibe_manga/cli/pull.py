@@ -6,15 +6,18 @@ Checks for completed torrents in qBittorrent and post-processes them.
 import click
 import logging
 from .base import get_library_root, console
-from ..grabber import process_pull
+from ..grabber import process_pull, watch_pull
+from ..constants import QBIT_WATCH_INTERVAL_SECONDS
 from ..logging import set_log_level
 
 @click.command()
 @click.option("--input-file", default="nyaa_match_results.json", help="Matched results JSON to update status.")
 @click.option("--simulate", is_flag=True, help="Show what would be done without making changes.")
 @click.option("--pause", is_flag=True, help="Pause between post-processing items.")
+@click.option("--watch", is_flag=True, help="Keep running and pull torrents as they complete (incremental qBittorrent sync).")
+@click.option("--interval", default=QBIT_WATCH_INTERVAL_SECONDS, show_default=True, type=float, help="Seconds between qBittorrent sync rounds in --watch mode.")
 @click.option("-v", "--verbose", count=True, help="Increase verbosity (-v: INFO, -vv: DEBUG).")
-def pull(input_file: str, simulate: bool, pause: bool, verbose: int) -> None:
+def pull(input_file: str, simulate: bool, pause: bool, watch: bool, interval: float, verbose: int) -> None:
     """
     Checks for completed torrents in qBittorrent and post-processes them.
     """
@@ -31,4 +34,7 @@ def pull(input_file: str, simulate: bool, pause: bool, verbose: int) -> None:
     set_log_level(log_level, "console", clean=clean_logs)
 
     root_path = get_library_root()
-    process_pull(simulate=simulate, pause=pause, root_path=root_path, input_file=input_file)
+    if watch:
+        watch_pull(simulate=simulate, pause=pause, root_path=root_path, input_file=input_file, interval=interval)
+    else:
+        process_pull(simulate=simulate, pause=pause, root_path=root_path, input_file=input_file)
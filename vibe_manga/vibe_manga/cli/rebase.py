@@ -16,6 +16,7 @@ from .base import console, get_library_root, run_scan_with_progress
 from ..constants import PULL_TEMPDIR, VALID_MANGA_EXTENSIONS
 from ..models import Series, Volume
 from ..analysis import semantic_normalize
+from ..inspection_store import get_inspection_store
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +36,8 @@ try:
 except ImportError:
     SEVENZIP_SUPPORT = False
 
-# Optional imports for Resize support
+# Optional imports for Resize support (numpy is bound by the JXL block above)
 try:
-    import numpy as np
     from sewar.full_ref import msssim
     RESIZE_SUPPORT = True
 except ImportError:
@@ -559,6 +559,7 @@ def process_nojxl(targets: List[Series], simulate: bool):
                     progress.advance(task_id)
 
     finally:
+        get_inspection_store().commit()
         # Cleanup work dir
         if work_dir.exists():
             try:
@@ -573,16 +574,22 @@ def process_archive_nojxl(volume: Volume, work_dir: Path, simulate: bool) -> boo
     """
     try:
         has_jxl = False
-        
+        store = get_inspection_store()
+
+        # 0. Entry formats recorded by an earlier inspection (--deep/--verify or a previous rebase)
+        record = store.lookup(volume.path)
+        if record and record.formats is not None and not record.corrupt and '.jxl' not in record.formats:
+            return False
+
         # 1. Quick Peek (without full extraction if possible)
         # Try generic zip peek
         try:
             if zipfile.is_zipfile(volume.path):
                 with zipfile.ZipFile(volume.path) as zf:
-                    for n in zf.namelist():
-                        if n.lower().endswith('.jxl'):
-                            has_jxl = True
-                            break
+                    names = zf.namelist()
+                formats = sorted({Path(n).suffix.lower() for n in names if not n.endswith('/')} - {''})
+                store.update(volume.path, formats=formats)
+                has_jxl = '.jxl' in formats
         except:
             pass
         
@@ -20,9 +20,13 @@ from ..constants import (
     NYAA_DEFAULT_PAGES_TO_SCRAPE,
     NYAA_DEFAULT_OUTPUT_FILENAME,
     SCRAPE_HISTORY_FILENAME,
-    SCRAPE_QUERY_COOLDOWN_DAYS
+    SCRAPE_QUERY_COOLDOWN_DAYS,
+    SCRAPE_YIELD_HISTORY_FILENAME,
+    SCRAPE_PAGE_BUDGET
 )
-from ..nyaa_scraper import scrape_nyaa, get_latest_timestamp_from_nyaa
+from ..nyaa_scraper import scrape_nyaa_queries, get_latest_timestamp_from_nyaa
+from ..scrape_store import open_scrape_store
+from ..scrape_planner import ScrapeTarget, plan_queries, gap_size
 from ..logging import get_logger, log_substep
 from ..analysis import find_gaps
 
@@ -54,6 +58,24 @@ def save_query_history(history: Dict[str, float]) -> None:
     except IOError as e:
         logger.error(f"Error saving scrape history to '{SCRAPE_HISTORY_FILENAME}': {e}")
 
+def load_yield_history() -> Dict[str, dict]:
+    """Loads when each search query last found new entries."""
+    if os.path.exists(SCRAPE_YIELD_HISTORY_FILENAME):
+        try:
+            with open(SCRAPE_YIELD_HISTORY_FILENAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not load scrape yield history from '{SCRAPE_YIELD_HISTORY_FILENAME}': {e}. Starting fresh.")
+    return {}
+
+def save_yield_history(history: Dict[str, dict]) -> None:
+    """Saves the per-query yield history."""
+    try:
+        with open(SCRAPE_YIELD_HISTORY_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2)
+    except IOError as e:
+        logger.error(f"Error saving scrape yield history to '{SCRAPE_YIELD_HISTORY_FILENAME}': {e}")
+
 def generate_search_alternatives(query: str) -> List[str]:
     """
     Generates alternative search queries based on the input query.
@@ -119,18 +141,18 @@ def generate_search_alternatives(query: str) -> List[str]:
 
 @click.command()
 @click.option("--pages", default=NYAA_DEFAULT_PAGES_TO_SCRAPE, help="Number of pages to scrape.")
-@click.option("--output", default=NYAA_DEFAULT_OUTPUT_FILENAME, help="Output file to save JSON results.")
+@click.option("--output", default=NYAA_DEFAULT_OUTPUT_FILENAME, help="Output JSON Lines store for results (appended to).")
 @click.option("--user-agent", help="Override the default User-Agent for scraping.")
 @click.option("--force", is_flag=True, help="Force a full rescrape, ignoring existing data.")
 @click.option("--summarize", is_flag=True, help="Display a summary of the scraped data.")
 @click.option("--query", "-q", help="Search query to filter results.")
 @click.option("--continuity", is_flag=True, help="Scan library and scrape for series with missing volumes/chapters.")
-def scrape(pages: int, output: str, user_agent: Optional[str], force: bool, summarize: bool, query: Optional[str], continuity: bool) -> None:
+@click.option("--page-budget", default=SCRAPE_PAGE_BUDGET, show_default=True, help="Max pages fetched across all searches in one run (0 = unlimited).")
+def scrape(pages: int, output: str, user_agent: Optional[str], force: bool, summarize: bool, query: Optional[str], continuity: bool, page_budget: int) -> None:
     """Scrapes nyaa.si for the latest English-translated literature."""
-    logger.info(f"Scrape command started (pages={pages}, output={output}, force={force}, summarize={summarize}, query={query}, continuity={continuity})")
+    logger.info(f"Scrape command started (pages={pages}, output={output}, force={force}, summarize={summarize}, query={query}, continuity={continuity}, page_budget={page_budget})")
 
-    existing_data = []
-    latest_known_timestamp = None
+    store = open_scrape_store(output)
     perform_scrape = True
     
     # Load query history
@@ -138,36 +160,25 @@ def scrape(pages: int, output: str, user_agent: Optional[str], force: bool, summ
     now_ts = datetime.datetime.now().timestamp()
     cooldown_seconds = SCRAPE_QUERY_COOLDOWN_DAYS * 24 * 3600
 
-    # 1. Load existing data & Check incremental
-    if os.path.exists(output):
-        try:
-            with open(output, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-            if existing_data:
-                # Assuming data is list of dicts with 'date' field
-                latest_known_timestamp = max(int(entry.get('date', 0)) for entry in existing_data)
-                
-                if not force and not query and not continuity:
-                    date_str = datetime.datetime.fromtimestamp(latest_known_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                    logger.info(f"Incremental scrape active. Stopping at timestamp: {latest_known_timestamp} ({date_str})")
-                    
-                    # Quick check against live site
-                    latest_live_timestamp = get_latest_timestamp_from_nyaa(user_agent=user_agent)
-                    if latest_live_timestamp and latest_live_timestamp <= latest_known_timestamp:
-                        logger.info("The Nyaa index has not been updated since the last scrape. Use --force to override.")
-                        perform_scrape = False
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Could not parse existing file '{output}': {e}. Starting fresh.")
-            # If parse failed, treat as if no existing data
-            existing_data = []
+    # 1. Check incremental against the store's high-water timestamp (no full load)
+    latest_known_timestamp = store.high_water
+    if latest_known_timestamp is not None and not force and not query and not continuity:
+        date_str = datetime.datetime.fromtimestamp(latest_known_timestamp).strftime('%Y-%m-%d %H:%M:%S')
+        logger.info(f"Incremental scrape active. Stopping at timestamp: {latest_known_timestamp} ({date_str})")
+
+        # Quick check against live site
+        latest_live_timestamp = get_latest_timestamp_from_nyaa(user_agent=user_agent)
+        if latest_live_timestamp and latest_live_timestamp <= latest_known_timestamp:
+            logger.info("The Nyaa index has not been updated since the last scrape. Use --force to override.")
+            perform_scrape = False
 
     # 2. Perform Scrape (if needed)
     if perform_scrape:
-        queries_to_try = []
+        targets: List[ScrapeTarget] = []
         
         # Add manual query
         if query:
-            queries_to_try.extend(generate_search_alternatives(query))
+            targets.append(ScrapeTarget(name=query, alternatives=generate_search_alternatives(query), manual=True, max_pages=pages))
         
         # Add continuity queries
         if continuity:
@@ -184,130 +195,121 @@ def scrape(pages: int, output: str, user_agent: Optional[str], force: bool, summ
             continuity_targets = []
             with console.status("[bold blue]Analyzing continuity gaps..."):
                 for s in all_series:
-                    if find_gaps(s):
+                    gaps = find_gaps(s)
+                    if gaps:
                         # Use metadata title if available for better search results, else folder name
                         # Metadata is populated during scan_library
                         name = s.metadata.title_english or s.metadata.title
                         if not name or name == "Unknown":
                             name = s.name
-                        continuity_targets.append(name)
+                        continuity_targets.append(ScrapeTarget(
+                            name=name,
+                            alternatives=generate_search_alternatives(name),
+                            gap_size=gap_size(gaps),
+                            max_pages=pages
+                        ))
             
             if continuity_targets:
                 console.print(f"[green]Found {len(continuity_targets)} series with continuity gaps. Adding to scrape queue.[/green]")
-                for target in continuity_targets:
-                     queries_to_try.extend(generate_search_alternatives(target))
+                targets.extend(continuity_targets)
             else:
                 console.print("[green]No continuity gaps found in library.[/green]")
 
-        # Default fallback: If no specific queries, scrape the front page (incremental)
-        if not queries_to_try:
-             queries_to_try.append(None) 
-
         new_results = []
-        seen_magnets = set(entry.get('magnet_link') for entry in existing_data)
+        seen_magnets = set()
         history_updated = False
+        budget = None
+        page_caps = {}
 
-        # Dedup queries while preserving order
-        unique_queries = []
-        seen_q = set()
-        for q in queries_to_try:
-            # Handle None (default scrape) separately
-            if q is None:
-                if None not in seen_q:
-                    unique_queries.append(None)
-                    seen_q.add(None)
-                continue
-                
-            q_norm = q.lower().strip()
-            if q_norm not in seen_q:
-                unique_queries.append(q)
-                seen_q.add(q_norm)
-        
-        queries_to_try = unique_queries
+        if targets:
+            # Coalesce overlapping searches, apply cooldown and order by expected yield
+            yield_history = load_yield_history()
+            plan = plan_queries(
+                targets,
+                query_history,
+                yield_history=yield_history,
+                now_ts=now_ts,
+                cooldown_seconds=cooldown_seconds,
+                force=force
+            )
+            for q in plan.cooling_down:
+                days_ago = (now_ts - query_history.get(q, 0)) / (24 * 3600)
+                logger.info(f"Skipping query '{q}': Run {days_ago:.1f} days ago (Cooldown: {SCRAPE_QUERY_COOLDOWN_DAYS} days). Use --force to override.")
+            if plan.coalesced:
+                logger.info(f"Coalesced {len(plan.coalesced)} overlapping searches into broader ones.")
+            for planned in plan.queries:
+                logger.info(f"Searching for: '{planned.query}' (gap size {planned.gap_size}, score {planned.score:.1f})")
+            scheduled_queries = plan.query_strings
+            page_caps = plan.page_caps
+            budget = page_budget or None
+        else:
+            # Default fallback: If no specific queries, scrape the front page (incremental)
+            scheduled_queries = [None]
 
-        for q in queries_to_try:
-            if q:
-                # Check history cooldown
-                last_run = query_history.get(q, 0)
-                if not force and (now_ts - last_run < cooldown_seconds):
-                    days_ago = (now_ts - last_run) / (24 * 3600)
-                    logger.info(f"Skipping query '{q}': Run {days_ago:.1f} days ago (Cooldown: {SCRAPE_QUERY_COOLDOWN_DAYS} days). Use --force to override.")
-                    continue
-                    
-                logger.info(f"Searching for: '{q}'")
-            
-            # If we are searching, we usually don't want to stop at timestamp unless explicitly asked?
-            # But the user might want to scrape *new* results for a query.
-            # However, search results aren't strictly chronological if Nyaa sorts by relevance?
-            # Nyaa default sort is Date Descending. So timestamp check is valid.
-            # But if we search, we might be looking for older stuff too.
-            # If query is present, maybe ignore stop_at_timestamp unless force is NOT set?
-            # The logic above sets stop_at_timestamp only if not force AND not query (modified logic).
-            # Wait, I changed the logic above to: if not force and not query.
-            # So if query is present, latest_known_timestamp is ignored (it's None passed to scrape_nyaa).
-            # This makes sense for search: find everything matching, up to 'pages'.
-            
+        if scheduled_queries:
             # Determine stop condition:
-            # If searching (q is not None), ignore timestamp (get all matches up to N pages).
-            # If scraping front page (q is None), use timestamp (incremental).
-            ts_stop = latest_known_timestamp if (q is None and not force) else None
+            # If searching, ignore timestamp (get all matches up to N pages).
+            # If scraping front page (the only query is None), use timestamp (incremental).
+            ts_stop = latest_known_timestamp if (scheduled_queries == [None] and not force) else None
 
-            results = scrape_nyaa(
+            # All queries share one worker pool and rate budget; results come back
+            # already deduplicated against the existing data and each other.
+            query_stats = {}
+            results = scrape_nyaa_queries(
+                scheduled_queries,
                 pages=pages,
                 user_agent=user_agent,
                 stop_at_timestamp=ts_stop,
-                query=q
+                known_magnets=store.magnets,
+                page_budget=budget,
+                query_stats=query_stats,
+                query_pages=page_caps
             )
-            
-            if q:
-                # Update history only if search was actually performed
-                query_history[q] = now_ts
-                history_updated = True
-            
+
+            successes = {}
+            for q in scheduled_queries:
+                q_stats = query_stats.get(q, {})
+                if q and q_stats.get("pages"):
+                    # Update history only if search was actually performed
+                    query_history[q] = now_ts
+                    history_updated = True
+                    if q_stats.get("new"):
+                        successes[q] = {"last_success": now_ts, "new_entries": q_stats["new"]}
+
+            if successes:
+                yield_history.update(successes)
+                save_yield_history(yield_history)
+
             for res in results:
-                # Use asdict if it's a dataclass, but scrape_nyaa returns list of dicts (from asdict)
-                # scrape_nyaa returns list of dicts.
                 magnet = res.get('magnet_link')
-                if magnet and magnet not in seen_magnets:
+                if magnet and magnet not in seen_magnets and magnet not in store:
                     new_results.append(res)
                     seen_magnets.add(magnet)
-        
+
         if history_updated:
             save_query_history(query_history)
             
         if new_results:
-            # Merge results: New + Old
-            combined_data = new_results + existing_data
-            
-            # Ensure uniqueness (already checked new against old, but good to be safe)
-            unique_data = {v['magnet_link']: v for v in combined_data}.values()
-            # Sort by date descending
-            final_list = sorted(unique_data, key=lambda x: int(x.get('date', 0)), reverse=True)
-
-            # Save
+            # Append only the new entries; the store keeps its magnet index and high-water mark
             try:
-                with open(output, 'w', encoding='utf-8') as f:
-                    json.dump(final_list, f, indent=2)
-                
-                logger.info(f"Successfully saved {len(final_list)} results ({len(new_results)} new) to {output}")
-                log_substep(f"Saved {len(final_list)} total entries ({len(new_results)} new) to {output}")
-                
-                # Update in-memory data for summary
-                existing_data = final_list
-                
+                store.append(new_results)
+
+                logger.info(f"Successfully saved {len(store)} results ({len(new_results)} new) to {store.path}")
+                log_substep(f"Saved {len(store)} total entries ({len(new_results)} new) to {store.path}")
+
             except IOError as e:
                 logger.error(f"Error writing to output file {output}: {e}", exc_info=True)
                 
             logger.info(f"Scrape command completed. Found {len(new_results)} new entries.")
         else:
-            if not existing_data and perform_scrape:
+            if not len(store) and perform_scrape:
                  logger.warning("Scraping completed with no results.")
             elif perform_scrape:
                  logger.info("No new entries found. Library is up to date.")
 
     # 3. Summarize
     if summarize:
-        if not existing_data:
+        if not len(store):
             console.print("[yellow]No data to summarize.[/yellow]")
         else:
             table = Table(title=f"Scrape Summary: {output}", box=box.SIMPLE)
@@ -315,7 +317,8 @@ def scrape(pages: int, output: str, user_agent: Optional[str], force: bool, summ
             table.add_column("Name", style="white")
             table.add_column("Size", style="green", justify="right")
 
-            for entry in existing_data:
+            # Newest first, as the summary has always been shown
+            for entry in sorted(store.iter_entries(), key=lambda x: int(x.get('date', 0)), reverse=True):
                 try:
                     ts = int(entry.get('date', 0))
                     date_str = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
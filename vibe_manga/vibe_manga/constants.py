@@ -62,6 +62,29 @@ STOP_WORDS = {
 
 # Analysis Thresholds
 SIMILARITY_THRESHOLD = 0.95  # Threshold for fuzzy matching duplicate detection
+FUZZY_LSH_BANDS = 21  # MinHash-LSH bands for fuzzy dedupe candidate blocking
+FUZZY_LSH_ROWS = 3  # Signature rows per band (bands * rows MinHash permutations)
+FUZZY_LSH_MAX_BUCKET = 200  # LSH buckets larger than this are ignored (too generic to block on)
+FUZZY_MAX_WORKERS = os.cpu_count() or 1  # Processes scoring fuzzy dedupe candidate pairs
+FUZZY_SHARD_SIZE = 2000  # Candidate pairs per scoring task
+FUZZY_PARALLEL_MIN_PAIRS = 20000  # Below this, scoring in-process beats starting a pool
+CONTENT_HASH_SAMPLE_BYTES = 64 * 1024  # Head and tail bytes hashed for same-size files
+CONTENT_HASH_MAX_CENTRAL_DIR = 16 * 1024 * 1024  # Larger ZIP central directories are left out of the sample digest
+CONTENT_HASH_READ_SIZE = 8 * 1024 * 1024  # Read size for full-file digests
+ZIP_TAIL_READ_BYTES = 256 * 1024  # Bytes read from the end of a CBZ for its central directory (one read for ~3000 pages)
+PERCEPTUAL_SAMPLE_ANCHORS = 6  # Evenly spaced positions sampled per volume for page fingerprints
+PERCEPTUAL_SAMPLE_RUN = 2  # Consecutive pages hashed at each position (tolerates a shifted page)
+PERCEPTUAL_MIN_PAGE_STDDEV = 8.0  # Near-blank pages (grayscale std below this) are not fingerprinted
+PERCEPTUAL_MAX_DISTANCE = 10  # Max Hamming distance (of 64 bits, dHash and pHash each) for matching pages
+PERCEPTUAL_MIN_MATCH_RATIO = 0.6  # Share of sampled pages that must match for volumes to be near-duplicates
+PERCEPTUAL_LSH_BANDS = 20  # Bit-sampling LSH bands over the 64-bit pHash
+PERCEPTUAL_LSH_BITS = 16  # pHash bits per band
+PERCEPTUAL_MAX_BUCKET = 500  # Larger LSH buckets (e.g. shared credits pages) are ignored
+PERCEPTUAL_MAX_WORKERS = 8  # Threads decoding sampled pages
+INSPECTION_MAX_WORKERS = 8  # Threads inspecting archives (integrity tests, page counts, checksums)
+INSPECTION_IN_FLIGHT_PER_WORKER = 2  # Queued inspections per worker; bounds memory on huge series
+INSPECTION_FILE_TIMEOUT = 120  # Seconds before an archive inspection is reported as timed out
+DEDUPE_ACTION_WORKERS = 4  # Threads executing independent dedupe resolution plans
 FUZZY_MATCH_THRESHOLD = 95  # Threshold for matching scraped names to library series (0-100)
 MAX_RANGE_SIZE = 200  # Maximum allowed range size to avoid parsing year ranges like 1-2021
 YEAR_RANGE_MIN = 1900  # Minimum year value to filter out from number extraction
@@ -73,6 +96,7 @@ MIN_CHAP_SIZE_MB = 3
 DEFAULT_CACHE_MAX_AGE_SECONDS = 3000  # 3000 seconds (50 minutes)
 CACHE_FILENAME = ".vibe_manga_cache.pkl"
 LIBRARY_STATE_FILENAME = "vibe_manga_library.json"
+INSPECTION_DB_FILENAME = "vibe_manga_inspections.db"  # Digests, page counts and integrity results per (device, inode)
 
 # Display Configuration
 DEFAULT_TREE_DEPTH = 2
@@ -91,6 +115,7 @@ SERIES_ALIASES = {
 # Progress Display
 PROGRESS_REFRESH_RATE = 10  # Refresh per second for progress bars
 DEEP_ANALYSIS_REFRESH_RATE = 5  # Refresh per second for deep analysis
+DEEP_ANALYSIS_WORKERS = 16  # Threads, and so archives open at once, for --deep/--verify
 
 # Scraper Configuration
 NYAA_BASE_URL = "https://nyaa.si"
@@ -98,12 +123,18 @@ NYAA_ENGLISH_TRANSLATED_URL_TEMPLATE = f"{NYAA_BASE_URL}/?f=0&c=3_1&q=&p={{page}
 NYAA_SEARCH_URL_TEMPLATE = f"{NYAA_BASE_URL}/?f=0&c=3_1&q={{query}}&p={{page}}"
 SCRAPER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0"
 SCRAPER_RATE_LIMIT_PER_SECOND = 3
-NYAA_DEFAULT_OUTPUT_FILENAME = "nyaa_scrape_results.json"
+NYAA_DEFAULT_OUTPUT_FILENAME = "nyaa_scrape_results.jsonl"  # Append-only JSON Lines store
+NYAA_LEGACY_OUTPUT_FILENAME = "nyaa_scrape_results.json"  # Pre-JSONL single-array file, migrated on first append
 SCRAPE_HISTORY_FILENAME = "vibe_manga_scrape_history.json"
 SCRAPE_QUERY_COOLDOWN_DAYS = 30
+SCRAPE_YIELD_HISTORY_FILENAME = "vibe_manga_scrape_yield.json"  # Last successful run per search query
+SCRAPE_PAGE_BUDGET = 300  # Max listing pages fetched per scrape run across all searches (0 = unlimited)
+SCRAPE_PLANNER_STALE_DAYS = 90  # Queries unsuccessful for this long get full priority again
 SCRAPER_RETRY_COUNT = 3
 SCRAPER_RETRY_BACKOFF_FACTOR = 0.5
 SCRAPER_TIMEOUT_SECONDS = 15
+SCRAPER_MAX_WORKERS = 4  # Concurrent page fetches (still bounded by SCRAPER_RATE_LIMIT_PER_SECOND)
+SCRAPER_PAGES_IN_FLIGHT = 2  # Pages a query may fetch ahead of the last page merged in order
 
 # qBittorrent API Configuration
 QBIT_DEFAULT_TAG = "VibeManga"
@@ -111,10 +142,29 @@ QBIT_DEFAULT_CATEGORY = "VibeManga"
 QBIT_DEFAULT_SAVEPATH = "VibeManga"
 QBIT_DOWNLOAD_ROOT = os.getenv("QBIT_DOWNLOAD_ROOT", "")
 PULL_TEMPDIR = os.getenv("PULL_TEMPDIR", "")
+QBIT_SYNC_STATE_FILENAME = "vibe_manga_qbit_sync.json"  # Cached torrent state + sync/maindata rid
+PULL_PLAN_CACHE_FILENAME = "vibe_manga_pull_plans.json"  # Analyzed transfer plans per torrent hash
+QBIT_WATCH_INTERVAL_SECONDS = 10
+TRANSFER_METHODS = ("hardlink", "reflink", "rename", "copy")  # Pull staging/import strategies, cheapest first
+TRANSFER_CHUNK_SIZE = 8 * BYTES_PER_MB
+PULL_MAX_WORKERS = 4  # Completed torrents staged/imported concurrently (same series: one at a time)
+SEARCH_CANDIDATE_CACHE_MAX = 10000  # Memoized generate_search_candidates results before the cache is reset
+QBIT_BATCH_MAX_PENDING = 50  # Queued grab adds before the batch is flushed to qBittorrent
+QBIT_BATCH_RETRIES = 3
+QBIT_BATCH_RETRY_BACKOFF = 1.0  # Seconds; doubled on each retry
+GRAB_STATUS_JOURNAL_SUFFIX = ".grab_status.jsonl"  # Write-behind grab_status journal next to the match file
+GRAB_STATUS_FLUSH_SECONDS = 5.0
+GRAB_STATUS_FLUSH_EVERY = 200  # Buffered status changes before the journal is appended to
 
 # Nyaa.si Scraper Internals
 NYAA_DEFAULT_PAGES_TO_SCRAPE = 60
 NYAA_TORRENT_TABLE_SELECTOR = "div.table-responsive table.torrent-list tbody tr"
+# XPath equivalent of NYAA_TORRENT_TABLE_SELECTOR, used by the fast lxml page parser
+NYAA_TORRENT_ROW_XPATH = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' table-responsive ')]"
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' torrent-list ')]"
+    "//tbody//tr"
+)
 NYAA_MIN_COLUMNS = 8
 NYAA_COL_IDX_NAME = 1
 NYAA_COL_IDX_LINKS = 2
@@ -139,6 +189,22 @@ LOCAL_AI_MODEL = os.getenv("LOCAL_AI_MODEL", "llama3")
 AI_TIMEOUT = int(os.getenv("AI_TIMEOUT", "30"))
 AI_MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "3"))
 
+# Maximum simultaneous in-flight requests per provider (local backends usually serve few in parallel)
+AI_MAX_CONCURRENT_LOCAL = int(os.getenv("AI_MAX_CONCURRENT_LOCAL", "2"))
+AI_MAX_CONCURRENT_REMOTE = int(os.getenv("AI_MAX_CONCURRENT_REMOTE", "8"))
+
+# Batch categorization: synopsis characters sent per series when packing many series into one request
+AI_BATCH_SYNOPSIS_CHARS = int(os.getenv("AI_BATCH_SYNOPSIS_CHARS", "400"))
+
+# Stream completions token-by-token and stop reading as soon as the JSON answer closes
+AI_STREAM = os.getenv("AI_STREAM", "false").lower() in ("1", "true", "yes", "on")
+AI_CHARS_PER_TOKEN_ESTIMATE = 4  # Token estimate for streams cut short before the server reports usage
+
+# AI Response Cache (persistent, keyed by provider/model/prompts/temperature)
+AI_CACHE_ENABLED = os.getenv("AI_CACHE_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+AI_CACHE_TTL_SECONDS = int(os.getenv("AI_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))  # 30 days
+AI_CACHE_FILENAME = "vibe_manga_ai_cache.jsonl"  # Append-only, one response per line
+
 # AI Role Configuration
 # This is the central place to edit AI behavior, providers, and models.
 ROLE_CONFIG = {
@@ -0,0 +1,131 @@
+"""
+Tiered content hashing for duplicate detection.
+
+Hashing every volume in full means reading the whole library. Files can only
+be identical if they have the same size, and archives that differ usually
+differ near the start or in their ZIP central directory (the file list at the
+end), so TieredHasher narrows candidates down before reading everything:
+
+  1. group by exact size - files with a unique size are never opened;
+  2. for size collisions, hash the first and last CONTENT_HASH_SAMPLE_BYTES
+     plus the ZIP central directory;
+  3. only files that still collide are hashed in full (BLAKE2b over mmap).
+
+Digests are kept in the InspectionStore, so repeat runs only read files that
+changed.
+"""
+
+import hashlib
+import mmap
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from .constants import (
+    CONTENT_HASH_SAMPLE_BYTES,
+    CONTENT_HASH_READ_SIZE,
+    CONTENT_HASH_MAX_CENTRAL_DIR,
+)
+from .inspection_store import InspectionStore
+from .logging import get_logger
+from .zip_directory import EOCD_SIZE, MAX_ZIP_COMMENT, central_directory
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+def sample_digest(path: Union[str, Path], size: int) -> str:
+    """Digest of the file size, its first/last sample bytes and its ZIP central directory."""
+    h = hashlib.blake2b(str(size).encode("ascii"), digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(CONTENT_HASH_SAMPLE_BYTES))
+        if size > CONTENT_HASH_SAMPLE_BYTES:
+            tail_len = min(size, CONTENT_HASH_SAMPLE_BYTES + EOCD_SIZE + MAX_ZIP_COMMENT)
+            f.seek(size - tail_len)
+            tail = f.read(tail_len)
+            h.update(tail[-CONTENT_HASH_SAMPLE_BYTES:])
+        else:
+            tail = b""
+        # ZIP64 or corrupt archives have none; head/tail still apply
+        found = central_directory(f, size, tail, CONTENT_HASH_MAX_CENTRAL_DIR) if tail else None
+        if found and found[0]:
+            h.update(found[0])
+    return h.hexdigest()
+
+
+def full_digest(path: Union[str, Path]) -> str:
+    """BLAKE2b of the whole file, read through mmap (buffered reads as fallback)."""
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), CONTENT_HASH_READ_SIZE):
+                    h.update(mm[offset:offset + CONTENT_HASH_READ_SIZE])
+        except (ValueError, OSError):
+            # Empty files (and some filesystems) cannot be mapped
+            f.seek(0)
+            for chunk in iter(lambda: f.read(CONTENT_HASH_READ_SIZE), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class TieredHasher:
+    """Groups files with identical content, reading as little of each as possible."""
+
+    def __init__(self, store: Optional[InspectionStore] = None):
+        self.store = store
+        self.stats = {"files": 0, "sampled": 0, "full": 0, "cached": 0}
+
+    def _digest(self, path: Path, tier: str) -> Optional[str]:
+        try:
+            st = os.stat(path)
+            if self.store is not None:
+                record = self.store.lookup(path, st)
+                cached = getattr(record, f"{tier}_hash", None) if record else None
+                if cached:
+                    self.stats["cached"] += 1
+                    return cached
+            if tier == "sample":
+                digest = sample_digest(path, st.st_size)
+                self.stats["sampled"] += 1
+            else:
+                digest = full_digest(path)
+                self.stats["full"] += 1
+        except OSError as e:
+            logger.warning(f"Failed to hash {path}: {e}")
+            return None
+        if self.store is not None:
+            self.store.update(path, st, **{f"{tier}_hash": digest})
+        return digest
+
+    def _split(self, groups: Iterable[List[Tuple[Path, T]]], tier: str) -> Dict[str, List[Tuple[Path, T]]]:
+        """Regroups each candidate group by the digest of the given tier, keeping collisions only."""
+        result: Dict[str, List[Tuple[Path, T]]] = {}
+        for group in groups:
+            by_digest: Dict[str, List[Tuple[Path, T]]] = defaultdict(list)
+            for path, item in group:
+                digest = self._digest(path, tier)
+                if digest:
+                    by_digest[digest].append((path, item))
+            result.update((d, g) for d, g in by_digest.items() if len(g) > 1)
+        return result
+
+    def find_duplicates(self, files: Iterable[Tuple[Path, int, T]]) -> Dict[str, List[T]]:
+        """
+        `files` are (path, size, item) tuples. Returns full digest -> items for
+        every set of two or more files with identical content.
+        """
+        by_size: Dict[int, List[Tuple[Path, T]]] = defaultdict(list)
+        for path, size, item in files:
+            by_size[size].append((Path(path), item))
+            self.stats["files"] += 1
+
+        candidates = [g for g in by_size.values() if len(g) > 1]
+        sampled = self._split(candidates, "sample")
+        full = self._split(sampled.values(), "full")
+        logger.info(
+            f"Content hashing: {self.stats['files']} files, {self.stats['sampled']} sampled, "
+            f"{self.stats['full']} fully hashed, {self.stats['cached']} from cache"
+        )
+        return {digest: [item for _, item in group] for digest, group in full.items()}
@@ -2,14 +2,25 @@
 Duplicate Resolution Actions for VibeManga.
 
 Executes file operations (merge, delete, move) for duplicate resolution plans.
+
+Merges are resolved before anything moves: each target directory is listed
+once into a DirectoryIndex, naming conflicts are settled against it in
+memory, and the resulting moves are applied with a plain rename whenever
+source and target share a device. Plans touching disjoint paths run in
+parallel.
 """
 
+import errno
 import json
 import logging
+import os
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
 from rich.progress import Progress, TaskProgressColumn, TextColumn, BarColumn
 from rich.console import Group
@@ -18,6 +29,7 @@ from .models import Series, Volume
 from .dedupe_resolver import ResolutionPlan, ResolutionAction
 from .logging import console
 from .analysis import sanitize_filename, classify_unit
+from .constants import BYTES_PER_MB, DEDUPE_ACTION_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -31,21 +43,137 @@ class ActionResult:
     files_deleted: int = 0
     space_freed_mb: float = 0.0
     errors: List[str] = None
+    files_renamed: int = 0  # Moves done as a same-device rename
+    bytes_moved: int = 0
+    bytes_copied: int = 0  # Part of bytes_moved that crossed devices
     
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
 
 
+@dataclass
+class FileMove:
+    """One file move of a merge, decided before anything is touched."""
+    source: Path
+    target: Path
+    size: int
+    rename: bool  # Same device: os.replace instead of copy + delete
+    replace: bool = False  # Overwrites an existing target file
+
+
+@dataclass
+class MergeBatch:
+    """All file operations of one merge plan."""
+    directories: List[Path] = field(default_factory=list)  # To create, parents first
+    moves: List[FileMove] = field(default_factory=list)
+
+
+# Windows and macOS volumes are case-insensitive: "Vol 01.cbz" and
+# "vol 01.cbz" are the same file there
+_CASE_INSENSITIVE = os.path.normcase("A") == "a" or sys.platform == "darwin"
+
+
+def _name_key(name: str) -> str:
+    return name.casefold() if _CASE_INSENSITIVE else name
+
+
+class DirectoryIndex:
+    """
+    Directory listings read once per plan. Names claimed by planned moves are
+    added, so later conflict checks see the directory as it will be.
+    Conflicts are matched the way the filesystem matches names.
+    """
+    
+    def __init__(self):
+        self._listings: Dict[Path, Dict[str, bool]] = {}
+        self._keys: Dict[Path, set] = {}
+    
+    def entries(self, path: Path) -> Dict[str, bool]:
+        """name -> is_dir for the entries of a directory (empty if it does not exist)."""
+        listing = self._listings.get(path)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            listing[entry.name] = entry.is_dir()
+                        except OSError:
+                            listing[entry.name] = False
+            except OSError:
+                pass
+            self._listings[path] = listing
+            self._keys[path] = {_name_key(name) for name in listing}
+        return listing
+    
+    def exists(self, path: Path) -> bool:
+        self.entries(path.parent)
+        return _name_key(path.name) in self._keys[path.parent]
+    
+    def claim(self, path: Path, is_dir: bool = False):
+        self.entries(path.parent)[path.name] = is_dir
+        self._keys[path.parent].add(_name_key(path.name))
+
+
+def _plan_paths(plan: ResolutionPlan) -> List[Path]:
+    paths = [Path(p) for p in plan.source_paths]
+    if plan.target_path:
+        paths.append(Path(plan.target_path))
+    return [Path(os.path.abspath(p)) for p in paths]
+
+
+def independent_groups(plans: List[ResolutionPlan]) -> List[List[int]]:
+    """
+    Splits plans (by index) into groups that touch disjoint paths. Two plans
+    share a group when a path of one equals or contains a path of the other;
+    groups can run concurrently, plans within a group run in order.
+    """
+    parent = list(range(len(plans)))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    owner: Dict[Path, int] = {}
+    paths = [_plan_paths(plan) for plan in plans]
+    for i, plan_paths in enumerate(paths):
+        for path in plan_paths:
+            if path in owner:
+                parent[find(i)] = find(owner[path])
+            else:
+                owner[path] = i
+    for i, plan_paths in enumerate(paths):
+        for path in plan_paths:
+            for ancestor in path.parents:
+                if ancestor in owner:
+                    parent[find(i)] = find(owner[ancestor])
+    
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(plans)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
 class ActionExecutor:
     """Executes resolution plans with safety checks and progress tracking."""
     
-    def __init__(self, simulate: bool = False):
+    def __init__(self, simulate: bool = False, workers: int = DEDUPE_ACTION_WORKERS):
         self.simulate = simulate
+        self.workers = max(1, workers)
         self.results: List[ActionResult] = []
+        self.elapsed = 0.0  # Wall time of the last execute_plans
+        self.plan_groups = 0  # Independent groups in the last execute_plans
     
     def execute_plan(self, plan: ResolutionPlan) -> ActionResult:
         """Execute a single resolution plan."""
+        result = self._run_plan(plan)
+        self.results.append(result)
+        return result
+    
+    def _run_plan(self, plan: ResolutionPlan) -> ActionResult:
         logger.info(f"Executing plan: {plan.group_id} - {plan.action.value}")
         
         if plan.action == ResolutionAction.MERGE:
@@ -58,10 +186,11 @@ class ActionExecutor:
             result = ActionResult(True, "Kept both series (whitelisted or user choice)")
         else:
             result = ActionResult(True, f"Skipped action: {plan.action.value}")
-        
-        self.results.append(result)
         return result
     
+    def _run_group(self, plans: List[ResolutionPlan], indices: List[int]) -> List[Tuple[int, ActionResult]]:
+        return [(i, self._run_plan(plans[i])) for i in indices]
+    
     def execute_plans(self, plans: List[ResolutionPlan]) -> List[ActionResult]:
         """Execute multiple resolution plans with progress tracking."""
         if not plans:
@@ -72,7 +201,10 @@ class ActionExecutor:
         if self.simulate:
             console.print("[dim]SIMULATE mode - no changes will be made[/dim]")
         
-        results = []
+        groups = independent_groups(plans)
+        self.plan_groups = len(groups)
+        results: List[Optional[ActionResult]] = [None] * len(plans)
+        start = time.perf_counter()
         
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -80,23 +212,25 @@ class ActionExecutor:
             TaskProgressColumn(),
             console=console
         ) as progress:
-            task = progress.add_task("Executing plans...", total=len(plans))
+            task = progress.add_task(f"Executing plans ({len(groups)} independent groups)...", total=len(plans))
             
-            for i, plan in enumerate(plans, 1):
-                progress.update(task, description=f"Plan {i}/{len(plans)}: {plan.action.value}")
-                
-                result = self.execute_plan(plan)
-                results.append(result)
-                
-                if result.success:
-                    progress.console.print(f"[green]✓[/green] {result.message}")
-                else:
-                    progress.console.print(f"[red]✗[/red] {result.message}")
-                    for error in result.errors:
-                        progress.console.print(f"  [dim]Error: {error}[/dim]")
-                
-                progress.advance(task)
-        
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(groups)), thread_name_prefix="dedupe-action") as pool:
+                futures = [pool.submit(self._run_group, plans, indices) for indices in groups]
+                for future in as_completed(futures):
+                    for i, result in future.result():
+                        results[i] = result
+                        
+                        if result.success:
+                            progress.console.print(f"[green]✓[/green] {result.message}")
+                        else:
+                            progress.console.print(f"[red]✗[/red] {result.message}")
+                            for error in result.errors:
+                                progress.console.print(f"  [dim]Error: {error}[/dim]")
+                        
+                        progress.advance(task)
+        
+        self.elapsed = time.perf_counter() - start
+        self.results.extend(results)
         return results
     
     def _execute_merge(self, plan: ResolutionPlan) -> ActionResult:
@@ -112,7 +246,8 @@ class ActionExecutor:
             # Create backup of target metadata
             self._backup_metadata(target_path)
             
-            # Move files from sources to target
+            # Resolve every move against one listing of the target, then apply
+            index = DirectoryIndex()
             for source_path in plan.source_paths:
                 source = Path(source_path)
                 if not source.exists():
@@ -120,8 +255,8 @@ class ActionExecutor:
                     continue
                 
                 # Move all files from source to target
-                moved = self._move_series_files(source, target_path, plan, result)
-                result.files_moved += moved
+                batch = self._plan_series_moves(source, target_path, plan, result, index)
+                self._apply_batch(batch, result)
                 
                 # After moving, remove empty source directory
                 if not self.simulate and source.exists() and not any(source.iterdir()):
@@ -226,16 +361,20 @@ class ActionExecutor:
         """Extract series name from path."""
         return series_path.name
     
-    def _detect_series_naming_pattern(self, series_path: Path) -> tuple[str, str, Optional[Path]]:
+    def _detect_series_naming_pattern(self, series_path: Path, index: Optional[DirectoryIndex] = None) -> tuple[str, str, Optional[Path]]:
         """
         Detect the naming pattern of a series.
         
+        Directory listings come from `index` when given.
+        
         Returns:
             Tuple of (base_name, unit_format, subgroup_path)
             - base_name: The series name (e.g., "One Piece")
             - unit_format: Format string for units (e.g., "v{:02d}", "c{}")
             - subgroup_path: Path to appropriate subgroup, or None for root
         """
+        index = index or DirectoryIndex()
+        
         # Get series name from path
         base_name = self._get_series_name_from_path(series_path)
         
@@ -243,25 +382,23 @@ class ActionExecutor:
         unit_format = "v{}"  # Default
         subgroup_path = None
         
-        # If path doesn't exist, return defaults
-        if not series_path.exists():
-            return base_name, unit_format, subgroup_path
-        
-        # Look for existing files to detect pattern
-        existing_files = []
-        for item in series_path.iterdir():
-            if item.is_file() and item.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']:
-                existing_files.append(item.name)
+        # Look for existing files to detect pattern (a missing path has none)
+        listing = index.entries(series_path)
+        existing_files = [
+            name for name, is_dir in listing.items()
+            if not is_dir and Path(name).suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']
+        ]
         
         # If no files in root, check subgroups
         if not existing_files:
-            for item in series_path.iterdir():
-                if item.is_dir() and item.name not in ['.git', '__pycache__', 'series.json']:
+            for name, is_dir in listing.items():
+                if is_dir and name not in ['.git', '__pycache__', 'series.json']:
                     # Check if this subgroup has files
-                    subgroup_files = []
-                    for subitem in item.iterdir():
-                        if subitem.is_file() and subitem.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']:
-                            subgroup_files.append(subitem.name)
+                    item = series_path / name
+                    subgroup_files = [
+                        subname for subname, sub_is_dir in index.entries(item).items()
+                        if not sub_is_dir and Path(subname).suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']
+                    ]
                     
                     if subgroup_files:
                         existing_files = subgroup_files
@@ -354,20 +491,34 @@ class ActionExecutor:
         
         return target_filename
     
-    def _move_series_files(self, source: Path, target: Path, plan: ResolutionPlan, result: ActionResult) -> int:
-        """Move files from source to target with conflict resolution and smart renaming."""
-        moved = 0
+    def _plan_series_moves(
+        self,
+        source: Path,
+        target: Path,
+        plan: ResolutionPlan,
+        result: ActionResult,
+        index: DirectoryIndex,
+        batch: Optional[MergeBatch] = None,
+        target_dev: Optional[int] = None,
+    ) -> MergeBatch:
+        """Decide where every file of `source` goes, with conflicts resolved against `index`."""
+        batch = batch if batch is not None else MergeBatch()
+        if target_dev is None:
+            target_dev = os.stat(target).st_dev
         
         # Detect target series naming pattern
-        target_base_name, target_unit_format, target_subgroup = self._detect_series_naming_pattern(target)
+        target_base_name, target_unit_format, target_subgroup = self._detect_series_naming_pattern(target, index)
         
         # If target has a subgroup pattern, use it
         if target_subgroup:
             target = target_subgroup
             console.print(f"[dim]Using subgroup: {target_subgroup.name}[/dim]")
         
-        for item in source.iterdir():
-            if item.is_file() and item.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']:
+        with os.scandir(source) as it:
+            entries = list(it)
+        for entry in entries:
+            item = Path(entry.path)
+            if entry.is_file() and item.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar']:
                 # Generate smart target filename based on target series pattern
                 target_filename = self._generate_target_filename(item, target_base_name, target_unit_format)
                 target_file = target / target_filename
@@ -375,37 +526,81 @@ class ActionExecutor:
                 console.print(f"[dim]  {item.name} -> {target_filename}[/dim]")
                 
                 # Check for conflicts
-                if target_file.exists():
+                replace = False
+                if index.exists(target_file):
                     conflict_action = plan.conflict_resolution.get(item.name, "skip")
                     
                     if conflict_action == "skip":
                         result.errors.append(f"Skipped (conflict): {item.name}")
                         continue
                     elif conflict_action == "replace":
-                        if not self.simulate:
-                            target_file.unlink()
+                        replace = True
                     elif conflict_action == "both":
                         # Rename with suffix
                         stem = target_file.stem
                         suffix = 1
-                        while target_file.exists():
+                        while index.exists(target_file):
                             target_file = target / f"{stem}_dup{suffix}{item.suffix}"
                             suffix += 1
                 
-                # Move the file
-                if not self.simulate:
-                    shutil.move(str(item), str(target_file))
-                moved += 1
-                logger.debug(f"Moved: {item.name} -> {target_file}")
+                index.claim(target_file)
+                st = entry.stat()
+                batch.moves.append(FileMove(item, target_file, st.st_size, st.st_dev == target_dev, replace))
             
-            elif item.is_dir() and item.name not in ['.git', '__pycache__']:
+            elif entry.is_dir() and item.name not in ['.git', '__pycache__']:
                 # Recursively move subdirectory files
                 sub_target = target / item.name
-                if not self.simulate:
-                    sub_target.mkdir(exist_ok=True)
-                moved += self._move_series_files(item, sub_target, plan, result)
+                if not index.exists(sub_target):
+                    batch.directories.append(sub_target)
+                    index.claim(sub_target, is_dir=True)
+                self._plan_series_moves(item, sub_target, plan, result, index, batch, target_dev)
         
-        return moved
+        return batch
+    
+    def _apply_batch(self, batch: MergeBatch, result: ActionResult):
+        """Carry out a planned merge; in simulate mode only count it."""
+        if not self.simulate:
+            for directory in batch.directories:
+                directory.mkdir(exist_ok=True)
+        
+        for move in batch.moves:
+            if not self.simulate:
+                # Never overwrite a file the plan did not decide to replace,
+                # even if it appeared (or differs only in case) since listing
+                if not move.replace and os.path.lexists(move.target):
+                    result.errors.append(f"Skipped (target exists): {move.source.name} -> {move.target.name}")
+                    continue
+                try:
+                    renamed = move.rename and self._rename(move)
+                    if not renamed:
+                        if move.replace and move.target.exists():
+                            move.target.unlink()
+                        shutil.move(str(move.source), str(move.target))
+                except OSError as e:
+                    result.errors.append(f"Failed to move {move.source.name}: {e}")
+                    continue
+            result.files_moved += 1
+            result.files_renamed += move.rename
+            result.bytes_moved += move.size
+            if not move.rename:
+                result.bytes_copied += move.size
+            logger.debug(f"Moved: {move.source.name} -> {move.target}")
+    
+    def _rename(self, move: FileMove) -> bool:
+        """Same-device move; False if the rename crossed a mount after all."""
+        try:
+            # Only a planned replace may overwrite (os.rename still would on POSIX,
+            # hence the existence check before it)
+            if move.replace:
+                os.replace(move.source, move.target)
+            else:
+                os.rename(move.source, move.target)
+            return True
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            move.rename = False
+            return False
     
     def _backup_metadata(self, target_path: Path):
         """Create backup of series.json before merge."""
@@ -466,9 +661,30 @@ class ActionExecutor:
             'files_moved': total_moved,
             'files_deleted': total_deleted,
             'space_freed_mb': total_space_freed,
+            'files_renamed': sum(r.files_renamed for r in self.results),
+            'bytes_moved': sum(r.bytes_moved for r in self.results),
+            'bytes_copied': sum(r.bytes_copied for r in self.results),
+            'plan_groups': self.plan_groups,
+            'seconds': self.elapsed,
             'simulate': self.simulate
         }
     
+    def describe_throughput(self) -> str:
+        """One line on how the last execute_plans moved data; in simulate mode, the dry-run estimate."""
+        summary = self.get_execution_summary()
+        if not summary['total_actions']:
+            return "No plans executed"
+        moved, renamed = summary['files_moved'], summary['files_renamed']
+        copy_mb = summary['bytes_copied'] / BYTES_PER_MB
+        seconds = summary['seconds']
+        rate = f"{moved / seconds:.0f} files/s" if seconds > 0 else "instant"
+        return (
+            f"{'Would move' if self.simulate else 'Moved'} {moved} files ({summary['bytes_moved'] / BYTES_PER_MB:.1f} MB): "
+            f"{renamed} by rename, {moved - renamed} by copy ({copy_mb:.1f} MB to copy); "
+            f"{summary['total_actions']} plans in {summary['plan_groups']} independent groups, "
+            f"{seconds:.2f}s ({rate})"
+        )
+    
     def save_execution_report(self, report_path: Path):
         """Save detailed execution report to JSON."""
         report = {
@@ -480,6 +696,8 @@ class ActionExecutor:
                     'files_moved': r.files_moved,
                     'files_deleted': r.files_deleted,
                     'space_freed_mb': r.space_freed_mb,
+                    'files_renamed': r.files_renamed,
+                    'bytes_moved': r.bytes_moved,
                     'errors': r.errors
                 }
                 for r in self.results
@@ -1,23 +1,36 @@
 """
 Duplicate Detection Engines for VibeManga.
 
-Provides three detection strategies:
+Provides four detection strategies:
 1. MAL ID Conflicts - High confidence, same MAL ID in different folders
 2. Content Duplicates - Medium confidence, same files via hashing/metadata
 3. Fuzzy Duplicates - Lower confidence, similar names with AI assistance
+4. Perceptual Duplicates - Same pages in differently encoded archives (opt-in, decodes images)
 """
 
 import hashlib
 import logging
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Callable, Iterator
 from collections import defaultdict
 
 from .models import Library, Series, Volume
-from .indexer import LibraryIndex
 from .analysis import semantic_normalize, classify_unit
-from .constants import SIMILARITY_THRESHOLD
+from .constants import (
+    SIMILARITY_THRESHOLD,
+    FUZZY_MAX_WORKERS,
+    FUZZY_SHARD_SIZE,
+    FUZZY_PARALLEL_MIN_PAIRS,
+    PERCEPTUAL_MAX_WORKERS,
+)
+from .fuzzy_blocking import NameBlocker, score_pairs
+from .content_hash import TieredHasher
+from .inspection_store import get_inspection_store
+from .perceptual import PERCEPTUAL_SUPPORT, volume_fingerprints, near_duplicate_pairs
 
 logger = logging.getLogger(__name__)
 
@@ -54,22 +67,67 @@ class ContentDuplicate:
     series_paths: Set[Path] = field(default_factory=set)
 
 
+@dataclass
+class PerceptualDuplicate(ContentDuplicate):
+    """Volumes whose sampled pages look the same, whatever their encoding."""
+    similarity: float = 0.0
+
+
+@dataclass
+class LibrarySnapshot:
+    """
+    Flat view of a library, built in one traversal and shared by all detectors.
+
+    Series-level lists are indexed alike (series[i], normalized[i], ...), as
+    are the volume-level ones (volumes[k], volume_series[k], size_keys[k]).
+    """
+    series: List[Series] = field(default_factory=list)
+    identities: List[List[str]] = field(default_factory=list)  # identities + folder name
+    normalized: List[List[str]] = field(default_factory=list)  # semantic_normalize of identities
+    mal_ids: List[Optional[int]] = field(default_factory=list)
+    volumes: List[Volume] = field(default_factory=list)  # series root volumes, then subgroup volumes
+    volume_series: List[int] = field(default_factory=list)  # series index of each volume
+    size_keys: List[str] = field(default_factory=list)  # size (+ page count) key of each volume
+
+    @classmethod
+    def build(cls, library: Library) -> "LibrarySnapshot":
+        snapshot = cls()
+        for main_cat in library.categories:
+            for sub_cat in main_cat.sub_categories:
+                for series in sub_cat.series:
+                    index = len(snapshot.series)
+                    identities = list(series.identities)
+                    if series.path.name not in identities:
+                        identities.append(series.path.name)
+                    mal_id = None
+                    if hasattr(series, 'metadata') and series.metadata:
+                        mal_id = getattr(series.metadata, 'mal_id', None)
+                    snapshot.series.append(series)
+                    snapshot.identities.append(identities)
+                    snapshot.normalized.append([semantic_normalize(name) for name in identities])
+                    snapshot.mal_ids.append(mal_id)
+                    for vol in series.volumes + [v for sg in series.sub_groups for v in sg.volumes]:
+                        snapshot.volumes.append(vol)
+                        snapshot.volume_series.append(index)
+                        snapshot.size_keys.append(_size_key(vol))
+        return snapshot
+
+
+def _size_key(volume: Volume) -> str:
+    """Metadata key for duplicate detection without hashing."""
+    # Use size + page count as proxy (faster, good enough for most cases)
+    if volume.page_count:
+        return f"{volume.size_bytes}_{volume.page_count}"
+    return str(volume.size_bytes)
+
+
 class MALIDDuplicateDetector:
     """Detects duplicate series by MAL ID (highest confidence)."""
     
-    def __init__(self, library: Library):
+    def __init__(self, library: Library, snapshot: Optional[LibrarySnapshot] = None):
         self.library = library
-        self.index = LibraryIndex()
-        self.index.build(library)
-        logger.debug(f"MALIDDuplicateDetector initialized with {self._count_series()} series")
-    
-    def _count_series(self) -> int:
-        """Count total series in library."""
-        count = 0
-        for main_cat in self.library.categories:
-            for sub_cat in main_cat.sub_categories:
-                count += len(sub_cat.series)
-        return count
+        self.snapshot = snapshot or LibrarySnapshot.build(library)
+        logger.debug(f"MALIDDuplicateDetector initialized with {len(self.snapshot.series)} series")
     
     def detect(self) -> List[MALIDDuplicate]:
         """Find all MAL ID conflicts in the library."""
@@ -91,28 +149,20 @@ class MALIDDuplicateDetector:
         
         # First pass: collect all series and their MAL IDs
         logger.debug("Scanning library for series with MAL IDs...")
-        for main_cat in self.library.categories:
-            for sub_cat in main_cat.sub_categories:
-                for series in sub_cat.series:
-                    total_series_scanned += 1
-                    
-                    # FIX: Access MAL ID from metadata (not series.mal_id)
-                    mal_id = None
-                    if hasattr(series, 'metadata') and series.metadata:
-                        mal_id = getattr(series.metadata, 'mal_id', None)
-                    
-                    logger.debug(f"Series: {series.name}")
-                    logger.debug(f"  Path: {series.path}")
-                    logger.debug(f"  MAL ID: {mal_id} (type: {type(mal_id)})")
-                    logger.debug(f"  Has metadata: {hasattr(series, 'metadata') and series.metadata is not None}")
-                    
-                    if mal_id:
-                        series_with_mal_id += 1
-                        unique_mal_ids.add(mal_id)
-                        debug_mal_id_map[mal_id].append(series)
-                        logger.debug(f"  → Added to MAL ID map: {mal_id}")
-                    else:
-                        logger.debug(f"  → No MAL ID, skipping")
+        for series, mal_id in zip(self.snapshot.series, self.snapshot.mal_ids):
+            total_series_scanned += 1
+            
+            logger.debug(f"Series: {series.name}")
+            logger.debug(f"  Path: {series.path}")
+            logger.debug(f"  MAL ID: {mal_id} (type: {type(mal_id)})")
+            
+            if mal_id:
+                series_with_mal_id += 1
+                unique_mal_ids.add(mal_id)
+                debug_mal_id_map[mal_id].append(series)
+                logger.debug(f"  → Added to MAL ID map: {mal_id}")
+            else:
+                logger.debug(f"  → No MAL ID, skipping")
         
         # Log diagnostic summary
         logger.info(f"DIAGNOSTIC: Scanned {total_series_scanned} series")
@@ -192,36 +242,24 @@ class MALIDDuplicateDetector:
 class ContentDuplicateDetector:
     """Detects duplicate files by content (hashing or metadata comparison)."""
     
-    def __init__(self, library: Library, use_hashing: bool = False):
+    def __init__(self, library: Library, use_hashing: bool = False, snapshot: Optional[LibrarySnapshot] = None):
         self.library = library
         self.use_hashing = use_hashing
+        self.snapshot = snapshot or LibrarySnapshot.build(library)
     
     def detect(self) -> List[ContentDuplicate]:
         """Find duplicate files across the library."""
-        volume_map = defaultdict(list)  # key -> list of volumes
-        
-        # Collect all volumes from library
-        for main_cat in self.library.categories:
-            for sub_cat in main_cat.sub_categories:
-                for series in sub_cat.series:
-                    # Add volumes from series root
-                    for vol in series.volumes:
-                        key = self._get_volume_key(vol)
-                        if key:
-                            volume_map[key].append(vol)
-                    
-                    # Add volumes from subgroups
-                    for sg in series.sub_groups:
-                        for vol in sg.volumes:
-                            key = self._get_volume_key(vol)
-                            if key:
-                                volume_map[key].append(vol)
-        
+        if self.use_hashing:
+            volume_map = self._hash_volumes(self.snapshot.volumes)
+        else:
+            volume_map = defaultdict(list)  # key -> list of volumes
+            for vol, key in zip(self.snapshot.volumes, self.snapshot.size_keys):
+                volume_map[key].append(vol)
+
         # Filter for actual duplicates
         duplicates = []
         for key, volumes in volume_map.items():
             if len(volumes) > 1:
-                # Check if they're actually duplicates (not just same size)
                 duplicate = ContentDuplicate(
                     file_hash=key,
                     file_size=volumes[0].size_bytes,
@@ -230,122 +268,304 @@ class ContentDuplicateDetector:
                     series_paths={vol.path.parent for vol in volumes}
                 )
                 duplicates.append(duplicate)
-        
+
         return duplicates
-    
-    def _get_volume_key(self, volume: Volume) -> Optional[str]:
-        """Generate a key for duplicate detection."""
-        if self.use_hashing:
-            return self._hash_file(volume.path)
-        else:
-            # Use size + page count as proxy (faster, good enough for most cases)
-            if volume.page_count:
-                return f"{volume.size_bytes}_{volume.page_count}"
-            return str(volume.size_bytes)
-    
-    def _hash_file(self, file_path: Path) -> Optional[str]:
-        """Generate MD5 hash of file (slow but accurate)."""
+
+    def _hash_volumes(self, volumes: List[Volume]) -> Dict[str, List[Volume]]:
+        """Full digest -> volumes, via size / sampled / full tiers (see content_hash)."""
+        store = get_inspection_store()
+        hasher = TieredHasher(store)
+        try:
+            return hasher.find_duplicates((vol.path, vol.size_bytes, vol) for vol in volumes)
+        finally:
+            store.commit()
+
+
+class PerceptualDuplicateDetector:
+    """Detects re-encoded copies of a volume by perceptual page fingerprints."""
+
+    def __init__(self, library: Library, workers: int = PERCEPTUAL_MAX_WORKERS, snapshot: Optional[LibrarySnapshot] = None):
+        self.library = library
+        self.workers = max(1, workers)
+        self.snapshot = snapshot or LibrarySnapshot.build(library)
+
+    def detect(self, progress: Optional[Callable[[int, int], None]] = None) -> List[PerceptualDuplicate]:
+        """Find groups of near-duplicate volumes. `progress` gets (fingerprinted, total) volumes."""
+        if not PERCEPTUAL_SUPPORT:
+            logger.warning("Perceptual detection requires Pillow - skipping")
+            return []
+
+        volumes = self.snapshot.volumes
+        signatures = self._fingerprint(volumes, progress)
+        pairs = near_duplicate_pairs(signatures)
+
+        # Union-find over matching pairs
+        parent = list(range(len(volumes)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for a, b in pairs:
+            parent[find(a)] = find(b)
+
+        members: Dict[int, List[int]] = defaultdict(list)
+        best: Dict[int, float] = defaultdict(float)
+        for (a, b), similarity in pairs.items():
+            root = find(a)
+            best[root] = max(best[root], similarity)
+        for i in {i for pair in pairs for i in pair}:
+            members[find(i)].append(i)
+
+        duplicates = []
+        for root, indices in members.items():
+            group = [volumes[i] for i in sorted(indices)]
+            group_id = hashlib.sha1("\0".join(str(v.path) for v in group).encode("utf-8", "surrogateescape")).hexdigest()
+            duplicates.append(PerceptualDuplicate(
+                file_hash=group_id,
+                file_size=max(v.size_bytes for v in group),
+                page_count=group[0].page_count,
+                volumes=group,
+                series_paths={v.path.parent for v in group},
+                similarity=best[root],
+            ))
+        logger.info(f"Perceptual detection: {len(signatures)} volumes fingerprinted, {len(duplicates)} groups")
+        return duplicates
+
+    def _fingerprint(self, volumes: List[Volume], progress: Optional[Callable[[int, int], None]]) -> Dict[int, List[int]]:
+        """Volume index -> page fingerprints, from the inspection store where unchanged."""
+        store = get_inspection_store()
+
+        def fingerprint(vol: Volume) -> Optional[List[int]]:
+            record = store.lookup(vol.path)
+            if record is not None and record.page_hashes is not None:
+                return [int(h, 16) for h in record.page_hashes]
+            fingerprints = volume_fingerprints(vol.path)
+            if fingerprints is not None:
+                store.update(vol.path, page_hashes=[f"{h:032x}" for h in fingerprints])
+            return fingerprints
+
+        signatures = {}
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            logger.warning(f"Failed to hash {file_path}: {e}")
-            return None
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(fingerprint, vol): i for i, vol in enumerate(volumes)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to fingerprint {volumes[futures[future]].path}: {e}")
+                        result = None
+                    if result:
+                        signatures[futures[future]] = result
+                    if progress:
+                        progress(done, len(volumes))
+        finally:
+            store.commit()
+        return signatures
+
+
+def _ignore_sigint() -> None:
+    # Workers leave Ctrl+C to the parent, which cancels the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class _FuzzyGrouper:
+    """
+    Forms fuzzy groups in series order as scored pairs arrive.
+
+    A series' group is final once every pair anchored at it or at an earlier
+    series has been scored, so groups can be emitted before scoring ends and
+    are identical however the pairs were sharded.
+    """
+
+    def __init__(self, series_info: List[Dict[str, Any]], on_group: Optional[Callable[[DuplicateGroup], None]] = None):
+        self.series_info = series_info
+        self.on_group = on_group
+        self.neighbors: Dict[int, Dict[int, float]] = defaultdict(dict)
+        self.groups: List[DuplicateGroup] = []
+        self._processed: Set[int] = set()
+        self._next_anchor = 0
+
+    def add(self, scored: List[Tuple[int, int, float]]) -> None:
+        for i, j, similarity in scored:
+            self.neighbors[i][j] = similarity
+
+    def emit_until(self, limit: int) -> None:
+        """Finalizes groups for all anchors below `limit`."""
+        while self._next_anchor < min(limit, len(self.series_info)):
+            self._group_anchor(self._next_anchor)
+            self._next_anchor += 1
+
+    def _group_anchor(self, i: int) -> None:
+        info1 = self.series_info[i]
+        if id(info1['series']) in self._processed:
+            return
+        
+        similar_group = [info1['series']]
+        max_similarity = 0.0
+        
+        for j, similarity in sorted(self.neighbors.pop(i, {}).items()):
+            similar_group.append(self.series_info[j]['series'])
+            self._processed.add(id(self.series_info[j]['series']))
+            max_similarity = max(max_similarity, similarity)
+        
+        self._processed.add(id(info1['series']))
+        if len(similar_group) < 2:
+            return
+        
+        # Check if they have different MAL IDs (if both have them)
+        mal_ids = {s.metadata.mal_id for s in similar_group if s.metadata.mal_id}
+        if len(mal_ids) > 1:
+            # Different MAL IDs = likely different series, skip
+            return
+        
+        group = DuplicateGroup(
+            group_id=f"fuzzy_{id(similar_group[0])}",
+            duplicate_type='fuzzy',
+            confidence=max_similarity,
+            items=similar_group,
+            metadata={'similarity': max_similarity}
+        )
+        self.groups.append(group)
+        if self.on_group:
+            self.on_group(group)
 
 
 class FuzzyDuplicateDetector:
     """Detects potential duplicates using fuzzy name matching."""
     
-    def __init__(self, library: Library, threshold: float = SIMILARITY_THRESHOLD):
+    def __init__(
+        self,
+        library: Library,
+        threshold: float = SIMILARITY_THRESHOLD,
+        workers: int = FUZZY_MAX_WORKERS,
+        snapshot: Optional[LibrarySnapshot] = None,
+    ):
         self.library = library
         self.threshold = threshold
+        self.workers = workers
+        self.snapshot = snapshot or LibrarySnapshot.build(library)
+        self.interrupted = False
     
-    def detect(self) -> List[DuplicateGroup]:
-        """Find series with similar names across the library."""
-        # Get all series paths and their identities
-        series_info = []
-        for main_cat in self.library.categories:
-            for sub_cat in main_cat.sub_categories:
-                for series in sub_cat.series:
-                    identities = list(series.identities)
-                    if series.path.name not in identities:
-                        identities.append(series.path.name)
-                    
-                    series_info.append({
-                        'series': series,
-                        'identities': identities,
-                        'normalized': [semantic_normalize(name) for name in identities]
-                    })
-        
-        # Find potential duplicates
-        duplicates = []
-        processed = set()
-        
-        for i, info1 in enumerate(series_info):
-            if id(info1['series']) in processed:
-                continue
-            
-            similar_group = [info1['series']]
-            
-            for j in range(i + 1, len(series_info)):
-                info2 = series_info[j]
-                
-                # Check if any identities match
-                max_similarity = 0
-                for norm1 in info1['normalized']:
-                    for norm2 in info2['normalized']:
-                        if len(norm1) > 3 and len(norm2) > 3:  # Avoid short name matches
-                            similarity = self._calculate_similarity(norm1, norm2)
-                            max_similarity = max(max_similarity, similarity)
-                
-                if max_similarity >= self.threshold:
-                    similar_group.append(info2['series'])
-                    processed.add(id(info2['series']))
-            
-            if len(similar_group) > 1:
-                # Check if they have different MAL IDs (if both have them)
-                mal_ids = {s.metadata.mal_id for s in similar_group if s.metadata.mal_id}
-                if len(mal_ids) > 1:
-                    # Different MAL IDs = likely different series, skip
-                    continue
-                
-                duplicates.append(DuplicateGroup(
-                    group_id=f"fuzzy_{id(similar_group[0])}",
-                    duplicate_type='fuzzy',
-                    confidence=max_similarity,
-                    items=similar_group,
-                    metadata={'similarity': max_similarity}
-                ))
-            
-            processed.add(id(info1['series']))
-        
-        return duplicates
+    def detect(
+        self,
+        progress: Optional[Callable[[int, int], None]] = None,
+        on_group: Optional[Callable[[DuplicateGroup], None]] = None,
+    ) -> List[DuplicateGroup]:
+        """
+        Find series with similar names across the library.
+
+        `progress(scored_pairs, total_pairs)` is called as scoring advances and
+        `on_group` for each group as soon as it is final. On Ctrl+C the groups
+        found so far are returned and `interrupted` is set.
+        """
+        snapshot = self.snapshot
+        series_info = [
+            {'series': series, 'identities': identities, 'normalized': normalized}
+            for series, identities, normalized in zip(snapshot.series, snapshot.identities, snapshot.normalized)
+        ]
+        
+        # Only pairs that survive blocking are scored
+        names = [[n for n in normalized if len(n) > 3] for normalized in snapshot.normalized]  # Avoid short name matches
+        pairs = sorted(NameBlocker(self.threshold).candidate_pairs(names))
+        shards = [pairs[k:k + FUZZY_SHARD_SIZE] for k in range(0, len(pairs), FUZZY_SHARD_SIZE)]
+        logger.info(f"Fuzzy detection: {len(pairs)} candidate pairs from {len(series_info)} series in {len(shards)} shard(s)")
+        
+        grouper = _FuzzyGrouper(series_info, on_group)
+        self.interrupted = False
+        done_pairs = 0
+        finished: Dict[int, List[Tuple[int, int, float]]] = {}
+        next_shard = 0
+        if progress:
+            progress(0, len(pairs))
+        scorer = self._score_shards(shards, names)
+        try:
+            for index, scored in scorer:
+                finished[index] = scored
+                done_pairs += len(shards[index])
+                # Apply shards in order so groups can be finalized early
+                while next_shard in finished:
+                    grouper.add(finished.pop(next_shard))
+                    next_shard += 1
+                    limit = shards[next_shard][0][0] if next_shard < len(shards) else len(series_info)
+                    grouper.emit_until(limit)
+                if progress:
+                    progress(done_pairs, len(pairs))
+            grouper.emit_until(len(series_info))
+        except KeyboardInterrupt:
+            self.interrupted = True
+            logger.warning(f"Fuzzy detection interrupted after {done_pairs}/{len(pairs)} pairs; returning {len(grouper.groups)} group(s) found so far")
+        finally:
+            scorer.close()
+        
+        return grouper.groups
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity ratio between two strings."""
-        import difflib
-        return difflib.SequenceMatcher(None, str1, str2).ratio()
+    def _score_shards(self, shards: List[List[Tuple[int, int]]], names: List[List[str]]) -> Iterator[Tuple[int, List[Tuple[int, int, float]]]]:
+        """Yields (shard index, scored pairs), in completion order when parallel."""
+        total = sum(len(shard) for shard in shards)
+        if self.workers <= 1 or total < FUZZY_PARALLEL_MIN_PAIRS:
+            for index, shard in enumerate(shards):
+                yield index, score_pairs(names, shard, self.threshold)
+            return
+        
+        executor = ProcessPoolExecutor(max_workers=min(self.workers, len(shards)), initializer=_ignore_sigint)
+        try:
+            futures = {}
+            for index, shard in enumerate(shards):
+                records = {r for pair in shard for r in pair}
+                futures[executor.submit(score_pairs, {r: names[r] for r in records}, shard, self.threshold)] = index
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Ctrl+C (or an error) drops the shards that have not started yet
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 class DedupeEngine:
     """Main orchestrator for duplicate detection."""
     
-    def __init__(self, library: Library, use_hashing: bool = False):
+    def __init__(self, library: Library, use_hashing: bool = False, workers: int = FUZZY_MAX_WORKERS):
         self.library = library
         self.use_hashing = use_hashing
-        self.mal_detector = MALIDDuplicateDetector(library)
-        self.content_detector = ContentDuplicateDetector(library, use_hashing)
-        self.fuzzy_detector = FuzzyDuplicateDetector(library)
+        self.timings: Dict[str, float] = {}  # step -> seconds, for the last detection run
+        
+        # One traversal shared by every detector
+        start = time.perf_counter()
+        self.snapshot = LibrarySnapshot.build(library)
+        self.snapshot_seconds = time.perf_counter() - start
+        logger.info(f"Library snapshot: {len(self.snapshot.series)} series, {len(self.snapshot.volumes)} volumes in {self.snapshot_seconds:.2f}s")
+        
+        self.mal_detector = MALIDDuplicateDetector(library, snapshot=self.snapshot)
+        self.content_detector = ContentDuplicateDetector(library, use_hashing, snapshot=self.snapshot)
+        self.fuzzy_detector = FuzzyDuplicateDetector(library, workers=workers, snapshot=self.snapshot)
+        self.perceptual_detector = PerceptualDuplicateDetector(library, snapshot=self.snapshot)
     
-    def detect_by_mode(self, mode: str) -> Dict[str, List[Any]]:
+    def _timed(self, name: str, detect: Callable[..., List[Any]], *args) -> List[Any]:
+        """Runs one detector and records how long it took."""
+        start = time.perf_counter()
+        try:
+            return detect(*args)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            logger.info(f"Detector '{name}' finished in {self.timings[name]:.2f}s")
+    
+    def detect_by_mode(
+        self,
+        mode: str,
+        fuzzy_progress: Optional[Callable[[int, int], None]] = None,
+        on_fuzzy_group: Optional[Callable[[DuplicateGroup], None]] = None,
+        perceptual_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, List[Any]]:
         """
         Run only the specified detection mode(s).
         
         Args:
-            mode: Detection mode - 'all', 'mal-id', 'content', or 'fuzzy'
+            mode: Detection mode - 'all', 'mal-id', 'content', 'fuzzy' or 'perceptual'
+            fuzzy_progress: Called with (scored, total) candidate pairs during fuzzy detection
+            on_fuzzy_group: Called with each fuzzy group as soon as it is found
+            perceptual_progress: Called with (fingerprinted, total) volumes during perceptual detection
             
         Returns:
             Dictionary with duplicate groups for the selected mode(s)
@@ -357,31 +577,39 @@ class DedupeEngine:
         results = {
             'mal_id_conflicts': [],
             'content_duplicates': [],
-            'fuzzy_duplicates': []
+            'fuzzy_duplicates': [],
+            'perceptual_duplicates': []
         }
+        self.timings = {'snapshot': self.snapshot_seconds}
         
         if mode == 'all':
             # Run all detection modes
-            return self.detect_all()
+            return self.detect_all(fuzzy_progress, on_fuzzy_group)
         
         elif mode == 'mal-id':
             # Only run MAL ID detection (fastest)
             logger.info("Running MAL ID conflict detection only...")
-            results['mal_id_conflicts'] = self.mal_detector.detect()
+            results['mal_id_conflicts'] = self._timed('mal-id', self.mal_detector.detect)
             logger.info(f"Detection complete: Found {len(results['mal_id_conflicts'])} MAL ID conflicts")
             
         elif mode == 'content':
             # Only run content duplicate detection
             logger.info("Running content duplicate detection only...")
-            results['content_duplicates'] = self.content_detector.detect()
+            results['content_duplicates'] = self._timed('content', self.content_detector.detect)
             logger.info(f"Detection complete: Found {len(results['content_duplicates'])} content duplicates")
             
         elif mode == 'fuzzy':
             # Only run fuzzy name detection
             logger.info("Running fuzzy name detection only...")
-            results['fuzzy_duplicates'] = self.fuzzy_detector.detect()
+            results['fuzzy_duplicates'] = self._timed('fuzzy', self.fuzzy_detector.detect, fuzzy_progress, on_fuzzy_group)
             logger.info(f"Detection complete: Found {len(results['fuzzy_duplicates'])} fuzzy matches")
             
+        elif mode == 'perceptual':
+            # Only run perceptual page detection (decodes sampled pages)
+            logger.info("Running perceptual duplicate detection only...")
+            results['perceptual_duplicates'] = self._timed('perceptual', self.perceptual_detector.detect, perceptual_progress)
+            logger.info(f"Detection complete: Found {len(results['perceptual_duplicates'])} perceptual duplicates")
+            
         else:
             raise ValueError(f"Unknown detection mode: {mode}")
         
@@ -392,8 +620,16 @@ class DedupeEngine:
         
         return results
     
-    def detect_all(self) -> Dict[str, List[Any]]:
-        """Run all detection engines and return results."""
+    def detect_all(
+        self,
+        fuzzy_progress: Optional[Callable[[int, int], None]] = None,
+        on_fuzzy_group: Optional[Callable[[DuplicateGroup], None]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Run the MAL ID, content and fuzzy engines concurrently (perceptual is
+        opt-in) and return results. Fuzzy detection stays on the calling thread
+        so Ctrl+C still stops it early; the others run on worker threads.
+        """
         logger.info("=" * 60)
         logger.info("COMPREHENSIVE DUPLICATE DETECTION STARTED")
         logger.info("=" * 60)
@@ -401,23 +637,32 @@ class DedupeEngine:
         results = {
             'mal_id_conflicts': [],
             'content_duplicates': [],
-            'fuzzy_duplicates': []
+            'fuzzy_duplicates': [],
+            'perceptual_duplicates': []
         }
+        self.timings = {'snapshot': self.snapshot_seconds}
         
-        # Detect MAL ID conflicts (highest priority)
-        logger.info("Phase 1: Detecting MAL ID conflicts...")
-        results['mal_id_conflicts'] = self.mal_detector.detect()
-        logger.info(f"Phase 1 complete: Found {len(results['mal_id_conflicts'])} MAL ID conflicts")
-        
-        # Detect content duplicates
-        logger.info("Phase 2: Detecting content duplicates...")
-        results['content_duplicates'] = self.content_detector.detect()
-        logger.info(f"Phase 2 complete: Found {len(results['content_duplicates'])} content duplicates")
-        
-        # Detect fuzzy duplicates
-        logger.info("Phase 3: Detecting fuzzy name duplicates...")
-        results['fuzzy_duplicates'] = self.fuzzy_detector.detect()
-        logger.info(f"Phase 3 complete: Found {len(results['fuzzy_duplicates'])} fuzzy duplicates")
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dedupe")
+        try:
+            mal_future = executor.submit(self._timed, 'mal-id', self.mal_detector.detect)
+            content_future = executor.submit(self._timed, 'content', self.content_detector.detect)
+            results['fuzzy_duplicates'] = self._timed('fuzzy', self.fuzzy_detector.detect, fuzzy_progress, on_fuzzy_group)
+            if self.fuzzy_detector.interrupted:
+                # Ctrl+C: keep what already finished instead of waiting on content hashing
+                for key, future in (('mal_id_conflicts', mal_future), ('content_duplicates', content_future)):
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        results[key] = future.result()
+                logger.warning("Detection interrupted; skipping detectors that had not finished")
+            else:
+                results['mal_id_conflicts'] = mal_future.result()
+                results['content_duplicates'] = content_future.result()
+        finally:
+            executor.shutdown(wait=not self.fuzzy_detector.interrupted, cancel_futures=True)
+        self.timings['total'] = time.perf_counter() - start
+        
+        logger.info(f"MAL ID conflicts: {len(results['mal_id_conflicts'])}, content duplicates: {len(results['content_duplicates'])}, "
+                    f"fuzzy duplicates: {len(results['fuzzy_duplicates'])}")
         
         # Final summary
         total_duplicates = sum(len(v) for v in results.values())
@@ -434,12 +679,16 @@ class DedupeEngine:
             'mal_id_groups': len(results['mal_id_conflicts']),
             'content_groups': len(results['content_duplicates']),
             'fuzzy_groups': len(results['fuzzy_duplicates']),
+            'perceptual_groups': len(results.get('perceptual_duplicates', [])),
             'total_affected_series': 0,
             'total_duplicate_files': 0,
-            'estimated_space_mb': 0
+            'estimated_space_mb': 0,
+            'perceptual_files': 0,
+            'perceptual_space_mb': 0
         }
         
-        summary['total_groups'] = summary['mal_id_groups'] + summary['content_groups'] + summary['fuzzy_groups']
+        summary['total_groups'] = (summary['mal_id_groups'] + summary['content_groups']
+                                   + summary['fuzzy_groups'] + summary['perceptual_groups'])
         
         # Count affected series and files
         for conflict in results['mal_id_conflicts']:
@@ -454,4 +703,10 @@ class DedupeEngine:
         for group in results['fuzzy_duplicates']:
             summary['total_affected_series'] += len(group.items)
         
+        for duplicate in results.get('perceptual_duplicates', []):
+            summary['perceptual_files'] += len(duplicate.volumes)
+            # Keeping the largest copy frees the others
+            sizes = [vol.size_bytes for vol in duplicate.volumes]
+            summary['perceptual_space_mb'] += (sum(sizes) - max(sizes)) / (1024 * 1024)
+        
         return summary
\ No newline at end of file
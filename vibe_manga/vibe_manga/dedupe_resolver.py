@@ -9,7 +9,7 @@ import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Tuple
 
 from rich.console import Console, Group
 from rich.table import Table
@@ -17,11 +17,14 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.text import Text
 from rich.columns import Columns
+from rich.live import Live
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn
 from rich import box
 
 from .models import Series, Volume
 from .dedupe_engine import MALIDDuplicate, ContentDuplicate, DuplicateGroup
 from .analysis import format_ranges, classify_unit
+from .inspection_service import InspectionResult, InspectionService
 from .logging import console
 
 logger = logging.getLogger(__name__)
@@ -58,6 +61,7 @@ class DuplicateResolver:
     def __init__(self, whitelist_path: Optional[Path] = None):
         self.whitelist_path = whitelist_path or Path("vibe_manga_duplicate_whitelist.json")
         self.whitelist = self._load_whitelist()
+        self.inspection_service = InspectionService()
         self.resolution_plans: List[ResolutionPlan] = []
         self._summary_shown: Dict[str, bool] = {}  # Track which summaries have been shown
     
@@ -433,43 +437,35 @@ class DuplicateResolver:
             total_files = len(all_volumes)
             total_size = 0
             total_pages = 0
+            reused = 0
             corrupted_files = []
             
-            with console.status(f"[dim]Inspecting {total_files} files...[/dim]"):
-                for vol in all_volumes:
-                    try:
-                        if vol.path.exists():
-                            size = vol.path.stat().st_size
-                            total_size += size
-                            
-                            # Try to open zip to check integrity
-                            import zipfile
-                            try:
-                                with zipfile.ZipFile(vol.path, 'r') as zf:
-                                    # Test zip integrity
-                                    result = zf.testzip()
-                                    if result is not None:
-                                        corrupted_files.append((vol.name, f"Corrupted file: {result}"))
-                            except zipfile.BadZipFile:
-                                corrupted_files.append((vol.name, "Not a valid zip file"))
-                            except Exception as e:
-                                corrupted_files.append((vol.name, f"Error: {str(e)}"))
-                        else:
-                            corrupted_files.append((vol.name, "File not found"))
-                    except Exception as e:
-                        corrupted_files.append((vol.name, f"Error: {str(e)}"))
+            with Progress(
+                SpinnerColumn(),
+                TextColumn(f"[dim]Inspecting {total_files} files...[/dim]"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=console,
+                transient=True
+            ) as progress:
+                task = progress.add_task("", total=total_files)
+                for result in self.inspection_service.run(all_volumes, check_integrity=True):
+                    total_size += result.size
+                    total_pages += result.page_count or 0
+                    reused += result.cached
+                    if not result.ok:
+                        corrupted_files.append((result.volume.name, result.error))
+                        progress.console.print(f"    [red]- {result.volume.name}: {result.error}[/red]")
+                    progress.advance(task)
             
             # Display results
-            console.print(f"  Files inspected: {total_files}")
+            console.print(f"  Files inspected: {total_files}" + (f" [dim]({reused} unchanged since last inspection)[/dim]" if reused else ""))
             console.print(f"  Total size: {total_size / (1024**2):.1f} MB")
             console.print(f"  Average size: {total_size / total_files / 1024:.1f} KB" if total_files > 0 else "  Average size: N/A")
+            console.print(f"  Total pages: {total_pages}")
             
             if corrupted_files:
                 console.print(f"  [red]Corrupted files: {len(corrupted_files)}[/red]")
-                for name, reason in corrupted_files[:5]:  # Show first 5
-                    console.print(f"    [red]- {name}: {reason}[/red]")
-                if len(corrupted_files) > 5:
-                    console.print(f"    [red]... and {len(corrupted_files) - 5} more[/red]")
             else:
                 console.print(f"  [green]All files OK![/green]")
     
@@ -479,8 +475,6 @@ class DuplicateResolver:
         console.print(f"[bold blue]FILE INTEGRITY VERIFICATION[/bold blue]")
         console.print(f"[bold blue]{'=' * 70}[/bold blue]")
         
-        import hashlib
-        
         for i, series in enumerate(series_list):
             console.print(f"\n[bold]Series {i+1}: {series.name}[/bold]")
             
@@ -489,46 +483,39 @@ class DuplicateResolver:
                 console.print("  [dim]No volumes found[/dim]")
                 continue
             
-            table = Table(title=f"File Integrity - {series.name}")
-            table.add_column("File", style="cyan")
-            table.add_column("Size", style="white")
-            table.add_column("Checksum", style="dim")
-            table.add_column("Status", style="green")
-            
-            for vol in sorted(all_volumes, key=lambda v: v.name):
-                try:
-                    if vol.path.exists():
-                        size = vol.path.stat().st_size
-                        
-                        # Calculate MD5 checksum
-                        md5_hash = hashlib.md5()
-                        with open(vol.path, "rb") as f:
-                            for chunk in iter(lambda: f.read(4096), b""):
-                                md5_hash.update(chunk)
-                        checksum = md5_hash.hexdigest()[:8]
-                        
-                        table.add_row(
-                            vol.name,
-                            f"{size / 1024:.0f} KB",
-                            checksum,
-                            "✓ OK"
-                        )
-                    else:
-                        table.add_row(
-                            vol.name,
-                            "N/A",
-                            "N/A",
-                            "✗ Missing"
-                        )
-                except Exception as e:
-                    table.add_row(
-                        vol.name,
-                        "Error",
-                        "Error",
-                        f"✗ {str(e)[:20]}"
-                    )
-            
-            console.print(table)
+            # Rows arrive as inspections finish; each one is placed at its sorted
+            # position and the table is rebuilt, so it never shows out of order
+            ordered = sorted(all_volumes, key=lambda v: v.name)
+            position = {id(volume): n for n, volume in enumerate(ordered)}
+            rows: Dict[int, Tuple[str, str, str, str]] = {}
+            with Live(self._integrity_table(series.name, []), console=console, refresh_per_second=4) as live:
+                for result in self.inspection_service.run(ordered, check_integrity=True, checksum=True):
+                    rows[position[id(result.volume)]] = self._integrity_row(result)
+                    live.update(self._integrity_table(series.name, [rows[n] for n in sorted(rows)]))
+
+    @staticmethod
+    def _integrity_table(series_name: str, rows: List[Tuple[str, str, str, str]]) -> Table:
+        table = Table(title=f"File Integrity - {series_name}")
+        table.add_column("File", style="cyan")
+        table.add_column("Size", style="white")
+        table.add_column("Checksum", style="dim")
+        table.add_column("Status", style="green")
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    @staticmethod
+    def _integrity_row(result: InspectionResult) -> Tuple[str, str, str, str]:
+        if not result.exists:
+            return (result.volume.name, "N/A", "N/A", "✗ Missing")
+        if result.ok:
+            return (result.volume.name, f"{result.size / 1024:.0f} KB", result.checksum[:8], "✓ OK")
+        return (
+            result.volume.name,
+            f"{result.size / 1024:.0f} KB" if result.size else "Error",
+            result.checksum[:8] if result.checksum else "Error",
+            f"[red]✗ {(result.error or 'Error')[:30]}[/red]"
+        )
     
     def _prompt_mal_id_action(self, duplicate: MALIDDuplicate) -> ResolutionAction:
         """Prompt user for action on MAL ID conflict."""
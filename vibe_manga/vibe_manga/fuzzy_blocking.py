@@ -0,0 +1,203 @@
+"""
+Candidate generation (blocking) for fuzzy duplicate detection.
+
+FuzzyDuplicateDetector used to score every series against every later one
+with difflib, O(n^2 x identities^2). Blocking narrows that down to pairs that
+can plausibly reach the threshold before any SequenceMatcher runs:
+
+  1. q-gram prefix filter - each normalized name is split into q-gram
+     occurrences ("abc#1", "abc#2", ...). With M matched characters, a
+     SequenceMatcher ratio of r between names of length a and b implies they
+     share at least ((2q - 1)r/2 - (q - 1))(a + b) - (q - 1) such occurrences,
+     so indexing only the rarest |T| - o + 1 of them is enough for two names to
+     meet in some bucket. Trigrams are used where that bound is positive
+     (thresholds above 0.8; the default is 0.95), bigrams for shorter names
+     and their possible partners. Lossless except for very short names that
+     share no bigram at all.
+  2. MinHash-LSH over trigrams - banded signatures put names with high
+     trigram Jaccard similarity into shared buckets. Probabilistic; it covers
+     thresholds too low for the prefix bound.
+  3. Length-ratio and quick_ratio upper bounds - discard candidates whose
+     ratio cannot reach the threshold before computing it exactly.
+
+Pairs that pass are scored with the same SequenceMatcher ratio as before, so
+the threshold means exactly what it did.
+"""
+
+import math
+import zlib
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .constants import FUZZY_LSH_BANDS, FUZZY_LSH_ROWS, FUZZY_LSH_MAX_BUCKET
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def qgram_tokens(name: str, q: int = 3) -> List[str]:
+    """q-gram occurrences of a name, numbered so repeats stay distinct ('aaa#1', 'aaa#2')."""
+    seen: Counter = Counter()
+    tokens = []
+    for i in range(len(name) - q + 1):
+        gram = name[i:i + q]
+        seen[gram] += 1
+        tokens.append(f"{gram}#{seen[gram]}")
+    return tokens
+
+
+def length_compatible(len_a: int, len_b: int, threshold: float) -> bool:
+    """Upper bound of the ratio from lengths alone (2 * shorter / total)."""
+    total = len_a + len_b
+    return total > 0 and 2.0 * min(len_a, len_b) / total >= threshold
+
+
+def min_shared_qgrams(length: int, threshold: float, q: int = 3) -> int:
+    """
+    Fewest q-gram occurrences a name of `length` shares with any name it can
+    reach `threshold` with; 0 means there is no useful bound.
+
+    With M matched characters in at most (a + b - 2M + 1) matching blocks,
+    each block of length L holding L - q + 1 shared q-grams, and M >= r(a + b)/2:
+    shared >= ((2q - 1)r/2 - (q - 1))(a + b) - (q - 1).
+    """
+    coefficient = (2 * q - 1) * threshold / 2 - (q - 1)
+    if coefficient <= 0:
+        return 0
+    # Shortest partner that still passes the length filter
+    partner = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+    return max(0, math.floor(coefficient * (length + partner) - (q - 1)))
+
+
+def ratio_if_similar(a: str, b: str, threshold: float) -> Optional[float]:
+    """SequenceMatcher ratio of a and b if it reaches threshold, else None (cheap bounds first)."""
+    if not length_compatible(len(a), len(b), threshold):
+        return None
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return None
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else None
+
+
+def best_similarity(names1: Sequence[str], names2: Sequence[str], threshold: float) -> Optional[float]:
+    """Highest ratio between any two names, or None if none reaches the threshold."""
+    best = None
+    for norm1 in names1:
+        for norm2 in names2:
+            similarity = ratio_if_similar(norm1, norm2, threshold)
+            if similarity is not None and (best is None or similarity > best):
+                best = similarity
+    return best
+
+
+def score_pairs(names: Dict[int, Sequence[str]], pairs: Sequence[Tuple[int, int]], threshold: float) -> List[Tuple[int, int, float]]:
+    """
+    Exact scoring for one shard of candidate pairs; `names` only needs the
+    records the shard mentions. Module-level so process pools can pickle it.
+    """
+    scored = []
+    for i, j in pairs:
+        similarity = best_similarity(names[i], names[j], threshold)
+        if similarity is not None:
+            scored.append((i, j, similarity))
+    return scored
+
+
+class NameBlocker:
+    """Finds record pairs whose names may be similar enough to score."""
+
+    def __init__(
+        self,
+        threshold: float,
+        bands: int = FUZZY_LSH_BANDS,
+        rows: int = FUZZY_LSH_ROWS,
+        max_bucket: int = FUZZY_LSH_MAX_BUCKET,
+        seed: int = 1,
+    ):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_bucket = max_bucket
+        # Fixed seed: the same library always yields the same candidates
+        rng = np.random.RandomState(seed)
+        num_perm = bands * rows
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+    def signature(self, tokens: Sequence[str]) -> np.ndarray:
+        """MinHash signature of a token set (bands * rows values)."""
+        hashes = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in set(tokens)), dtype=np.uint64)
+        # a < 2^31 and hash < 2^32, so a*h + b fits in uint64
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def candidate_pairs(self, names: Sequence[Sequence[str]]) -> Set[Tuple[int, int]]:
+        """
+        `names[i]` are the normalized names of record i. Returns (i, j) pairs,
+        i < j, where some name of i may reach the threshold with some name of j.
+
+        Names shorter than 2 characters are dropped, so pairs reachable only
+        through them are never returned. Callers must filter such names out
+        themselves (FuzzyDuplicateDetector keeps only names longer than 3).
+        """
+        entries = []  # (record, name, tokens)
+        for record, record_names in enumerate(names):
+            for name in set(record_names):
+                if len(name) >= 2:
+                    entries.append((record, name, qgram_tokens(name, 3)))
+
+        pairs: Set[Tuple[int, int]] = set()
+        self._add_bucket_pairs(self._prefix_buckets(entries).values(), pairs, cap=None)
+        self._add_bucket_pairs(self._lsh_buckets(entries).values(), pairs, cap=self.max_bucket)
+        return pairs
+
+    def _prefix_buckets(self, entries) -> Dict[str, Set[int]]:
+        """
+        Trigram prefixes where the trigram bound is positive, bigram prefixes
+        for shorter names and for names that may pair with one of them.
+        """
+        indexed = []  # (record, tokens, prefix length)
+        for record, name, _ in entries:
+            length = len(name)
+            shared3 = min_shared_qgrams(length, self.threshold, 3)
+            if shared3 > 0:
+                tokens = qgram_tokens(name, 3)
+                indexed.append((record, tokens, len(tokens) - shared3 + 1))
+            shortest_partner = math.ceil(length * self.threshold / (2 - self.threshold) - 1e-9)
+            if shared3 <= 0 or min_shared_qgrams(shortest_partner, self.threshold, 3) <= 0:
+                tokens = qgram_tokens(name, 2)
+                # Without a bound (very short names) the whole token list is the prefix
+                shared2 = max(1, min_shared_qgrams(length, self.threshold, 2))
+                indexed.append((record, tokens, len(tokens) - shared2 + 1))
+
+        frequency: Counter = Counter(t for _, tokens, _ in indexed for t in tokens)
+        buckets: Dict[str, Set[int]] = defaultdict(set)
+        for record, tokens, size in indexed:
+            rarest = sorted(tokens, key=lambda t: (frequency[t], t))
+            for token in rarest[:max(1, size)]:
+                buckets[token].add(record)
+        return buckets
+
+    def _lsh_buckets(self, entries) -> Dict[Tuple[int, bytes], Set[int]]:
+        buckets: Dict[Tuple[int, bytes], Set[int]] = defaultdict(set)
+        for record, _, tokens in entries:
+            if not tokens:
+                continue
+            signature = self.signature(tokens)
+            for band in range(self.bands):
+                key = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+                buckets[(band, key)].add(record)
+        return buckets
+
+    @staticmethod
+    def _add_bucket_pairs(buckets, pairs: Set[Tuple[int, int]], cap: Optional[int]) -> None:
+        for members in buckets:
+            if len(members) < 2 or (cap is not None and len(members) > cap):
+                continue
+            ordered = sorted(members)
+            for x, i in enumerate(ordered):
+                for j in ordered[x + 1:]:
+                    pairs.add((i, j))
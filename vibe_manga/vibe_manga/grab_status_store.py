@@ -0,0 +1,174 @@
+"""
+Write-behind persistence for per-entry grab_status.
+
+`grab` and `pull` change the status of a handful of entries at a time, but the
+match results file is one large JSON array. Rewriting it for every group made
+long auto-add sessions I/O bound. Status changes instead go to an append-only
+journal next to the match file (`<file>.grab_status.jsonl`, one
+`{"key", "status"}` record per line, keyed by magnet link):
+
+  * changes are buffered in memory and appended in one write (then fsynced)
+    every GRAB_STATUS_FLUSH_SECONDS or GRAB_STATUS_FLUSH_EVERY changes;
+  * readers overlay the journal on the match data they load (last record wins),
+    so the journal is authoritative until it is merged;
+  * `merge()` folds the journal back into the match file (atomic replace) and
+    truncates it; `match` does this implicitly when it rewrites the file.
+
+A torn final line (crash mid-append) is ignored on load.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .constants import (
+    GRAB_STATUS_JOURNAL_SUFFIX,
+    GRAB_STATUS_FLUSH_SECONDS,
+    GRAB_STATUS_FLUSH_EVERY,
+)
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def entry_key(entry: Dict[str, Any]) -> Optional[str]:
+    """Journal key for a match entry: its magnet link, else its torrent name."""
+    if entry.get("magnet_link"):
+        return entry["magnet_link"]
+    if entry.get("name"):
+        return f"name:{entry['name']}"
+    return None
+
+
+class GrabStatusStore:
+    """Append-only grab_status journal for one match results file."""
+
+    def __init__(
+        self,
+        match_path: Union[str, Path],
+        flush_seconds: float = GRAB_STATUS_FLUSH_SECONDS,
+        flush_every: int = GRAB_STATUS_FLUSH_EVERY,
+    ):
+        self.match_path = Path(match_path)
+        self.journal_path = self.match_path.with_name(self.match_path.name + GRAB_STATUS_JOURNAL_SUFFIX)
+        self.flush_seconds = flush_seconds
+        self.flush_every = flush_every
+        self._pending: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+
+    def __len__(self) -> int:
+        """Number of buffered changes not yet written to the journal."""
+        return len(self._pending)
+
+    # --- Reading ---
+
+    def load(self) -> Dict[str, str]:
+        """Returns key -> status from the journal plus buffered changes (last write wins)."""
+        statuses: Dict[str, str] = {}
+        if self.journal_path.exists():
+            try:
+                with open(self.journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Torn write
+                        if isinstance(record, dict) and record.get("key"):
+                            statuses[record["key"]] = record.get("status")
+            except OSError as e:
+                logger.warning(f"Could not read grab status journal '{self.journal_path}': {e}")
+        statuses.update(self._pending)
+        return statuses
+
+    def apply(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Overlays journaled statuses onto loaded match entries. Returns how many changed."""
+        statuses = self.load()
+        if not statuses:
+            return 0
+        changed = 0
+        for entry in entries:
+            key = entry_key(entry)
+            if key in statuses and entry.get("grab_status") != statuses[key]:
+                entry["grab_status"] = statuses[key]
+                changed += 1
+        return changed
+
+    # --- Writing ---
+
+    def set(self, entry: Dict[str, Any], status: str) -> None:
+        """Sets an entry's grab_status in memory and queues it for the journal."""
+        entry["grab_status"] = status
+        key = entry_key(entry)
+        if key is None:
+            return
+        self._pending[key] = status
+        self.maybe_flush()
+
+    def maybe_flush(self) -> bool:
+        """Flushes if enough changes are buffered or the flush interval has passed."""
+        if not self._pending:
+            return False
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Appends buffered changes to the journal in a single write."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        payload = "".join(
+            json.dumps({"key": key, "status": status}, ensure_ascii=False) + "\n"
+            for key, status in self._pending.items()
+        )
+        try:
+            with open(self.journal_path, "a+b") as f:
+                # Never glue a record onto a torn trailing line
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        payload = "\n" + payload
+                f.write(payload.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending.clear()
+        except OSError as e:
+            logger.error(f"Error writing grab status journal '{self.journal_path}': {e}")
+
+    def merge(self, entries: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Writes the journaled statuses into the match file and truncates the journal.
+        `entries` may be passed if the match data is already loaded.
+        """
+        if entries is None:
+            try:
+                with open(self.match_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not load match results from '{self.match_path}': {e}")
+                return False
+        self.apply(entries)
+
+        tmp = self.match_path.with_name(self.match_path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, self.match_path)
+        except OSError as e:
+            logger.error(f"Error saving updates to '{self.match_path}': {e}")
+            return False
+        self.clear()
+        return True
+
+    def clear(self) -> None:
+        """Drops the journal and buffered changes (after they were merged into the match file)."""
+        self._pending.clear()
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Could not remove grab status journal '{self.journal_path}': {e}")
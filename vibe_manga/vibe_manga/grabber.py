@@ -6,12 +6,13 @@ import click
 import time
 import shutil
 import difflib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Set, Tuple, Union
 from datetime import datetime
 
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, DownloadColumn, TransferSpeedColumn
 from rich import box
 from rich.rule import Rule
 from rich.panel import Panel
@@ -19,6 +20,12 @@ from rich.text import Text
 from rich.prompt import Confirm
 
 from .qbit_api import QBitAPI
+from .qbit_sync import QBitSyncClient, get_torrents_with_sync
+from .grab_status_store import GrabStatusStore
+from .match_index import MatchIndex, load_match_index, magnet_info_hash
+from .transfer import transfer_file, describe_transfers
+from .pull_executor import SerialKeyExecutor
+from .transfer_plan_cache import TransferPlanCache, files_fingerprint, series_fingerprint
 from .constants import (
     QBIT_DEFAULT_TAG, 
     QBIT_DEFAULT_SAVEPATH, 
@@ -28,6 +35,10 @@ from .constants import (
     BYTES_PER_GB,
     PROGRESS_REFRESH_RATE,
     PULL_TEMPDIR,
+    QBIT_WATCH_INTERVAL_SECONDS,
+    QBIT_BATCH_MAX_PENDING,
+    PULL_MAX_WORKERS,
+    SEARCH_CANDIDATE_CACHE_MAX,
     FUZZY_MATCH_THRESHOLD,
     SERIES_ALIASES
 )
@@ -53,6 +64,8 @@ logger = get_logger(__name__)
 
 # Simple cache for LibraryIndex to avoid rebuilding it multiple times in a single command run
 _index_cache = {}
+# Search candidates per raw title; pull asks for the same torrent names repeatedly
+_candidate_cache: Dict[str, Tuple[str, ...]] = {}
 
 def find_series_match(text: str, library: Library) -> Optional[Series]:
     """
@@ -100,7 +113,17 @@ def generate_search_candidates(text: str) -> List[str]:
     """
     Generates potential series title candidates from a raw filename/title.
     Replicates the logic from the old find_series_match to ensure robust matching.
+    Results are memoized per text; callers get their own list.
     """
+    cached = _candidate_cache.get(text)
+    if cached is None:
+        if len(_candidate_cache) >= SEARCH_CANDIDATE_CACHE_MAX:
+            _candidate_cache.clear()
+        cached = tuple(_generate_search_candidates(text))
+        _candidate_cache[text] = cached
+    return list(cached)
+
+def _generate_search_candidates(text: str) -> List[str]:
     raw_pieces = [text]
     
     # Split original text by common separators BEFORE stripping
@@ -143,19 +166,18 @@ def generate_search_candidates(text: str) -> List[str]:
     # Dedup and clean
     return sorted(list(set(c for c in candidates if c.strip())), key=len, reverse=True)
 
-def get_matched_or_parsed_name(torrent_name: str, library_index: Optional[LibraryIndex] = None, match_data: Optional[List[Dict]] = None, series_map: Optional[Dict[str, Any]] = None) -> str:
+def get_matched_or_parsed_name(torrent_name: str, library_index: Optional[LibraryIndex] = None, match_index: Optional[MatchIndex] = None, series_map: Optional[Dict[str, Any]] = None) -> str:
     """
     Tries to find a library match for a torrent name, 
     falling back to a parsed name if no match is found.
     """
     # 1. Try Match Data (Ground Truth from match command)
-    if match_data and series_map:
-        for entry in match_data:
-            if entry.get("name") == torrent_name:
-                mid = entry.get("matched_id")
-                if mid and mid in series_map:
-                    return f"[green]{series_map[mid].name}[/green]"
-                break
+    if match_index and series_map:
+        entry = match_index.by_name(torrent_name)
+        if entry:
+            mid = entry.get("matched_id")
+            if mid and mid in series_map:
+                return f"[green]{series_map[mid].name}[/green]"
 
     # 2. Try Library Index Match (Exact/Synonym with Candidates)
     if library_index:
@@ -215,11 +237,8 @@ def vibe_format_range(numbers: List[float], prefix: str = "", pad: int = 0) -> s
         # Range: v01-05
         return f"{prefix}{fmt(start)}-{fmt(end)}"
 
-def generate_transfer_plan(source_root: Path, series_name: str) -> List[Dict]:
-    """
-    Scans source_root for files, generates normalized names, and returns a plan.
-    Does NOT move or rename files.
-    """
+def collect_transfer_files(source_root: Path) -> List[Path]:
+    """Returns the archive/manga files of a torrent, sorted alphabetically."""
     files_to_process = []
     
     if source_root.is_file():
@@ -235,10 +254,18 @@ def generate_transfer_plan(source_root: Path, series_name: str) -> List[Dict]:
                 if path.suffix.lower() in [".cbz", ".cbr", ".pdf", ".zip", ".rar", ".7z", ".epub"]:
                     files_to_process.append(path)
     
+    files_to_process.sort() # Alphabetical sort for consistency
+    return files_to_process
+
+def generate_transfer_plan(source_root: Path, series_name: str, files: Optional[List[Path]] = None) -> List[Dict]:
+    """
+    Scans source_root for files, generates normalized names, and returns a plan.
+    Does NOT move or rename files. `files` may be passed if already collected.
+    """
+    files_to_process = files if files is not None else collect_transfer_files(source_root)
+    
     if not files_to_process:
         return []
-
-    files_to_process.sort() # Alphabetical sort for consistency
     
     plan = []
     seen_names = set()
@@ -307,7 +334,7 @@ def process_grab(name: Optional[str], input_file: str, status: bool, root_path:
     qbit = QBitAPI()
 
     if status:
-        torrents = qbit.get_torrents_info(tag=QBIT_DEFAULT_TAG)
+        torrents = get_torrents_with_sync(qbit, tag=QBIT_DEFAULT_TAG)
         if not torrents:
             console.print("[yellow]No active VibeManga torrents found in qBittorrent.[/yellow]")
             return
@@ -320,12 +347,16 @@ def process_grab(name: Optional[str], input_file: str, status: bool, root_path:
 
         # Load library for matching reporting
         library = load_library_state(Path(root_path))
+        match_index = load_match_index(input_file)
         
         for t in torrents:
             # Try to find what series this matches to in our library
             match_name = "No Match"
+            entry = match_index.for_torrent(t)
+            if entry and entry.get("matched_name"):
+                match_name = entry["matched_name"]
             # We use the qbit 'name' to find a match in our library series
-            if library:
+            elif library:
                 local_series = find_series_match(t['name'], library)
                 if local_series:
                     match_name = local_series.name
@@ -350,6 +381,10 @@ def process_grab(name: Optional[str], input_file: str, status: bool, root_path:
         console.print(f"[red]Error reading {input_file}: {e}[/red]")
         return
 
+    # Status changes not yet merged into input_file live in its journal
+    status_store = GrabStatusStore(input_file)
+    status_store.apply(data)
+
     # Consolidate entries to show all related files for this series
     consolidated = consolidate_entries(data)
     manga_groups = [g for g in consolidated if g.get("type") == "Manga"]
@@ -426,462 +461,458 @@ def process_grab(name: Optional[str], input_file: str, status: bool, root_path:
     total_added_count = 0
     groups_processed = 0
     groups_skipped = 0
-    
+
+    # Adds are queued and sent in one request per tag; grab_status changes go
+    # to the status journal, which flushes on its own schedule.
+    batch = qbit.batch()
+    # Torrents waiting in the batch; overlapping groups share entries, and
+    # grab_status is only set on flush, so this stops double queueing.
+    queued: Set[str] = set()
+
+    def queue_key(f: Dict[str, Any]) -> str:
+        magnet = f.get("magnet_link", "")
+        return magnet_info_hash(magnet) or magnet
+
+    def flush_grabs() -> None:
+        nonlocal total_added_count
+        if len(batch):
+            result = batch.flush()
+            for f, reason in result.succeeded:
+                status_store.set(f, "grabbed")
+                console.print(f"[green]✓ Added: {f.get('name')}[/green] [dim]({reason})[/dim]")
+            for f, reason in result.failed:
+                console.print(f"[red] - Failed to add: {f.get('name')}[/red]")
+            total_added_count -= len(result.failed)
+            queued.clear()
+        status_store.flush()
+
     with console.status("[bold blue]Initializing grab process...[/bold blue]") as status:
-        while current_idx < len(manga_groups):
-            group = manga_groups[current_idx]
-
-            # Identify group files
-            group_files = []
-            group_names = set(group["parsed_name"])
-            for e in data:
-                if any(n in group_names for n in e.get("parsed_name", [])):
-                    group_files.append(e)
-
-            # Check if group is fully processed (all files have terminal status)
-            # This prevents showing prompts for groups where we've already grabbed/skipped everything
-            check_statuses = {"grabbed", "skipped", "pulled", "blacklisted"}
-            if not force:
-                if auto_add or auto_add_only:
-                    check_statuses.add("skipautoadd")
-                if auto_add_only:
-                    check_statuses.add("skipautoaddonly")
-            
-            all_processed = True
-            for f in group_files:
-                if f.get("grab_status") not in check_statuses:
-                    all_processed = False
-                    break
+        try:
+            while current_idx < len(manga_groups):
+                group = manga_groups[current_idx]
+
+                # Identify group files
+                group_files = []
+                group_names = set(group["parsed_name"])
+                for e in data:
+                    if any(n in group_names for n in e.get("parsed_name", [])):
+                        group_files.append(e)
+
+                # Check if group is fully processed (all files have terminal status)
+                # This prevents showing prompts for groups where we've already grabbed/skipped everything
+                check_statuses = {"grabbed", "skipped", "pulled", "blacklisted"}
+                if not force:
+                    if auto_add or auto_add_only:
+                        check_statuses.add("skipautoadd")
+                    if auto_add_only:
+                        check_statuses.add("skipautoaddonly")
             
-            if all_processed:
-                status.update(f"[dim]Skipping processed group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])}[/dim]")
-                groups_skipped += 1
-                current_idx += 1
-                continue
-
-            match_id = group.get("matched_id")
-            local_series = series_map.get(match_id) if match_id else None
-
-            # Fallback: Try real-time matching if not found (using robust clean name logic)
-            if not local_series and library:
-                for clean_name in group.get("parsed_name", []):
-                    # Try exact/fuzzy match with the clean name
-                    found = find_series_match(clean_name, library)
-                    if found:
-                        local_series = found
-                        # Update matched_name for display
-                        group['matched_name'] = found.name
+                all_processed = True
+                for f in group_files:
+                    if f.get("grab_status") not in check_statuses:
+                        all_processed = False
                         break
+            
+                if all_processed:
+                    status.update(f"[dim]Skipping processed group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])}[/dim]")
+                    groups_skipped += 1
+                    current_idx += 1
+                    continue
 
-            # Pre-calculate content analysis for auto-skip
-            l_v_nums, l_c_nums = [], []
-            l_v_set, l_c_set = set(), set()
-            new_v, new_c = set(), set()
-            max_torrent_bytes = 0
+                match_id = group.get("matched_id")
+                local_series = series_map.get(match_id) if match_id else None
+
+                # Fallback: Try real-time matching if not found (using robust clean name logic)
+                if not local_series and library:
+                    for clean_name in group.get("parsed_name", []):
+                        # Try exact/fuzzy match with the clean name
+                        found = find_series_match(clean_name, library)
+                        if found:
+                            local_series = found
+                            # Update matched_name for display
+                            group['matched_name'] = found.name
+                            break
+
+                # Pre-calculate content analysis for auto-skip
+                l_v_nums, l_c_nums = [], []
+                l_v_set, l_c_set = set(), set()
+                new_v, new_c = set(), set()
+                max_torrent_bytes = 0
         
-            if local_series:
-                all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
-                for v in all_local_vols:
-                    v_n, c_n, u_n = classify_unit(v.name)
-                    l_v_nums.extend(v_n); l_c_nums.extend(c_n + u_n)
+                if local_series:
+                    all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
+                    for v in all_local_vols:
+                        v_n, c_n, u_n = classify_unit(v.name)
+                        l_v_nums.extend(v_n); l_c_nums.extend(c_n + u_n)
                 
-                l_v_set = set(l_v_nums)
-                l_c_set = set(l_c_nums)
+                    l_v_set = set(l_v_nums)
+                    l_c_set = set(l_c_nums)
                 
-                # Heuristic: If we have volumes, assume each covers ~6 chapters
-                # Any chapter number below this cutoff is likely redundant/subsumed
-                max_local_vol = max(l_v_set) if l_v_set else 0
-                cutoff_chapter = max_local_vol * 6
+                    # Heuristic: If we have volumes, assume each covers ~6 chapters
+                    # Any chapter number below this cutoff is likely redundant/subsumed
+                    max_local_vol = max(l_v_set) if l_v_set else 0
+                    cutoff_chapter = max_local_vol * 6
                 
-                # Dynamic Heuristic: Check if any file in the group provides a "Rosetta Stone"
-                # (mapping volumes to chapters, e.g., "001-025 as v01-02")
-                # If so, use that ratio to calibrate our cutoff.
-                for f in group_files:
-                    try:
-                        f_ve = f.get("volume_end")
-                        f_ce = f.get("chapter_end")
-                        if f_ve and f_ce:
-                            val_ve = float(f_ve)
-                            val_ce = float(f_ce)
-                            if val_ve > 0:
-                                ratio = val_ce / val_ve
-                                # If the ratio is reasonable (e.g. > 3 chaps/vol), use it
-                                if ratio > 3:
-                                    implied_cutoff = max_local_vol * ratio
-                                    if implied_cutoff > cutoff_chapter:
-                                        cutoff_chapter = implied_cutoff
-                    except (ValueError, TypeError):
-                        pass
-
-                # Define statuses to skip for content analysis
-                skip_content = ["grabbed", "skipped", "pulled", "blacklisted"]
-                if not force:
-                    skip_content.append("skipautoadd")
-                    if auto_add_only:
-                        skip_content.append("skipautoaddonly")
+                    # Dynamic Heuristic: Check if any file in the group provides a "Rosetta Stone"
+                    # (mapping volumes to chapters, e.g., "001-025 as v01-02")
+                    # If so, use that ratio to calibrate our cutoff.
+                    for f in group_files:
+                        try:
+                            f_ve = f.get("volume_end")
+                            f_ce = f.get("chapter_end")
+                            if f_ve and f_ce:
+                                val_ve = float(f_ve)
+                                val_ce = float(f_ce)
+                                if val_ve > 0:
+                                    ratio = val_ce / val_ve
+                                    # If the ratio is reasonable (e.g. > 3 chaps/vol), use it
+                                    if ratio > 3:
+                                        implied_cutoff = max_local_vol * ratio
+                                        if implied_cutoff > cutoff_chapter:
+                                            cutoff_chapter = implied_cutoff
+                        except (ValueError, TypeError):
+                            pass
+
+                    # Define statuses to skip for content analysis
+                    skip_content = ["grabbed", "skipped", "pulled", "blacklisted"]
+                    if not force:
+                        skip_content.append("skipautoadd")
+                        if auto_add_only:
+                            skip_content.append("skipautoaddonly")
 
-                for f in group_files:
-                    # Skip already processed files from content analysis
-                    if f.get("grab_status") in skip_content:
-                        continue
+                    for f in group_files:
+                        # Skip already processed files from content analysis
+                        if f.get("grab_status") in skip_content:
+                            continue
 
-                    t_bytes = parse_size(f.get("size"))
-                    if t_bytes > max_torrent_bytes:
-                        max_torrent_bytes = t_bytes
+                        t_bytes = parse_size(f.get("size"))
+                        if t_bytes > max_torrent_bytes:
+                            max_torrent_bytes = t_bytes
 
-                    v_s, v_e = f.get("volume_begin"), f.get("volume_end")
-                    file_has_vols = False
-                    all_vols_known = True
+                        v_s, v_e = f.get("volume_begin"), f.get("volume_end")
+                        file_has_vols = False
+                        all_vols_known = True
 
-                    if v_s is not None:
-                        file_has_vols = True
-                        try:
-                            s, e = float(v_s), float(v_e or v_s)
-                            if s.is_integer() and e.is_integer():
-                                for n in range(int(s), int(e) + 1):
-                                    if float(n) not in l_v_set: 
-                                        new_v.add(float(n))
+                        if v_s is not None:
+                            file_has_vols = True
+                            try:
+                                s, e = float(v_s), float(v_e or v_s)
+                                if s.is_integer() and e.is_integer():
+                                    for n in range(int(s), int(e) + 1):
+                                        if float(n) not in l_v_set: 
+                                            new_v.add(float(n))
+                                            all_vols_known = False
+                                else:
+                                    if s not in l_v_set: 
+                                        new_v.add(s)
                                         all_vols_known = False
-                            else:
-                                if s not in l_v_set: 
-                                    new_v.add(s)
-                                    all_vols_known = False
-                                if e not in l_v_set: 
-                                    new_v.add(e)
-                                    all_vols_known = False
-                        except (ValueError, TypeError): 
-                            all_vols_known = False
-
-                    # If the file defines volumes and we have all of them, check if chapters are redundant.
-                    # Heuristic: If chapter start is within range of the volumes (e.g. <= vol_end * 5),
-                    # assume chapters are just describing the volume content.
-                    if file_has_vols and all_vols_known:
-                        c_s_check = f.get("chapter_begin")
-                        try:
-                            if c_s_check:
-                                s_check = float(c_s_check)
-                                v_e_val = float(v_e or v_s) if v_s else 0
-                                # If chapters start "early" (within conservative 5 ch/vol), ignore them
-                                if s_check <= v_e_val * 5:
+                                    if e not in l_v_set: 
+                                        new_v.add(e)
+                                        all_vols_known = False
+                            except (ValueError, TypeError): 
+                                all_vols_known = False
+
+                        # If the file defines volumes and we have all of them, check if chapters are redundant.
+                        # Heuristic: If chapter start is within range of the volumes (e.g. <= vol_end * 5),
+                        # assume chapters are just describing the volume content.
+                        if file_has_vols and all_vols_known:
+                            c_s_check = f.get("chapter_begin")
+                            try:
+                                if c_s_check:
+                                    s_check = float(c_s_check)
+                                    v_e_val = float(v_e or v_s) if v_s else 0
+                                    # If chapters start "early" (within conservative 5 ch/vol), ignore them
+                                    if s_check <= v_e_val * 5:
+                                        continue
+                            except (ValueError, TypeError): pass
+                            # If chapters start "late" (e.g. v1-3 + c26), fall through to check against local cutoff
+
+                        # Heuristic: "Start at 1" Skip
+                        # If we have volumes locally, and this file is a chapter batch starting at 1 (or 0),
+                        # assume it's a redundant compilation covered by our volumes.
+                        # We prefer to grab "Vol X" or "Ch X-Y" where X > 1.
+                        if l_v_set and not file_has_vols:
+                            c_s_check = f.get("chapter_begin")
+                            try:
+                                if c_s_check and float(c_s_check) <= 1.0:
                                     continue
-                        except (ValueError, TypeError): pass
-                        # If chapters start "late" (e.g. v1-3 + c26), fall through to check against local cutoff
-
-                    # Heuristic: "Start at 1" Skip
-                    # If we have volumes locally, and this file is a chapter batch starting at 1 (or 0),
-                    # assume it's a redundant compilation covered by our volumes.
-                    # We prefer to grab "Vol X" or "Ch X-Y" where X > 1.
-                    if l_v_set and not file_has_vols:
-                        c_s_check = f.get("chapter_begin")
-                        try:
-                            if c_s_check and float(c_s_check) <= 1.0:
-                                continue
-                        except (ValueError, TypeError): pass
+                            except (ValueError, TypeError): pass
                     
-                    c_s, c_e = f.get("chapter_begin"), f.get("chapter_end")
-                    if c_s is not None:
-                        try:
-                            s, e = float(c_s), float(c_e or c_s)
-                            if s.is_integer() and e.is_integer():
-                                for n in range(int(s), int(e) + 1):
-                                    if float(n) not in l_c_set and float(n) > cutoff_chapter:
-                                        new_c.add(float(n))
-                            else:
-                                if s not in l_c_set and s > cutoff_chapter: new_c.add(s)
-                                if e not in l_c_set and e > cutoff_chapter: new_c.add(e)
-                        except (ValueError, TypeError): pass
-
-                # Auto-skip if no new content
-                if not new_v and not new_c:
-                    # Update status with transient message (no permanent output)
-                    status.update(f"[dim]Processing Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])} (No new content - skipping)[/dim]")
-                    groups_skipped += 1
-                    for f in group_files:
-                        if not f.get("grab_status"):
-                            f["grab_status"] = "skipped"
-                    
-                    try:
-                        with open(input_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
-                    except Exception as e:
-                        console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
+                        c_s, c_e = f.get("chapter_begin"), f.get("chapter_end")
+                        if c_s is not None:
+                            try:
+                                s, e = float(c_s), float(c_e or c_s)
+                                if s.is_integer() and e.is_integer():
+                                    for n in range(int(s), int(e) + 1):
+                                        if float(n) not in l_c_set and float(n) > cutoff_chapter:
+                                            new_c.add(float(n))
+                                else:
+                                    if s not in l_c_set and s > cutoff_chapter: new_c.add(s)
+                                    if e not in l_c_set and e > cutoff_chapter: new_c.add(e)
+                            except (ValueError, TypeError): pass
+
+                    # Auto-skip if no new content
+                    if not new_v and not new_c:
+                        # Update status with transient message (no permanent output)
+                        status.update(f"[dim]Processing Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])} (No new content - skipping)[/dim]")
+                        groups_skipped += 1
+                        for f in group_files:
+                            if not f.get("grab_status"):
+                                status_store.set(f, "skipped")
                     
-                    current_idx += 1
-                    continue
+                        current_idx += 1
+                        continue
 
-            # Auto-Add Logic
-            if auto_add or auto_add_only:
-                if max_downloads is not None and total_added_count >= max_downloads:
-                    console.print(f"\n[yellow]Max downloads limit ({max_downloads}) reached. Stopping.[/yellow]")
-                    return
+                # Auto-Add Logic
+                if auto_add or auto_add_only:
+                    if max_downloads is not None and total_added_count >= max_downloads:
+                        console.print(f"\n[yellow]Max downloads limit ({max_downloads}) reached. Stopping.[/yellow]")
+                        return
 
-                def is_jxl(f):
-                    n = f.get("name", "").lower()
-                    return "jxl" in n or "jpeg-xl" in n or "jpegxl" in n
+                    def is_jxl(f):
+                        n = f.get("name", "").lower()
+                        return "jxl" in n or "jpeg-xl" in n or "jpegxl" in n
                 
-                def is_completed(f):
-                    return "completed" in f.get("name", "").lower()
-
-                # Sort: Prefer Non-JXL (True > False), then Seeders
-                sorted_group_files = sorted(
-                    group_files, 
-                    key=lambda x: (not is_jxl(x), int(x.get("seeders", 0))), 
-                    reverse=True
-                )
+                    def is_completed(f):
+                        return "completed" in f.get("name", "").lower()
+
+                    # Sort: Prefer Non-JXL (True > False), then Seeders
+                    sorted_group_files = sorted(
+                        group_files, 
+                        key=lambda x: (not is_jxl(x), int(x.get("seeders", 0))), 
+                        reverse=True
+                    )
             
-                files_to_auto_add = []
-                volumes_handled_in_group = set()
-                added_via_completed = False
-
-                for f in sorted_group_files:
-                    # Skip files that are terminal or already skipped for auto-add in this mode
-                    skip_eval = ["grabbed", "skipped", "pulled", "blacklisted"]
-                    if not force:
-                        skip_eval.append("skipautoadd")
-                        if auto_add_only:
-                            skip_eval.append("skipautoaddonly")
+                    files_to_auto_add = []
+                    volumes_handled_in_group = set()
+                    added_via_completed = False
+
+                    for f in sorted_group_files:
+                        # Skip files that are terminal or already skipped for auto-add in this mode
+                        skip_eval = ["grabbed", "skipped", "pulled", "blacklisted"]
+                        if not force:
+                            skip_eval.append("skipautoadd")
+                            if auto_add_only:
+                                skip_eval.append("skipautoaddonly")
                         
-                    if f.get("grab_status") in skip_eval:
-                        continue
+                        if f.get("grab_status") in skip_eval or queue_key(f) in queued:
+                            continue
 
-                    # Explicitly skip JXL/JPEG-XL formats for auto-add
-                    if is_jxl(f):
-                        continue
+                        # Explicitly skip JXL/JPEG-XL formats for auto-add
+                        if is_jxl(f):
+                            continue
 
-                    # Skip torrents with less than 2 seeders for reliability
-                    try:
-                        if int(f.get("seeders", 0)) < 2:
+                        # Skip torrents with less than 2 seeders for reliability
+                        try:
+                            if int(f.get("seeders", 0)) < 2:
+                                continue
+                        except (ValueError, TypeError):
                             continue
-                    except (ValueError, TypeError):
-                        continue
 
-                    v_nums, c_nums, u_nums = classify_unit(f.get("name", ""))
+                        v_nums, c_nums, u_nums = classify_unit(f.get("name", ""))
                     
-                    # Criterion 1: New Volumes
-                    if v_nums:
-                        # Criteria: Must have volumes not in local library
-                        new_vols_in_file = [v for v in v_nums if v not in l_v_set]
+                        # Criterion 1: New Volumes
+                        if v_nums:
+                            # Criteria: Must have volumes not in local library
+                            new_vols_in_file = [v for v in v_nums if v not in l_v_set]
                         
-                        if not local_series or new_vols_in_file:
-                            # For new series, all volumes are "new"
-                            v_to_check = v_nums if not local_series else new_vols_in_file
+                            if not local_series or new_vols_in_file:
+                                # For new series, all volumes are "new"
+                                v_to_check = v_nums if not local_series else new_vols_in_file
                             
-                            # Check if this torrent provides any volumes we haven't already decided to grab in this group
-                            if any(v not in volumes_handled_in_group for v in v_to_check):
-                                grabbing_str = format_ranges(v_to_check)
-                                if not local_series:
-                                    reason = f"New series, grabbing volumes {grabbing_str}"
-                                else:
-                                    local_str = format_ranges(list(l_v_set))
-                                    if len(local_str) > 30: local_str = local_str[:27] + "..."
-                                    reason = f"Existing volumes {local_str}, grabbing {grabbing_str}"
+                                # Check if this torrent provides any volumes we haven't already decided to grab in this group
+                                if any(v not in volumes_handled_in_group for v in v_to_check):
+                                    grabbing_str = format_ranges(v_to_check)
+                                    if not local_series:
+                                        reason = f"New series, grabbing volumes {grabbing_str}"
+                                    else:
+                                        local_str = format_ranges(list(l_v_set))
+                                        if len(local_str) > 30: local_str = local_str[:27] + "..."
+                                        reason = f"Existing volumes {local_str}, grabbing {grabbing_str}"
                                 
-                                files_to_auto_add.append((f, reason))
-                                volumes_handled_in_group.update(v_to_check)
-                                continue # Move to next file
+                                    files_to_auto_add.append((f, reason))
+                                    volumes_handled_in_group.update(v_to_check)
+                                    continue # Move to next file
                 
-                    # Criterion 2: New Series + ("Completed" tag OR > 10 chapters)
-                    # For chapter-only series, we want to grab if it has a significant chunk of chapters
-                    has_significant_content = len(set(c_nums + u_nums)) >= 10
-
-                    if not local_series and (is_completed(f) or has_significant_content) and not added_via_completed:
-                        # Check if we already grabbed a 'completed' set (or volumes) to avoid duplicates
-                        # If it's a chapter-only series, volumes_handled_in_group will be empty.
-                        reason = "New completed series" if is_completed(f) else "New series with significant chapters"
-                        files_to_auto_add.append((f, reason))
-                        added_via_completed = True
+                        # Criterion 2: New Series + ("Completed" tag OR > 10 chapters)
+                        # For chapter-only series, we want to grab if it has a significant chunk of chapters
+                        has_significant_content = len(set(c_nums + u_nums)) >= 10
+
+                        if not local_series and (is_completed(f) or has_significant_content) and not added_via_completed:
+                            # Check if we already grabbed a 'completed' set (or volumes) to avoid duplicates
+                            # If it's a chapter-only series, volumes_handled_in_group will be empty.
+                            reason = "New completed series" if is_completed(f) else "New series with significant chapters"
+                            files_to_auto_add.append((f, reason))
+                            added_via_completed = True
             
-                if files_to_auto_add:
-                    # Print permanent message for additions
-                    console.print(f"\n[bold blue]Auto-Adding {len(files_to_auto_add)} torrent(s) for: {', '.join(group['parsed_name'])}[/bold blue]")
-                    added_count = 0
-                    for f, reason in files_to_auto_add:
-                        if max_downloads is not None and total_added_count >= max_downloads:
-                            console.print(f"[yellow]Max downloads limit ({max_downloads}) reached. Stopping.[/yellow]")
-                            return
-
-                        magnet = f.get("magnet_link")
-                        if magnet:
-                            if qbit.add_torrent([magnet], tag=QBIT_DEFAULT_TAG, savepath=QBIT_DEFAULT_SAVEPATH):
-                                console.print(f"[green]✓ Added: {f.get('name')}[/green] [dim]({reason})[/dim]")
-                                f["grab_status"] = "grabbed"
+                    if files_to_auto_add:
+                        # Print permanent message for additions
+                        console.print(f"\n[bold blue]Auto-Adding {len(files_to_auto_add)} torrent(s) for: {', '.join(group['parsed_name'])}[/bold blue]")
+                        added_count = 0
+                        for f, reason in files_to_auto_add:
+                            if max_downloads is not None and total_added_count >= max_downloads:
+                                console.print(f"[yellow]Max downloads limit ({max_downloads}) reached. Stopping.[/yellow]")
+                                return
+
+                            magnet = f.get("magnet_link")
+                            if magnet and queue_key(f) not in queued:
+                                # grab_status is set once qBittorrent accepts the batch
+                                batch.add(magnet, key=(f, reason), tag=QBIT_DEFAULT_TAG, savepath=QBIT_DEFAULT_SAVEPATH)
+                                queued.add(queue_key(f))
                                 added_count += 1
                                 total_added_count += 1
-                            else:
-                                console.print(f"[red] - Failed to add: {f.get('name')}[/red]")
                     
-                    if added_count > 0:
-                        try:
-                            with open(input_file, 'w', encoding='utf-8') as f:
-                                json.dump(data, f, indent=2)
-                        except Exception as e:
-                            console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
+                        if added_count > 0:
+                            if len(batch) >= QBIT_BATCH_MAX_PENDING:
+                                flush_grabs()
                         
-                        current_idx += 1
-                        continue
+                            current_idx += 1
+                            continue
         
-                if auto_add_only:
-                    # Update status with transient message (no permanent output)
-                    status.update(f"[dim]Processing Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])} (Auto-add criteria not met - skipping)[/dim]")
-                    
-                    # Mark unflagged files as skipautoaddonly so they are skipped in future --auto-add-only runs
-                    for f in group_files:
-                        if not f.get("grab_status"):
-                            f["grab_status"] = "skipautoaddonly"
+                    if auto_add_only:
+                        # Update status with transient message (no permanent output)
+                        status.update(f"[dim]Processing Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])} (Auto-add criteria not met - skipping)[/dim]")
                     
-                    try:
-                        with open(input_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
-                    except Exception as e:
-                        console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
+                        # Mark unflagged files as skipautoaddonly so they are skipped in future --auto-add-only runs
+                        for f in group_files:
+                            if not f.get("grab_status"):
+                                status_store.set(f, "skipautoaddonly")
 
-                    groups_skipped += 1
-                    current_idx += 1
-                    continue
+                        groups_skipped += 1
+                        current_idx += 1
+                        continue
 
-            # Exit status context before interactive mode
-            # This ensures the interactive prompt appears correctly
-            status.stop()
+                # Exit status context before interactive mode
+                # This ensures the interactive prompt appears correctly
+                status.stop()
+                # Commit queued work before blocking on user input
+                flush_grabs()
 
-            console.print(Rule(style="dim"))
-            # Show selection info
-            console.print(Panel(f"[bold cyan]Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])}[/bold cyan]"))
+                console.print(Rule(style="dim"))
+                # Show selection info
+                console.print(Panel(f"[bold cyan]Group {current_idx + 1}/{len(manga_groups)}: {', '.join(group['parsed_name'])}[/bold cyan]"))
             
-            if group.get("matched_name"):
-                console.print(f"[green]Library Match: {group['matched_name']}[/green]")
+                if group.get("matched_name"):
+                    console.print(f"[green]Library Match: {group['matched_name']}[/green]")
                 
-                if local_series:
-                    # Use pre-calculated values
-                    l_vols = format_ranges(l_v_nums)
-                    l_chaps = format_ranges(l_c_nums)
-                    size_str = format_size(local_series.total_size_bytes)
-                    console.print(f"[bold yellow]Local Content: Vols: {l_vols} | Chaps: {l_chaps} | Size: {size_str}[/bold yellow]")
-
-                    msg_parts = []
-                    if new_v or new_c:
-                        part = "[bold green]NEW CONTENT AVAILABLE:"
-                        if new_v:
-                            part += f" [{len(new_v)} new vols: {format_ranges(list(new_v))}]"
-                        if new_c:
-                            part += f" [{len(new_c)} new chaps: {format_ranges(list(new_c))}]"
-                        part += "[/bold green]"
-                        msg_parts.append(part)
+                    if local_series:
+                        # Use pre-calculated values
+                        l_vols = format_ranges(l_v_nums)
+                        l_chaps = format_ranges(l_c_nums)
+                        size_str = format_size(local_series.total_size_bytes)
+                        console.print(f"[bold yellow]Local Content: Vols: {l_vols} | Chaps: {l_chaps} | Size: {size_str}[/bold yellow]")
+
+                        msg_parts = []
+                        if new_v or new_c:
+                            part = "[bold green]NEW CONTENT AVAILABLE:"
+                            if new_v:
+                                part += f" [{len(new_v)} new vols: {format_ranges(list(new_v))}]"
+                            if new_c:
+                                part += f" [{len(new_c)} new chaps: {format_ranges(list(new_c))}]"
+                            part += "[/bold green]"
+                            msg_parts.append(part)
                 
-                    # Size hints
-                    diff = max_torrent_bytes - local_series.total_size_bytes
-                    if max_torrent_bytes > local_series.total_size_bytes * 1.1:
-                        msg_parts.append(f"[bold cyan]LARGER CONTENT: [+{format_size(diff)}][/bold cyan]")
-                    elif not new_v and not new_c and max_torrent_bytes < local_series.total_size_bytes * 0.5:
-                        # Only show smaller if detection failed for EVERYTHING in the group
-                        vols_avail = group.get("consolidated_volumes")
-                        chaps_avail = group.get("consolidated_chapters")
-                        if not vols_avail and not chaps_avail:
-                            msg_parts.append(f"[bold magenta]SMALLER CONTENT: [{format_size(diff)}][/bold magenta]")
-
-                    if msg_parts:
-                        console.print(" ".join(msg_parts))
+                        # Size hints
+                        diff = max_torrent_bytes - local_series.total_size_bytes
+                        if max_torrent_bytes > local_series.total_size_bytes * 1.1:
+                            msg_parts.append(f"[bold cyan]LARGER CONTENT: [+{format_size(diff)}][/bold cyan]")
+                        elif not new_v and not new_c and max_torrent_bytes < local_series.total_size_bytes * 0.5:
+                            # Only show smaller if detection failed for EVERYTHING in the group
+                            vols_avail = group.get("consolidated_volumes")
+                            chaps_avail = group.get("consolidated_chapters")
+                            if not vols_avail and not chaps_avail:
+                                msg_parts.append(f"[bold magenta]SMALLER CONTENT: [{format_size(diff)}][/bold magenta]")
+
+                        if msg_parts:
+                            console.print(" ".join(msg_parts))
             
-            vols = ", ".join(group.get("consolidated_volumes", []))
-            chaps = ", ".join(group.get("consolidated_chapters", []))
-            console.print(f"[dim]Scraped Avail: Vols: {vols if vols else 'None'} | Chapters: {chaps if chaps else 'None'}[/dim]")
-
-            table = Table(title="Available Torrents", box=box.SIMPLE)
-            table.add_column("ID", justify="right", style="dim")
-            table.add_column("Name", style="white")
-            table.add_column("Size", justify="right", style="green")
-            table.add_column("Seed", justify="right", style="yellow")
-            table.add_column("Status", justify="center")
-
-            for i, f in enumerate(group_files):
-                status_val = f.get("grab_status", "-")
-                table.add_row(str(i+1), f.get("name"), f.get("size"), str(f.get("seeders")), status_val)
+                vols = ", ".join(group.get("consolidated_volumes", []))
+                chaps = ", ".join(group.get("consolidated_chapters", []))
+                console.print(f"[dim]Scraped Avail: Vols: {vols if vols else 'None'} | Chapters: {chaps if chaps else 'None'}[/dim]")
+
+                table = Table(title="Available Torrents", box=box.SIMPLE)
+                table.add_column("ID", justify="right", style="dim")
+                table.add_column("Name", style="white")
+                table.add_column("Size", justify="right", style="green")
+                table.add_column("Seed", justify="right", style="yellow")
+                table.add_column("Status", justify="center")
+
+                for i, f in enumerate(group_files):
+                    status_val = f.get("grab_status", "-")
+                    table.add_row(str(i+1), f.get("name"), f.get("size"), str(f.get("seeders")), status_val)
             
-            console.print(table)
+                console.print(table)
             
-            choice = click.prompt("Enter ID(s) to grab (e.g. 1,2,3 or 'all'), 's' to skip, 'n' to next, or 'q' to quit", default="n")
-            choice_clean = choice.lower().strip()
+                choice = click.prompt("Enter ID(s) to grab (e.g. 1,2,3 or 'all'), 's' to skip, 'n' to next, or 'q' to quit", default="n")
+                choice_clean = choice.lower().strip()
             
-            if choice_clean == 'q':
-                break
-            elif choice_clean == 'n':
-                # If we are in any auto-add mode, mark as skipautoadd to avoid re-prompting/re-evaluating next time
-                if auto_add or auto_add_only:
-                    for f in group_files:
-                        if not f.get("grab_status"):
-                            f["grab_status"] = "skipautoadd"
-                    
-                    try:
-                        with open(input_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
-                    except Exception as e:
-                        console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
+                if choice_clean == 'q':
+                    break
+                elif choice_clean == 'n':
+                    # If we are in any auto-add mode, mark as skipautoadd to avoid re-prompting/re-evaluating next time
+                    if auto_add or auto_add_only:
+                        for f in group_files:
+                            if not f.get("grab_status"):
+                                status_store.set(f, "skipautoadd")
 
-                current_idx += 1
-                continue
-            elif choice_clean == 's':
-                # Flag all in group as skipped
-                for f in group_files:
-                    f["grab_status"] = "skipped"
-                console.print("[yellow]Group marked as skipped.[/yellow]")
-                
-                # Save updated data
-                try:
-                    with open(input_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2)
-                except Exception as e:
-                    console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
+                    current_idx += 1
+                    continue
+                elif choice_clean == 's':
+                    # Flag all in group as skipped
+                    for f in group_files:
+                        status_store.set(f, "skipped")
+                    console.print("[yellow]Group marked as skipped.[/yellow]")
                 
-                current_idx += 1
-                continue
+                    current_idx += 1
+                    continue
                 
-            # Parse IDs
-            selected_indices = []
-            if choice_clean == 'all':
-                selected_indices = list(range(len(group_files)))
-            else:
-                # Handle both single digits and comma-separated
-                parts = choice_clean.split(",")
-                for p in parts:
-                    p = p.strip()
-                    if p.isdigit():
-                        selected_indices.append(int(p) - 1)
+                # Parse IDs
+                selected_indices = []
+                if choice_clean == 'all':
+                    selected_indices = list(range(len(group_files)))
+                else:
+                    # Handle both single digits and comma-separated
+                    parts = choice_clean.split(",")
+                    for p in parts:
+                        p = p.strip()
+                        if p.isdigit():
+                            selected_indices.append(int(p) - 1)
             
-            if selected_indices:
-                added_any = False
-                for idx in selected_indices:
-                    if 0 <= idx < len(group_files):
-                        selected = group_files[idx]
+                if selected_indices:
+                    for idx in selected_indices:
+                        if 0 <= idx < len(group_files):
+                            selected = group_files[idx]
                         
-                        # Skip if already grabbed
-                        if selected.get("grab_status") == "grabbed":
-                            console.print(f"[dim]ID {idx+1} already grabbed, skipping.[/dim]")
-                            continue
+                            # Skip if already grabbed
+                            if selected.get("grab_status") == "grabbed":
+                                console.print(f"[dim]ID {idx+1} already grabbed, skipping.[/dim]")
+                                continue
 
-                        magnet = selected.get("magnet_link")
-                        if not magnet:
-                            console.print(f"[red]No magnet link found for ID {idx+1}.[/red]")
-                            continue
+                            magnet = selected.get("magnet_link")
+                            if not magnet:
+                                console.print(f"[red]No magnet link found for ID {idx+1}.[/red]")
+                                continue
                         
-                        if qbit.add_torrent([magnet], tag=QBIT_DEFAULT_TAG, savepath=QBIT_DEFAULT_SAVEPATH):
-                            console.print(f"[bold green]Successfully added to qBittorrent: {selected.get('name')}[/bold green]")
-                            selected["grab_status"] = "grabbed"
-                            added_any = True
+                            batch.add(magnet, key=(idx, selected), tag=QBIT_DEFAULT_TAG, savepath=QBIT_DEFAULT_SAVEPATH)
                         else:
-                            console.print(f"[red]Failed to add torrent ID {idx+1} to qBittorrent.[/red]")
-                    else:
-                        console.print(f"[red]Invalid ID: {idx+1}[/red]")
+                            console.print(f"[red]Invalid ID: {idx+1}[/red]")
+
+                    # All selected IDs go to qBittorrent in one request
+                    result = batch.flush()
+                    for idx, selected in result.succeeded:
+                        console.print(f"[bold green]Successfully added to qBittorrent: {selected.get('name')}[/bold green]")
+                        status_store.set(selected, "grabbed")
+                    for idx, selected in result.failed:
+                        console.print(f"[red]Failed to add torrent ID {idx+1} to qBittorrent.[/red]")
                 
-                if added_any:
-                    # Save updated data
-                    try:
-                        with open(input_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
-                    except Exception as e:
-                        console.print(f"[red]Error saving updates to {input_file}: {e}[/red]")
-                    
-                    current_idx += 1
-            else:
-                console.print("[red]Invalid input. Use IDs (e.g. 1,2), 'all', 's', 'n', or 'q'.[/red]")
+                    if result.succeeded:
+                        status_store.flush()
+                        current_idx += 1
+                else:
+                    console.print("[red]Invalid input. Use IDs (e.g. 1,2), 'all', 's', 'n', or 'q'.[/red]")
+
+        finally:
+            flush_grabs()
 
         # Print final summary
         if groups_processed > 0 or groups_skipped > 0:
@@ -894,7 +925,599 @@ def process_grab(name: Optional[str], input_file: str, status: bool, root_path:
         elif current_idx >= len(manga_groups):
             console.print("[green]Reached the end of the match list.[/green]")
 
-def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "", input_file: str = "") -> None:
+@dataclass
+class PullJob:
+    """One completed torrent on its way into the library."""
+    index: int
+    torrent: Dict[str, Any]
+    display_name: str
+    series_name: str
+    content_path: str
+    transfer_plan: List[Dict]
+    local_series: Optional[Series] = None
+    target_dir: Optional[Path] = None
+    stage_dir: Optional[Path] = None
+    status: str = "pending"  # pending | done | failed | aborted
+    new_series: Optional[Series] = None
+    skip_cleanup: bool = False
+
+    @property
+    def files_to_stage(self) -> List[Dict]:
+        return [item for item in self.transfer_plan if not item['skip']]
+
+    @property
+    def series_key(self) -> str:
+        """Jobs importing into the same series folder are serialized on this key."""
+        return str(self.target_dir) if self.target_dir else self.series_name.lower()
+
+
+def _resolve_content_path(t: Dict[str, Any]) -> str:
+    """Maps qBittorrent's content path onto the local download root."""
+    raw_path = t.get("content_path") or os.path.join(t.get("save_path", ""), t["name"])
+    content_path = raw_path
+    if QBIT_DOWNLOAD_ROOT:
+        clean_path = raw_path.lstrip("/").lstrip("\\")
+        if ":" in clean_path:
+            clean_path = clean_path.split(":", 1)[1].lstrip("/").lstrip("\\")
+        content_path = os.path.join(QBIT_DOWNLOAD_ROOT, clean_path)
+    return content_path
+
+
+def _find_local_series(t: Dict[str, Any], series_name: str, display_name: str, match_index: Optional[MatchIndex], series_map: Dict[str, Series], library_index: Optional[LibraryIndex]) -> Optional[Series]:
+    local_series = None
+    if match_index and series_map:
+        entry = match_index.by_name(t["name"])
+        if entry:
+            mid = entry.get("matched_id")
+            if mid and mid in series_map:
+                local_series = series_map[mid]
+    
+    if not local_series and library_index:
+        # Robust candidate generation from multiple sources
+        # 1. From our calculated series_name
+        candidates = generate_search_candidates(series_name)
+        
+        # 2. From the raw torrent name (if different)
+        if t['name'] != series_name:
+            raw_candidates = generate_search_candidates(t['name'])
+            for rc in raw_candidates:
+                if rc not in candidates: candidates.append(rc)
+        
+        # 3. From the display name (if different)
+        if display_name != series_name and display_name != t['name']:
+            disp_candidates = generate_search_candidates(display_name)
+            for dc in disp_candidates:
+                if dc not in candidates: candidates.append(dc)
+        
+        for cand in candidates:
+            matches = library_index.search(cand)
+            if matches: 
+                local_series = matches[0]
+                break
+        
+        # If no exact match, try fuzzy search on the best candidate (usually the first one)
+        if not local_series and candidates:
+            # Use project-wide threshold (usually 0.9 or 90)
+            # LibraryIndex.fuzzy_search expects float 0.0-1.0
+            thresh = FUZZY_MATCH_THRESHOLD / 100.0 if FUZZY_MATCH_THRESHOLD > 1.0 else FUZZY_MATCH_THRESHOLD
+            fuzzy_matches = library_index.fuzzy_search(candidates[0], threshold=thresh)
+            if fuzzy_matches:
+                local_series = fuzzy_matches[0]
+    return local_series
+
+
+def _filter_transfer_plan(transfer_plan: List[Dict], series_name: str, local_series: Optional[Series]) -> str:
+    """
+    Step 4: marks files the library already has as skipped and renames the plan
+    to the library's series name. Returns the series name to import under.
+    """
+    pulled_vols = []
+    pulled_chaps = []
+    for item in transfer_plan:
+        pulled_vols.extend(item['v'])
+        pulled_chaps.extend(item['c'])
+        
+    log_substep(f"Scraped Content: Vols: {format_ranges(pulled_vols)} | Chaps: {format_ranges(pulled_chaps)}")
+
+    if local_series:
+        log_substep(f"Matched to Library: {local_series.name}")
+        
+        # Fix filenames if series_name was generic/incorrect
+        sanitized_local_name = sanitize_filename(local_series.name)
+        if sanitized_local_name != series_name:
+            for item in transfer_plan:
+                if item['dst_name'].startswith(series_name):
+                     item['dst_name'] = sanitized_local_name + item['dst_name'][len(series_name):]
+            
+            # Update series_name for subsequent steps (folder naming)
+            series_name = sanitized_local_name
+
+        all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
+        l_v_nums, l_c_nums = [], []
+        for v in all_local_vols:
+            v_n, c_n, u_n = classify_unit(v.name)
+            l_v_nums.extend(v_n); l_c_nums.extend(c_n + u_n)
+        
+        l_v_set, l_c_set = set(l_v_nums), set(l_c_nums)
+        new_v = sorted(list(set(n for n in pulled_vols if n not in l_v_set)))
+        new_c = sorted(list(set(n for n in pulled_chaps if n not in l_c_set)))
+        
+        if new_v or new_c:
+            msg = "Fills Gaps:"
+            if new_v: msg += f" [bold green]Vols: {format_ranges(new_v)}[/bold green]"
+            if new_c: msg += f" [bold green]Chaps: {format_ranges(new_c)}[/bold green]"
+            console.print(msg)
+            log_substep(f"Fills Gaps: Vols: {format_ranges(new_v)} | Chaps: {format_ranges(new_c)}")
+        else:
+            logger.info("All pulled content already exists in library (Potential Upgrade/Duplicate).")
+            console.print("[yellow]All pulled content already exists in library (Potential Upgrade/Duplicate).[/yellow]")
+
+        skipped_count = 0
+        for item in transfer_plan:
+            is_redundant = True
+            if item['v']:
+                if any(n not in l_v_set for n in item['v']): is_redundant = False
+            elif item['c']:
+                if any(n not in l_c_set for n in item['c']): is_redundant = False
+            elif item['u']:
+                 if any(n not in l_c_set for n in item['u']): is_redundant = False
+            else:
+                is_redundant = False
+                
+            if is_redundant:
+                item['skip'] = True
+                skipped_count += 1
+                
+        if skipped_count > 0:
+            log_substep(f"Marking {skipped_count} redundant files to skip copying.")
+            console.print(f"[dim]Marking {skipped_count} redundant files to skip copying.[/dim]")
+    else:
+        console.print("[yellow]No matching series found in library. Treating as new series.[/yellow]")
+        log_substep("NEW SERIES: No match found in library. All files will be copied.")
+
+
+    return series_name
+
+
+def _prepare_pull_job(i: int, total: int, t: Dict[str, Any], simulate: bool, match_index: Optional[MatchIndex], series_map: Dict[str, Series], library_index: Optional[LibraryIndex], library: Optional[Library], plan_cache: Optional[TransferPlanCache] = None) -> Optional[PullJob]:
+    """
+    Steps 2-4 of a pull: locate the torrent's files, build the transfer plan and
+    filter it against the library. Read-only; returns None if there is nothing to pull.
+    """
+    display_name = t["_display_name"]
+    logger.info(f"Processing [{i+1}/{total}]: {t['_sort_name']}")
+
+    # Step 2: Identify Location
+    content_path = _resolve_content_path(t)
+    if simulate:
+        logger.info(f"[SIMULATE] Locating files at {content_path}")
+    elif content_path and os.path.exists(content_path):
+        log_substep(f"Found files at: {content_path}")
+    else:
+        logger.error(f"Could not find files at: {content_path}")
+
+    # Step 3: Calculate Names
+    # Don't strip brackets here anymore, strip_volume_info and semantic_normalize handle it better,
+    # and it might be the actual title (e.g. [Oshi no Ko]).
+    series_name = re.sub(r"^\d+\.\s+", "", display_name).strip()
+    series_name = sanitize_filename(series_name)
+    
+    if simulate:
+        logger.info(f"[SIMULATE] Analyzing content for: {series_name}")
+    
+    files = collect_transfer_files(Path(content_path)) if os.path.exists(content_path) else []
+    if not files:
+        logger.error(f"No valid files found in {content_path}")
+        return None
+
+    local_series = _find_local_series(t, series_name, display_name, match_index, series_map, library_index)
+
+    # Reuse the plan from an earlier run (e.g. --simulate) if neither the
+    # torrent's files nor the matched series changed since
+    files_fp = files_fingerprint(files)
+    series_fp = series_fingerprint(local_series)
+    cached = plan_cache.get(t["hash"], files_fp, series_fp, series_name) if plan_cache is not None else None
+    if cached:
+        transfer_plan = cached["plan"]
+    else:
+        transfer_plan = generate_transfer_plan(Path(content_path), series_name, files=files)
+    
+    if not transfer_plan:
+        logger.error(f"No valid files found in {content_path}")
+        return None
+
+    log_substep(f"Identified {len(transfer_plan)} potential files")
+    for item in transfer_plan:
+         logger.debug(f"[dim]Found File: {item['src'].name} -> {item['dst_name']} (v:{item['v']} c:{item['c']} u:{item['u']})[/dim]")
+    
+    # Log a summary of what was found
+    total_v = len(set(n for item in transfer_plan for n in item['v']))
+    total_c = len(set(n for item in transfer_plan for n in item['c'] + item['u']))
+    console.print(Panel(f"[bold magenta]Processing Torrent: [/bold magenta][bold white]{display_name}[/bold white]\n[dim white]{t['name']}[/dim white]\n[bold cyan]Found Content: [/bold cyan][bold white]{total_v} volumes[/bold white] and [bold white]{total_c} chapters/units[/bold white]", title="Torrent Analysis Summary", subtitle_align="right"))
+
+    # Step 4: Analyze (Filter Plan)
+    if cached:
+        series_name = cached["series_name"]
+        skipped_count = sum(1 for item in transfer_plan if item['skip'])
+        log_substep(f"Reusing cached analysis: {len(transfer_plan) - skipped_count} to copy, {skipped_count} redundant.")
+        console.print(f"[dim]Reusing cached analysis: {len(transfer_plan) - skipped_count} to copy, {skipped_count} redundant.[/dim]")
+    else:
+        input_name = series_name
+        series_name = _filter_transfer_plan(transfer_plan, series_name, local_series)
+        if plan_cache is not None:
+            plan_cache.put(t["hash"], files_fp, series_fp, input_name, series_name, transfer_plan)
+
+    target_dir = None
+    if library:
+        target_dir = Path(local_series.path) if local_series else Path(library.path) / "Uncategorized" / f"Pulled-{datetime.now().strftime('%Y-%m-%d')}" / series_name
+
+    return PullJob(
+        index=i,
+        torrent=t,
+        display_name=display_name,
+        series_name=series_name,
+        content_path=content_path,
+        transfer_plan=transfer_plan,
+        local_series=local_series,
+        target_dir=target_dir,
+        # Each torrent stages into its own folder so jobs can overlap
+        stage_dir=Path(PULL_TEMPDIR) / t["hash"] if PULL_TEMPDIR else None,
+    )
+
+
+def _staging_bytes(files_to_stage: List[Dict]) -> int:
+    return sum(item['src'].stat().st_size for item in files_to_stage)
+
+
+def _stage_files(job: PullJob, files_to_stage: List[Dict], progress: Optional[Progress] = None, task_id: Optional[int] = None) -> None:
+    """Step 5: brings the files to import into the job's staging folder."""
+    if progress is None:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            console=console,
+            refresh_per_second=PROGRESS_REFRESH_RATE
+        ) as own_progress:
+            task = own_progress.add_task(f"Staging {len(files_to_stage)} files...", total=_staging_bytes(files_to_stage))
+            _stage_files(job, files_to_stage, own_progress, task)
+        return
+
+    job.stage_dir.mkdir(parents=True, exist_ok=True)
+    stage_results = []
+    for item in files_to_stage:
+        s = item['src']
+        d = job.stage_dir / item['dst_name']
+        logger.debug(f"Staging: [dim]{s}[/dim] -> [bold cyan]{d.name}[/bold cyan]")
+        progress.update(task_id, description=f"[dim]Staging: {item['dst_name']}[/dim]")
+        # The torrent keeps its files until cleanup, so never move them
+        stage_results.append(transfer_file(s, d, progress=lambda n: progress.advance(task_id, n)))
+
+    logger.info(f"Successfully staged {len(files_to_stage)} files to [bold cyan]{job.stage_dir}[/bold cyan]")
+    log_substep(f"Successfully staged {len(files_to_stage)} files ({describe_transfers(stage_results)}).")
+
+
+def _import_staged_files(job: PullJob, files_to_stage: List[Dict], pause: bool) -> bool:
+    """Step 6: moves staged files into the series folder. Returns False if the user quit."""
+    target_dir = job.target_dir
+    series_name = job.series_name
+    local_series = job.local_series
+
+    files_to_import = []
+    overwrite_count = 0
+    if files_to_stage and job.stage_dir:
+         for item in files_to_stage:
+             staged_path = job.stage_dir / item['dst_name']
+             if not staged_path.exists(): continue
+             files_to_import.append({
+                 "path": staged_path,
+                 "v": item['v'], "c": item['c'], "u": item['u']
+             })
+             if (target_dir / item['dst_name']).exists(): overwrite_count += 1
+
+    if not files_to_import:
+        logger.info("No files to import.")
+        return True
+
+    if pause:
+        console.print(f"\n[bold yellow]Ready to import {len(files_to_import)} files from {job.stage_dir} into: {target_dir}[/bold yellow]")
+        if overwrite_count > 0:
+            console.print(f"[bold red]WARNING: {overwrite_count} files already exist in the destination and will be overwritten![/bold red]")
+        
+        res = click.prompt("Press Enter to continue, or 'q' to quit", default="", show_default=False)
+        if res.lower() == 'q': return False
+
+    use_subfolders = False 
+    l_v_set, l_c_set = set(), set()
+    if local_series:
+        all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
+        for v in all_local_vols:
+            v_n, c_n, u_n = classify_unit(v.name)
+            l_v_set.update(v_n); l_c_set.update(c_n + u_n)
+    
+    all_vols_set = set(l_v_set)
+    all_chaps_set = set(l_c_set)
+    for f in files_to_import:
+        all_vols_set.update(f['v']); all_chaps_set.update(f['c']); all_chaps_set.update(f['u'])
+    
+    has_volumes = bool(all_vols_set)
+    has_chapters = bool(all_chaps_set)
+
+    target_vol_path = target_dir
+    target_chap_path = target_dir
+
+    if all_vols_set:
+        min_v = min(all_vols_set)
+        max_v = max(all_vols_set)
+        def fmt_num(n): return str(int(n)).zfill(2) if n.is_integer() else str(n).zfill(2)
+
+        vol_folder_name = f"{series_name} v{fmt_num(min_v)}-v{fmt_num(max_v)}"
+        if min_v == max_v: vol_folder_name = f"{series_name} v{fmt_num(min_v)}"
+            
+        chap_start = int(max_v) + 1
+        chap_folder_name = f"{series_name} v{str(chap_start).zfill(2)}+"
+        
+        existing_vol_dir = None
+        existing_chap_dir = None
+        s_name_esc = re.escape(series_name)
+        vol_pat = re.compile(rf"^{s_name_esc} v(\d+)(?:-v(\d+))?$", re.IGNORECASE)
+        chap_pat = re.compile(rf"^{s_name_esc} v(\d+)\+$", re.IGNORECASE)
+
+        if target_dir.exists():
+            for item in target_dir.iterdir():
+                if item.is_dir():
+                    if vol_pat.match(item.name): existing_vol_dir = item; use_subfolders = True
+                    elif chap_pat.match(item.name): existing_chap_dir = item; use_subfolders = True
+        
+        if not use_subfolders and has_volumes and has_chapters:
+            use_subfolders = True
+        
+        if use_subfolders:
+            target_vol_path = target_dir / vol_folder_name
+            target_chap_path = target_dir / chap_folder_name
+            
+            if existing_vol_dir and existing_vol_dir.name != vol_folder_name:
+                try:
+                    existing_vol_dir.rename(target_vol_path)
+                except Exception as e:
+                    logger.error(f"Failed to rename volume folder: {e}")
+                    target_vol_path = existing_vol_dir
+            
+            if existing_chap_dir and existing_chap_dir.name != chap_folder_name:
+                try:
+                    existing_chap_dir.rename(target_chap_path)
+                except Exception as e:
+                    logger.error(f"Failed to rename chapter folder: {e}")
+                    target_chap_path = existing_chap_dir
+
+            # Move loose files from root to subfolders if we're now using subfolders
+            if target_dir.exists():
+                if not target_vol_path.exists(): target_vol_path.mkdir(parents=True, exist_ok=True)
+                if not target_chap_path.exists(): target_chap_path.mkdir(parents=True, exist_ok=True)
+                
+                for item in target_dir.iterdir():
+                    if item.is_file() and item.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar', '.pdf', '.epub']:
+                        v_nums, c_nums, u_nums = classify_unit(item.name)
+                        dest = None
+                        if v_nums: dest = target_vol_path / item.name
+                        elif c_nums or u_nums: dest = target_chap_path / item.name
+                        
+                        if dest and dest != item:
+                            try:
+                                shutil.move(str(item), str(dest))
+                                log_substep(f"Organized existing file {item.name} into subfolder")
+                            except Exception as e:
+                                logger.error(f"Failed to organize existing file {item.name}: {e}")
+
+    imported_count = 0
+    import_results = []
+    for file_info in files_to_import:
+        f_path = file_info["path"]
+        dest_folder = target_dir 
+        if use_subfolders:
+            if file_info['v']: dest_folder = target_vol_path
+            elif file_info['c'] or file_info['u']: dest_folder = target_chap_path
+        
+        try:
+            if not dest_folder.exists(): dest_folder.mkdir(parents=True, exist_ok=True)
+            dest_path = dest_folder / f_path.name
+            logger.debug(f"Importing: [dim]{f_path.name}[/dim] -> [bold green]{dest_folder.name}[/bold green]")
+            # Staged files are discarded after import, so they may be moved
+            import_results.append(transfer_file(f_path, dest_path, allow_move=True))
+            imported_count += 1
+        except Exception as e:
+            logger.error(f"Failed to import {f_path.name}: {e}")
+    
+    if imported_count > 0:
+        logger.info(f"Successfully imported {imported_count} files into [bold green]{target_dir}[/bold green] ({describe_transfers(import_results)})")
+        console.print(f"Successfully imported {imported_count} files.")
+    return True
+
+
+def _run_pull_job(job: PullJob, simulate: bool = False, pause: bool = False, progress: Optional[Progress] = None, task_id: Optional[int] = None) -> PullJob:
+    """
+    Steps 5-7 of a pull: stage, import and rescan the series folder.
+    Safe to run on a worker thread when `pause` is off; the library object itself
+    is only updated afterwards, by _apply_library_updates.
+    """
+    files_to_stage = job.files_to_stage
+    if not files_to_stage:
+         logger.info("No files need to be copied (All redundant).")
+
+    # Step 5: Stage
+    if not job.stage_dir:
+         logger.error("PULL_TEMPDIR is not set. Cannot stage files.")
+    elif simulate:
+        logger.info(f"[SIMULATE] Staging {len(files_to_stage)} files to: {job.stage_dir}")
+    elif files_to_stage:
+        try:
+            _stage_files(job, files_to_stage, progress, task_id)
+        except Exception as e:
+            logger.error(f"Copy failed for {job.display_name}: {e}")
+            # Only interactive (sequential) runs can ask; parallel runs leave the torrent for next time
+            if not pause or not click.confirm("Continue anyway?"):
+                job.status = "aborted" if pause else "failed"
+                return job
+
+    # Step 6: Import Files
+    if simulate:
+        logger.info("[SIMULATE] Importing files into library...")
+    elif not job.target_dir:
+        logger.error("Library root not found. Skipping import.")
+    elif not _import_staged_files(job, files_to_stage, pause):
+        job.status = "aborted"
+        return job
+
+    # Step 7 (scan only): the library state is updated for all jobs at once
+    if not simulate and job.target_dir:
+        job.new_series = scan_series(job.target_dir)
+
+    job.status = "done"
+    return job
+
+
+def _apply_library_updates(library: Library, jobs: List[PullJob]) -> None:
+    """Step 7: swaps rescanned series into the library and saves the state once."""
+    updated = [job for job in jobs if job.status == "done" and job.new_series is not None]
+    if not updated:
+        return
+
+    with console.status("[bold blue]Updating library state..."):
+        for job in updated:
+            new_series_obj = job.new_series
+            if job.local_series:
+                found = False
+                for cat in library.categories:
+                    for sub in cat.sub_categories:
+                        for idx, s in enumerate(sub.series):
+                            if s.path == job.local_series.path:
+                                new_series_obj.external_data = s.external_data
+                                sub.series[idx] = new_series_obj
+                                found = True
+                                break
+                        if found: break
+                    if found: break
+            else:
+                date_str = datetime.now().strftime("%Y-%m-%d")
+                uncat = next((c for c in library.categories if c.name == "Uncategorized"), None)
+                if not uncat:
+                    uncat = Category(name="Uncategorized", path=library.path / "Uncategorized")
+                    library.categories.append(uncat)
+                sub_name = f"Pulled-{date_str}"
+                subcat = next((s for s in uncat.sub_categories if s.name == sub_name), None)
+                if not subcat:
+                    subcat = Category(name=sub_name, path=uncat.path / sub_name, parent=uncat)
+                    uncat.sub_categories.append(subcat)
+                # Several torrents of one new series share a folder; keep the latest scan
+                subcat.series = [s for s in subcat.series if s.path != new_series_obj.path]
+                subcat.series.append(new_series_obj)
+
+            v_n, c_n = [], []
+            all_vols = new_series_obj.volumes + [v for sg in new_series_obj.sub_groups for v in sg.volumes]
+            for v in all_vols:
+                vn, cn, un = classify_unit(v.name)
+                v_n.extend(vn); c_n.extend(cn)
+            log_substep(f"Final Library Content for {job.series_name}: Vols: {format_ranges(v_n)} | Chaps: {format_ranges(c_n)}")
+
+        save_library_cache(library)
+        log_substep(f"Library state updated and saved ({len(updated)} series).")
+
+
+def _clear_directory(path: Path) -> None:
+    for item in path.iterdir():
+        try:
+            if item.is_dir(): shutil.rmtree(item)
+            else: item.unlink()
+        except Exception as e:
+            logger.error(f"Error clearing {item}: {e}")
+
+
+def _finish_pull(
+    qbit: QBitAPI,
+    jobs: List[PullJob],
+    simulate: bool,
+    library: Optional[Library],
+    match_index: MatchIndex,
+    status_store: Optional[GrabStatusStore],
+    input_file: str,
+    plan_cache: TransferPlanCache,
+) -> Set[str]:
+    """
+    Steps 7-8 of a pull: updates the library state, removes finished torrents
+    from qBittorrent in one request and marks them pulled in the match file.
+    Returns the hashes of the torrents that were removed.
+    """
+    removed: Set[str] = set()
+
+    # Step 7: Update Library State (once, for every finished job)
+    if simulate:
+        logger.info("[SIMULATE] Updating library state...")
+    elif not library:
+        logger.error("Library object missing. Skipping state update.")
+    else:
+        _apply_library_updates(library, jobs)
+
+    # Step 8: Final Cleanup
+    # Torrent removals are sent in one request after every torrent is processed
+    removals = qbit.batch()
+    pulled_names: List[str] = []
+    if simulate:
+        logger.info("[SIMULATE] Final cleanup...")
+    else:
+        for job in jobs:
+            if job.status != "done" or job.skip_cleanup:
+                continue
+            t = job.torrent
+            removals.delete(t["hash"], key=t, delete_files=True)
+            plan_cache.discard(t["hash"])
+
+            if job.stage_dir and job.stage_dir.exists():
+                shutil.rmtree(job.stage_dir, ignore_errors=True)
+
+            if match_index and status_store is not None:
+                entries = [e for e in match_index.all_by_name(t["name"]) if e.get("grab_status") == "grabbed"]
+                for entry in entries:
+                    status_store.set(entry, "pulled")
+                if entries:
+                    pulled_names.append(t["name"])
+        if any(job.stage_dir for job in jobs):
+            log_substep("Temporary pull directory cleared")
+
+    if len(removals):
+        with console.status(f"[bold blue]Removing {len(removals)} torrent(s) from qBittorrent..."):
+            result = removals.flush()
+        removed.update(t["hash"] for t in result.succeeded)
+        if result.succeeded:
+            log_substep(f"Removed {len(result.succeeded)} torrent(s) from qBittorrent")
+        for t in result.failed:
+            logger.error(f"Failed to remove torrent from qBittorrent: {t['name']}")
+
+    if pulled_names:
+        status_store.flush()
+        log_substep(f"Updated {input_file}: {len(pulled_names)} torrent(s) marked as pulled.")
+
+    plan_cache.save()
+    return removed
+
+
+def _resume_torrents(qbit: QBitAPI, stopped: List[Dict[str, Any]], removed: Set[str]) -> None:
+    """Starts again every torrent stopped for a pull that was not removed from qBittorrent."""
+    resumes = qbit.batch()
+    for t in stopped:
+        if t["hash"] not in removed:
+            resumes.resume(t["hash"], key=t)
+    if not len(resumes):
+        return
+    result = resumes.flush()
+    if result.succeeded:
+        log_substep(f"Restarted {len(result.succeeded)} torrent(s) left in qBittorrent")
+    for t in result.failed:
+        logger.error(f"Failed to restart torrent in qBittorrent: {t['name']}")
+
+
+def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "", input_file: str = "", sync_client: Optional[QBitSyncClient] = None, assume_yes: bool = False) -> None:
     """
     Checks qBittorrent for completed torrents with the VibeManga tag
     and performs post-processing.
@@ -904,8 +1527,12 @@ def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "
         pause: If True, wait for user input between items.
         root_path: Path to the library root.
         input_file: Path to the JSON file with match results to update.
+        sync_client: Optional sync client to reuse (watch mode keeps one alive).
+        assume_yes: Run unattended: never prompt. Confirmations are answered
+            yes, except clearing a non-empty temp directory, which is left alone
+            (staging uses per-torrent folders inside it).
     """
-    qbit = QBitAPI()
+    qbit = sync_client.qbit if sync_client else QBitAPI()
     
     logger.info("Pulling Completed Torrents...")
     console.print(Rule("[bold blue]Pulling Completed VibeManga Torrents[/bold blue]"))
@@ -921,17 +1548,18 @@ def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "
 
     with console.status("[bold blue]Loading match results..."):
         # Load match results
-        match_data = []
-        if input_file and os.path.exists(input_file):
-            try:
-                with open(input_file, 'r', encoding='utf-8') as f:
-                    match_data = json.load(f)
-            except Exception as e:
-                logger.error(f"Could not load match results from {input_file}: {e}")
+        match_index = load_match_index(input_file)
+        status_store = GrabStatusStore(input_file) if input_file else None
+        if status_store:
+            status_store.apply(match_index.entries)
 
     # Use status for connecting as it's a blocking op
     log_substep("[bold blue]Connecting to qBittorrent...")
-    torrents = qbit.get_torrents_info(tag=QBIT_DEFAULT_TAG)
+    torrents = None
+    if sync_client:
+        torrents = sync_client.get_torrents(tag=QBIT_DEFAULT_TAG)
+    if torrents is None:
+        torrents = get_torrents_with_sync(qbit, tag=QBIT_DEFAULT_TAG)
     
     if not torrents:
         logger.warning("No VibeManga torrents found in qBittorrent.")
@@ -962,7 +1590,7 @@ def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "
     # Pre-calculate display names
     log_substep(f"Analyzing {len(torrents)} torrents...")
     for t in torrents:
-        disp = get_matched_or_parsed_name(t["name"], library_index, match_data=match_data, series_map=series_map)
+        disp = get_matched_or_parsed_name(t["name"], library_index, match_index=match_index, series_map=series_map)
         t["_display_name"] = disp
         t["_sort_name"] = re.sub(r"\[.*?\]", "", disp).lower()
 
@@ -1006,456 +1634,153 @@ def process_pull(simulate: bool = False, pause: bool = False, root_path: str = "
         pass
 
     console.print(f"\n[bold green]Found [bold white]{len(completed)}[/bold white] completed torrent(s) ready for post-processing.[/bold green]")
-    if not click.confirm(f"Proceed with post-processing?"):
+    if not assume_yes and not click.confirm(f"Proceed with post-processing?"):
         console.print("[yellow]Operation cancelled.[/yellow]")
         return
 
-    for i, t in enumerate(completed):
-        display_name = t["_display_name"]
-        logger.info(f"Processing [{i+1}/{len(completed)}]: {t['_sort_name']}")
-
-        # Step 1: Stop Torrent
-        if simulate:
-            logger.info("[SIMULATE] Stopping torrent...")
-            logger.info("[SIMULATE] Torrent stopped")
-        else:
-            if qbit.pause_torrents([t["hash"]]):
-                log_substep("Torrent stopped")
+    # Staging happens in per-torrent folders under PULL_TEMPDIR
+    if PULL_TEMPDIR and not simulate:
+        temp_root = Path(PULL_TEMPDIR)
+        if temp_root.exists() and any(temp_root.iterdir()):
+            logger.warning(f"Temp directory is not empty: {temp_root}")
+            if assume_yes:
+                logger.warning("Leaving temp directory as is (unattended run).")
+            elif Confirm.ask("Clear temp directory? This is destructive!"):
+                _clear_directory(temp_root)
+                log_substep("Temp directory cleared")
             else:
-                logger.error("Failed to stop torrent")
-                if not click.confirm("Continue anyway?"): break
-
-        # Step 2: Identify Location
-        raw_path = t.get("content_path") or os.path.join(t.get("save_path", ""), t["name"])
-        content_path = raw_path
-        if QBIT_DOWNLOAD_ROOT:
-            clean_path = raw_path.lstrip("/").lstrip("\\")
-            if ":" in clean_path:
-                clean_path = clean_path.split(":", 1)[1].lstrip("/").lstrip("\\")
-            content_path = os.path.join(QBIT_DOWNLOAD_ROOT, clean_path)
-            
-        if simulate:
-            logger.info(f"[SIMULATE] Locating files at {content_path}")
+                logger.warning("Pull aborted by user.")
+                return
+
+    # Step 1: Stop Torrents (one request for all of them)
+    # Whatever is stopped here and not removed in Step 8 is started again on the
+    # way out, including when a job aborts, the user quits or preparation fails.
+    stopped: List[Dict[str, Any]] = []
+    removed: Set[str] = set()
+    jobs: List[PullJob] = []
+    plan_cache = TransferPlanCache()
+    if simulate:
+        logger.info(f"[SIMULATE] Stopping {len(completed)} torrent(s)...")
+    else:
+        stops = qbit.batch()
+        for t in completed:
+            stops.pause(t["hash"], key=t)
+        stop_result = stops.flush()
+        stopped = stop_result.succeeded
+        if stop_result.failed:
+            logger.error("Failed to stop torrents")
+            if not assume_yes and not click.confirm("Continue anyway?"):
+                _resume_torrents(qbit, stopped, removed)
+                return
         else:
-            if content_path and os.path.exists(content_path):
-                log_substep(f"Found files at: {content_path}")
-            else:
-                logger.error(f"Could not find files at: {content_path}")
-                if not click.confirm("Continue anyway?"): break
-
-        # Step 3: Calculate Names
-        # Don't strip brackets here anymore, strip_volume_info and semantic_normalize handle it better,
-        # and it might be the actual title (e.g. [Oshi no Ko]).
-        series_name = re.sub(r"^\d+\.\s+", "", display_name).strip()
-        series_name = sanitize_filename(series_name)
-        
-        if simulate:
-            logger.info(f"[SIMULATE] Analyzing content for: {series_name}")
-        
-        transfer_plan = []
-        if os.path.exists(content_path):
-             transfer_plan = generate_transfer_plan(Path(content_path), series_name)
-        
-        if not transfer_plan:
-            logger.error(f"No valid files found in {content_path}")
-            continue
+            log_substep(f"Stopped {len(completed)} torrent(s)")
 
-        log_substep(f"Identified {len(transfer_plan)} potential files")
-        for item in transfer_plan:
-             logger.debug(f"[dim]Found File: {item['src'].name} -> {item['dst_name']} (v:{item['v']} c:{item['c']} u:{item['u']})[/dim]")
-        
-        # Log a summary of what was found
-        total_v = len(set(n for item in transfer_plan for n in item['v']))
-        total_c = len(set(n for item in transfer_plan for n in item['c'] + item['u']))
-        console.print(Panel(f"[bold magenta]Processing Torrent: [/bold magenta][bold white]{display_name}[/bold white]\n[dim white]{t['name']}[/dim white]\n[bold cyan]Found Content: [/bold cyan][bold white]{total_v} volumes[/bold white] and [bold white]{total_c} chapters/units[/bold white]", title="Torrent Analysis Summary", subtitle_align="right"))
-
-        # Step 4: Analyze (Filter Plan)
-        local_series = None
-        if match_data and series_map:
-            for entry in match_data:
-                if entry.get("name") == t["name"]:
-                    mid = entry.get("matched_id")
-                    if mid and mid in series_map:
-                        local_series = series_map[mid]
-                    break
-        
-        if not local_series and library_index:
-            # Robust candidate generation from multiple sources
-            # 1. From our calculated series_name
-            candidates = generate_search_candidates(series_name)
-            
-            # 2. From the raw torrent name (if different)
-            if t['name'] != series_name:
-                raw_candidates = generate_search_candidates(t['name'])
-                for rc in raw_candidates:
-                    if rc not in candidates: candidates.append(rc)
-            
-            # 3. From the display name (if different)
-            if display_name != series_name and display_name != t['name']:
-                disp_candidates = generate_search_candidates(display_name)
-                for dc in disp_candidates:
-                    if dc not in candidates: candidates.append(dc)
-            
-            for cand in candidates:
-                matches = library_index.search(cand)
-                if matches: 
-                    local_series = matches[0]
-                    break
-            
-            # If no exact match, try fuzzy search on the best candidate (usually the first one)
-            if not local_series and candidates:
-                # Use project-wide threshold (usually 0.9 or 90)
-                # LibraryIndex.fuzzy_search expects float 0.0-1.0
-                thresh = FUZZY_MATCH_THRESHOLD / 100.0 if FUZZY_MATCH_THRESHOLD > 1.0 else FUZZY_MATCH_THRESHOLD
-                fuzzy_matches = library_index.fuzzy_search(candidates[0], threshold=thresh)
-                if fuzzy_matches:
-                    local_series = fuzzy_matches[0]
-
-        action_msg = "[4/8] Filtering content against library..."
-        pulled_vols = []
-        pulled_chaps = []
-        pulled_units = []
-        for item in transfer_plan:
-            pulled_vols.extend(item['v'])
-            pulled_chaps.extend(item['c'])
-            pulled_units.extend(item['u'])
-            
-        log_substep(f"Scraped Content: Vols: {format_ranges(pulled_vols)} | Chaps: {format_ranges(pulled_chaps)}")
+    try:
+        plan_cache.prune(t["hash"] for t in torrents)
 
-        if local_series:
-            log_substep(f"Matched to Library: {local_series.name}")
-            
-            # Fix filenames if series_name was generic/incorrect
-            sanitized_local_name = sanitize_filename(local_series.name)
-            if sanitized_local_name != series_name:
-                for item in transfer_plan:
-                    if item['dst_name'].startswith(series_name):
-                         item['dst_name'] = sanitized_local_name + item['dst_name'][len(series_name):]
-                
-                # Update series_name for subsequent steps (folder naming)
-                series_name = sanitized_local_name
-
-            all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
-            l_v_nums, l_c_nums = [], []
-            for v in all_local_vols:
-                v_n, c_n, u_n = classify_unit(v.name)
-                l_v_nums.extend(v_n); l_c_nums.extend(c_n + u_n)
-            
-            l_v_set, l_c_set = set(l_v_nums), set(l_c_nums)
-            new_v = sorted(list(set(n for n in pulled_vols if n not in l_v_set)))
-            new_c = sorted(list(set(n for n in pulled_chaps if n not in l_c_set)))
-            
-            if new_v or new_c:
-                msg = "Fills Gaps:"
-                if new_v: msg += f" [bold green]Vols: {format_ranges(new_v)}[/bold green]"
-                if new_c: msg += f" [bold green]Chaps: {format_ranges(new_c)}[/bold green]"
-                console.print(msg)
-                log_substep(f"Fills Gaps: Vols: {format_ranges(new_v)} | Chaps: {format_ranges(new_c)}")
-            else:
-                logger.info("All pulled content already exists in library (Potential Upgrade/Duplicate).")
-                console.print("[yellow]All pulled content already exists in library (Potential Upgrade/Duplicate).[/yellow]")
+        def prepare(i: int, t: Dict[str, Any]) -> Optional[PullJob]:
+            return _prepare_pull_job(i, len(completed), t, simulate, match_index, series_map, library_index, library, plan_cache)
 
-            skipped_count = 0
-            for item in transfer_plan:
-                is_redundant = True
-                if item['v']:
-                    if any(n not in l_v_set for n in item['v']): is_redundant = False
-                elif item['c']:
-                    if any(n not in l_c_set for n in item['c']): is_redundant = False
-                elif item['u']:
-                     if any(n not in l_c_set for n in item['u']): is_redundant = False
-                else:
-                    is_redundant = False
-                    
-                if is_redundant:
-                    item['skip'] = True
-                    skipped_count += 1
-                    
-            if skipped_count > 0:
-                log_substep(f"Marking {skipped_count} redundant files to skip copying.")
-                console.print(f"[dim]Marking {skipped_count} redundant files to skip copying.[/dim]")
-        else:
-            console.print("[yellow]No matching series found in library. Treating as new series.[/yellow]")
-            log_substep("NEW SERIES: No match found in library. All files will be copied.")
+        if pause or simulate or PULL_MAX_WORKERS <= 1:
+            # Interactive and simulated runs stay strictly sequential
+            for i, t in enumerate(completed):
+                job = prepare(i, t)
+                if job is None:
+                    continue
+                jobs.append(_run_pull_job(job, simulate=simulate, pause=pause))
+                if job.status == "aborted":
+                    logger.warning("Pull aborted by user.")
+                    break
 
-        # Step 5: Stage (Copy)
-        files_to_stage = [item for item in transfer_plan if not item['skip']]
-        
-        if not files_to_stage:
-             logger.info("No files need to be copied (All redundant).")
-        
-        if not PULL_TEMPDIR:
-             logger.error("PULL_TEMPDIR is not set. Cannot stage files.")
-        else:
-            dest_dir = Path(PULL_TEMPDIR)
-            if not simulate:
-                if dest_dir.exists() and any(dest_dir.iterdir()):
-                    logger.warning(f"Temp directory is not empty: {dest_dir}")
-                    if Confirm.ask("Clear temp directory? This is destructive!"):
-                        for item in dest_dir.iterdir():
-                            try:
-                                if item.is_dir(): shutil.rmtree(item)
-                                else: item.unlink()
-                            except Exception as e:
-                                logger.error(f"Error clearing {item}: {e}")
-                        log_substep("Temp directory cleared")
-                    else:
-                        logger.warning("Pull aborted by user.")
-                        break
+                if pause and not simulate:
+                    console.print(f"\n[bold red]Ready for final cleanup for: {job.series_name}[/bold red]")
+                    res = click.prompt("Press Enter to execute cleanup, or 'q' to skip", default="", show_default=False)
+                    if res.lower() == 'q': job.skip_cleanup = True
+
+                logger.info(f"Finished processing {job.display_name}")
             
-            if simulate:
-                logger.info(f"[SIMULATE] Staging {len(files_to_stage)} files to: {dest_dir}")
-            else:
-                 try:
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        BarColumn(),
-                        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                        console=console,
-                        refresh_per_second=PROGRESS_REFRESH_RATE
-                    ) as progress:
-                        copy_task = progress.add_task(f"Copying {len(files_to_stage)} files...", total=len(files_to_stage))
-                        dest_dir.mkdir(parents=True, exist_ok=True)
-                        for item in files_to_stage:
-                            s = item['src']
-                            d = dest_dir / item['dst_name']
-                            logger.debug(f"Staging: [dim]{s}[/dim] -> [bold cyan]{d.name}[/bold cyan]")
-                            shutil.copy2(s, d)
-                            progress.update(copy_task, advance=1, description=f"[dim]Copying: {item['dst_name']}[/dim]")
-                    
-                    logger.info(f"Successfully staged {len(files_to_stage)} files to [bold cyan]{dest_dir}[/bold cyan]")
-                    log_substep(f"Successfully staged {len(files_to_stage)} files.")
-                 except Exception as e:
-                    logger.error(f"Copy failed: {e}")
-                    if not click.confirm("Continue anyway?"): break
-
-        # Step 6: Import Files
-        if simulate:
-            logger.info("[SIMULATE] Importing files into library...")
+                if (pause or simulate) and not assume_yes and i < len(completed) - 1:
+                    res = click.prompt("Press Enter to continue to the next item, or 'q' to quit", default="", show_default=False)
+                    if res.lower() == 'q':
+                        logger.info("Post-processing aborted by user.")
+                        break
         else:
-            if not library:
-                logger.error("Library root not found. Skipping import.")
-            else:
-                target_dir = Path(local_series.path) if local_series else Path(library.path) / "Uncategorized" / f"Pulled-{datetime.now().strftime('%Y-%m-%d')}" / series_name
-                
-                files_to_import = []
-                overwrite_count = 0
-                if files_to_stage and PULL_TEMPDIR:
-                     for item in files_to_stage:
-                         staged_path = Path(PULL_TEMPDIR) / item['dst_name']
-                         if not staged_path.exists(): continue
-                         files_to_import.append({
-                             "path": staged_path,
-                             "v": item['v'], "c": item['c'], "u": item['u']
-                         })
-                         if (target_dir / item['dst_name']).exists(): overwrite_count += 1
-
-                if files_to_import:
-                        if pause:
-                            console.print(f"\n[bold yellow]Ready to import {len(files_to_import)} files from {PULL_TEMPDIR} into: {target_dir}[/bold yellow]")
-                            if overwrite_count > 0:
-                                console.print(f"[bold red]WARNING: {overwrite_count} files already exist in the destination and will be overwritten![/bold red]")
-                            
-                            res = click.prompt("Press Enter to continue, or 'q' to quit", default="", show_default=False)
-                            if res.lower() == 'q': break
-
-                        use_subfolders = False 
-                        l_v_set, l_c_set = set(), set()
-                        if local_series:
-                            all_local_vols = local_series.volumes + [v for sg in local_series.sub_groups for v in sg.volumes]
-                            for v in all_local_vols:
-                                v_n, c_n, u_n = classify_unit(v.name)
-                                l_v_set.update(v_n); l_c_set.update(c_n + u_n)
-                        
-                        all_vols_set = set(l_v_set)
-                        all_chaps_set = set(l_c_set)
-                        for f in files_to_import:
-                            all_vols_set.update(f['v']); all_chaps_set.update(f['c']); all_chaps_set.update(f['u'])
-                        
-                        has_volumes = bool(all_vols_set)
-                        has_chapters = bool(all_chaps_set)
-
-                        target_vol_path = target_dir
-                        target_chap_path = target_dir
+            # Analysis runs here while staging/import of earlier torrents proceeds on the
+            # pool; jobs for the same series folder run one after another.
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                console=console,
+                refresh_per_second=PROGRESS_REFRESH_RATE
+            ) as progress, SerialKeyExecutor(PULL_MAX_WORKERS) as executor:
+
+                def run(job: PullJob, task_id: int, total: int) -> PullJob:
+                    try:
+                        return _run_pull_job(job, progress=progress, task_id=task_id)
+                    finally:
+                        progress.update(task_id, completed=total, description=f"[dim]{job.series_name}[/dim]")
+
+                pending = []
+                for i, t in enumerate(completed):
+                    job = prepare(i, t)
+                    if job is None:
+                        continue
+                    total = _staging_bytes(job.files_to_stage)
+                    task_id = progress.add_task(f"[dim]Queued: {job.series_name}[/dim]", total=total)
+                    pending.append((job, executor.submit(job.series_key, run, job, task_id, total)))
 
-                        if all_vols_set:
-                            min_v = min(all_vols_set)
-                            max_v = max(all_vols_set)
-                            def fmt_num(n): return str(int(n)).zfill(2) if n.is_integer() else str(n).zfill(2)
+                for job, future in pending:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Pull failed for {job.display_name}: {e}")
+                        job.status = "failed"
+                    jobs.append(job)
 
-                            vol_folder_name = f"{series_name} v{fmt_num(min_v)}-v{fmt_num(max_v)}"
-                            if min_v == max_v: vol_folder_name = f"{series_name} v{fmt_num(min_v)}"
-                                
-                            chap_start = int(max_v) + 1
-                            chap_folder_name = f"{series_name} v{str(chap_start).zfill(2)}+"
-                            
-                            existing_vol_dir = None
-                            existing_chap_dir = None
-                            s_name_esc = re.escape(series_name)
-                            vol_pat = re.compile(rf"^{s_name_esc} v(\d+)(?:-v(\d+))?$", re.IGNORECASE)
-                            chap_pat = re.compile(rf"^{s_name_esc} v(\d+)\+$", re.IGNORECASE)
-
-                            if target_dir.exists():
-                                for item in target_dir.iterdir():
-                                    if item.is_dir():
-                                        if vol_pat.match(item.name): existing_vol_dir = item; use_subfolders = True
-                                        elif chap_pat.match(item.name): existing_chap_dir = item; use_subfolders = True
-                            
-                            if not use_subfolders and has_volumes and has_chapters:
-                                use_subfolders = True
-                            
-                            if use_subfolders:
-                                target_vol_path = target_dir / vol_folder_name
-                                target_chap_path = target_dir / chap_folder_name
-                                
-                                if existing_vol_dir and existing_vol_dir.name != vol_folder_name:
-                                    try:
-                                        existing_vol_dir.rename(target_vol_path)
-                                    except Exception as e:
-                                        logger.error(f"Failed to rename volume folder: {e}")
-                                        target_vol_path = existing_vol_dir
-                                
-                                if existing_chap_dir and existing_chap_dir.name != chap_folder_name:
-                                    try:
-                                        existing_chap_dir.rename(target_chap_path)
-                                    except Exception as e:
-                                        logger.error(f"Failed to rename chapter folder: {e}")
-                                        target_chap_path = existing_chap_dir
-
-                                # Move loose files from root to subfolders if we're now using subfolders
-                                if target_dir.exists():
-                                    if not target_vol_path.exists(): target_vol_path.mkdir(parents=True, exist_ok=True)
-                                    if not target_chap_path.exists(): target_chap_path.mkdir(parents=True, exist_ok=True)
-                                    
-                                    for item in target_dir.iterdir():
-                                        if item.is_file() and item.suffix.lower() in ['.cbz', '.cbr', '.zip', '.rar', '.pdf', '.epub']:
-                                            v_nums, c_nums, u_nums = classify_unit(item.name)
-                                            dest = None
-                                            if v_nums: dest = target_vol_path / item.name
-                                            elif c_nums or u_nums: dest = target_chap_path / item.name
-                                            
-                                            if dest and dest != item:
-                                                try:
-                                                    shutil.move(str(item), str(dest))
-                                                    log_substep(f"Organized existing file {item.name} into subfolder")
-                                                except Exception as e:
-                                                    logger.error(f"Failed to organize existing file {item.name}: {e}")
-
-                        imported_count = 0
-                        for file_info in files_to_import:
-                            f_path = file_info["path"]
-                            dest_folder = target_dir 
-                            if use_subfolders:
-                                if file_info['v']: dest_folder = target_vol_path
-                                elif file_info['c'] or file_info['u']: dest_folder = target_chap_path
-                            
-                            try:
-                                if not dest_folder.exists(): dest_folder.mkdir(parents=True, exist_ok=True)
-                                dest_path = dest_folder / f_path.name
-                                logger.debug(f"Importing: [dim]{f_path.name}[/dim] -> [bold green]{dest_folder.name}[/bold green]")
-                                shutil.copy2(f_path, dest_path)
-                                imported_count += 1
-                            except Exception as e:
-                                logger.error(f"Failed to import {f_path.name}: {e}")
-                        
-                        if imported_count > 0:
-                            logger.info(f"Successfully imported {imported_count} files into [bold green]{target_dir}[/bold green]")
-                            console.print(f"Successfully imported {imported_count} files.")
+            for job in jobs:
+                if job.status == "done":
+                    logger.info(f"Finished processing {job.display_name}")
                 else:
-                    logger.info("No files to import.")
+                    logger.error(f"Left in qBittorrent for the next pull: {job.display_name}")
 
-        # Step 7: Update Library State
-        if simulate:
-            logger.info("[SIMULATE] Updating library state...")
-        else:
-            if not library:
-                logger.error("Library object missing. Skipping state update.")
-            else:
-                with console.status("[bold blue]Updating library state..."):
-                    new_series_obj = scan_series(target_dir)
-                    if local_series:
-                        found = False
-                        for cat in library.categories:
-                            for sub in cat.sub_categories:
-                                for idx, s in enumerate(sub.series):
-                                    if s.path == local_series.path:
-                                        new_series_obj.external_data = s.external_data
-                                        sub.series[idx] = new_series_obj
-                                        found = True
-                                        break
-                                if found: break
-                            if found: break
-                    else:
-                        date_str = datetime.now().strftime("%Y-%m-%d")
-                        uncat = next((c for c in library.categories if c.name == "Uncategorized"), None)
-                        if not uncat:
-                            uncat = Category(name="Uncategorized", path=library.path / "Uncategorized")
-                            library.categories.append(uncat)
-                        sub_name = f"Pulled-{date_str}"
-                        subcat = next((s for s in uncat.sub_categories if s.name == sub_name), None)
-                        if not subcat:
-                            subcat = Category(name=sub_name, path=uncat.path / sub_name, parent=uncat)
-                            uncat.sub_categories.append(subcat)
-                        subcat.series.append(new_series_obj)
-
-                    save_library_cache(library)
-                    log_substep("Library state updated and saved.")
-
-                    v_n, c_n, u_n = [], [], []
-                    all_vols = new_series_obj.volumes + [v for sg in new_series_obj.sub_groups for v in sg.volumes]
-                    for v in all_vols:
-                        vn, cn, un = classify_unit(v.name)
-                        v_n.extend(vn); c_n.extend(cn); u_n.extend(un)
-                    
-                    log_substep(f"Final Library Content for {series_name}: Vols: {format_ranges(v_n)} | Chaps: {format_ranges(c_n)}")
+    finally:
+        # Steps 7-8 run for every job that finished, even if a later one raised
+        # or the user quit, so imported torrents do not stay in qBittorrent.
+        try:
+            removed = _finish_pull(qbit, jobs, simulate, library, match_index, status_store, input_file, plan_cache)
+        finally:
+            _resume_torrents(qbit, stopped, removed)
 
-        # Step 8: Final Cleanup
-        if simulate:
-            logger.info("[SIMULATE] Final cleanup...")
-        else:
-            if pause:
-                console.print(f"\n[bold red]Ready for final cleanup for: {series_name}[/bold red]")
-                res = click.prompt("Press Enter to execute cleanup, or 'q' to skip", default="", show_default=False)
-                if res.lower() == 'q': continue
-
-            with console.status("[bold blue]Final cleanup..."):
-                if qbit.delete_torrents([t["hash"]], delete_files=True):
-                    log_substep("Torrent removed from qBittorrent")
-                else:
-                    logger.error("Failed to remove torrent from qBittorrent")
+    logger.info(f"Finished pulling {len(completed)} torrents!")
 
-                if PULL_TEMPDIR and os.path.exists(PULL_TEMPDIR):
-                    for item in Path(PULL_TEMPDIR).iterdir():
-                        try:
-                            if item.is_dir(): shutil.rmtree(item)
-                            else: item.unlink()
-                        except Exception as e:
-                            logger.error(f"Failed to clear temp item {item.name}: {e}")
-                    log_substep("Temporary pull directory cleared")
-
-                if match_data:
-                    found_entry = False
-                    for entry in match_data:
-                        if entry.get("name") == t["name"] and entry.get("grab_status") == "grabbed":
-                            entry["grab_status"] = "pulled"
-                            found_entry = True
-                    
-                    if found_entry:
-                        try:
-                            with open(input_file, 'w', encoding='utf-8') as f:
-                                json.dump(match_data, f, indent=2)
-                            log_substep(f"Updated {input_file}: {t['name']} marked as pulled.")
-                        except Exception as e:
-                            logger.error(f"Failed to update {input_file}: {e}")
 
-        logger.info(f"Finished processing {display_name}")
-        
-        if (pause or simulate) and i < len(completed) - 1:
-            res = click.prompt("Press Enter to continue to the next item, or 'q' to quit", default="", show_default=False)
-            if res.lower() == 'q':
-                logger.info("Post-processing aborted by user.")
-                break
 
-    logger.info(f"Finished pulling {len(completed)} torrents!")
+def watch_pull(simulate: bool = False, pause: bool = False, root_path: str = "", input_file: str = "", interval: float = QBIT_WATCH_INTERVAL_SECONDS) -> None:
+    """
+    Follows qBittorrent through incremental sync/maindata updates and runs the
+    pull flow whenever VibeManga torrents finish downloading. Stops on Ctrl+C.
+    Runs unattended: no confirmations, and --pause is ignored. Torrents that
+    are already complete when watching starts are pulled first.
+    """
+    if pause:
+        logger.warning("--pause is ignored in watch mode (it runs unattended).")
+    client = QBitSyncClient(QBitAPI())
+    console.print(Rule(f"[bold blue]Watching qBittorrent for completed torrents (every {interval:g}s, Ctrl+C to stop)[/bold blue]"))
+
+    def pull() -> None:
+        process_pull(simulate=simulate, pause=False, root_path=root_path, input_file=input_file, sync_client=client, assume_yes=True)
 
+    def on_complete(finished: List[Dict[str, Any]]) -> None:
+        for t in finished:
+            log_substep(f"Download completed: {t.get('name')}")
+        pull()
+
+    try:
+        # The watch's first round is only a baseline: pull what is already done now
+        pull()
+        client.watch(on_complete, tag=QBIT_DEFAULT_TAG, interval=interval, baseline=False)
+    except KeyboardInterrupt:
+        console.print("[yellow]Stopped watching.[/yellow]")
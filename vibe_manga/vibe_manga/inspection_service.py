@@ -0,0 +1,172 @@
+"""
+Parallel archive inspection with bounded memory and per-file timeouts.
+
+Integrity tests (zipfile.testzip / testrar) and checksums read every byte of
+an archive. Run one after another they leave the interactive resolver
+blocked for minutes on a big series. InspectionService runs them on a thread
+pool and yields each result as soon as it is ready:
+
+  * at most workers x INSPECTION_IN_FLIGHT_PER_WORKER volumes are queued
+    at a time, so memory does not grow with the number of volumes;
+  * an inspection running longer than the timeout is reported as timed out
+    and abandoned (Python threads cannot be killed, so it finishes in the
+    background without holding up the results);
+  * results still valid in the InspectionStore are returned without
+    opening the archive.
+
+Each worker has at most one archive open, so the worker count caps open
+archives. disk_order() sorts volumes by (device, inode) beforehand so that
+reads sweep the disk rather than seek back and forth.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .analysis import inspect_archive_details
+from .constants import INSPECTION_MAX_WORKERS, INSPECTION_IN_FLIGHT_PER_WORKER, INSPECTION_FILE_TIMEOUT
+from .content_hash import full_digest
+from .inspection_store import InspectionStore, get_inspection_store
+from .logging import get_logger
+from .models import Volume
+
+logger = get_logger(__name__)
+
+_POLL_SECONDS = 0.25
+
+
+@dataclass
+class InspectionResult:
+    """Outcome of inspecting one volume."""
+    volume: Volume
+    exists: bool = True
+    size: int = 0
+    page_count: Optional[int] = None
+    corrupt: bool = False
+    error: Optional[str] = None
+    checksum: Optional[str] = None
+    cached: bool = False
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.exists and not self.corrupt and not self.timed_out and self.error is None
+
+
+def inspect_file(volume: Volume, check_integrity: bool, checksum: bool, store: InspectionStore) -> InspectionResult:
+    """Inspects one volume, using and updating the store."""
+    path = volume.path
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return InspectionResult(volume, exists=False, error="File not found")
+    except OSError as e:
+        return InspectionResult(volume, exists=False, error=f"Error: {e}")
+
+    result = InspectionResult(volume, size=st.st_size, cached=True)
+    record = store.lookup(path, st)
+    if record is not None and record.has_inspection(check_integrity):
+        result.page_count, result.corrupt = record.page_count, bool(record.corrupt)
+        if result.corrupt:
+            result.error = "Corrupted (stored result)"
+    else:
+        result.cached = False
+        details = inspect_archive_details(path, check_integrity=check_integrity)
+        store.update(
+            path, st,
+            page_count=details["page_count"],
+            corrupt=details["is_corrupt"],
+            verified=check_integrity,
+            formats=details["formats"],
+            crcs=details["crcs"],
+        )
+        result.page_count, result.corrupt, result.error = details["page_count"], details["is_corrupt"], details["error"]
+
+    if checksum:
+        if record is not None and record.full_hash:
+            result.checksum = record.full_hash
+        else:
+            result.cached = False
+            result.checksum = full_digest(path)
+            store.update(path, st, full_hash=result.checksum)
+    return result
+
+
+def _location(volume: Volume) -> Tuple[int, int, int, str]:
+    try:
+        st = os.stat(volume.path)
+    except OSError:
+        return (1, 0, 0, str(volume.path))  # Unreadable: last, by path
+    return (0, st.st_dev, st.st_ino, str(volume.path))
+
+
+def disk_order(volumes: Iterable[Volume], workers: int = INSPECTION_MAX_WORKERS) -> List[Volume]:
+    """
+    Volumes sorted by (device, inode), which tracks on-disk placement on most
+    filesystems. The stats run on a thread pool since on network storage
+    their latency dominates; they also warm the attribute cache for the
+    inspection that follows.
+    """
+    volumes = list(volumes)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="stat") as executor:
+        keys = list(executor.map(_location, volumes))
+    return [volume for _, volume in sorted(zip(keys, volumes), key=lambda pair: pair[0])]
+
+
+class InspectionService:
+    """Inspects volumes on a bounded thread pool, yielding results as they complete."""
+
+    def __init__(
+        self,
+        workers: int = INSPECTION_MAX_WORKERS,
+        timeout: float = INSPECTION_FILE_TIMEOUT,
+        store: Optional[InspectionStore] = None,
+    ):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.store = store
+
+    def run(self, volumes: Iterable[Volume], check_integrity: bool = False, checksum: bool = False) -> Iterator[InspectionResult]:
+        """Yields one InspectionResult per volume, in completion order."""
+        store = self.store if self.store is not None else get_inspection_store()
+        pending = iter(volumes)
+        in_flight: Dict[Future, Tuple[Volume, List[float]]] = {}
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inspect")
+
+        def task(volume: Volume, started: List[float]) -> InspectionResult:
+            started.append(time.monotonic())
+            return inspect_file(volume, check_integrity, checksum, store)
+
+        def submit_next() -> None:
+            volume = next(pending, None)
+            if volume is not None:
+                started: List[float] = []
+                in_flight[executor.submit(task, volume, started)] = (volume, started)
+
+        try:
+            for _ in range(self.workers * INSPECTION_IN_FLIGHT_PER_WORKER):
+                submit_next()
+            while in_flight:
+                done, _ = wait(list(in_flight), timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    volume, _ = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(f"Inspection failed for {volume.path}: {e}")
+                        result = InspectionResult(volume, corrupt=True, error=f"Error: {e}")
+                    submit_next()
+                    yield result
+
+                now = time.monotonic()
+                for future, (volume, started) in list(in_flight.items()):
+                    if started and now - started[0] > self.timeout:
+                        del in_flight[future]
+                        logger.warning(f"Inspection of {volume.path} timed out after {self.timeout:.0f}s")
+                        submit_next()
+                        yield InspectionResult(volume, timed_out=True, error=f"Timed out after {self.timeout:.0f}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            store.commit()
@@ -0,0 +1,246 @@
+"""
+Persistent digest and inspection store for library files.
+
+Content hashes (dedupe), page counts (--deep) and integrity results
+(--verify) used to be recomputed on every run. InspectionStore keeps them in a
+small SQLite database in the working directory, keyed by (device, inode) and
+valid only while the file's size and mtime are unchanged - so renames and
+moves inside the library keep their results, and any rewrite of the file
+(rebase, re-download) invalidates them.
+
+Per file it records:
+
+  * sample_hash / full_hash - tiered content digests (see content_hash);
+  * page_count, formats, crcs - from reading the archive's entry list;
+  * corrupt / verified - corrupt is the last inspection's result, verified
+    says whether that inspection ran the full integrity test;
+  * page_hashes - perceptual fingerprints of sampled pages (see perceptual).
+
+SQLite rather than the usual JSON state file: per-entry CRCs for a large
+library are far too big to rewrite as one document on every run.
+
+Content digests briefly lived in vibe_manga_content_hashes.json, keyed by
+(path, size, mtime). The key is now (device, inode), with size and mtime_ns
+checked on lookup, so a moved file keeps its digests. That file is not
+migrated (its path keys would not survive the renames dedupe makes) and is
+removed the first time the store is opened next to it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .analysis import inspect_archive_details
+from .constants import INSPECTION_DB_FILENAME
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+_COLUMNS = ("path", "size", "mtime_ns", "sample_hash", "full_hash", "page_count", "corrupt", "verified", "formats", "crcs", "page_hashes")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sample_hash TEXT,
+    full_hash TEXT,
+    page_count INTEGER,
+    corrupt INTEGER,
+    verified INTEGER NOT NULL DEFAULT 0,
+    formats TEXT,
+    crcs TEXT,
+    page_hashes TEXT,
+    PRIMARY KEY (dev, ino)
+)
+"""
+
+# Columns added after the first release of the table: name -> type
+_ADDED_COLUMNS = {"page_hashes": "TEXT"}
+
+# Path-keyed digest cache that this store replaced
+_LEGACY_DIGEST_CACHE = "vibe_manga_content_hashes.json"
+
+
+@dataclass
+class FileRecord:
+    """Stored results for one file; None means not computed yet."""
+    path: str
+    size: int
+    mtime_ns: int
+    sample_hash: Optional[str] = None
+    full_hash: Optional[str] = None
+    page_count: Optional[int] = None
+    corrupt: Optional[bool] = None
+    verified: bool = False
+    formats: Optional[List[str]] = None
+    crcs: Optional[Dict[str, int]] = None
+    page_hashes: Optional[List[str]] = None
+
+    def has_inspection(self, check_integrity: bool = False) -> bool:
+        """True if an inspection at least this thorough is stored."""
+        return self.page_count is not None and (self.verified or not check_integrity)
+
+
+class InspectionStore:
+    """(device, inode) -> FileRecord while size and mtime_ns match, in SQLite. Safe to share between threads."""
+
+    def __init__(self, path: Union[str, Path] = INSPECTION_DB_FILENAME):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            try:
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute(_SCHEMA)
+                existing = {row[1] for row in self._conn.execute("PRAGMA table_info(files)")}
+                for name, kind in _ADDED_COLUMNS.items():
+                    if name not in existing:
+                        self._conn.execute(f"ALTER TABLE files ADD COLUMN {name} {kind}")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open inspection store '{self.path}': {e}. Results will not be cached.")
+                self._conn = None
+            else:
+                self._remove_legacy_cache()
+        return self._conn
+
+    def _remove_legacy_cache(self) -> None:
+        legacy = self.path.parent / _LEGACY_DIGEST_CACHE
+        try:
+            legacy.unlink()
+            logger.info(f"Removed superseded digest cache {legacy}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove superseded digest cache {legacy}: {e}")
+
+    def lookup(self, path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[FileRecord]:
+        """The stored record for a file, or None if missing or the file changed since."""
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM files WHERE dev = ? AND ino = ?",
+                    (st.st_dev, st.st_ino),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Inspection store lookup failed for {path}: {e}")
+                return None
+        if row is None:
+            return None
+        record = dict(zip(_COLUMNS, row))
+        if record["size"] != st.st_size or record["mtime_ns"] != st.st_mtime_ns:
+            return None
+        record["path"] = str(path)
+        record["corrupt"] = None if record["corrupt"] is None else bool(record["corrupt"])
+        record["verified"] = bool(record["verified"])
+        record["formats"] = json.loads(record["formats"]) if record["formats"] else None
+        record["crcs"] = json.loads(record["crcs"]) if record["crcs"] else None
+        record["page_hashes"] = json.loads(record["page_hashes"]) if record["page_hashes"] is not None else None
+        return FileRecord(**record)
+
+    def update(self, path: Union[str, Path], st: Optional[os.stat_result] = None, **fields: Any) -> None:
+        """
+        Stores fields (FileRecord attributes) for a file. Results recorded for
+        an older version of the file are dropped.
+        """
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return
+        record = self.lookup(path, st) or FileRecord(path=str(path), size=st.st_size, mtime_ns=st.st_mtime_ns)
+        for name, value in fields.items():
+            setattr(record, name, value)
+        record.path = str(path)
+        values = (
+            st.st_dev, st.st_ino, record.path, record.size, record.mtime_ns,
+            record.sample_hash, record.full_hash, record.page_count,
+            None if record.corrupt is None else int(record.corrupt), int(record.verified),
+            json.dumps(record.formats) if record.formats is not None else None,
+            json.dumps(record.crcs, ensure_ascii=False) if record.crcs is not None else None,
+            json.dumps(record.page_hashes) if record.page_hashes is not None else None,
+        )
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO files (dev, ino, {', '.join(_COLUMNS)}) VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})",
+                    values,
+                )
+                self._pending += 1
+            except sqlite3.Error as e:
+                logger.warning(f"Inspection store update failed for {path}: {e}")
+
+    def commit(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pending:
+                try:
+                    self._conn.commit()
+                    self._pending = 0
+                except sqlite3.Error as e:
+                    logger.error(f"Error saving inspection store '{self.path}': {e}")
+
+    def close(self) -> None:
+        self.commit()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def inspect_volume(path: Path, check_integrity: bool = False, store: Optional[InspectionStore] = None) -> Tuple[int, bool]:
+    """
+    inspect_archive() through the store: (page_count, is_corrupt) from the
+    stored record when it is thorough enough, otherwise inspected and recorded.
+    """
+    store = store if store is not None else get_inspection_store()
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is not None:
+        record = store.lookup(path, st)
+        if record is not None and record.has_inspection(check_integrity):
+            return record.page_count, bool(record.corrupt)
+
+    details = inspect_archive_details(path, check_integrity=check_integrity)
+    if st is not None:
+        store.update(
+            path, st,
+            page_count=details["page_count"],
+            corrupt=details["is_corrupt"],
+            verified=check_integrity,
+            formats=details["formats"],
+            crcs=details["crcs"],
+        )
+    return details["page_count"], details["is_corrupt"]
+
+
+_default_store: Optional[InspectionStore] = None
+_default_lock = threading.Lock()
+
+
+def get_inspection_store() -> InspectionStore:
+    """Process-wide store in the working directory, opened on first use."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = InspectionStore()
+        return _default_store
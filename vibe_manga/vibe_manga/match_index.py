@@ -0,0 +1,107 @@
+"""
+Lookup index over match results.
+
+Pull and `grab --status` resolve each qBittorrent torrent to its match entry
+(torrent name -> matched series). Scanning the whole match list per torrent
+made those commands O(torrents x entries). MatchIndex builds name, magnet and
+info-hash lookups once; `load_match_index` reuses the parsed file for as long
+as it is unchanged on disk, so commands chained in one process (pullcomplete,
+watch mode) do not parse it again.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+_BTIH_RE = re.compile(r"xt=urn:btih:([0-9a-zA-Z]+)")
+
+# (resolved path) -> ((mtime_ns, size), MatchIndex)
+_loaded: Dict[str, Tuple[Tuple[int, int], "MatchIndex"]] = {}
+
+
+def magnet_info_hash(magnet: str) -> Optional[str]:
+    """Lower-case btih of a magnet link (hex form only), or None."""
+    m = _BTIH_RE.search(magnet or "")
+    if not m or len(m.group(1)) != 40:
+        return None
+    return m.group(1).lower()
+
+
+class MatchIndex:
+    """name / magnet / info-hash -> match entries, built once over a loaded list."""
+
+    def __init__(self, entries: Optional[List[Dict[str, Any]]] = None):
+        self.entries: List[Dict[str, Any]] = entries if entries is not None else []
+        self._by_name: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_magnet: Dict[str, Dict[str, Any]] = {}
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries:
+            name = entry.get("name")
+            if name:
+                self._by_name.setdefault(name, []).append(entry)
+            magnet = entry.get("magnet_link")
+            if magnet:
+                self._by_magnet.setdefault(magnet, entry)
+                info_hash = magnet_info_hash(magnet)
+                if info_hash:
+                    self._by_hash.setdefault(info_hash, entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """First entry with this torrent name (the order the old linear scan used)."""
+        found = self._by_name.get(name)
+        return found[0] if found else None
+
+    def all_by_name(self, name: str) -> List[Dict[str, Any]]:
+        return self._by_name.get(name, [])
+
+    def by_magnet(self, magnet: str) -> Optional[Dict[str, Any]]:
+        return self._by_magnet.get(magnet)
+
+    def for_torrent(self, torrent: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Match entry for a qBittorrent torrent: by name first, then by info-hash."""
+        entry = self.by_name(torrent.get("name", ""))
+        if entry is None and torrent.get("hash"):
+            entry = self._by_hash.get(torrent["hash"].lower())
+        return entry
+
+
+def load_match_index(input_file: Union[str, Path]) -> MatchIndex:
+    """
+    Loads match results into a MatchIndex. The parsed result is reused while the
+    file's mtime and size are unchanged. Returns an empty index on errors.
+    """
+    if not input_file or not os.path.exists(input_file):
+        return MatchIndex()
+    path = str(Path(input_file).resolve())
+    try:
+        st = os.stat(path)
+    except OSError:
+        return MatchIndex()
+    signature = (st.st_mtime_ns, st.st_size)
+
+    cached = _loaded.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except Exception as e:
+        logger.error(f"Could not load match results from {input_file}: {e}")
+        return MatchIndex()
+    if not isinstance(entries, list):
+        logger.error(f"Match results in {input_file} are not a list")
+        return MatchIndex()
+
+    index = MatchIndex(entries)
+    _loaded[path] = (signature, index)
+    return index
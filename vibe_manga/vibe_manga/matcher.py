@@ -36,6 +36,8 @@ from .analysis import (
     parse_size
 )
 from .cache import get_cached_library, save_library_cache, load_resolution_cache, save_resolution_cache
+from .scrape_store import open_scrape_store
+from .grab_status_store import GrabStatusStore
 
 logger = get_logger(__name__) 
 console = Console()
@@ -950,18 +952,11 @@ def _resolve_remote_identities(data: List[Dict[str, Any]], library_index: Librar
 
 def process_match(input_file: str, output_file: str, show_table: bool, show_all: bool, library: Optional[Library] = None, show_stats: bool = False, query: Optional[str] = None, parallel: bool = True):
     start_time = time.time()
-    p = Path(input_file)
-    if not p.exists():
+    store = open_scrape_store(input_file)
+    if not store.exists():
         logger.error(f"Input file {input_file} not found.")
         return
 
-    try:
-        with open(p, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        logger.error(f"Error reading {input_file}: {e}")
-        return
-
     # NEW: Build Library Index for Matching
     # This replaces the old list of tuples
     index = LibraryIndex()
@@ -1051,7 +1046,7 @@ def process_match(input_file: str, output_file: str, show_table: bool, show_all:
 
     # 1. Matching Logic (Parallel or Serial)
     with Live(display_group, console=console, refresh_per_second=10):
-        task_id = progress.add_task("[bold green]Matching Content...", total=len(data))
+        task_id = progress.add_task("[bold green]Matching Content...", total=len(store))
         
         # Determine number of workers
         num_workers = multiprocessing.cpu_count() if parallel else 1
@@ -1061,7 +1056,7 @@ def process_match(input_file: str, output_file: str, show_table: bool, show_all:
         # NOTE: LibraryIndex might be large. Passing it to workers via pickle is okay for moderate libraries.
         # If library grows to 100k series, this might need shared memory or database.
         
-        if parallel and len(data) > 20: # Only use parallel for non-trivial amounts
+        if parallel and len(store) > 20: # Only use parallel for non-trivial amounts
             logger.info(f"Parallel matching active (Workers: {num_workers})")
             
             # Optimize payload size for workers
@@ -1070,7 +1065,7 @@ def process_match(input_file: str, output_file: str, show_table: bool, show_all:
             with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
                 # Prepare tasks
                 futures = []
-                for entry in data:
+                for entry in store.iter_entries():
                     magnet = entry.get("magnet_link")
                     existing = existing_map.get(magnet) if magnet else None
                     # Pass worker_index instead of full index
@@ -1093,7 +1088,7 @@ def process_match(input_file: str, output_file: str, show_table: bool, show_all:
                     progress.advance(task_id)
         else:
             # Serial Mode
-            for entry in data:
+            for entry in store.iter_entries():
                 magnet = entry.get("magnet_link")
                 existing = existing_map.get(magnet) if magnet else None
                 parsed = match_single_entry(entry, index, existing)
@@ -1165,9 +1160,15 @@ def process_match(input_file: str, output_file: str, show_table: bool, show_all:
     if propagated > 0:
         log_substep(f"Propagated matches to {propagated} related entries.")
 
+    # Carry over grab/pull status changes not yet merged into the output file
+    status_store = GrabStatusStore(output_file)
+    status_store.apply(processed_data)
+
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(processed_data, f, indent=2)
+        # The rewritten file now carries every journaled status
+        status_store.clear()
         logger.info(f"Successfully processed {len(processed_data)} entries. Saved to {output_file}")
         log_substep(f"Saved match results to {output_file}")
     except Exception as e:
@@ -1,8 +1,10 @@
 
 import time
 import json
-from dataclasses import dataclass, asdict
-from typing import Optional
+import threading
+import concurrent.futures
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Set, Iterable, Callable
 from datetime import datetime
 from urllib.parse import quote_plus
 
@@ -10,6 +12,7 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from rich.live import Live
 from rich.console import Console, Group
@@ -36,6 +39,7 @@ def _create_retry_session(
     retries: int = c.SCRAPER_RETRY_COUNT,
     backoff_factor: float = c.SCRAPER_RETRY_BACKOFF_FACTOR,
     status_forcelist: tuple = (500, 502, 503, 504),
+    pool_size: int = 10,
 ) -> requests.Session:
     """Creates a requests session with retry logic."""
     session = requests.Session()
@@ -46,7 +50,7 @@ def _create_retry_session(
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
@@ -84,6 +88,290 @@ def _parse_row(row) -> Torrent | None:
         return None
 
 
+def _parse_page_soup(html_text: str) -> List[Torrent]:
+    """Reference parser: BeautifulSoup + CSS selector. Slower; kept for comparison."""
+    soup = BeautifulSoup(html_text, "lxml")
+    rows = soup.select(c.NYAA_TORRENT_TABLE_SELECTOR)
+    return [t for t in (_parse_row(row) for row in rows) if t]
+
+
+# Compiled once; the fast parser only walks the cells it needs.
+# lxml parser objects must not be shared between threads, so each worker gets its own.
+_parser_local = threading.local()
+_ROWS_XPATH = etree.XPath(c.NYAA_TORRENT_ROW_XPATH)
+_CELLS_XPATH = etree.XPath(".//td")
+_ANCHORS_XPATH = etree.XPath(".//a")
+_TORRENT_HREF_XPATH = etree.XPath(".//a[contains(@href, '.torrent')][1]/@href")
+_MAGNET_HREF_XPATH = etree.XPath(".//a[contains(@href, 'magnet:')][1]/@href")
+_TEXT_XPATH = etree.XPath("string()")
+
+
+def _page_rows(html_text: str) -> list:
+    """Returns the torrent table row elements of a listing page."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.HTMLParser(encoding="utf-8")
+    root = etree.fromstring(html_text.encode("utf-8"), parser) if html_text else None
+    return _ROWS_XPATH(root) if root is not None else []
+
+
+def _parse_row_element(row) -> Torrent | None:
+    """lxml counterpart of `_parse_row`; produces identical Torrent objects."""
+    try:
+        columns = _CELLS_XPATH(row)
+        if len(columns) < c.NYAA_MIN_COLUMNS:
+            return None
+
+        # Column 1 contains the name. It may have multiple 'a' tags, the last one is the title.
+        name = _ANCHORS_XPATH(columns[c.NYAA_COL_IDX_NAME])[-1].get("title", "").strip()
+
+        # Column 2 contains torrent and magnet links
+        links_cell = columns[c.NYAA_COL_IDX_LINKS]
+        torrent_link = c.NYAA_BASE_URL + str(_TORRENT_HREF_XPATH(links_cell)[0])
+        magnet_link = str(_MAGNET_HREF_XPATH(links_cell)[0])
+
+        return Torrent(
+            name=name,
+            torrent_link=torrent_link,
+            magnet_link=magnet_link,
+            size=_TEXT_XPATH(columns[c.NYAA_COL_IDX_SIZE]).strip(),
+            date=columns[c.NYAA_COL_IDX_DATE].get("data-timestamp"),
+            seeders=int(_TEXT_XPATH(columns[c.NYAA_COL_IDX_SEEDERS]).strip()),
+            leechers=int(_TEXT_XPATH(columns[c.NYAA_COL_IDX_LEECHERS]).strip()),
+            completed=int(_TEXT_XPATH(columns[c.NYAA_COL_IDX_COMPLETED]).strip()),
+        )
+    except (AttributeError, IndexError, ValueError, TypeError):
+        # Same skip rules as _parse_row
+        return None
+
+
+def _parse_page(html_text: str) -> List[Torrent]:
+    """Parses a listing page into Torrents using lxml + precompiled XPath."""
+    return [t for t in (_parse_row_element(row) for row in _page_rows(html_text)) if t]
+
+
+class _RateLimiter:
+    """Thread-safe global request budget: at most `per_second` request starts per second."""
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _build_page_url(query: Optional[str], page_num: int) -> str:
+    if query:
+        # Use search template
+        return c.NYAA_SEARCH_URL_TEMPLATE.format(query=quote_plus(query), page=page_num)
+    # Use default template
+    return c.NYAA_ENGLISH_TRANSLATED_URL_TEMPLATE.format(page=page_num)
+
+
+def _fetch_page(
+    session: requests.Session,
+    url: str,
+    headers: dict,
+    limiter: _RateLimiter,
+    abandoned: Callable[[], bool],
+) -> Optional[List[Torrent]]:
+    """Fetches and parses one listing page. Returns None if the query was stopped meanwhile."""
+    limiter.wait()
+    if abandoned():
+        return None
+    response = session.get(url, headers=headers, timeout=c.SCRAPER_TIMEOUT_SECONDS)
+    response.raise_for_status()  # Raise an exception for bad status codes
+    return _parse_page(response.text)
+
+
+@dataclass
+class _QueryState:
+    """Per-query bookkeeping for the ordered merge."""
+    query: Optional[str]
+    max_pages: int = c.NYAA_DEFAULT_PAGES_TO_SCRAPE
+    next_page: int = 1
+    merged_through: int = 0
+    done: bool = False
+    pages: Dict[int, object] = field(default_factory=dict)  # page -> List[Torrent] | Exception
+
+
+def scrape_nyaa_queries(
+    queries: Iterable[Optional[str]],
+    pages: int = c.NYAA_DEFAULT_PAGES_TO_SCRAPE,
+    user_agent: Optional[str] = None,
+    stop_at_timestamp: Optional[int] = None,
+    known_magnets: Optional[Set[str]] = None,
+    max_workers: int = c.SCRAPER_MAX_WORKERS,
+    pages_in_flight: int = c.SCRAPER_PAGES_IN_FLIGHT,
+    rate_limit_per_second: float = c.SCRAPER_RATE_LIMIT_PER_SECOND,
+    show_progress: bool = True,
+    page_budget: Optional[int] = None,
+    query_stats: Optional[Dict[Optional[str], Dict[str, int]]] = None,
+    query_pages: Optional[Dict[Optional[str], int]] = None,
+) -> List[dict]:
+    """
+    Scrapes up to N pages for each query with bounded concurrency.
+
+    Page fetches (and their parsing) for all queries share one worker pool and one
+    global rate budget. Each query fetches at most `pages_in_flight` pages ahead
+    of the last page it merged, and finished pages are merged strictly in page
+    order, so the early-stop rules of the sequential scraper still hold:
+      * a search query stops at its first empty page;
+      * a torrent at or older than `stop_at_timestamp` stops that query, and
+        anything after it (later rows and pages) is discarded.
+    Results are deduplicated by magnet link across all queries (and against
+    `known_magnets`) as pages are merged.
+
+    If `page_budget` is set, at most that many pages are fetched in total;
+    pages are handed out in query order each round, so when the budget runs
+    out it is the lowest-priority queries that go without. `query_stats`, if given, is filled
+    with the pages merged and new entries found per query. `query_pages`
+    overrides `pages` for individual queries.
+
+    Returns:
+        A list of torrent dictionaries, in query order then page order.
+    """
+    query_pages = query_pages or {}
+    states = [_QueryState(query=q, max_pages=query_pages.get(q, pages)) for q in queries]
+    if not states:
+        return []
+
+    headers = {"User-Agent": user_agent or c.SCRAPER_USER_AGENT}
+    session = _create_retry_session(pool_size=max(max_workers, 1))
+    limiter = _RateLimiter(rate_limit_per_second)
+    seen_magnets: Set[str] = set(known_magnets or ())
+    collected: Dict[int, List[dict]] = {i: [] for i in range(len(states))}
+    stats = {"pages": 0, "entries": 0, "requested": 0}
+    if query_stats is None:
+        query_stats = {}
+    for state in states:
+        query_stats[state.query] = {"pages": 0, "new": 0}
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeRemainingColumn(),
+    )
+    status_text = Text("Initializing...", style="dim")
+
+    if len(states) == 1:
+        q = states[0].query
+        task_desc = f"[bold cyan]Searching Nyaa for '{q}'..." if q else "[bold cyan]Scraping Nyaa..."
+    else:
+        task_desc = f"[bold cyan]Searching Nyaa ({len(states)} queries)..."
+    task_id = progress.add_task(task_desc, total=sum(state.max_pages for state in states))
+
+    def finish(state: _QueryState) -> None:
+        if not state.done:
+            state.done = True
+            # Count pages that will never be fetched as complete for the bar
+            progress.advance(task_id, state.max_pages - state.merged_through)
+
+    def merge(index: int) -> None:
+        """Consumes contiguous finished pages for one query, in order."""
+        state = states[index]
+        while not state.done and (state.merged_through + 1) in state.pages:
+            page_num = state.merged_through + 1
+            outcome = state.pages.pop(page_num)
+            state.merged_through = page_num
+            query_stats[state.query]["pages"] += 1
+            progress.advance(task_id)
+
+            if isinstance(outcome, Exception):
+                label = f" for '{state.query}'" if state.query else ""
+                console.print(f"[red]Error fetching page {page_num}{label}: {outcome}[/red]")
+                continue  # Move to the next page
+
+            if not outcome and state.query:
+                # If searching and no rows found, we've likely reached the end of results
+                status_text.plain = f"No results on page {page_num} for '{state.query}'. Stopping."
+                finish(state)
+                break
+
+            for torrent in outcome:
+                # Check for incremental stop condition
+                if stop_at_timestamp is not None:
+                    try:
+                        # _parse_row sets date as a string timestamp, convert for comparison
+                        t_time = int(torrent.date)
+                        if t_time <= stop_at_timestamp:
+                            date_str = datetime.fromtimestamp(t_time).strftime('%Y-%m-%d %H:%M:%S')
+                            console.print(f"[green]Found existing entry from {date_str}, stopping incremental scrape.[/green]")
+                            finish(state)
+                            break
+                    except (ValueError, TypeError):
+                        pass
+
+                if torrent.magnet_link in seen_magnets:
+                    continue
+                seen_magnets.add(torrent.magnet_link)
+                collected[index].append(asdict(torrent))
+                stats["entries"] += 1
+                query_stats[state.query]["new"] += 1
+
+            if state.merged_through >= state.max_pages:
+                finish(state)
+
+        status_text.plain = f"{stats['pages']} pages fetched. {stats['entries']} new entries found."
+
+    with Live(Group(progress, status_text), console=console, refresh_per_second=10, transient=not show_progress):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures: Dict[concurrent.futures.Future, tuple] = {}
+
+            def submit_more() -> None:
+                # Queries are served in order, so earlier ones claim budget first each round
+                for index, state in enumerate(states):
+                    budget_left = page_budget is None or stats["requested"] < page_budget
+                    if not state.done and not budget_left and state.next_page - 1 == state.merged_through:
+                        finish(state)  # Nothing in flight and no budget for more pages
+                        continue
+                    while (
+                        not state.done
+                        and (page_budget is None or stats["requested"] < page_budget)
+                        and state.next_page <= state.max_pages
+                        and state.next_page <= state.merged_through + pages_in_flight
+                        and len(futures) < max_workers * 2
+                    ):
+                        page_num = state.next_page
+                        url = _build_page_url(state.query, page_num)
+                        future = executor.submit(_fetch_page, session, url, headers, limiter, lambda st=state: st.done)
+                        futures[future] = (index, page_num)
+                        state.next_page += 1
+                        stats["requested"] += 1
+
+            submit_more()
+            while futures:
+                finished, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    index, page_num = futures.pop(future)
+                    state = states[index]
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        # Parse failures as well as network errors; one bad page must not abort the other queries
+                        outcome = e  # Reported in page order by merge()
+                    if outcome is None:
+                        stats["requested"] -= 1  # Skipped before fetching; refund the budget
+                        continue
+                    if state.done:
+                        continue  # Result past the stop point; discard
+                    stats["pages"] += 1
+                    state.pages[page_num] = outcome
+                    merge(index)
+                submit_more()
+
+    return [entry for index in range(len(states)) for entry in collected[index]]
+
+
 def scrape_nyaa(
     pages: int = c.NYAA_DEFAULT_PAGES_TO_SCRAPE,
     user_agent: Optional[str] = None,
@@ -103,81 +391,14 @@ def scrape_nyaa(
     Returns:
         A list of dictionaries, where each dictionary represents a torrent.
     """
-    all_torrents = []
-    
-    headers = {"User-Agent": user_agent or c.SCRAPER_USER_AGENT}
-    
-    session = _create_retry_session()
-
-    # Progress Bar Setup
-    progress = Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
+    return scrape_nyaa_queries(
+        [query],
+        pages=pages,
+        user_agent=user_agent,
+        stop_at_timestamp=stop_at_timestamp
     )
-    status_text = Text("Initializing...", style="dim")
-    display_group = Group(progress, status_text)
-
-    with Live(display_group, console=console, refresh_per_second=10):
-        task_desc = f"[bold cyan]Searching Nyaa for '{query}'..." if query else "[bold cyan]Scraping Nyaa..."
-        task_id = progress.add_task(task_desc, total=pages)
-
-        for page_num in range(1, pages + 1):
-            if query:
-                # Use search template
-                url = c.NYAA_SEARCH_URL_TEMPLATE.format(query=quote_plus(query), page=page_num)
-            else:
-                # Use default template
-                url = c.NYAA_ENGLISH_TRANSLATED_URL_TEMPLATE.format(page=page_num)
-            
-            status_text.plain = f"Fetching Page {page_num}/{pages}: {url}"
-            
-            try:
-                response = session.get(url, headers=headers, timeout=c.SCRAPER_TIMEOUT_SECONDS)
-                response.raise_for_status()  # Raise an exception for bad status codes
-
-                soup = BeautifulSoup(response.text, "lxml")
-                rows = soup.select(c.NYAA_TORRENT_TABLE_SELECTOR)
-
-                if not rows and query:
-                    # If searching and no rows found, we've likely reached the end of results
-                    status_text.plain = f"No results on page {page_num}. Stopping."
-                    break
-
-                for row in rows:
-                    torrent_data = _parse_row(row)
-                    if torrent_data:
-                        # Check for incremental stop condition
-                        if stop_at_timestamp is not None:
-                            try:
-                                # _parse_row sets date as a string timestamp, convert for comparison
-                                t_time = int(torrent_data.date)
-                                if t_time <= stop_at_timestamp:
-                                    date_str = datetime.fromtimestamp(t_time).strftime('%Y-%m-%d %H:%M:%S')
-                                    # Since we are in a Live display, we should print outside or update status
-                                    # To be clean, we'll let the function return, and the caller handles the message
-                                    # OR we can print a message via console.print (Live will handle it)
-                                    console.print(f"[green]Found existing entry from {date_str}, stopping incremental scrape.[/green]")
-                                    return all_torrents
-                            except (ValueError, TypeError):
-                                pass
-
-                        all_torrents.append(asdict(torrent_data))
-
-                # Update progress
-                progress.advance(task_id)
-                status_text.plain = f"Page {page_num} processed. {len(all_torrents)} total entries found."
-
-                # Rate limit requests
-                time.sleep(1 / c.SCRAPER_RATE_LIMIT_PER_SECOND)
-
-            except requests.RequestException as e:
-                console.print(f"[red]Error fetching page {page_num}: {e}[/red]")
-                continue # Move to the next page
-
-    return all_torrents
+
+
 def get_latest_timestamp_from_nyaa(user_agent: Optional[str] = None) -> Optional[int]:
     """
     Scrapes the first page of nyaa.si to find the most recent entry's timestamp.
@@ -196,13 +417,10 @@ def get_latest_timestamp_from_nyaa(user_agent: Optional[str] = None) -> Optional
         response = session.get(url, headers=headers, timeout=c.SCRAPER_TIMEOUT_SECONDS)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
-        rows = soup.select(c.NYAA_TORRENT_TABLE_SELECTOR)
-        
         timestamps = []
-        for row in rows:
+        for row in _page_rows(response.text):
             try:
-                timestamp = int(row.find_all("td")[c.NYAA_COL_IDX_DATE].get("data-timestamp"))
+                timestamp = int(_CELLS_XPATH(row)[c.NYAA_COL_IDX_DATE].get("data-timestamp"))
                 timestamps.append(timestamp)
             except (ValueError, TypeError, AttributeError, IndexError):
                 continue
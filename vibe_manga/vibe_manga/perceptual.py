@@ -0,0 +1,232 @@
+"""
+Perceptual page fingerprints for near-duplicate volume detection.
+
+Content dedupe only finds byte-identical files. The same volume re-encoded
+(JXL vs PNG, WebP vs JPEG, another release group's scans) has different
+bytes but near-identical pages. Here:
+
+  1. a few pages per archive are sampled - PERCEPTUAL_SAMPLE_RUN consecutive
+     pages at each of PERCEPTUAL_SAMPLE_ANCHORS evenly spaced positions, so a
+     release with one extra page still overlaps;
+  2. each sampled page is decoded as a small grayscale image and hashed with
+     NumPy: dHash (9x8 gradient signs) and pHash (signs of the low 8x8 DCT
+     coefficients of a 32x32 image), packed into one 128-bit fingerprint;
+     near-blank pages are skipped since they match everything;
+  3. near-duplicate volumes are found through bit-sampling LSH over the
+     pHash: every band keys pages on PERCEPTUAL_LSH_BITS fixed bits, pages
+     sharing a key are compared exactly (both hashes within
+     PERCEPTUAL_MAX_DISTANCE), and volumes are paired when enough of their
+     sampled pages match.
+
+Decoding uses Pillow, with imagecodecs for formats Pillow cannot read (JXL)
+when it is installed.
+"""
+
+import io
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .analysis import rarfile
+from .constants import (
+    IMAGE_EXTENSIONS,
+    PERCEPTUAL_SAMPLE_ANCHORS,
+    PERCEPTUAL_SAMPLE_RUN,
+    PERCEPTUAL_MIN_PAGE_STDDEV,
+    PERCEPTUAL_MAX_DISTANCE,
+    PERCEPTUAL_MIN_MATCH_RATIO,
+    PERCEPTUAL_LSH_BANDS,
+    PERCEPTUAL_LSH_BITS,
+    PERCEPTUAL_MAX_BUCKET,
+)
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Optional imports for page decoding
+try:
+    from PIL import Image
+    PERCEPTUAL_SUPPORT = True
+except ImportError:
+    PERCEPTUAL_SUPPORT = False
+
+try:
+    import imagecodecs
+except ImportError:
+    imagecodecs = None
+
+PAGE_EXTENSIONS = IMAGE_EXTENSIONS | {'.jxl'}
+_MIN_PAGES = 3  # Volumes with fewer usable sampled pages are not compared
+
+_DCT_SIZE = 32
+_k = np.arange(_DCT_SIZE)
+_DCT = np.cos(np.pi * (2 * _k[None, :] + 1) * _k[:, None] / (2 * _DCT_SIZE))
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _pack_bits(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def dhash(gray: np.ndarray) -> int:
+    """64-bit difference hash of a 8x9 (rows x columns) grayscale array."""
+    return _pack_bits(gray[:, 1:] > gray[:, :-1])
+
+
+def phash(gray: np.ndarray) -> int:
+    """64-bit DCT hash of a 32x32 grayscale array."""
+    coefficients = (_DCT @ gray.astype(np.float64) @ _DCT.T)[:8, :8].ravel()
+    # The DC term only reflects overall brightness
+    median = np.median(coefficients[1:])
+    return _pack_bits(coefficients > median)
+
+
+def _decode(data: bytes):
+    """Grayscale PIL image of an encoded page, or None."""
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.draft("L", (64, 64))  # JPEG: let the decoder downscale
+        return img.convert("L")
+    except Exception:
+        pass
+    if imagecodecs is not None:
+        try:
+            return Image.fromarray(np.asarray(imagecodecs.imread(data))).convert("L")
+        except Exception:
+            pass
+    return None
+
+
+def page_fingerprint(data: bytes) -> Optional[int]:
+    """128-bit fingerprint (dHash << 64 | pHash) of an encoded page; None if undecodable or blank."""
+    img = _decode(data)
+    if img is None:
+        return None
+    small = np.asarray(img.resize((_DCT_SIZE, _DCT_SIZE), Image.BILINEAR), dtype=np.float64)
+    if small.std() < PERCEPTUAL_MIN_PAGE_STDDEV:
+        return None
+    tiny = np.asarray(img.resize((9, 8), Image.BILINEAR), dtype=np.int16)
+    return (dhash(tiny) << 64) | phash(small)
+
+
+def sample_page_names(names: Sequence[str]) -> List[str]:
+    """Image entries to fingerprint: short runs at evenly spaced positions, in page order."""
+    pages = sorted((n for n in names if Path(n).suffix.lower() in PAGE_EXTENSIONS), key=str.lower)
+    wanted = PERCEPTUAL_SAMPLE_ANCHORS * PERCEPTUAL_SAMPLE_RUN
+    if len(pages) <= wanted:
+        return pages
+    picked: List[int] = []
+    for anchor in range(PERCEPTUAL_SAMPLE_ANCHORS):
+        start = (anchor + 1) * len(pages) // (PERCEPTUAL_SAMPLE_ANCHORS + 1)
+        for index in range(start, min(start + PERCEPTUAL_SAMPLE_RUN, len(pages))):
+            if index not in picked:
+                picked.append(index)
+    return [pages[i] for i in picked]
+
+
+def volume_fingerprints(path: Path) -> Optional[List[int]]:
+    """Fingerprints of a volume's sampled pages; None if the archive cannot be read."""
+    try:
+        if zipfile.is_zipfile(path):
+            archive = zipfile.ZipFile(path)
+            names = [n for n in archive.namelist() if not n.endswith("/")]
+        elif rarfile and rarfile.is_rarfile(path):
+            archive = rarfile.RarFile(path)
+            names = [i.filename for i in archive.infolist() if not i.isdir()]
+        else:
+            return None
+    except Exception as e:
+        logger.debug(f"Cannot open {path} for fingerprinting: {e}")
+        return None
+
+    fingerprints = []
+    with archive:
+        for name in sample_page_names(names):
+            try:
+                fingerprint = page_fingerprint(archive.read(name))
+            except Exception as e:
+                logger.debug(f"Cannot read page {name} of {path}: {e}")
+                continue
+            if fingerprint is not None:
+                fingerprints.append(fingerprint)
+    return fingerprints
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return _BYTE_POPCOUNT[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def near_duplicate_pairs(
+    signatures: Dict[int, Sequence[int]],
+    max_distance: int = PERCEPTUAL_MAX_DISTANCE,
+    min_ratio: float = PERCEPTUAL_MIN_MATCH_RATIO,
+    seed: int = 1,
+) -> Dict[Tuple[int, int], float]:
+    """
+    `signatures` maps a volume id to its page fingerprints. Returns
+    {(a, b): similarity} for a < b, where similarity is the smaller of the two
+    volumes' shares of sampled pages that matched a page of the other.
+    """
+    owners, pages, dhashes, phashes = [], [], [], []
+    for volume, fingerprints in signatures.items():
+        if len(fingerprints) < _MIN_PAGES:
+            continue
+        for page, fingerprint in enumerate(fingerprints):
+            owners.append(volume)
+            pages.append(page)
+            dhashes.append(fingerprint >> 64)
+            phashes.append(fingerprint & 0xFFFFFFFFFFFFFFFF)
+    if not owners:
+        return {}
+    owner = np.array(owners, dtype=np.int64)
+    dh = np.array(dhashes, dtype=np.uint64)
+    ph = np.array(phashes, dtype=np.uint64)
+
+    # Candidate page pairs: pages that agree on every sampled bit of some band
+    rng = np.random.RandomState(seed)
+    candidates: Set[Tuple[int, int]] = set()
+    for _ in range(PERCEPTUAL_LSH_BANDS):
+        mask = np.uint64(sum(1 << int(b) for b in rng.choice(64, PERCEPTUAL_LSH_BITS, replace=False)))
+        keys = ph & mask
+        order = np.argsort(keys, kind="stable")
+        boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+        for bucket in np.split(order, boundaries):
+            if len(bucket) < 2 or len(bucket) > PERCEPTUAL_MAX_BUCKET:
+                continue
+            members = sorted(bucket.tolist())
+            for x, i in enumerate(members):
+                for j in members[x + 1:]:
+                    if owners[i] != owners[j]:
+                        candidates.add((i, j))
+    if not candidates:
+        return {}
+
+    left, right = (np.array(side, dtype=np.int64) for side in zip(*candidates))
+    close = (_popcount64(ph[left] ^ ph[right]) <= max_distance) & (_popcount64(dh[left] ^ dh[right]) <= max_distance)
+
+    matched: Dict[Tuple[int, int], Tuple[Set[int], Set[int]]] = defaultdict(lambda: (set(), set()))
+    for i, j in zip(left[close].tolist(), right[close].tolist()):
+        a, b = int(owner[i]), int(owner[j])
+        if a > b:
+            a, b, i, j = b, a, j, i
+        matched[(a, b)][0].add(pages[i])
+        matched[(a, b)][1].add(pages[j])
+
+    pairs = {}
+    for (a, b), (pages_a, pages_b) in matched.items():
+        similarity = min(len(pages_a) / len(signatures[a]), len(pages_b) / len(signatures[b]))
+        if similarity >= min_ratio:
+            pairs[(a, b)] = similarity
+    return pairs
@@ -0,0 +1,82 @@
+"""
+Keyed thread pool for pull.
+
+Completed torrents for different series can be staged and imported at the
+same time, but two torrents that land in the same series folder must not:
+the import step reorganizes that folder (volume/chapter subfolders, loose file
+moves) based on what it finds there. SerialKeyExecutor runs tasks on a shared
+pool while guaranteeing that tasks with the same key run one at a time, in
+submission order. Waiting tasks do not occupy a worker.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Hashable, List, Tuple
+
+
+class SerialKeyExecutor:
+    """ThreadPoolExecutor wrapper that serializes tasks sharing a key."""
+
+    def __init__(self, max_workers: int):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pull")
+        self._queues: Dict[Hashable, Deque[Tuple[Callable, tuple, dict, Future]]] = {}
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SerialKeyExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # On Ctrl+C (or any error) let running tasks finish but drop queued ones
+        self.shutdown(wait_for_tasks=exc_type is None)
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Schedules fn(*args, **kwargs) after every earlier task with the same key."""
+        future: Future = Future()
+        with self._lock:
+            queue = self._queues.setdefault(key, deque())
+            queue.append((fn, args, kwargs, future))
+            self._futures.append(future)
+            if len(queue) == 1:
+                self._start(key)
+        return future
+
+    def _start(self, key: Hashable) -> None:
+        # Called with self._lock held
+        fn, args, kwargs, future = self._queues[key][0]
+        try:
+            self._pool.submit(self._run, key, fn, args, kwargs, future)
+        except RuntimeError:
+            # Pool already shut down without waiting: drop the rest of this key
+            for _, _, _, pending in self._queues.pop(key):
+                pending.cancel()
+
+    def _run(self, key: Hashable, fn: Callable, args: tuple, kwargs: dict, future: Future) -> None:
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                queue = self._queues[key]
+                queue.popleft()
+                if queue:
+                    self._start(key)
+                else:
+                    del self._queues[key]
+
+    def shutdown(self, wait_for_tasks: bool = True) -> None:
+        """Shuts the pool down; queued tasks still run first if wait_for_tasks is set."""
+        if wait_for_tasks:
+            # Queued tasks are only handed to the pool when their predecessor
+            # finishes, so wait for all of them before closing it.
+            wait(list(self._futures))
+        else:
+            with self._lock:
+                for queue in self._queues.values():
+                    for _, _, _, future in list(queue)[1:]:
+                        future.cancel()
+        self._pool.shutdown(wait=wait_for_tasks)
@@ -1,7 +1,15 @@
 import os
+import time
 import requests
 import logging
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+from .constants import (
+    QBIT_DEFAULT_TAG,
+    QBIT_DEFAULT_SAVEPATH,
+    QBIT_BATCH_RETRIES,
+    QBIT_BATCH_RETRY_BACKOFF,
+)
 from .logging import get_logger, log_api_call
 
 logger = get_logger(__name__)
@@ -36,7 +44,19 @@ class QBitAPI:
             logger.error(f"Error connecting to qBittorrent: {e}")
             return False
 
-    def add_torrent(self, urls: List[str], tag: str = "VibeManga", savepath: str = "VibeManga") -> bool:
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Request that logs in again once if the session has expired (403)."""
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 403:
+            self.sid = None
+            if self.login():
+                response = self.session.request(method, url, **kwargs)
+        return response
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        return self._request("POST", url, **kwargs)
+
+    def add_torrent(self, urls: List[str], tag: str = "VibeManga", savepath: str = "VibeManga", category: Optional[str] = None) -> bool:
         """Add one or more torrents via URLs/magnets."""
         if not self.sid and not self.login():
             return False
@@ -49,10 +69,12 @@ class QBitAPI:
             "tags": (None, tag),
             "savepath": (None, savepath)
         }
+        if category:
+            files["category"] = (None, category)
         log_api_call(add_url, "POST", params={"count": len(urls), "tag": tag})
 
         try:
-            response = self.session.post(add_url, files=files)
+            response = self._post(add_url, files=files)
             if response.status_code == 200:
                 logger.info(f"Successfully added {len(urls)} torrents to qBittorrent")
                 return True
@@ -85,6 +107,33 @@ class QBitAPI:
             logger.error(f"Error getting torrents info: {e}")
             return []
 
+    def batch(self, retries: int = QBIT_BATCH_RETRIES, backoff: float = QBIT_BATCH_RETRY_BACKOFF) -> "TorrentBatch":
+        """Returns a TorrentBatch that queues adds/pauses/resumes/deletes against this client."""
+        return TorrentBatch(self, retries=retries, backoff=backoff)
+
+    def get_maindata(self, rid: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Fetches /api/v2/sync/maindata: the changes since response `rid`
+        (a full snapshot when rid is 0 or unknown to the server).
+        """
+        if not self.sid and not self.login():
+            return None
+
+        sync_url = f"{self.base_url}/api/v2/sync/maindata"
+        params = {"rid": rid}
+        log_api_call(sync_url, "GET", params=params)
+
+        try:
+            response = self._request("GET", sync_url, params=params)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Failed to get sync data: {response.status_code} {response.text}")
+                return None
+        except Exception as e:
+            logger.error(f"Error getting sync data: {e}")
+            return None
+
     def pause_torrents(self, hashes: List[str]) -> bool:
         """Pause (stop) one or more torrents. Supports both old 'pause' and new 'stop' endpoints."""
         if not self.sid and not self.login():
@@ -96,7 +145,7 @@ class QBitAPI:
         log_api_call(stop_url, "POST", params={"count": len(hashes)})
 
         try:
-            response = self.session.post(stop_url, data=data)
+            response = self._post(stop_url, data=data)
             if response.status_code == 200:
                 logger.info(f"Successfully stopped {len(hashes)} torrents")
                 return True
@@ -115,6 +164,36 @@ class QBitAPI:
             logger.error(f"Error pausing torrents: {e}")
             return False
 
+    def resume_torrents(self, hashes: List[str]) -> bool:
+        """Resume (start) one or more torrents. Supports both old 'resume' and new 'start' endpoints."""
+        if not self.sid and not self.login():
+            return False
+
+        # Try 'start' first (qBit 4.6.0+)
+        start_url = f"{self.base_url}/api/v2/torrents/start"
+        data = {"hashes": "|".join(hashes)}
+        log_api_call(start_url, "POST", params={"count": len(hashes)})
+
+        try:
+            response = self._post(start_url, data=data)
+            if response.status_code == 200:
+                logger.info(f"Successfully started {len(hashes)} torrents")
+                return True
+
+            # If 404, try the older 'resume' endpoint
+            if response.status_code == 404:
+                resume_url = f"{self.base_url}/api/v2/torrents/resume"
+                response = self._post(resume_url, data=data)
+                if response.status_code == 200:
+                    logger.info(f"Successfully resumed {len(hashes)} torrents")
+                    return True
+
+            logger.error(f"Failed to start/resume torrents: {response.status_code} {response.text}")
+            return False
+        except Exception as e:
+            logger.error(f"Error resuming torrents: {e}")
+            return False
+
     def delete_torrents(self, hashes: List[str], delete_files: bool = True) -> bool:
         """Delete one or more torrents, optionally deleting their downloaded data."""
         if not self.sid and not self.login():
@@ -128,7 +207,7 @@ class QBitAPI:
         log_api_call(delete_url, "POST", params={"count": len(hashes), "delete_files": delete_files})
 
         try:
-            response = self.session.post(delete_url, data=data)
+            response = self._post(delete_url, data=data)
             if response.status_code == 200:
                 logger.info(f"Successfully deleted {len(hashes)} torrents (delete_files={delete_files})")
                 return True
@@ -138,3 +217,104 @@ class QBitAPI:
         except Exception as e:
             logger.error(f"Error deleting torrents: {e}")
             return False
+
+
+@dataclass
+class BatchResult:
+    """Outcome of TorrentBatch.flush(): the caller keys of queued items, by result."""
+    succeeded: List[Any] = field(default_factory=list)
+    failed: List[Any] = field(default_factory=list)
+
+
+class TorrentBatch:
+    """
+    Accumulates torrent adds, pauses, resumes and deletes and submits them with one
+    request per (tag, savepath, category) group instead of one per torrent.
+
+    Every queued item carries a caller-supplied key (e.g. the match entry it
+    came from) so the caller can commit its own state once, after flush(),
+    for exactly the items qBittorrent accepted. Failed group requests are
+    retried with exponential backoff; a group that still fails reports all of
+    its keys as failed and nothing is retried implicitly on the next flush.
+    """
+
+    def __init__(self, qbit: QBitAPI, retries: int = QBIT_BATCH_RETRIES, backoff: float = QBIT_BATCH_RETRY_BACKOFF):
+        self.qbit = qbit
+        self.retries = retries
+        self.backoff = backoff
+        # Insertion-ordered: group -> magnet/hash -> keys queued for it
+        self._adds: Dict[Tuple[str, str, Optional[str]], Dict[str, List[Any]]] = {}
+        self._pauses: Dict[str, List[Any]] = {}
+        self._resumes: Dict[str, List[Any]] = {}
+        self._deletes: Dict[bool, Dict[str, List[Any]]] = {}
+
+    def __enter__(self) -> "TorrentBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        groups = list(self._adds.values()) + list(self._deletes.values()) + [self._pauses, self._resumes]
+        return sum(len(items) for items in groups)
+
+    def add(self, magnet: str, key: Any = None, tag: str = QBIT_DEFAULT_TAG, savepath: str = QBIT_DEFAULT_SAVEPATH, category: Optional[str] = None) -> None:
+        self._adds.setdefault((tag, savepath, category), {}).setdefault(magnet, []).append(key)
+
+    def pause(self, torrent_hash: str, key: Any = None) -> None:
+        self._pauses.setdefault(torrent_hash, []).append(key)
+
+    def resume(self, torrent_hash: str, key: Any = None) -> None:
+        self._resumes.setdefault(torrent_hash, []).append(key)
+
+    def delete(self, torrent_hash: str, key: Any = None, delete_files: bool = True) -> None:
+        self._deletes.setdefault(delete_files, {}).setdefault(torrent_hash, []).append(key)
+
+    def _submit(self, description: str, send) -> bool:
+        for attempt in range(self.retries + 1):
+            if send():
+                return True
+            if attempt < self.retries:
+                delay = self.backoff * (2 ** attempt)
+                logger.warning(f"Batch {description} failed; retrying in {delay:g}s ({attempt + 1}/{self.retries})")
+                time.sleep(delay)
+        logger.error(f"Batch {description} failed after {self.retries + 1} attempts")
+        return False
+
+    def flush(self) -> BatchResult:
+        """Submits everything queued (pauses, resumes, then adds, then deletes) and clears the queue."""
+        result = BatchResult()
+        pauses, resumes, adds, deletes = self._pauses, self._resumes, self._adds, self._deletes
+        self._pauses, self._resumes, self._adds, self._deletes = {}, {}, {}, {}
+
+        def record(ok: bool, items: Dict[str, List[Any]]) -> None:
+            keys = [k for ks in items.values() for k in ks]
+            (result.succeeded if ok else result.failed).extend(keys)
+
+        if pauses:
+            hashes = list(pauses)
+            record(self._submit(f"stop of {len(hashes)} torrent(s)", lambda: self.qbit.pause_torrents(hashes)), pauses)
+
+        if resumes:
+            resume_hashes = list(resumes)
+            ok = self._submit(f"start of {len(resume_hashes)} torrent(s)", lambda: self.qbit.resume_torrents(resume_hashes))
+            record(ok, resumes)
+
+        for (tag, savepath, category), items in adds.items():
+            urls = list(items)
+            ok = self._submit(
+                f"add of {len(urls)} torrent(s) [tag={tag}]",
+                lambda: self.qbit.add_torrent(urls, tag=tag, savepath=savepath, category=category),
+            )
+            record(ok, items)
+
+        for delete_files, items in deletes.items():
+            hashes = list(items)
+            ok = self._submit(
+                f"delete of {len(hashes)} torrent(s)",
+                lambda: self.qbit.delete_torrents(hashes, delete_files=delete_files),
+            )
+            record(ok, items)
+
+        return result
@@ -0,0 +1,199 @@
+"""
+Incremental qBittorrent state via the /api/v2/sync/maindata protocol.
+
+qBittorrent answers `sync/maindata?rid=N` with only what changed since its
+response N (or a full snapshot when N is 0 or unknown). QBitSyncClient keeps
+the merged torrent table and the last rid, so watch loops only transfer
+deltas, and saves both in a small JSON file. The session cookie is never
+written to disk: each invocation logs in again and gets one full snapshot
+(rids are per session), which is still diffed against the saved table.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .qbit_api import QBitAPI
+from .constants import QBIT_SYNC_STATE_FILENAME, QBIT_WATCH_INTERVAL_SECONDS
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _has_tag(torrent: Dict[str, Any], tag: str) -> bool:
+    return tag in [t.strip() for t in (torrent.get("tags") or "").split(",")]
+
+
+def _is_complete(torrent: Dict[str, Any]) -> bool:
+    return (torrent.get("progress") or 0) >= 1.0
+
+
+@dataclass
+class SyncDelta:
+    """What one sync round changed in the local torrent table."""
+    full_update: bool = False
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    completed: List[str] = field(default_factory=list)  # Crossed to 100% this round
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class QBitSyncClient:
+    """Keeps a local, incrementally updated copy of qBittorrent's torrent list."""
+
+    def __init__(self, qbit: Optional[QBitAPI] = None, state_path: Union[str, Path] = QBIT_SYNC_STATE_FILENAME):
+        self.qbit = qbit or QBitAPI()
+        self.state_path = Path(state_path)
+        self.rid = 0
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.server_state: Dict[str, Any] = {}
+        self._load_state()
+
+    # --- Persistence ---
+
+    def _load_state(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not load qBittorrent sync state from '{self.state_path}': {e}. Starting fresh.")
+            return
+
+        if state.get("base_url") != self.qbit.base_url:
+            # Cached state belongs to a different qBittorrent instance
+            return
+        self.rid = state.get("rid", 0)
+        self.torrents = state.get("torrents", {})
+        self.server_state = state.get("server_state", {})
+
+    def save_state(self) -> None:
+        state = {
+            "base_url": self.qbit.base_url,
+            "rid": self.rid,
+            "torrents": self.torrents,
+            "server_state": self.server_state,
+        }
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            logger.error(f"Error saving qBittorrent sync state to '{self.state_path}': {e}")
+
+    # --- Sync ---
+
+    def sync(self) -> Optional[SyncDelta]:
+        """Applies one sync/maindata delta. Returns None if qBittorrent could not be reached."""
+        data = self.qbit.get_maindata(self.rid)
+        if data is None:
+            return None
+
+        delta = SyncDelta(full_update=bool(data.get("full_update")))
+        previous = self.torrents
+
+        if delta.full_update:
+            incoming = data.get("torrents", {}) or {}
+            self.torrents = {h: dict(fields, hash=h) for h, fields in incoming.items()}
+            delta.added = [h for h in self.torrents if h not in previous]
+            delta.removed = [h for h in previous if h not in self.torrents]
+            delta.updated = [h for h in self.torrents if h in previous and self.torrents[h] != previous[h]]
+        else:
+            for h, fields in (data.get("torrents", {}) or {}).items():
+                if h in self.torrents:
+                    self.torrents[h].update(fields)
+                    delta.updated.append(h)
+                else:
+                    self.torrents[h] = dict(fields, hash=h)
+                    delta.added.append(h)
+            for h in data.get("torrents_removed", []) or []:
+                if self.torrents.pop(h, None) is not None:
+                    delta.removed.append(h)
+
+        if data.get("server_state"):
+            self.server_state.update(data["server_state"])
+
+        was_complete = {h for h, t in previous.items() if _is_complete(t)} if delta.full_update else None
+        for h in delta.added + delta.updated:
+            torrent = self.torrents[h]
+            if not _is_complete(torrent):
+                continue
+            if was_complete is not None:
+                if h not in was_complete:
+                    delta.completed.append(h)
+            elif "progress" in (data.get("torrents", {}) or {}).get(h, {}):
+                # Partial updates only carry changed fields, so progress changed to 100%
+                delta.completed.append(h)
+
+        self.rid = data.get("rid", self.rid)
+        self.save_state()
+        return delta
+
+    def get_torrents(self, tag: Optional[str] = None, refresh: bool = True) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns torrents (same fields as torrents/info), optionally filtered by tag.
+        Returns None if a refresh was requested and qBittorrent could not be reached.
+        """
+        if refresh and self.sync() is None:
+            return None
+        torrents = [dict(t) for t in self.torrents.values()]
+        if tag:
+            torrents = [t for t in torrents if _has_tag(t, tag)]
+        return torrents
+
+    def watch(
+        self,
+        on_complete: Callable[[List[Dict[str, Any]]], None],
+        tag: Optional[str] = None,
+        interval: float = QBIT_WATCH_INTERVAL_SECONDS,
+        stop_event: Optional[threading.Event] = None,
+        max_rounds: Optional[int] = None,
+        baseline: bool = True,
+    ) -> None:
+        """
+        Polls sync/maindata every `interval` seconds and calls `on_complete` with
+        torrents that finished downloading since the previous round.
+        With `baseline` the first round only establishes one; without it the
+        first round already reports against the current table (for callers that
+        just synced and handled what was complete). Stops on `stop_event` or
+        after `max_rounds` rounds.
+        """
+        stop_event = stop_event or threading.Event()
+        rounds = 0
+        while not stop_event.is_set():
+            delta = self.sync()
+            rounds += 1
+            if delta is None:
+                logger.warning("qBittorrent unreachable; retrying next round.")
+            elif not baseline and delta.completed:
+                finished = [dict(self.torrents[h]) for h in delta.completed]
+                if tag:
+                    finished = [t for t in finished if _has_tag(t, tag)]
+                if finished:
+                    on_complete(finished)
+            if delta is not None:
+                baseline = False
+            if max_rounds is not None and rounds >= max_rounds:
+                break
+            stop_event.wait(interval)
+
+
+def get_torrents_with_sync(
+    qbit: QBitAPI,
+    tag: Optional[str] = None,
+    state_path: Union[str, Path] = QBIT_SYNC_STATE_FILENAME,
+) -> List[Dict[str, Any]]:
+    """Torrent list via the incremental sync cache, falling back to a full torrents/info call."""
+    torrents = QBitSyncClient(qbit, state_path=state_path).get_torrents(tag=tag)
+    if torrents is None:
+        return qbit.get_torrents_info(tag=tag)
+    return torrents
@@ -2,11 +2,11 @@ import os
 import logging
 import concurrent.futures
 from pathlib import Path
-from typing import List, Optional, Dict, Callable
+from typing import Iterable, Iterator, List, Optional, Dict, Callable
 
 from .models import Library, Category, Series, SubGroup, Volume
-from .analysis import inspect_archive
-from .constants import VALID_MANGA_EXTENSIONS
+from .inspection_service import InspectionResult, InspectionService, disk_order
+from .constants import VALID_MANGA_EXTENSIONS, DEEP_ANALYSIS_WORKERS
 from .metadata import load_local_metadata
 
 logger = logging.getLogger(__name__)
@@ -179,18 +179,30 @@ def enrich_series(series: Series, deep: bool = False, verify: bool = False) -> S
     """
     if not (deep or verify):
         return series
-        
-    for vol in series.volumes:
-        pages, corrupt = inspect_archive(vol.path, check_integrity=verify)
-        if deep:
-            vol.page_count = pages
-        vol.is_corrupt = corrupt
-            
-    for sg in series.sub_groups:
-        for vol in sg.volumes:
-            pages, corrupt = inspect_archive(vol.path, check_integrity=verify)
-            if deep:
-                vol.page_count = pages
-            vol.is_corrupt = corrupt
-            
+    
+    volumes = series.volumes + [vol for sg in series.sub_groups for vol in sg.volumes]
+    for _ in enrich_volumes(volumes, deep=deep, verify=verify):
+        pass
     return series
+
+
+def enrich_volumes(
+    volumes: Iterable[Volume],
+    deep: bool = False,
+    verify: bool = False,
+    workers: int = DEEP_ANALYSIS_WORKERS,
+) -> Iterator[InspectionResult]:
+    """
+    Inspects volumes in parallel, in on-disk order, updating each Volume as
+    its result arrives. Yields the results in completion order for progress
+    display. Timed-out volumes are yielded but left unchanged.
+    """
+    service = InspectionService(workers=workers)
+    for result in service.run(disk_order(volumes, workers), check_integrity=verify):
+        if not result.timed_out:
+            vol = result.volume
+            if deep:
+                vol.page_count = result.page_count or 0
+            # A missing or unreadable archive counts as corrupt, as before
+            vol.is_corrupt = result.corrupt or not result.exists
+        yield result
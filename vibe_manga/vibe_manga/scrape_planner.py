@@ -0,0 +1,196 @@
+"""
+Query planning for Nyaa search scrapes.
+
+`scrape --continuity` produces several search alternatives for every series
+with gaps, and many of them return the same torrents. Nyaa matches all terms
+of a search, so a query whose terms are a subset of another query's terms
+already returns everything the narrower one would. The planner uses that to:
+  * coalesce equivalent queries ("Re:Zero" / "Re Zero") and drop queries
+    subsumed by a broader one ("Tower of God" is covered by "Tower God");
+  * order the remaining searches by expected yield (gap size, time since the
+    query last found something new);
+  * leave the total page budget to the scraper, which spends it in plan order.
+
+A merged query keeps the largest page cap of the queries it absorbed. Queries
+with no word terms at all (only punctuation) are passed through as they are.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional
+
+from .constants import SCRAPE_PLANNER_STALE_DAYS
+
+_GAP_RANGE_PATTERN = re.compile(r"#(\d+)(?:-(\d+))?")
+
+
+def query_terms(query: str) -> FrozenSet[str]:
+    """Lowercased alphanumeric search terms of a query (any script: "進撃の巨人" is one term)."""
+    return frozenset(re.findall(r"[^\W_]+", query.lower()))
+
+
+def _larger_cap(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    """Larger of two page caps; None (no cap) is the largest."""
+    if a is None or b is None:
+        return None
+    return max(a, b)
+
+
+def gap_size(gap_messages: List[str]) -> int:
+    """Counts missing units in `find_gaps` messages ("Missing Vol #3-7" -> 5)."""
+    total = 0
+    for message in gap_messages:
+        match = _GAP_RANGE_PATTERN.search(message)
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+            total += max(end - start + 1, 1)
+        else:
+            total += 1  # e.g. "No volumes found."
+    return total
+
+
+@dataclass
+class ScrapeTarget:
+    """Something we want to find torrents for, with its search alternatives."""
+    name: str
+    alternatives: List[str]
+    gap_size: int = 1
+    manual: bool = False  # Explicit --query targets always go first
+    max_pages: Optional[int] = None  # Page cap for its searches; None = the scraper's default
+
+
+@dataclass
+class PlannedQuery:
+    query: str
+    terms: FrozenSet[str]
+    targets: Dict[str, int] = field(default_factory=dict)  # target name -> gap size
+    manual: bool = False
+    max_pages: Optional[int] = None
+    score: float = 0.0
+    order: int = 0
+
+    @property
+    def gap_size(self) -> int:
+        return sum(self.targets.values())
+
+
+@dataclass
+class ScrapePlan:
+    queries: List[PlannedQuery]
+    coalesced: Dict[str, str]  # dropped query -> query that covers it
+    cooling_down: List[str]
+
+    @property
+    def query_strings(self) -> List[str]:
+        return [p.query for p in self.queries]
+
+    @property
+    def page_caps(self) -> Dict[str, int]:
+        """Page cap per query, for queries that have one."""
+        return {p.query: p.max_pages for p in self.queries if p.max_pages is not None}
+
+
+def _covers(broad: PlannedQuery, narrow: PlannedQuery) -> bool:
+    """True if `broad`'s results include everything `narrow` would return."""
+    if not broad.terms or not broad.terms < narrow.terms:
+        return False
+    # Single-term searches are only trusted inside their own target: across
+    # unrelated series a one-word search is too broad to fit in the page budget.
+    return len(broad.terms) > 1 or bool(broad.targets.keys() & narrow.targets.keys())
+
+
+def _expected_yield(
+    planned: PlannedQuery,
+    now_ts: float,
+    query_history: Dict[str, float],
+    yield_history: Dict[str, dict],
+) -> float:
+    stale_seconds = SCRAPE_PLANNER_STALE_DAYS * 24 * 3600
+    last_success = yield_history.get(planned.query, {}).get("last_success")
+    if last_success is None:
+        staleness = 1.0
+    else:
+        staleness = min(max(now_ts - last_success, 0) / stale_seconds, 1.0)
+
+    score = planned.gap_size * (0.25 + 0.75 * staleness)
+
+    last_run = query_history.get(planned.query)
+    if last_run is not None and (last_success is None or last_success < last_run):
+        # The last run found nothing new; expect less this time
+        score *= 0.5
+    return score
+
+
+def plan_queries(
+    targets: List[ScrapeTarget],
+    query_history: Dict[str, float],
+    yield_history: Optional[Dict[str, dict]] = None,
+    now_ts: float = 0.0,
+    cooldown_seconds: float = 0.0,
+    force: bool = False,
+) -> ScrapePlan:
+    """
+    Builds an ordered, coalesced list of search queries for the given targets.
+
+    Queries run within `cooldown_seconds` (per `query_history`) are skipped
+    unless `force` is set; the cooldown is checked on the query that survives
+    coalescing, since it covers the ones dropped in its favour.
+    """
+    yield_history = yield_history or {}
+
+    # 1. Collect unique queries, merging identical term sets across targets
+    by_terms: Dict[FrozenSet[str], PlannedQuery] = {}
+    unplanned: Dict[str, PlannedQuery] = {}  # Queries without terms, by exact string
+    coalesced: Dict[str, str] = {}
+    order = 0
+    for target in targets:
+        for alt in target.alternatives:
+            terms = query_terms(alt)
+            planned = by_terms.get(terms) if terms else unplanned.get(alt)
+            if planned is None:
+                planned = PlannedQuery(query=alt, terms=terms, max_pages=target.max_pages, order=order)
+                order += 1
+                if terms:
+                    by_terms[terms] = planned
+                else:
+                    unplanned[alt] = planned
+            else:
+                if alt != planned.query:
+                    coalesced[alt] = planned.query
+                planned.max_pages = _larger_cap(planned.max_pages, target.max_pages)
+            planned.targets.setdefault(target.name, target.gap_size)
+            planned.manual = planned.manual or target.manual
+
+    candidates = list(by_terms.values()) + list(unplanned.values())
+
+    # 2. Drop queries covered by a broader one (broadest first so chains collapse)
+    candidates.sort(key=lambda p: (len(p.terms), p.order))
+    kept: List[PlannedQuery] = []
+    for planned in candidates:
+        cover = next((k for k in kept if _covers(k, planned)), None)
+        if cover is None:
+            kept.append(planned)
+            continue
+        coalesced[planned.query] = cover.query
+        for name, size in planned.targets.items():
+            cover.targets.setdefault(name, size)
+        cover.manual = cover.manual or planned.manual
+        cover.max_pages = _larger_cap(cover.max_pages, planned.max_pages)
+
+    # 3. Cooldown
+    cooling_down: List[str] = []
+    runnable: List[PlannedQuery] = []
+    for planned in kept:
+        last_run = query_history.get(planned.query, 0)
+        if not force and now_ts - last_run < cooldown_seconds:
+            cooling_down.append(planned.query)
+        else:
+            runnable.append(planned)
+
+    # 4. Order by expected yield; manual searches first, ties keep generation order
+    for planned in runnable:
+        planned.score = _expected_yield(planned, now_ts, query_history, yield_history)
+    runnable.sort(key=lambda p: (not p.manual, -p.score, p.order))
+
+    return ScrapePlan(queries=runnable, coalesced=coalesced, cooling_down=cooling_down)
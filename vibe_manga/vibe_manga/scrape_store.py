@@ -0,0 +1,312 @@
+"""
+Append-only storage for Nyaa scrape results.
+
+Entries live in a JSON Lines file (one torrent per line) next to two small
+sidecars:
+  * `<file>.magnets` - one magnet link per line, the uniqueness index;
+  * `<file>.meta.json` - entry count, high-water timestamp and the data file
+    size they describe.
+
+New entries are appended to both files and only the tiny meta file is
+rewritten, so an incremental scrape costs O(new entries) instead of a full
+load/sort/rewrite. If the sidecars do not match the data file (crash, manual
+edit) they are rebuilt from the data file on open.
+
+The data file is written in append order so appends stay cheap, and entries
+are read back in reverse append order (the file is read backwards in blocks).
+Each batch is sorted by date before it is appended, so this is newest-first
+within a batch with the latest batch first; batches are not merged by date.
+For incremental scrapes that is newest-first overall, the order legacy files
+and everything downstream of them (match, grab) expect.
+
+Legacy stores (a single JSON array, as written by older versions) are read
+transparently and converted to JSON Lines on the first append. The JSON Lines
+copy is written next to the legacy file, which is never modified.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+from .constants import NYAA_DEFAULT_OUTPUT_FILENAME, NYAA_LEGACY_OUTPUT_FILENAME
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+_REVERSE_READ_BLOCK = 64 * 1024
+
+
+def _entry_timestamp(entry: dict) -> Optional[int]:
+    try:
+        return int(entry.get("date"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_legacy_file(path: Path) -> bool:
+    """True if the file holds a single JSON array rather than JSON Lines."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            while True:
+                ch = f.read(1)
+                if not ch:
+                    return False
+                if not ch.isspace():
+                    return ch == "["
+    except OSError:
+        return False
+
+
+def _reverse_lines(f) -> Iterator[bytes]:
+    """Lines of a binary file from last to first, reading it backwards in blocks."""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    pending = b""
+    while pos > 0:
+        step = min(_REVERSE_READ_BLOCK, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + pending).split(b"\n")
+        pending = lines[0]
+        yield from reversed(lines[1:])
+    yield pending
+
+
+class ScrapeStore:
+    """JSON Lines scrape result store with a magnet index and a high-water timestamp."""
+
+    def __init__(self, path: Union[str, Path], legacy_path: Optional[Union[str, Path]] = None):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.index_path = self.path.with_name(self.path.name + ".magnets")
+        self.meta_path = self.path.with_name(self.path.name + ".meta.json")
+        self._magnets: Optional[Set[str]] = None
+        self._meta: Optional[dict] = None
+
+    # --- Reading ---
+
+    def _source(self) -> Optional[Path]:
+        """Returns the file entries are currently read from (store or legacy)."""
+        if self.path.exists():
+            return self.path
+        if self.legacy_path and self.legacy_path.exists():
+            return self.legacy_path
+        return None
+
+    def exists(self) -> bool:
+        return self._source() is not None
+
+    def iter_entries(self, newest_first: bool = True) -> Iterator[dict]:
+        """
+        Streams stored entries without loading the whole store: reverse append
+        order (latest batch first, the legacy order) by default, append order
+        otherwise. Entries are not re-sorted by date across batches.
+        """
+        source = self._source()
+        if source is None:
+            return
+
+        if _is_legacy_file(source):
+            try:
+                with open(source, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Could not parse legacy scrape file '{source}': {e}")
+                return
+            # Legacy files are newest-first
+            yield from (entries if newest_first else reversed(entries))
+            return
+
+        with open(source, "rb") as f:
+            lines = _reverse_lines(f) if newest_first else iter(f)
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Usually a torn final line from an interrupted append
+                    logger.warning(f"Skipping unreadable line in '{source}'")
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter_entries()
+
+    def __len__(self) -> int:
+        return self._load_meta()["count"]
+
+    def __contains__(self, magnet: str) -> bool:
+        return magnet in self.magnets
+
+    @property
+    def high_water(self) -> Optional[int]:
+        """Newest entry timestamp in the store, or None if empty."""
+        return self._load_meta()["high_water"]
+
+    @property
+    def magnets(self) -> Set[str]:
+        """Magnet links already stored (loaded lazily from the index sidecar)."""
+        if self._magnets is None:
+            self._load_meta()
+            if self._magnets is None:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._magnets = {line.rstrip("\n") for line in f if line.strip()}
+        return self._magnets
+
+    # --- Sidecars ---
+
+    def _load_meta(self) -> dict:
+        if self._meta is not None:
+            return self._meta
+
+        source = self._source()
+        if source is None:
+            self._meta = {"version": STORE_VERSION, "count": 0, "high_water": None, "size": 0}
+            self._magnets = set()
+            return self._meta
+
+        if source == self.path and not _is_legacy_file(source):
+            try:
+                with open(self.meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                if (
+                    meta.get("version") == STORE_VERSION
+                    and meta.get("size") == self.path.stat().st_size
+                    and self.index_path.exists()
+                ):
+                    self._meta = meta
+                    return meta
+            except (OSError, json.JSONDecodeError):
+                pass
+            logger.info(f"Rebuilding scrape store index for '{self.path}'")
+
+        # Legacy file or stale sidecars: derive everything from the entries
+        self._rebuild_from_entries()
+        return self._meta
+
+    def _rebuild_from_entries(self) -> None:
+        magnets: Set[str] = set()
+        count = 0
+        high_water = None
+        for entry in self.iter_entries(newest_first=False):
+            magnet = entry.get("magnet_link")
+            if not magnet or magnet in magnets:
+                continue
+            magnets.add(magnet)
+            count += 1
+            ts = _entry_timestamp(entry)
+            if ts is not None and (high_water is None or ts > high_water):
+                high_water = ts
+
+        self._magnets = magnets
+        self._meta = {"version": STORE_VERSION, "count": count, "high_water": high_water, "size": 0}
+
+        if self.path.exists() and not _is_legacy_file(self.path):
+            # Persist the rebuilt sidecars so the next open is cheap again
+            self._meta["size"] = self.path.stat().st_size
+            self._write_index(magnets)
+            self._save_meta()
+
+    def _write_index(self, magnets: Iterable[str]) -> None:
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for magnet in magnets:
+                f.write(magnet + "\n")
+        os.replace(tmp, self.index_path)
+
+    def _save_meta(self) -> None:
+        tmp = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._meta, f, indent=2)
+        os.replace(tmp, self.meta_path)
+
+    def _convert_legacy(self) -> None:
+        """Rewrites a legacy JSON array store as JSON Lines (once)."""
+        source = self._source()
+        entries = list(self.iter_entries(newest_first=False))
+        logger.info(f"Converting legacy scrape file '{source}' ({len(entries)} entries) to JSON Lines at '{self.path}'")
+
+        seen: Set[str] = set()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            # Oldest first so appends keep date order
+            for entry in entries:
+                magnet = entry.get("magnet_link")
+                if not magnet or magnet in seen:
+                    continue
+                seen.add(magnet)
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+        self._meta = None
+        self._magnets = None
+        self._rebuild_from_entries()
+
+    # --- Writing ---
+
+    def append(self, entries: Iterable[dict]) -> List[dict]:
+        """
+        Appends entries whose magnet link is not stored yet.
+
+        Returns:
+            The entries that were actually added.
+        """
+        entries = list(entries)
+        if not entries:
+            return []
+
+        source = self._source()
+        if source is not None and (source != self.path or _is_legacy_file(source)):
+            self._convert_legacy()
+
+        magnets = self.magnets
+        added: List[dict] = []
+        for entry in entries:
+            magnet = entry.get("magnet_link")
+            if not magnet or magnet in magnets:
+                continue
+            magnets.add(magnet)
+            added.append(entry)
+
+        if not added:
+            return added
+
+        # Oldest first, matching the on-disk order of earlier appends
+        added.sort(key=lambda e: _entry_timestamp(e) or 0)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for entry in added:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for entry in added:
+                f.write(entry["magnet_link"] + "\n")
+
+        meta = self._meta
+        meta["count"] += len(added)
+        for entry in added:
+            ts = _entry_timestamp(entry)
+            if ts is not None and (meta["high_water"] is None or ts > meta["high_water"]):
+                meta["high_water"] = ts
+        meta["size"] = self.path.stat().st_size
+        self._save_meta()
+        return added
+
+
+def open_scrape_store(path: Union[str, Path]) -> ScrapeStore:
+    """
+    Opens a store, falling back to the legacy JSON file for the default location.
+
+    A legacy JSON array passed explicitly (e.g. `--output results.json`) is read
+    as the fallback of a `.jsonl` store next to it, so converting it never
+    overwrites the original.
+    """
+    path = Path(path)
+    if path == Path(NYAA_DEFAULT_OUTPUT_FILENAME):
+        return ScrapeStore(path, legacy_path=NYAA_LEGACY_OUTPUT_FILENAME)
+    if _is_legacy_file(path):
+        store_path = path.with_suffix(".jsonl")
+        if store_path == path:
+            store_path = path.with_name(path.name + ".jsonl")
+        return ScrapeStore(store_path, legacy_path=path)
+    return ScrapeStore(path)
@@ -0,0 +1,161 @@
+"""
+File transfer strategies for pull.
+
+Staging a completed torrent and importing it into the library used to copy
+every file twice. `transfer_file` instead tries the cheapest way to make the
+data appear at the destination and only falls back to copying bytes:
+
+  1. hardlink   - same filesystem, no data written at all;
+  2. reflink    - FICLONE ioctl (btrfs, XFS, ...): copy-on-write clone;
+  3. rename     - same device, only when the caller allows the source to go;
+  4. copy       - chunked copy reporting progress, metadata preserved.
+
+Every strategy lands the file under a temporary name in the destination
+directory and then atomically replaces the destination, so an existing file
+is never left half-written.
+"""
+
+import errno
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Union
+
+from .constants import BYTES_PER_MB, TRANSFER_CHUNK_SIZE, TRANSFER_METHODS
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+ProgressCallback = Callable[[int], None]
+
+
+@dataclass
+class TransferResult:
+    method: str
+    bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second actually written (0 for link/rename/clone)."""
+        if self.method != "copy" or self.seconds <= 0:
+            return 0.0
+        return self.bytes / self.seconds
+
+
+def _temp_path(dst: Path) -> Path:
+    return dst.with_name(f".{dst.name}.{os.getpid()}.part")
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _hardlink(src: Path, tmp: Path) -> None:
+    os.link(src, tmp)
+
+
+def _reflink(src: Path, tmp: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is only supported on Linux")
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, tmp)
+
+
+def _copy(src: Path, tmp: Path, progress: Optional[ProgressCallback]) -> None:
+    with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+        while True:
+            chunk = fsrc.read(TRANSFER_CHUNK_SIZE)
+            if not chunk:
+                break
+            fdst.write(chunk)
+            if progress:
+                progress(len(chunk))
+    shutil.copystat(src, tmp)
+
+
+def transfer_file(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    allow_move: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    methods: Sequence[str] = TRANSFER_METHODS,
+) -> TransferResult:
+    """
+    Makes `src` available at `dst` using the first strategy in `methods` that works.
+
+    `allow_move` permits the rename strategy, which removes `src`.
+    `progress` is called with the number of bytes handled: per chunk while
+    copying, once with the whole size for the other strategies.
+    Raises OSError only if every strategy failed.
+    """
+    src, dst = Path(src), Path(dst)
+    size = src.stat().st_size
+    start = time.monotonic()
+    last_error: Optional[OSError] = None
+
+    for method in methods:
+        if method == "rename" and not allow_move:
+            continue
+        tmp = _temp_path(dst)
+        try:
+            if method == "hardlink":
+                _hardlink(src, tmp)
+            elif method == "reflink":
+                _reflink(src, tmp)
+            elif method == "rename":
+                if src.stat().st_dev != dst.parent.stat().st_dev:
+                    raise OSError(errno.EXDEV, "source and destination are on different devices")
+                os.replace(src, dst)
+                tmp = None
+            elif method == "copy":
+                _copy(src, tmp, progress)
+            else:
+                raise ValueError(f"Unknown transfer method: {method}")
+            if tmp is not None:
+                os.replace(tmp, dst)
+                # rename() is a no-op if dst already links to the same inode
+                _discard(tmp)
+        except OSError as e:
+            if tmp is not None:
+                _discard(tmp)
+            logger.debug(f"{method} failed for {src.name}: {e}")
+            last_error = e
+            continue
+
+        if progress and method != "copy":
+            progress(size)
+        return TransferResult(method=method, bytes=size, seconds=time.monotonic() - start)
+
+    raise last_error or OSError(f"No transfer method available for {src}")
+
+
+_METHOD_LABELS = {"hardlink": "hardlinked", "reflink": "cloned", "rename": "moved", "copy": "copied"}
+
+
+def describe_transfers(results: Sequence[TransferResult]) -> str:
+    """Summary like '12 hardlinked, 2 copied at 95.3 MB/s' for log output."""
+    parts = []
+    for method in TRANSFER_METHODS:
+        done = [r for r in results if r.method == method]
+        if not done:
+            continue
+        part = f"{len(done)} {_METHOD_LABELS[method]}"
+        if method == "copy":
+            seconds = sum(r.seconds for r in done)
+            if seconds > 0:
+                part += f" at {sum(r.bytes for r in done) / seconds / BYTES_PER_MB:.1f} MB/s"
+        parts.append(part)
+    return ", ".join(parts) or "nothing transferred"
@@ -0,0 +1,121 @@
+"""
+Cached transfer plans for pull.
+
+Analyzing a completed torrent means walking its files, running classify_unit
+and name normalization on each of them and comparing the result against the
+matched library series. `pull --simulate` followed by `pull`, or a re-run
+after a partial failure, used to redo all of it.
+
+TransferPlanCache keeps the finished plan (normalized names, volume/chapter
+numbers and skip decisions) per torrent hash in a small JSON file. An entry is
+only reused while both fingerprints still match:
+
+  * the file-list fingerprint: path, size and mtime of every source file;
+  * the series fingerprint: the matched library series and its volume names,
+    since the redundancy decisions depend on what the library already has.
+
+Entries are dropped once their torrent is pulled or leaves qBittorrent.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .constants import PULL_PLAN_CACHE_FILENAME
+from .logging import get_logger
+from .models import Series
+
+logger = get_logger(__name__)
+
+
+def files_fingerprint(files: Iterable[Path]) -> str:
+    """Digest of (path, size, mtime) for a torrent's source files."""
+    h = hashlib.sha1()
+    for path in files:
+        st = path.stat()
+        h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+def series_fingerprint(series: Optional[Series]) -> str:
+    """Digest of the matched series' path and volume names ('new' if unmatched)."""
+    if series is None:
+        return "new"
+    names = sorted(v.name for v in series.volumes + [v for sg in series.sub_groups for v in sg.volumes])
+    h = hashlib.sha1(str(series.path).encode("utf-8", "surrogateescape"))
+    for name in names:
+        h.update(b"\0" + name.encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+class TransferPlanCache:
+    """torrent hash -> analyzed transfer plan, persisted as JSON in the working directory."""
+
+    def __init__(self, path: Union[str, Path] = PULL_PLAN_CACHE_FILENAME):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not load transfer plan cache from '{self.path}': {e}. Starting fresh.")
+            return
+        if isinstance(data, dict):
+            self.entries = data
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.error(f"Error saving transfer plan cache to '{self.path}': {e}")
+
+    def get(self, torrent_hash: str, files_fp: str, series_fp: str, series_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns {"series_name", "plan"} if a plan for exactly these inputs is cached.
+        Plan items are fresh dicts with `src` as a Path, ready to be mutated.
+        """
+        entry = self.entries.get(torrent_hash)
+        if not entry:
+            return None
+        if (entry.get("files") != files_fp or entry.get("series") != series_fp
+                or entry.get("input_name") != series_name):
+            return None
+        plan = [dict(item, src=Path(item["src"])) for item in entry.get("plan", [])]
+        return {"series_name": entry.get("series_name", series_name), "plan": plan}
+
+    def put(self, torrent_hash: str, files_fp: str, series_fp: str, series_name: str, final_name: str, plan: List[Dict]) -> None:
+        self.entries[torrent_hash] = {
+            "files": files_fp,
+            "series": series_fp,
+            "input_name": series_name,
+            "series_name": final_name,
+            "plan": [dict(item, src=str(item["src"])) for item in plan],
+        }
+        self.dirty = True
+
+    def discard(self, torrent_hash: str) -> None:
+        if self.entries.pop(torrent_hash, None) is not None:
+            self.dirty = True
+
+    def prune(self, keep_hashes: Iterable[str]) -> None:
+        """Drops plans for torrents that are no longer in qBittorrent."""
+        keep = set(keep_hashes)
+        for torrent_hash in [h for h in self.entries if h not in keep]:
+            self.discard(torrent_hash)
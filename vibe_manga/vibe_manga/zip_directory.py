@@ -0,0 +1,126 @@
+"""
+Minimal ZIP central-directory reader.
+
+zipfile.ZipFile parses every central-directory record into a ZipInfo and
+most callers then build a Path per name just to look at its suffix. For page
+counts and entry listings only the central directory is needed: it sits at
+the end of the file, so one seek and read of the last ZIP_TAIL_READ_BYTES
+usually covers both the end-of-central-directory (EOCD) record and the whole
+directory. Larger directories take one more read.
+
+Entries are returned as raw bytes. ZIP64 archives and anything that does not
+parse cleanly return None, so callers can fall back to zipfile, which also
+produces the proper error for corrupt files.
+"""
+
+import struct
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .constants import ZIP_TAIL_READ_BYTES
+
+EOCD_SIGNATURE = b"PK\x05\x06"
+EOCD_SIZE = 22
+MAX_ZIP_COMMENT = 0xFFFF
+
+_EOCD = struct.Struct("<4sHHHHIIH")
+_CENTRAL_HEADER = struct.Struct("<4s6H3I5H2I")
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_UTF8_FLAG = 0x800
+
+# (name, crc, flags) of one central-directory record
+Entry = Tuple[bytes, int, int]
+
+
+def locate_central_directory(tail: bytes, size: int) -> Optional[Tuple[int, int, int]]:
+    """
+    (offset, size, entry count) of the central directory from the last bytes
+    of a file of `size` bytes; None if there is no usable EOCD record.
+    """
+    pos = tail.rfind(EOCD_SIGNATURE)
+    if pos < 0 or len(tail) - pos < EOCD_SIZE:
+        return None
+    _, disk, cd_disk, _, count, cd_size, _, _ = _EOCD.unpack_from(tail, pos)
+    if disk or cd_disk or count == 0xFFFF or cd_size == 0xFFFFFFFF:
+        return None  # Multi-disk or ZIP64
+    # Like zipfile, trust the EOCD position over the stored offset, which is
+    # wrong when data was prepended (self-extracting archives)
+    cd_offset = size - len(tail) + pos - cd_size
+    if cd_offset < 0:
+        return None
+    return cd_offset, cd_size, count
+
+
+def central_directory(f, size: int, tail: bytes, max_size: Optional[int] = None) -> Optional[Tuple[bytes, int]]:
+    """
+    Raw central directory and its entry count. Sliced from `tail` when it is
+    already there, otherwise read from `f`; None if not a usable ZIP or the
+    directory is larger than `max_size`.
+    """
+    located = locate_central_directory(tail, size)
+    if located is None:
+        return None
+    cd_offset, cd_size, count = located
+    if max_size is not None and cd_size > max_size:
+        return None
+    start = cd_offset - (size - len(tail))
+    if start >= 0:
+        return tail[start:start + cd_size], count
+    f.seek(cd_offset)
+    data = f.read(cd_size)
+    return (data, count) if len(data) == cd_size else None
+
+
+def parse_entries(data: bytes, count: int) -> Optional[List[Entry]]:
+    """(name, crc, flags) per central-directory record; None if a record is malformed."""
+    entries: List[Entry] = []
+    offset = 0
+    for _ in range(count):
+        if offset + _CENTRAL_HEADER.size > len(data):
+            return None
+        header = _CENTRAL_HEADER.unpack_from(data, offset)
+        if header[0] != _CENTRAL_SIGNATURE:
+            return None
+        flags, crc = header[3], header[7]
+        name_len, extra_len, comment_len = header[10], header[11], header[12]
+        name_start = offset + _CENTRAL_HEADER.size
+        entries.append((data[name_start:name_start + name_len], crc, flags))
+        offset = name_start + name_len + extra_len + comment_len
+    return entries if offset <= len(data) else None
+
+
+def read_entries(path: Union[str, Path]) -> Optional[List[Entry]]:
+    """Central-directory entries of a ZIP file, or None to fall back to zipfile."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            tail_len = min(size, ZIP_TAIL_READ_BYTES)
+            f.seek(size - tail_len)
+            tail = f.read(tail_len)
+            found = central_directory(f, size, tail)
+    except OSError:
+        return None
+    if found is None:
+        return None
+    return parse_entries(*found)
+
+
+def decode_name(name: bytes, flags: int) -> str:
+    """Entry name as zipfile decodes it."""
+    return name.decode("utf-8" if flags & _UTF8_FLAG else "cp437")
+
+
+def suffix(name: bytes) -> bytes:
+    """Suffix of an entry name, with the same rules as Path.suffix."""
+    base = name[name.rfind(b"/") + 1:]
+    dot = base.rfind(b".")
+    if 0 < dot < len(base) - 1:
+        return base[dot:]
+    return b""
+
+
+def count_suffixes(entries: Iterable[Entry], suffixes: Iterable[bytes]) -> int:
+    """Number of file entries whose lower-cased suffix is in `suffixes`."""
+    wanted = frozenset(suffixes)
+    return sum(1 for name, _, _ in entries if not name.endswith(b"/") and suffix(name).lower() in wanted)